@@ -0,0 +1,35 @@
+"""
+Exit rule backtesting over historical candles
+"""
+
+from .data import Candles, Entry, load_candles_dir, load_lighter_entries, load_tracker_entries, save_candles
+from .engine import (
+    EXIT_REASONS,
+    BacktestResult,
+    ExitParams,
+    PricePaths,
+    build_paths,
+    replay_rules,
+    run_vectorized,
+    summarize,
+)
+from .sweep import expand_grid, sweep
+
+__all__ = [
+    'Candles',
+    'Entry',
+    'load_candles_dir',
+    'load_lighter_entries',
+    'load_tracker_entries',
+    'save_candles',
+    'EXIT_REASONS',
+    'BacktestResult',
+    'ExitParams',
+    'PricePaths',
+    'build_paths',
+    'replay_rules',
+    'run_vectorized',
+    'summarize',
+    'expand_grid',
+    'sweep',
+]
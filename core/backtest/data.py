@@ -0,0 +1,181 @@
+"""
+Backtest Data Loading
+Historical candles and trade entries for the exit-rule backtester
+
+Candles are cached as one CSV per symbol (timestamp, open, high, low, close,
+volume) - the format the kline fetchers already return - so a pull is made
+once and every sweep after that runs offline.
+
+Entries come from exchange exports (data/lighter_exports) or TradeTracker
+JSON snapshots (logs/trades/<dex>.json).
+
+Usage:
+    entries = load_lighter_entries("data/lighter_exports/lighter-trade-export-....csv")
+    candles = load_candles_dir("data/candles/5m", symbols={e.symbol for e in entries})
+"""
+
+import csv
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Entry:
+    """One position entry to replay"""
+    symbol: str
+    side: str                     # LONG / SHORT
+    time: datetime
+    price: Optional[float] = None  # Fill price (None: use the candle close)
+
+
+@dataclass
+class Candles:
+    """OHLCV series for one symbol as NumPy arrays (timestamps in epoch seconds)"""
+    symbol: str
+    timestamps: np.ndarray
+    close: np.ndarray
+    interval_seconds: float
+
+    @classmethod
+    def from_frame(cls, symbol: str, df: pd.DataFrame) -> "Candles":
+        """Build from a kline DataFrame (timestamp column as datetime or epoch ms)"""
+        ts = df['timestamp']
+        if np.issubdtype(ts.dtype, np.number):
+            seconds = ts.to_numpy(dtype=float) / 1000.0
+        else:
+            seconds = pd.to_datetime(ts).to_numpy(dtype='datetime64[ms]').astype(np.int64) / 1000.0
+        order = np.argsort(seconds, kind='stable')
+        seconds = seconds[order]
+        close = df['close'].to_numpy(dtype=float)[order]
+        interval = float(np.median(np.diff(seconds))) if len(seconds) > 1 else 60.0
+        return cls(symbol=symbol, timestamps=seconds, close=close, interval_seconds=interval)
+
+
+def _normalize_side(side: str) -> str:
+    side = (side or '').strip().upper()
+    return 'LONG' if side in ('LONG', 'BUY', 'BID', 'OPEN LONG') else 'SHORT'
+
+
+def load_lighter_entries(csv_path: str) -> List[Entry]:
+    """
+    Entries from a Lighter trade export ("Open Long" / "Open Short" rows)
+
+    Args:
+        csv_path: Path to lighter-trade-export-*.csv
+
+    Returns:
+        Entries sorted by time
+    """
+    entries = []
+    with open(csv_path, newline='') as f:
+        for row in csv.DictReader(f):
+            side = row.get('Side', '')
+            if not side.startswith('Open'):
+                continue
+            try:
+                entries.append(Entry(
+                    symbol=row['Market'],
+                    side=_normalize_side(side.replace('Open', '')),
+                    time=datetime.strptime(row['Date'], '%Y-%m-%d %H:%M:%S'),
+                    price=float(row['Price'])
+                ))
+            except (KeyError, ValueError) as e:
+                logger.debug(f"Skipping export row {row}: {e}")
+    entries.sort(key=lambda e: e.time)
+    logger.info(f"✅ Loaded {len(entries)} entries from {os.path.basename(csv_path)}")
+    return entries
+
+
+def load_tracker_entries(json_path: str) -> List[Entry]:
+    """
+    Entries from a TradeTracker JSON snapshot (open and closed trades)
+
+    Args:
+        json_path: Path to logs/trades/<dex>.json
+
+    Returns:
+        Entries sorted by time
+    """
+    with open(json_path) as f:
+        trades = json.load(f)
+
+    entries = []
+    for trade in trades:
+        try:
+            entries.append(Entry(
+                symbol=trade['symbol'],
+                side=_normalize_side(trade.get('side')),
+                time=datetime.fromisoformat(trade['timestamp']),
+                price=float(trade['entry_price']) if trade.get('entry_price') else None
+            ))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug(f"Skipping tracker trade {trade.get('trade_id')}: {e}")
+    entries.sort(key=lambda e: e.time)
+    logger.info(f"✅ Loaded {len(entries)} entries from {os.path.basename(json_path)}")
+    return entries
+
+
+def candle_path(candle_dir: str, symbol: str) -> str:
+    """Cache file for a symbol (slashes in Hibachi symbols become underscores)"""
+    return os.path.join(candle_dir, f"{symbol.replace('/', '_')}.csv")
+
+
+def save_candles(df: pd.DataFrame, candle_dir: str, symbol: str) -> str:
+    """
+    Cache a kline DataFrame, merging with any candles already on disk
+
+    Args:
+        df: DataFrame with timestamp, open, high, low, close, volume
+        candle_dir: Cache directory
+        symbol: Market symbol
+
+    Returns:
+        Path written
+    """
+    os.makedirs(candle_dir, exist_ok=True)
+    path = candle_path(candle_dir, symbol)
+    frame = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']].copy()
+    frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+    if os.path.exists(path):
+        cached = pd.read_csv(path, parse_dates=['timestamp'])
+        frame = pd.concat([cached, frame])
+    frame = frame.drop_duplicates('timestamp', keep='last').sort_values('timestamp')
+    frame.to_csv(path, index=False)
+    return path
+
+
+def load_candles_dir(candle_dir: str, symbols: Optional[Iterable[str]] = None) -> Dict[str, Candles]:
+    """
+    Load cached candles
+
+    Args:
+        candle_dir: Directory of <SYMBOL>.csv files
+        symbols: Only these symbols (default: every file in the directory)
+
+    Returns:
+        Dict of symbol -> Candles
+    """
+    if symbols is None:
+        symbols = [name[:-4].replace('_', '/') for name in os.listdir(candle_dir) if name.endswith('.csv')]
+
+    candles = {}
+    for symbol in symbols:
+        path = candle_path(candle_dir, symbol)
+        if not os.path.exists(path):
+            logger.warning(f"No cached candles for {symbol} ({path})")
+            continue
+        df = pd.read_csv(path)
+        if df.empty:
+            continue
+        candles[symbol] = Candles.from_frame(symbol, df)
+    logger.info(f"✅ Loaded candles for {len(candles)} symbols from {candle_dir}")
+    return candles
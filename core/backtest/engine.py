@@ -0,0 +1,409 @@
+"""
+Exit Rule Backtest Engine
+Replays position entries over historical candles and applies exit rules
+
+Two engines over the same sampled price paths:
+
+- run_vectorized(): NumPy evaluation of TP / SL / cut-loser / time exit /
+  trailing / breakeven for every entry at once. Exit parameters are plain
+  numbers (ExitParams), so thousands of combinations can be swept.
+- replay_rules(): event-driven replay through the live exit-rule classes
+  (StrategyAExitRules, StrategyBExitRules, HardExitRules, the fast exit
+  monitor's trailing logic) unchanged, on a simulated clock. Slower; used
+  to validate the vectorized engine and to run rules that are not
+  parameterized.
+
+Prices are sampled at each candle close from the bar containing the entry
+(the way the fast exit monitor polls), fees and slippage are charged on
+both sides.
+
+Usage:
+    paths = build_paths(entries, candles, horizon_hours=96)
+    result = run_vectorized(paths, ExitParams.strategy_a(), fee_bps=4.5, slippage_bps=2)
+    print(summarize(result))
+"""
+
+import contextlib
+import logging
+import math
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .data import Candles, Entry
+
+logger = logging.getLogger(__name__)
+
+# Exit reason codes (index into EXIT_REASONS)
+EXIT_REASONS = ["END_OF_DATA", "TRAILING_STOP", "BREAKEVEN_STOP", "TAKE_PROFIT", "STOP_LOSS", "CUT_LOSER", "TIME_EXIT"]
+END, TRAILING, BREAKEVEN, TAKE_PROFIT, STOP_LOSS, CUT_LOSER, TIME_EXIT = range(len(EXIT_REASONS))
+
+
+@dataclass
+class ExitParams:
+    """Exit rule parameters (percentages in P&L percent, e.g. 4.0 = +4%)"""
+    take_profit_pct: float = 8.0
+    stop_loss_pct: float = 4.0
+    max_hold_hours: float = 48.0
+    time_exit_min_pnl: Optional[float] = None     # Time exit only at/above this P&L (None: always)
+    cut_loser_hours: Optional[float] = 4.0        # Close losing positions after this long (None: off)
+    trailing_trigger_pct: Optional[float] = None  # Start trailing once peak P&L reaches this (None: off)
+    trailing_distance_pct: float = 2.0            # Close when P&L falls this far below the peak
+    trailing_requires_profit: bool = False        # Only trail out while P&L > 0 (Strategy B)
+    breakeven_trigger_pct: Optional[float] = None  # After peak reaches this, close at P&L <= 0
+
+    @classmethod
+    def strategy_a(cls) -> "ExitParams":
+        """Hibachi: StrategyAExitRules + FastExitMonitor trailing/breakeven"""
+        from hibachi_agent.execution.fast_exit_monitor import FastExitMonitor
+        from hibachi_agent.execution.strategy_a_exit_rules import StrategyAExitRules as rules
+
+        with quiet_loggers(FastExitMonitor.__module__):
+            monitor = FastExitMonitor(None, None, None, None, enabled=False)
+        return cls(
+            take_profit_pct=rules.TAKE_PROFIT_PCT,
+            stop_loss_pct=rules.STOP_LOSS_PCT,
+            max_hold_hours=rules.MAX_HOLD_HOURS,
+            cut_loser_hours=4.0,
+            trailing_trigger_pct=monitor.TRAILING_TRIGGER_PCT,
+            trailing_distance_pct=monitor.TRAILING_DISTANCE_PCT,
+            breakeven_trigger_pct=monitor.BREAKEVEN_TRIGGER_PCT,
+        )
+
+    @classmethod
+    def strategy_b(cls) -> "ExitParams":
+        """Extended: StrategyBExitRules (own trailing stop, profitable-only time exit)"""
+        from extended_agent.execution.strategy_b_exit_rules import StrategyBExitRules as rules
+
+        return cls(
+            take_profit_pct=rules.TAKE_PROFIT_PCT,
+            stop_loss_pct=rules.STOP_LOSS_PCT,
+            max_hold_hours=rules.MAX_HOLD_HOURS,
+            time_exit_min_pnl=0.5,
+            cut_loser_hours=4.0,
+            trailing_trigger_pct=rules.TRAILING_ACTIVATION_PCT,
+            trailing_distance_pct=rules.TRAILING_DISTANCE_PCT,
+            trailing_requires_profit=True,
+        )
+
+    @classmethod
+    def hard_rules(cls) -> "ExitParams":
+        """HardExitRules defaults (TP/SL + profitable-only time exit)"""
+        from hibachi_agent.execution.hard_exit_rules import HardExitRules
+
+        rules = HardExitRules()
+        return cls(
+            take_profit_pct=rules.profit_target_pct,
+            stop_loss_pct=rules.stop_loss_pct,
+            max_hold_hours=rules.max_hold_hours,
+            time_exit_min_pnl=0.5,
+            cut_loser_hours=None,
+        )
+
+
+@dataclass
+class PricePaths:
+    """P&L paths for replayable entries, sampled at candle closes (E entries x H samples)"""
+    entries: List[Entry]
+    entry_ts: np.ndarray   # (E,) epoch seconds
+    entry_price: np.ndarray  # (E,)
+    times: np.ndarray      # (E, H) sample epoch seconds
+    prices: np.ndarray     # (E, H) close at each sample
+    pnl: np.ndarray        # (E, H) P&L percent (NaN past the end of data)
+    peak: np.ndarray       # (E, H) running max of pnl
+    hours: np.ndarray      # (E, H) hours since entry
+    valid: np.ndarray      # (E, H) sample exists
+    last: np.ndarray       # (E,) index of the last valid sample
+
+
+@dataclass
+class BacktestResult:
+    """Per-trade outcome of one backtest run"""
+    exit_idx: np.ndarray
+    reason: np.ndarray
+    gross_pnl_pct: np.ndarray
+    net_pnl_pct: np.ndarray
+    hold_hours: np.ndarray
+
+
+def _epoch(dt: datetime) -> float:
+    """Naive datetimes are UTC (exports and kline timestamps are UTC)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def build_paths(entries: List[Entry], candles: Dict[str, Candles], horizon_hours: float = 96.0) -> PricePaths:
+    """
+    Sample each entry's P&L path from its symbol's candles
+
+    Args:
+        entries: Entries to replay
+        candles: Dict of symbol -> Candles
+        horizon_hours: Longest a position is followed (END_OF_DATA exit after)
+
+    Returns:
+        PricePaths (entries without candle coverage are dropped)
+    """
+    rows = []
+    for entry in entries:
+        series = candles.get(entry.symbol)
+        if series is None or len(series.timestamps) == 0:
+            continue
+        t0 = _epoch(entry.time)
+        start = int(np.searchsorted(series.timestamps, t0, side='right')) - 1
+        if start < 0 or series.timestamps[start] + series.interval_seconds <= t0:
+            continue  # entry outside candle coverage
+        count = min(
+            int(math.ceil(horizon_hours * 3600 / series.interval_seconds)) + 1,
+            len(series.timestamps) - start
+        )
+        price = entry.price if entry.price else float(series.close[start])
+        rows.append((entry, t0, price, series, start, count))
+
+    skipped = len(entries) - len(rows)
+    if skipped:
+        logger.warning(f"⚠️ {skipped}/{len(entries)} entries have no candle coverage - skipped")
+
+    width = max((r[5] for r in rows), default=1)
+    n = len(rows)
+    times = np.full((n, width), np.nan)
+    prices = np.full((n, width), np.nan)
+    entry_ts = np.zeros(n)
+    entry_price = np.zeros(n)
+    sign = np.zeros(n)
+
+    for i, (entry, t0, price, series, start, count) in enumerate(rows):
+        times[i, :count] = series.timestamps[start:start + count] + series.interval_seconds
+        prices[i, :count] = series.close[start:start + count]
+        entry_ts[i] = t0
+        entry_price[i] = price
+        sign[i] = 1.0 if entry.side == 'LONG' else -1.0
+
+    valid = ~np.isnan(prices)
+    pnl = (prices - entry_price[:, None]) / entry_price[:, None] * 100 * sign[:, None]
+    peak = np.fmax.accumulate(pnl, axis=1)
+    hours = (times - entry_ts[:, None]) / 3600
+    last = valid.sum(axis=1) - 1
+
+    return PricePaths(
+        entries=[r[0] for r in rows], entry_ts=entry_ts, entry_price=entry_price,
+        times=times, prices=prices, pnl=pnl, peak=peak, hours=hours, valid=valid, last=last,
+    )
+
+
+def run_vectorized(paths: PricePaths, params: ExitParams, fee_bps: float = 4.5,
+                   slippage_bps: float = 2.0) -> BacktestResult:
+    """
+    Apply parameterized exit rules to every entry at once
+
+    Rules fire at the first sample where any condition holds; when several
+    hold on the same sample the reason follows the live check order.
+
+    Args:
+        paths: From build_paths()
+        params: Exit parameters
+        fee_bps: Fee per side in basis points
+        slippage_bps: Slippage per side in basis points
+
+    Returns:
+        BacktestResult
+    """
+    pnl, peak, hours = paths.pnl, paths.peak, paths.hours
+
+    with np.errstate(invalid='ignore'):
+        trailing = None
+        if params.trailing_trigger_pct is not None:
+            trailing = (peak >= params.trailing_trigger_pct) & (peak - pnl >= params.trailing_distance_pct)
+            if params.trailing_requires_profit:
+                trailing &= pnl > 0
+
+        time_exit = hours >= params.max_hold_hours
+        if params.time_exit_min_pnl is not None:
+            time_exit &= pnl >= params.time_exit_min_pnl
+
+        # Live check order: monitor trailing/breakeven first, then the rule class
+        checks = []
+        if trailing is not None and not params.trailing_requires_profit:
+            checks.append((TRAILING, trailing))
+        if params.breakeven_trigger_pct is not None:
+            checks.append((BREAKEVEN, (peak >= params.breakeven_trigger_pct) & (pnl <= 0)))
+        checks.append((TAKE_PROFIT, pnl >= params.take_profit_pct))
+        checks.append((STOP_LOSS, pnl <= -params.stop_loss_pct))
+        if params.cut_loser_hours is not None:
+            checks.append((CUT_LOSER, (hours >= params.cut_loser_hours) & (pnl < 0)))
+        if trailing is not None and params.trailing_requires_profit:
+            checks.append((TRAILING, trailing))
+        checks.append((TIME_EXIT, time_exit))
+
+    fired = np.zeros(pnl.shape, dtype=bool)
+    for _, mask in checks:
+        fired |= mask
+    fired &= paths.valid
+
+    has_exit = fired.any(axis=1)
+    exit_idx = np.where(has_exit, fired.argmax(axis=1), paths.last)
+    rows = np.arange(len(exit_idx))
+
+    reason = np.full(len(exit_idx), END, dtype=np.int8)
+    for code, mask in reversed(checks):
+        hit = has_exit & mask[rows, exit_idx]
+        reason[hit] = code
+
+    gross = pnl[rows, exit_idx] if len(rows) else np.zeros(0)
+    net = gross - 2 * (fee_bps + slippage_bps) / 100
+    return BacktestResult(
+        exit_idx=exit_idx, reason=reason, gross_pnl_pct=gross,
+        net_pnl_pct=net, hold_hours=hours[rows, exit_idx] if len(rows) else np.zeros(0),
+    )
+
+
+def summarize(result: BacktestResult) -> Dict:
+    """
+    Aggregate per-trade results (equal notional per trade)
+
+    Returns:
+        Dict with trades, win_rate, total/avg P&L %, profit factor,
+        max drawdown %, avg hold hours and exit reason counts
+    """
+    net = result.net_pnl_pct
+    n = len(net)
+    if n == 0:
+        return {'trades': 0, 'win_rate': 0.0, 'total_pnl_pct': 0.0, 'avg_pnl_pct': 0.0,
+                'profit_factor': 0.0, 'max_drawdown_pct': 0.0, 'avg_hold_hours': 0.0, 'exits': {}}
+
+    wins = net[net > 0].sum()
+    losses = -net[net < 0].sum()
+    equity = np.cumsum(net)
+    drawdown = np.maximum.accumulate(np.maximum(equity, 0)) - equity
+    counts = np.bincount(result.reason, minlength=len(EXIT_REASONS))
+
+    return {
+        'trades': n,
+        'win_rate': float((net > 0).mean()),
+        'total_pnl_pct': float(net.sum()),
+        'avg_pnl_pct': float(net.mean()),
+        'profit_factor': float(wins / losses) if losses > 0 else float('inf'),
+        'max_drawdown_pct': float(drawdown.max()),
+        'avg_hold_hours': float(result.hold_hours.mean()),
+        'exits': {EXIT_REASONS[i]: int(c) for i, c in enumerate(counts) if c},
+    }
+
+
+class _SimDatetime(datetime):
+    """datetime whose now() returns the replay clock"""
+    current: Optional[datetime] = None
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@contextlib.contextmanager
+def simulated_clock(*module_names: str):
+    """Point datetime.now() in the given modules at the replay clock"""
+    modules = [sys.modules[name] for name in module_names]
+    saved = [module.datetime for module in modules]
+    try:
+        for module in modules:
+            module.datetime = _SimDatetime
+        yield _SimDatetime
+    finally:
+        for module, original in zip(modules, saved):
+            module.datetime = original
+
+
+@contextlib.contextmanager
+def quiet_loggers(*names: str):
+    """Silence per-exit INFO logging from the rule classes during replays"""
+    loggers = [logging.getLogger(name) for name in names]
+    levels = [lg.level for lg in loggers]
+    try:
+        for lg in loggers:
+            lg.setLevel(logging.WARNING)
+        yield
+    finally:
+        for lg, level in zip(loggers, levels):
+            lg.setLevel(level)
+
+
+def replay_rules(paths: PricePaths, rules, monitor=None, fee_bps: float = 4.5,
+                 slippage_bps: float = 2.0) -> BacktestResult:
+    """
+    Event-driven replay through live exit-rule objects (unchanged)
+
+    Each sample does what the fast exit monitor does: optional
+    monitor.check_trailing_stop(), then rules.check_should_force_close().
+
+    Args:
+        paths: From build_paths()
+        rules: StrategyAExitRules / StrategyBExitRules / HardExitRules instance
+        monitor: Optional FastExitMonitor whose trailing/breakeven logic runs first
+        fee_bps: Fee per side in basis points
+        slippage_bps: Slippage per side in basis points
+
+    Returns:
+        BacktestResult (reason codes parsed from the rule's reason text)
+    """
+    modules = [type(rules).__module__] + ([type(monitor).__module__] if monitor is not None else [])
+    n = len(paths.entries)
+    exit_idx = paths.last.copy()
+    reason = np.full(n, END, dtype=np.int8)
+
+    with simulated_clock(*modules) as clock, quiet_loggers(*modules):
+        for i, entry in enumerate(paths.entries):
+            key = f"{entry.symbol}#{i}"
+            entry_time = datetime.fromtimestamp(paths.entry_ts[i], tz=timezone.utc).replace(tzinfo=None)
+            tracker_data = {'timestamp': entry_time.isoformat(), 'entry_price': paths.entry_price[i]}
+
+            for k in range(paths.last[i] + 1):
+                clock.current = datetime.fromtimestamp(paths.times[i, k], tz=timezone.utc).replace(tzinfo=None)
+                pnl_pct = paths.pnl[i, k]
+                close, why = False, ""
+                if monitor is not None:
+                    close, why = monitor.check_trailing_stop(key, pnl_pct)
+                if not close:
+                    position = {
+                        'symbol': key,
+                        'side': entry.side,
+                        'entry_price': paths.entry_price[i],
+                        'current_price': paths.prices[i, k],
+                        'pnl_pct': pnl_pct / 100,
+                    }
+                    close, why = rules.check_should_force_close(position, {}, tracker_data)
+                if close:
+                    exit_idx[i] = k
+                    reason[i] = _reason_code(why)
+                    break
+
+            if hasattr(rules, 'unregister_position'):
+                rules.unregister_position(key)
+            if monitor is not None:
+                monitor.clear_trailing_stop(key)
+
+    rows = np.arange(n)
+    gross = paths.pnl[rows, exit_idx] if n else np.zeros(0)
+    return BacktestResult(
+        exit_idx=exit_idx, reason=reason, gross_pnl_pct=gross,
+        net_pnl_pct=gross - 2 * (fee_bps + slippage_bps) / 100,
+        hold_hours=paths.hours[rows, exit_idx] if n else np.zeros(0),
+    )
+
+
+def _reason_code(text: str) -> int:
+    """Map a rule's reason string to an exit reason code"""
+    text = text.upper()
+    for code, keys in (
+        (TRAILING, ("TRAILING",)),
+        (BREAKEVEN, ("BREAKEVEN",)),
+        (TAKE_PROFIT, ("TAKE PROFIT", "PROFIT TARGET")),
+        (STOP_LOSS, ("STOP LOSS",)),
+        (CUT_LOSER, ("CUT LOSER",)),
+        (TIME_EXIT, ("TIME EXIT",)),
+    ):
+        if any(key in text for key in keys):
+            return code
+    return END
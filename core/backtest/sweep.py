@@ -0,0 +1,111 @@
+"""
+Exit Parameter Sweep
+Grid search over ExitParams with the vectorized engine, spread across cores
+
+Price paths are built once and handed to each worker process at startup
+(pool initializer), so a task only carries its parameter combos and the
+per-combo work is a handful of NumPy passes.
+
+Usage:
+    results = sweep(paths, {'take_profit_pct': [4, 6, 8], 'stop_loss_pct': [2, 3, 4]},
+                    base=ExitParams.strategy_a())
+    for row in results[:10]:
+        print(row)
+"""
+
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+from typing import Dict, List, Optional, Sequence
+
+from .engine import ExitParams, PricePaths, run_vectorized, summarize
+
+logger = logging.getLogger(__name__)
+
+# Set per worker process by _init_worker
+_worker_paths: Optional[PricePaths] = None
+
+
+def expand_grid(grid: Dict[str, Sequence], base: Optional[ExitParams] = None) -> List[ExitParams]:
+    """
+    Every combination of the grid values applied on top of base params
+
+    Args:
+        grid: ExitParams field name -> candidate values
+        base: Params for fields not in the grid (default: ExitParams())
+
+    Returns:
+        List of ExitParams
+    """
+    base = base or ExitParams()
+    names = list(grid)
+    return [replace(base, **dict(zip(names, values))) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def _init_worker(paths: PricePaths):
+    global _worker_paths
+    _worker_paths = paths
+
+
+def _evaluate(paths: PricePaths, combos: List[ExitParams], fee_bps: float, slippage_bps: float) -> List[Dict]:
+    rows = []
+    for params in combos:
+        stats = summarize(run_vectorized(paths, params, fee_bps=fee_bps, slippage_bps=slippage_bps))
+        rows.append({**asdict(params), **stats})
+    return rows
+
+
+def _evaluate_chunk(combos: List[ExitParams], fee_bps: float, slippage_bps: float) -> List[Dict]:
+    return _evaluate(_worker_paths, combos, fee_bps, slippage_bps)
+
+
+def sweep(
+    paths: PricePaths,
+    grid: Dict[str, Sequence],
+    base: Optional[ExitParams] = None,
+    fee_bps: float = 4.5,
+    slippage_bps: float = 2.0,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    sort_by: str = 'total_pnl_pct'
+) -> List[Dict]:
+    """
+    Evaluate every parameter combination
+
+    Args:
+        paths: From build_paths()
+        grid: ExitParams field name -> candidate values
+        base: Params for fields not in the grid
+        fee_bps: Fee per side in basis points
+        slippage_bps: Slippage per side in basis points
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        chunk_size: Combos per task
+        sort_by: Summary key to sort by (descending)
+
+    Returns:
+        One dict per combo (params + summary stats), best first
+    """
+    combos = expand_grid(grid, base)
+    workers = workers or os.cpu_count() or 1
+    chunks = [combos[i:i + chunk_size] for i in range(0, len(combos), chunk_size)]
+    start = time.time()
+
+    if workers <= 1 or len(chunks) <= 1:
+        results = _evaluate(paths, combos, fee_bps, slippage_bps)
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(paths,)) as pool:
+            futures = [pool.submit(_evaluate_chunk, chunk, fee_bps, slippage_bps) for chunk in chunks]
+            for future in futures:
+                results.extend(future.result())
+
+    elapsed = time.time() - start
+    logger.info(
+        f"✅ Swept {len(combos)} combos x {len(paths.entries)} trades in {elapsed:.2f}s "
+        f"({workers} worker{'s' if workers != 1 else ''})"
+    )
+    results.sort(key=lambda row: row[sort_by], reverse=True)
+    return results
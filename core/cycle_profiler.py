@@ -0,0 +1,235 @@
+"""
+Cycle Profiler - per-phase timing for the bots' run_once decision cycles
+
+A slow cycle used to show up only as one "Loaded N markets in X s" line, so
+there was no telling whether the exchange, the LLM or our own code was slow.
+The profiler times each phase of a cycle (positions, markets, exits, prompt,
+llm, parse, validation, execution) and keeps rolling p50/p95/p99 per phase
+over the last `window` cycles.
+
+Two ways to time a phase, both summed per cycle when a phase runs more than
+once (e.g. LLM retries):
+- with profiler.span("llm"): ...   around a call or block
+- profiler.phase("prompt")         lap marker for long linear code: ends the
+                                   previous phase and starts this one
+
+After every cycle the stats are written to logs/metrics/<bot>_cycles.json
+($CYCLE_METRICS_DIR) and logged as a one-line breakdown; serve_http()
+exposes the same JSON at http://127.0.0.1:<port>/cycles.
+
+Usage:
+    profiler = CycleProfiler("lighter")
+    await profiler.serve_http()
+    with profiler.cycle():
+        profiler.phase("positions")
+        ...
+        with profiler.span("llm"):
+            response = await model.aquery(prompt)
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIR = "logs/metrics"
+DIR_ENV = "CYCLE_METRICS_DIR"
+
+# Local HTTP ports, one per bot so they can share a host (override: <BOT>_METRICS_PORT, 0 = off)
+METRICS_PORTS = {
+    'lighter': 9310,
+    'hibachi': 9311,
+    'pacifica': 9312,
+    'extended': 9313,
+    'paradex': 9314,
+}
+
+
+class PhaseHistogram:
+    """Rolling latency samples for one phase"""
+
+    def __init__(self, window: int = 500):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.last_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.samples.append(elapsed_ms)
+        self.count += 1
+        self.last_ms = elapsed_ms
+
+    def to_dict(self) -> Dict:
+        """Export as {count, last_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms} over the window"""
+        if not self.samples:
+            return {'count': 0, 'last_ms': 0.0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0,
+                    'p99_ms': 0.0, 'max_ms': 0.0}
+        samples = np.fromiter(self.samples, dtype=float, count=len(self.samples))
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {
+            'count': self.count,
+            'last_ms': round(self.last_ms, 1),
+            'mean_ms': round(float(samples.mean()), 1),
+            'p50_ms': round(float(p50), 1),
+            'p95_ms': round(float(p95), 1),
+            'p99_ms': round(float(p99), 1),
+            'max_ms': round(float(samples.max()), 1),
+        }
+
+
+class CycleProfiler:
+    """Phase timings for one bot's decision cycles"""
+
+    def __init__(
+        self,
+        bot_name: str,
+        window: int = 500,
+        metrics_path: Optional[str] = None,
+        port: Optional[int] = None
+    ):
+        """
+        Args:
+            bot_name: Used for the metrics file name and default port
+            window: Cycles kept for the rolling percentiles
+            metrics_path: JSON file rewritten after every cycle
+                          (default: $CYCLE_METRICS_DIR or logs/metrics, <bot>_cycles.json)
+            port: Local HTTP port for serve_http() (default: <BOT>_METRICS_PORT or METRICS_PORTS)
+        """
+        self.bot_name = bot_name
+        self.window = window
+        directory = os.getenv(DIR_ENV) or DEFAULT_DIR
+        self.metrics_path = metrics_path or os.path.join(directory, f"{bot_name}_cycles.json")
+        if port is None:
+            port = int(os.getenv(f"{bot_name.upper()}_METRICS_PORT", METRICS_PORTS.get(bot_name, 0)))
+        self.port = port
+        self.histograms: Dict[str, PhaseHistogram] = {}
+        self.cycles = 0
+        self.last_cycle: Dict[str, float] = {}
+        self._current: Optional[Dict[str, float]] = None     # phase -> ms, while a cycle runs
+        self._phase: Optional[Tuple[str, float]] = None      # open lap: (name, start)
+        self._runner = None
+
+    def _histogram(self, name: str) -> PhaseHistogram:
+        if name not in self.histograms:
+            self.histograms[name] = PhaseHistogram(self.window)
+        return self.histograms[name]
+
+    def _add(self, name: str, elapsed_ms: float):
+        if self._current is not None:
+            self._current[name] = self._current.get(name, 0.0) + elapsed_ms
+        else:
+            self._histogram(name).record(elapsed_ms)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block as phase `name`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, (time.perf_counter() - start) * 1000)
+
+    def phase(self, name: str):
+        """End the open lap (if any) and start timing phase `name`"""
+        self.end_phase()
+        self._phase = (name, time.perf_counter())
+
+    def end_phase(self):
+        """End the open lap, e.g. before code that shouldn't be attributed to it"""
+        if self._phase is not None:
+            name, start = self._phase
+            self._phase = None
+            self._add(name, (time.perf_counter() - start) * 1000)
+
+    def add_stages(self, stage_timings: Dict[str, float], prefix: str = ""):
+        """
+        Record sub-phases timed elsewhere
+
+        Args:
+            stage_timings: name -> seconds (e.g. ConcurrentFetchEngine.stage_timings; 'total' is skipped)
+            prefix: Prepended to each name (e.g. "markets.")
+        """
+        for name, seconds in stage_timings.items():
+            if name != 'total':
+                self._add(f"{prefix}{name}", seconds * 1000)
+
+    @contextmanager
+    def cycle(self):
+        """One decision cycle: phase totals are recorded, logged and dumped when it ends"""
+        self._current = {}
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.end_phase()
+            total_ms = (time.perf_counter() - start) * 1000
+            phases, self._current = self._current, None
+            for name, elapsed_ms in phases.items():
+                self._histogram(name).record(elapsed_ms)
+            self._histogram('cycle').record(total_ms)
+            self.cycles += 1
+            self.last_cycle = {'cycle': total_ms, **phases}
+            breakdown = " · ".join(f"{name} {ms / 1000:.1f}s" for name, ms in phases.items())
+            logger.info(f"⏱️ Cycle {total_ms / 1000:.1f}s | {breakdown or 'no phases'}")
+            self.dump()
+
+    def snapshot(self) -> Dict:
+        """All phase stats as a JSON-ready dict"""
+        return {
+            'bot': self.bot_name,
+            'updated_at': time.time(),
+            'cycles': self.cycles,
+            'last_cycle_ms': {name: round(ms, 1) for name, ms in self.last_cycle.items()},
+            'phases': {name: hist.to_dict() for name, hist in self.histograms.items()},
+        }
+
+    def dump(self) -> bool:
+        """Write snapshot() to metrics_path atomically; True on success"""
+        tmp_path = f"{self.metrics_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.metrics_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(tmp_path, self.metrics_path)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write cycle metrics to {self.metrics_path}: {e}")
+            return False
+
+    async def serve_http(self, host: str = "127.0.0.1") -> bool:
+        """
+        Serve snapshot() at http://host:port/cycles (returns False if disabled or the port is taken)
+        """
+        if not self.port or self._runner is not None:
+            return False
+        from aiohttp import web
+
+        async def handle(request):
+            return web.json_response(self.snapshot())
+
+        app = web.Application()
+        app.router.add_get('/cycles', handle)
+        app.router.add_get('/', handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, self.port).start()
+        except OSError as e:
+            logger.warning(f"⚠️ Cycle metrics endpoint not started on {host}:{self.port}: {e}")
+            await runner.cleanup()
+            return False
+        self._runner = runner
+        logger.info(f"⏱️ Cycle metrics at http://{host}:{self.port}/cycles")
+        return True
+
+    async def close(self):
+        """Stop the HTTP endpoint"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,48 @@
+"""
+Shared grid market making core
+
+One async GridEngine per (venue, symbol), venue access through pluggable
+VenueAdapters, and a GridRunner that runs them all on one event loop.
+"""
+
+from .adapters import (
+    ADAPTERS,
+    ExtendedAdapter,
+    HibachiAdapter,
+    MarketInfo,
+    NadoAdapter,
+    OrderSync,
+    ParadexAdapter,
+    VenueAdapter,
+)
+from .config import VENUE_PRESETS, GridConfig, preset_for
+from .engine import GridEngine
+from .metrics import GridMetrics, MetricsRegistry
+from .price_ring import PriceRing
+from .runner import GridRunner, parse_bot_spec
+from .sim import SimVenue
+from .ticks import TickRecorder, load_ticks, tick_path
+
+__all__ = [
+    'ADAPTERS',
+    'ExtendedAdapter',
+    'GridConfig',
+    'GridEngine',
+    'GridMetrics',
+    'GridRunner',
+    'HibachiAdapter',
+    'MarketInfo',
+    'MetricsRegistry',
+    'NadoAdapter',
+    'OrderSync',
+    'ParadexAdapter',
+    'PriceRing',
+    'SimVenue',
+    'TickRecorder',
+    'VENUE_PRESETS',
+    'VenueAdapter',
+    'load_ticks',
+    'parse_bot_spec',
+    'preset_for',
+    'tick_path',
+]
@@ -0,0 +1,662 @@
+"""
+Venue adapters for the shared grid engine
+
+A VenueAdapter is the only venue-specific code the GridEngine talks to:
+top of book, balance, position, open orders, limit placement and
+cancellation. One adapter (one SDK client / HTTP session) is shared by every
+engine quoting on that venue, so several symbols cost one login and one
+connection pool.
+
+All methods are async. Synchronous SDKs (paradex_py) are run through
+asyncio.to_thread so a slow request on one venue never stalls the other
+engines sharing the event loop.
+
+Errors follow the bots' convention: log and return None / empty.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.grid_reconciler import GridLevel
+
+logger = logging.getLogger(__name__)
+
+LIVE_STATUSES = ('NEW', 'OPEN', 'UNTRIGGERED', 'PENDING')
+# Statuses of orders that can no longer fill (get_order_status answers None for anything else)
+FINAL_STATUSES = ('FILLED', 'CANCELLED', 'REJECTED', 'EXPIRED')
+
+
+@dataclass
+class MarketInfo:
+    """Order constraints for one symbol"""
+    tick_size: float
+    step_size: float
+    min_notional: float
+
+
+@dataclass
+class OrderSync:
+    """Result of comparing tracked orders with the venue"""
+    live: Set[str] = field(default_factory=set)
+    filled: Dict[str, float] = field(default_factory=dict)  # order_id -> filled size
+
+
+class VenueAdapter:
+    """
+    Interface the GridEngine trades through
+
+    Subclasses implement the abstract methods; the defaults for cancel_orders
+    and sync_orders are built on the smaller primitives.
+    """
+
+    name = "venue"
+    # False when the venue can only cancel everything (the engine then
+    # replaces the whole grid instead of patching single levels)
+    supports_partial_cancel = True
+
+    async def connect(self):
+        """Log in / verify credentials. Called once before any engine starts."""
+
+    async def close(self):
+        """Release sessions"""
+
+    async def market_info(self, symbol: str) -> Optional[MarketInfo]:
+        raise NotImplementedError
+
+    async def get_bbo(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """(best bid, best ask) or None"""
+        raise NotImplementedError
+
+    async def get_balance(self) -> Optional[float]:
+        """Account equity in USD"""
+        raise NotImplementedError
+
+    async def get_position(self, symbol: str) -> Optional[float]:
+        """Signed position size in base units (positive = long)"""
+        raise NotImplementedError
+
+    async def get_open_order_ids(self, symbol: str) -> Optional[Set[str]]:
+        """Ids of resting orders, or None if the request failed"""
+        raise NotImplementedError
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Optional[Tuple[str, float]]:
+        """(status, filled size) of an order that left the book, or None if unknown"""
+        raise NotImplementedError
+
+    async def place_limit(self, symbol: str, level: GridLevel) -> Optional[str]:
+        """Submit one maker order; returns its id or None"""
+        raise NotImplementedError
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        raise NotImplementedError
+
+    async def cancel_all(self, symbol: str) -> bool:
+        raise NotImplementedError
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str]) -> bool:
+        """Cancel several orders (one request where the venue allows it)"""
+        results = await asyncio.gather(
+            *(self.cancel_order(symbol, oid) for oid in order_ids), return_exceptions=True
+        )
+        return all(r is True for r in results)
+
+    async def sync_orders(self, symbol: str, tracked: Dict[str, Dict]) -> Optional[OrderSync]:
+        """
+        Split tracked orders into still-resting and filled
+
+        Default: a tracked order missing from the open orders is looked up
+        and counted only if its status is FILLED (cancelled, rejected and
+        expired orders are dropped). Orders whose status can't be read stay
+        tracked until the next sync.
+        """
+        live = await self.get_open_order_ids(symbol)
+        if live is None:
+            return None
+        sync = OrderSync(live=live & set(tracked))
+        gone = [oid for oid in tracked if oid not in live]
+        statuses = await asyncio.gather(
+            *(self.get_order_status(symbol, oid) for oid in gone), return_exceptions=True
+        )
+        for order_id, status in zip(gone, statuses):
+            if status is None or isinstance(status, BaseException):
+                sync.live.add(order_id)
+            elif status[0] == 'FILLED':
+                sync.filled[order_id] = status[1] or tracked[order_id]['size']
+        return sync
+
+
+# ----------------------------------------------------------------------
+# Paradex (paradex_py, synchronous REST client)
+# ----------------------------------------------------------------------
+
+class ParadexAdapter(VenueAdapter):
+    """
+    Paradex via paradex_py's api_client
+
+    Accepts any object exposing the api_client surface, including
+    dexes.paradex.LocalParadexClient for paper runs.
+    """
+
+    name = "paradex"
+
+    def __init__(self, client=None, name: Optional[str] = None):
+        """
+        Args:
+            client: Connected ParadexSubkey / LocalParadexClient (default:
+                log in from PARADEX_* env vars on connect)
+            name: Label override (e.g. 'local' for paper runs)
+        """
+        self.client = client
+        if name:
+            self.name = name
+        self._markets: Optional[List[Dict]] = None
+
+    async def connect(self):
+        if self.client is not None:
+            return
+        from paradex_py import ParadexSubkey
+
+        private_key = os.getenv("PARADEX_PRIVATE_SUBKEY")
+        if not private_key:
+            raise ValueError("PARADEX_PRIVATE_SUBKEY not set in .env")
+        self.client = await asyncio.to_thread(
+            ParadexSubkey,
+            env='prod',
+            l2_private_key=private_key,
+            l2_address=os.getenv('PARADEX_ACCOUNT_ADDRESS'),
+        )
+
+    def _call(self, method: str, *args, **kwargs):
+        return asyncio.to_thread(getattr(self.client.api_client, method), *args, **kwargs)
+
+    async def market_info(self, symbol: str) -> Optional[MarketInfo]:
+        try:
+            if self._markets is None:
+                self._markets = (await self._call('fetch_markets')).get('results', [])
+            for market in self._markets:
+                if market.get('symbol') == symbol:
+                    return MarketInfo(
+                        tick_size=float(market.get('price_tick_size', 1)),
+                        step_size=float(market.get('order_size_increment', 0.00001)),
+                        min_notional=float(market.get('min_notional', 10)),
+                    )
+        except Exception as e:
+            logger.error(f"Paradex market info error: {e}")
+        return None
+
+    async def get_bbo(self, symbol: str) -> Optional[Tuple[float, float]]:
+        try:
+            bbo = await self._call('fetch_bbo', market=symbol)
+            if bbo:
+                return float(bbo['bid']), float(bbo['ask'])
+        except Exception as e:
+            logger.error(f"Paradex BBO error: {e}")
+        return None
+
+    async def get_balance(self) -> Optional[float]:
+        try:
+            account = await self._call('fetch_account_summary')
+            return float(account.account_value) if account else None
+        except Exception as e:
+            logger.error(f"Paradex balance error: {e}")
+            return None
+
+    async def get_position(self, symbol: str) -> Optional[float]:
+        try:
+            positions = await self._call('fetch_positions')
+            for pos in positions.get('results', []):
+                if pos.get('market') == symbol:
+                    return float(pos.get('size', 0))  # signed
+            return 0.0
+        except Exception as e:
+            logger.error(f"Paradex position error: {e}")
+            return None
+
+    async def _fetch_orders(self, symbol: str) -> Optional[List[Dict]]:
+        try:
+            orders = await self._call('fetch_orders', params={'market': symbol})
+            return (orders or {}).get('results', [])
+        except Exception as e:
+            logger.error(f"Paradex orders error: {e}")
+            return None
+
+    async def get_open_order_ids(self, symbol: str) -> Optional[Set[str]]:
+        orders = await self._fetch_orders(symbol)
+        if orders is None:
+            return None
+        return {str(o.get('id')) for o in orders if o.get('status') in LIVE_STATUSES}
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Optional[Tuple[str, float]]:
+        try:
+            order = await self._call('fetch_order', order_id=order_id)
+        except Exception as e:
+            logger.error(f"Paradex order {order_id} error: {e}")
+            return None
+        if not order or order.get('status') in LIVE_STATUSES:
+            return None
+        # Paradex closes every finished order; a fill is one with no cancel reason
+        filled = float(order.get('size', 0)) - float(order.get('remaining_size', 0))
+        if order.get('cancel_reason') or filled <= 0:
+            return 'CANCELLED', filled
+        return 'FILLED', filled
+
+    async def place_limit(self, symbol: str, level: GridLevel) -> Optional[str]:
+        from paradex_py.common.order import Order, OrderSide, OrderType
+
+        order = Order(
+            market=symbol,
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy if level.side == 'BUY' else OrderSide.Sell,
+            size=Decimal(str(level.size)),
+            limit_price=Decimal(str(level.price)),
+            instruction="POST_ONLY",
+        )
+        try:
+            result = await self._call('submit_order', order=order)
+        except Exception as e:
+            logger.error(f"Paradex {level.side} L{level.level} error: {e}")
+            return None
+        if result and result.get('id') and result.get('status') not in ('CLOSED', 'REJECTED'):
+            return str(result['id'])
+        return None
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        try:
+            await self._call('cancel_order', order_id=order_id)
+            return True
+        except Exception as e:
+            logger.debug(f"Paradex cancel error for {order_id}: {e}")
+            return False
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str]) -> bool:
+        if not hasattr(self.client.api_client, 'cancel_orders_batch'):
+            return await super().cancel_orders(symbol, order_ids)
+        from dexes.paradex.market_stream import parse_batch_cancel
+
+        try:
+            response = await self._call('cancel_orders_batch', order_ids=order_ids)
+        except Exception as e:
+            logger.error(f"Paradex batch cancel error: {e}")
+            return False
+        cancelled, missing = parse_batch_cancel(response, order_ids)
+        retried = await super().cancel_orders(symbol, missing) if missing else True
+        # ALREADY_CLOSED / NOT_FOUND ids (possibly fills) make this False so sync_orders settles them
+        return retried and len(cancelled) + len(missing) == len(order_ids)
+
+    async def cancel_all(self, symbol: str) -> bool:
+        ids = await self.get_open_order_ids(symbol)
+        if ids is None:
+            return False
+        return await self.cancel_orders(symbol, list(ids)) if ids else True
+
+
+# ----------------------------------------------------------------------
+# Hibachi (async HibachiSDK)
+# ----------------------------------------------------------------------
+
+class HibachiAdapter(VenueAdapter):
+    """Hibachi via dexes.hibachi.HibachiSDK (no POST_ONLY on this venue)"""
+
+    name = "hibachi"
+
+    def __init__(self, sdk=None):
+        self.sdk = sdk
+
+    async def connect(self):
+        if self.sdk is not None:
+            return
+        from dexes.hibachi.hibachi_sdk import HibachiSDK
+
+        api_key = os.getenv('HIBACHI_PUBLIC_KEY')
+        api_secret = os.getenv('HIBACHI_PRIVATE_KEY')
+        account_id = os.getenv('HIBACHI_ACCOUNT_ID')
+        if not api_key or not api_secret or not account_id:
+            raise ValueError("HIBACHI_PUBLIC_KEY, HIBACHI_PRIVATE_KEY, HIBACHI_ACCOUNT_ID required")
+        self.sdk = HibachiSDK(api_key, api_secret, account_id)
+
+    async def close(self):
+        if self.sdk is not None and hasattr(self.sdk, 'close'):
+            await self.sdk.close()
+
+    async def market_info(self, symbol: str) -> Optional[MarketInfo]:
+        info = await self.sdk.get_market_info(symbol)
+        if not info:
+            return None
+        return MarketInfo(
+            tick_size=float(info.get('tickSize', 0.1)),
+            step_size=float(info.get('minOrderSize', 0.0001)),
+            min_notional=float(info.get('minNotional', 1.0)),
+        )
+
+    async def get_bbo(self, symbol: str) -> Optional[Tuple[float, float]]:
+        try:
+            orderbook = await self.sdk.get_orderbook(symbol)
+            if not orderbook:
+                return None
+            bids = orderbook.get('bid', {}).get('levels', [])
+            asks = orderbook.get('ask', {}).get('levels', [])
+            if bids and asks:
+                return float(bids[0]['price']), float(asks[0]['price'])
+        except Exception as e:
+            logger.error(f"Hibachi BBO error: {e}")
+        return None
+
+    async def get_balance(self) -> Optional[float]:
+        return await self.sdk.get_balance()
+
+    async def get_position(self, symbol: str) -> Optional[float]:
+        try:
+            return await self.sdk.get_position_size(symbol)
+        except Exception as e:
+            logger.error(f"Hibachi position error: {e}")
+            return None
+
+    async def get_open_order_ids(self, symbol: str) -> Optional[Set[str]]:
+        # fetch_orders, not get_orders: a failed request must not read as an empty book
+        orders = await self.sdk.fetch_orders(symbol)
+        if orders is None:
+            return None
+        return {
+            str(o.get('orderId')) for o in orders
+            if str(o.get('status', '')).upper() not in ('FILLED', 'CANCELLED', 'REJECTED')
+        }
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Optional[Tuple[str, float]]:
+        order = await self.sdk.get_order(order_id)
+        if not order:
+            return None
+        status = str(order.get('status', '')).upper()
+        if status not in FINAL_STATUSES:
+            return None
+        return status, float(order.get('totalQuantity', 0)) - float(order.get('availableQuantity', 0))
+
+    async def place_limit(self, symbol: str, level: GridLevel) -> Optional[str]:
+        result = await self.sdk.create_limit_order(
+            symbol=symbol, is_buy=level.side == 'BUY', amount=level.size, price=level.price
+        )
+        if result and 'orderId' in result:
+            return str(result['orderId'])
+        return None
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        return bool(await self.sdk.cancel_order(order_id))
+
+    async def cancel_all(self, symbol: str) -> bool:
+        ids = await self.get_open_order_ids(symbol)
+        if ids is None:
+            return False
+        return await self.cancel_orders(symbol, list(ids)) if ids else True
+
+
+# ----------------------------------------------------------------------
+# Extended (x10 PerpetualTradingClient, async)
+# ----------------------------------------------------------------------
+
+EXTENDED_MARKETS = {
+    "BTC-USD": {"amount_precision": 5, "price_precision": 0, "min_size_usd": 10},
+    "ETH-USD": {"amount_precision": 3, "price_precision": 0, "min_size_usd": 10},
+    "SOL-USD": {"amount_precision": 2, "price_precision": 2, "min_size_usd": 10},
+}
+
+
+class ExtendedAdapter(VenueAdapter):
+    """Extended via x10's PerpetualTradingClient (POST_ONLY, 1h GTT)"""
+
+    name = "extended"
+
+    def __init__(self, client=None):
+        self.client = client
+
+    async def connect(self):
+        if self.client is not None:
+            return
+        from x10.perpetual.accounts import StarkPerpetualAccount
+        from x10.perpetual.configuration import MAINNET_CONFIG
+        from x10.perpetual.trading_client import PerpetualTradingClient
+
+        api_key = os.getenv("EXTENDED") or os.getenv("EXTENDED_API_KEY")
+        private_key = os.getenv("EXTENDED_STARK_PRIVATE_KEY")
+        public_key = os.getenv("EXTENDED_STARK_PUBLIC_KEY")
+        vault = os.getenv("EXTENDED_VAULT")
+        if not all([api_key, private_key, public_key, vault]):
+            raise ValueError(
+                "Missing Extended credentials. Set EXTENDED_API_KEY, EXTENDED_STARK_PRIVATE_KEY, "
+                "EXTENDED_STARK_PUBLIC_KEY, EXTENDED_VAULT in .env"
+            )
+        stark_account = StarkPerpetualAccount(
+            vault=int(vault), private_key=private_key, public_key=public_key, api_key=api_key,
+        )
+        self.client = PerpetualTradingClient(endpoint_config=MAINNET_CONFIG, stark_account=stark_account)
+
+    async def close(self):
+        if self.client is not None and hasattr(self.client, 'close'):
+            await self.client.close()
+
+    async def market_info(self, symbol: str) -> Optional[MarketInfo]:
+        config = EXTENDED_MARKETS.get(symbol, EXTENDED_MARKETS["BTC-USD"])
+        return MarketInfo(
+            tick_size=10 ** -config["price_precision"],
+            step_size=10 ** -config["amount_precision"],
+            min_notional=config["min_size_usd"],
+        )
+
+    async def get_bbo(self, symbol: str) -> Optional[Tuple[float, float]]:
+        try:
+            ob = await self.client.markets_info.get_orderbook_snapshot(market_name=symbol)
+            if ob and ob.data and ob.data.bid and ob.data.ask:
+                return float(ob.data.bid[0].price), float(ob.data.ask[0].price)
+        except Exception as e:
+            logger.error(f"Extended BBO error: {e}")
+        return None
+
+    async def get_balance(self) -> Optional[float]:
+        try:
+            balance = await self.client.account.get_balance()
+            if balance and balance.data:
+                return float(balance.data.equity)
+        except Exception as e:
+            logger.error(f"Extended balance error: {e}")
+        return None
+
+    async def get_position(self, symbol: str) -> Optional[float]:
+        try:
+            positions = await self.client.account.get_positions(market_names=[symbol])
+            for pos in (positions.data or []) if positions else []:
+                size = abs(float(pos.size)) if pos.size else 0.0
+                if size:
+                    # x10 reports the size unsigned with a LONG/SHORT side
+                    side = str(getattr(pos.side, 'value', pos.side)).upper()
+                    return -size if side.endswith('SHORT') else size
+            return 0.0
+        except Exception as e:
+            logger.error(f"Extended position error: {e}")
+            return None
+
+    async def get_open_order_ids(self, symbol: str) -> Optional[Set[str]]:
+        try:
+            orders = await self.client.account.get_open_orders(market_names=[symbol])
+        except Exception as e:
+            logger.error(f"Extended orders error: {e}")
+            return None
+        return {str(o.id) for o in (orders.data or [])} if orders else set()
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Optional[Tuple[str, float]]:
+        try:
+            order = await self.client.account.get_order_by_id(int(order_id))
+        except Exception as e:
+            logger.error(f"Extended order {order_id} error: {e}")
+            return None
+        if not order or not order.data:
+            return None
+        status = str(getattr(order.data.status, 'value', order.data.status)).upper()
+        if status not in FINAL_STATUSES:
+            return None
+        return status, float(order.data.filled_qty or 0)
+
+    async def place_limit(self, symbol: str, level: GridLevel) -> Optional[str]:
+        from x10.perpetual.orders import OrderSide, TimeInForce
+
+        order = await self.client.place_order(
+            market_name=symbol,
+            amount_of_synthetic=Decimal(str(level.size)),
+            price=Decimal(str(level.price)),
+            side=OrderSide.BUY if level.side == 'BUY' else OrderSide.SELL,
+            post_only=True,
+            time_in_force=TimeInForce.GTT,
+            expire_time=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        return str(order.data.id) if order and order.data else None
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        return await self.cancel_orders(symbol, [order_id])
+
+    async def cancel_orders(self, symbol: str, order_ids: List[str]) -> bool:
+        try:
+            await self.client.orders.mass_cancel(order_ids=[int(oid) for oid in order_ids])
+            return True
+        except Exception as e:
+            logger.error(f"Extended cancel error: {e}")
+            return False
+
+    async def cancel_all(self, symbol: str) -> bool:
+        try:
+            await self.client.orders.mass_cancel(markets=[symbol])
+            return True
+        except Exception as e:
+            logger.error(f"Extended cancel all error: {e}")
+            return False
+
+
+# ----------------------------------------------------------------------
+# Nado (async NadoSDK, cancel-all only)
+# ----------------------------------------------------------------------
+
+class NadoAdapter(VenueAdapter):
+    """
+    Nado via dexes.nado.NadoSDK
+
+    Nado only cancels everything for a product, and orders can briefly vanish
+    from get_orders() after placement, so fills are only counted on an
+    explicit FILLED/CLOSED status (as in grid_mm_nado_v8).
+    """
+
+    name = "nado"
+    supports_partial_cancel = False
+    MIN_NOTIONAL = 100.0
+
+    def __init__(self, sdk=None):
+        self.sdk = sdk
+        self._product_ids: Dict[str, int] = {}
+
+    async def connect(self):
+        if self.sdk is None:
+            from dexes.nado.nado_sdk import NadoSDK
+
+            wallet_address = os.getenv('NADO_WALLET_ADDRESS')
+            signer_key = os.getenv('NADO_LINKED_SIGNER_PRIVATE_KEY')
+            subaccount_name = os.getenv('NADO_SUBACCOUNT_NAME', 'default')
+            if not wallet_address or not signer_key:
+                raise ValueError("NADO_WALLET_ADDRESS and NADO_LINKED_SIGNER_PRIVATE_KEY required in .env")
+            self.sdk = NadoSDK(wallet_address, signer_key, subaccount_name=subaccount_name)
+        if not await self.sdk.verify_linked_signer():
+            raise ValueError("Linked signer not verified")
+
+    async def market_info(self, symbol: str) -> Optional[MarketInfo]:
+        product = await self.sdk.get_product_by_symbol(symbol)
+        if not product:
+            return None
+        self._product_ids[symbol] = product.get('product_id')
+        return MarketInfo(
+            tick_size=float(product.get('quote_currency_price_increment', 0.1)),
+            step_size=float(product.get('base_currency_increment', 0.001)),
+            min_notional=self.MIN_NOTIONAL,
+        )
+
+    async def get_bbo(self, symbol: str) -> Optional[Tuple[float, float]]:
+        try:
+            response = await self.sdk._query("market_price", {"product_id": str(self._product_ids[symbol])})
+            if response.get("status") == "success":
+                data = response.get("data", {})
+                bid = self.sdk._from_x18(int(data.get('bid_x18', '0')))
+                ask = self.sdk._from_x18(int(data.get('ask_x18', '0')))
+                if bid > 0 and ask > 0:
+                    return bid, ask
+        except Exception as e:
+            logger.error(f"Nado BBO error: {e}")
+        return None
+
+    async def get_balance(self) -> Optional[float]:
+        return await self.sdk.get_balance()
+
+    async def get_position(self, symbol: str) -> Optional[float]:
+        try:
+            return await self.sdk.get_position_size(symbol)
+        except Exception as e:
+            logger.error(f"Nado position error: {e}")
+            return None
+
+    async def _get_orders(self, symbol: str) -> Optional[List[Dict]]:
+        try:
+            return await self.sdk.get_orders(self._product_ids[symbol])
+        except Exception as e:
+            logger.error(f"Nado orders error: {e}")
+            return None
+
+    async def get_open_order_ids(self, symbol: str) -> Optional[Set[str]]:
+        orders = await self._get_orders(symbol)
+        if orders is None:
+            return None
+        return {o.get('digest') for o in orders if o.get('status', '').upper() in LIVE_STATUSES}
+
+    async def sync_orders(self, symbol: str, tracked: Dict[str, Dict]) -> Optional[OrderSync]:
+        orders = await self._get_orders(symbol)
+        if orders is None:
+            return None
+        sync = OrderSync()
+        for order in orders:
+            digest = order.get('digest')
+            if digest not in tracked:
+                continue
+            status = order.get('status', '').upper()
+            if status in LIVE_STATUSES:
+                sync.live.add(digest)
+            elif status in ('FILLED', 'CLOSED'):
+                sync.filled[digest] = float(order.get('filled_amount', tracked[digest]['size']))
+        return sync
+
+    async def place_limit(self, symbol: str, level: GridLevel) -> Optional[str]:
+        result = await self.sdk.create_limit_order(
+            symbol=symbol,
+            is_buy=level.side == 'BUY',
+            amount=level.size,
+            price=level.price,
+            order_type="POST_ONLY",
+        )
+        if result and result.get('status') == 'success':
+            return result.get('data', {}).get('digest', str(time.time()))
+        return None
+
+    async def cancel_order(self, symbol: str, order_id: str) -> bool:
+        return False  # no single-order cancel; see supports_partial_cancel
+
+    async def cancel_all(self, symbol: str) -> bool:
+        try:
+            await self.sdk.cancel_all_orders(symbol)
+            return True
+        except Exception as e:
+            logger.error(f"Nado cancel error: {e}")
+            return False
+
+
+ADAPTERS = {
+    "paradex": ParadexAdapter,
+    "hibachi": HibachiAdapter,
+    "extended": ExtendedAdapter,
+    "nado": NadoAdapter,
+}
@@ -0,0 +1,96 @@
+"""
+Grid MM configuration and per-venue presets
+
+Spread bands, ROC thresholds and sizing are the values the single-venue
+scripts run with today (grid_mm_live.py, grid_mm_nado_v8.py,
+grid_mm_hibachi.py, grid_mm_extended.py), so moving a market onto the shared
+engine doesn't change how it quotes.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
+
+# (max abs ROC in bps, spread in bps) - first band with abs(roc) < max wins
+SpreadBands = List[Tuple[float, float]]
+
+PARADEX_BANDS: SpreadBands = [(5, 1.5), (15, 3.0), (30, 6.0), (50, 10.0)]
+NADO_EXTENDED_BANDS: SpreadBands = [(5, 4.0), (10, 6.0), (20, 8.0), (30, 12.0), (50, 15.0)]
+HIBACHI_BANDS: SpreadBands = [(5, 8.0), (10, 12.0), (20, 16.0)]
+
+
+@dataclass
+class GridConfig:
+    """Strategy parameters for one GridEngine (one venue + symbol)"""
+
+    # Sizing
+    order_size_usd: float = 100.0
+    num_levels: int = 2
+    max_inventory_pct: float = 100.0  # of account balance
+
+    # Dynamic spread
+    spread_bands: SpreadBands = field(default_factory=lambda: list(PARADEX_BANDS))
+    max_spread_bps: float = 15.0  # above the last band
+
+    # Trend pause (ROC over roc_window samples taken every tick_interval)
+    roc_window: int = 180
+    roc_threshold_bps: float = 50.0
+    min_pause_duration: float = 300.0
+
+    # Tight spread mode (NP-002): -20% spread after 2 min of ROC < 2 bps
+    tight_spread: bool = False
+    tight_spread_threshold_bps: float = 2.0
+    tight_spread_exit_threshold_bps: float = 5.0
+    tight_spread_activation_seconds: float = 120.0
+    tight_spread_reduction_pct: float = 0.20
+
+    # Refresh triggers
+    grid_reset_pct: float = 0.50          # price move from grid center
+    time_refresh_interval: float = 300.0
+    stale_order_pct: float = 0.2          # order this far from mid
+    inventory_reset_ratio: float = 0.8
+
+    # Inventory skew (fraction of max inventory): shrink the adding side
+    # above skew ratio, quote only the reducing side above reduce ratio
+    inventory_skew_ratio: float = 0.3
+    inventory_reduce_ratio: float = 0.7
+
+    # Reconciliation
+    reconcile_tolerance: float = 0.25     # keep orders within 25% of spread of target
+    order_max_age: Optional[float] = None  # replace orders older than this (GTT venues)
+
+    # Loop
+    tick_interval: float = 1.0
+    status_interval: int = 30             # ticks between status logs
+    balance_max_age: float = 10.0
+    fill_grace_seconds: float = 0.0       # ignore missing new orders for this long (propagation delay)
+
+    def with_overrides(self, **overrides) -> "GridConfig":
+        """Copy with some fields replaced (None values are ignored)"""
+        return replace(self, **{k: v for k, v in overrides.items() if v is not None})
+
+
+VENUE_PRESETS = {
+    "paradex": GridConfig(
+        order_size_usd=100.0, num_levels=2, spread_bands=list(PARADEX_BANDS), max_spread_bps=15.0,
+        roc_threshold_bps=50.0, min_pause_duration=300.0, tight_spread=True,
+    ),
+    "nado": GridConfig(
+        order_size_usd=100.0, num_levels=2, spread_bands=list(NADO_EXTENDED_BANDS), max_spread_bps=0.0,
+        roc_threshold_bps=50.0, min_pause_duration=300.0, fill_grace_seconds=3.0,
+    ),
+    "hibachi": GridConfig(
+        order_size_usd=100.0, num_levels=3, spread_bands=list(HIBACHI_BANDS), max_spread_bps=20.0,
+        roc_threshold_bps=10.0, min_pause_duration=20.0, time_refresh_interval=30.0,
+    ),
+    "extended": GridConfig(
+        order_size_usd=50.0, num_levels=2, spread_bands=list(NADO_EXTENDED_BANDS), max_spread_bps=0.0,
+        roc_threshold_bps=50.0, min_pause_duration=120.0, order_max_age=3000.0,
+    ),
+}
+
+
+def preset_for(venue: str) -> GridConfig:
+    """Default config for a venue (a fresh copy)"""
+    if venue not in VENUE_PRESETS:
+        raise ValueError(f"Unknown venue {venue!r} (expected one of {sorted(VENUE_PRESETS)})")
+    return replace(VENUE_PRESETS[venue], spread_bands=list(VENUE_PRESETS[venue].spread_bands))
@@ -0,0 +1,535 @@
+"""
+Grid Engine - Exchange-agnostic async grid market maker
+
+One GridEngine quotes one symbol on one venue through a VenueAdapter. The
+strategy is the one the single-venue bots converged on:
+- Dynamic spread from ROC (rate of change) bands
+- Pause one side on a trend, everything on a strong trend (2x threshold)
+- Optional tight spread mode after a calm stretch (NP-002)
+- Inventory skew: shrink/skip the side that would add to a large position
+- Refresh on fills, price move, inventory, stale orders, empty book or timer
+- Diff-based reconciliation (core.grid_reconciler) so resting orders keep
+  queue priority
+- Optional GridMetrics: API latency, fills, realized spread, time-to-requote
+  and quote uptime (core/grid_mm/metrics.py)
+
+Engines never block: every venue call is awaited, so any number of engines
+(symbols x venues) can share a single event loop.
+
+Usage:
+    engine = GridEngine(ParadexAdapter(), "BTC-USD-PERP", preset_for("paradex"))
+    await engine.run(stop_event)
+"""
+
+import asyncio
+import logging
+import time
+from decimal import ROUND_DOWN, Decimal
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.grid_reconciler import GridLevel, ReconcilePlan, execute_plan, plan_grid
+
+from .adapters import MarketInfo, VenueAdapter
+from .config import GridConfig
+from .metrics import GridMetrics
+from .price_ring import PriceRing
+
+logger = logging.getLogger(__name__)
+
+
+class GridEngine:
+    """Grid market maker for one venue + symbol"""
+
+    def __init__(self, adapter: VenueAdapter, symbol: str, config: GridConfig,
+                 clock: Callable[[], float] = time.monotonic, history_path: Optional[str] = None,
+                 metrics: Optional[GridMetrics] = None):
+        """
+        Args:
+            adapter: Venue adapter (may be shared with other engines)
+            symbol: Venue market symbol
+            config: Strategy parameters
+            clock: Monotonic seconds source (replays pass the recording's clock)
+            history_path: Memory-mapped price history file, so a restart keeps
+                its ROC warm-up window (None = in-memory)
+            metrics: Quoting-loop metrics for this market (None = off)
+        """
+        self.adapter = adapter
+        self.symbol = symbol
+        self.config = config
+        self.clock = clock
+        self.metrics = metrics
+        self.label = f"{adapter.name}:{symbol}"
+
+        self.market: Optional[MarketInfo] = None
+        self.price_history = PriceRing(max(config.roc_window, 1), path=history_path,
+                                       max_gap=max(config.tick_interval * 30, 60.0))
+        self.open_orders: Dict[str, Dict] = {}  # order_id -> {'side', 'price', 'size', 'level', 'placed_at'}
+        self._unpriced_fills: List[Tuple[str, float, float]] = []  # (side, size, price) awaiting a mid for metrics
+
+        # Position / balance
+        self.position_size = 0.0
+        self.position_notional = 0.0  # signed
+        self.initial_balance = 0.0
+        self.current_balance = 0.0
+        self._balance_time: Optional[float] = None
+
+        # Grid state
+        self.grid_center: Optional[float] = None
+        self.last_refresh_time: Optional[float] = None
+        self.current_spread_bps = 0.0
+        self.last_spread_bps = 0.0
+
+        # Pause state
+        self.orders_paused = False
+        self.pause_side: Optional[str] = None  # 'BUY', 'SELL' or 'ALL'
+        self.pause_start_time: Optional[float] = None
+
+        # Tight spread mode
+        self.tight_spread_mode = False
+        self.low_roc_start_time: Optional[float] = None
+
+        # Stats
+        self.fills_count = 0
+        self.total_volume = 0.0
+        self.ticks = 0
+        self.start_time: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Load market constraints, balance and position; raises if the market is unusable"""
+        self.market = await self.adapter.market_info(self.symbol)
+        if not self.market:
+            raise ValueError(f"[{self.label}] market info unavailable")
+
+        balance = await self.adapter.get_balance()
+        self.initial_balance = self.current_balance = balance or 0.0
+        self._balance_time = self.clock()
+
+        bbo = await self.adapter.get_bbo(self.symbol)
+        if not bbo:
+            raise ValueError(f"[{self.label}] cannot get initial price")
+        mid = (bbo[0] + bbo[1]) / 2
+        await self._sync_position(mid)
+
+        self.start_time = self.clock()
+        logger.info(f"[{self.label}] 🚀 Grid engine started @ ${mid:,.2f} | balance ${self.initial_balance:,.2f} | "
+                    f"tick={self.market.tick_size} step={self.market.step_size} min=${self.market.min_notional}")
+
+    async def run(self, stop: asyncio.Event):
+        """Tick every config.tick_interval until stop is set, then pull all orders"""
+        try:
+            while not stop.is_set():
+                try:
+                    await self.tick()
+                except Exception as e:
+                    logger.error(f"[{self.label}] Tick error: {e}")
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.config.tick_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self):
+        """Cancel resting orders and log the session summary"""
+        if await self._timed('cancel_all', self.adapter.cancel_all(self.symbol)):
+            self._count_orders(cancelled=len(self.open_orders))
+            self.open_orders.clear()
+        self.price_history.flush()
+        elapsed = (self.clock() - self.start_time) / 60 if self.start_time else 0
+        logger.info(f"[{self.label}] 🛑 Stopped after {elapsed:.1f}m | fills {self.fills_count} | "
+                    f"volume ${self.total_volume:,.2f} | P&L ${self.current_balance - self.initial_balance:+.2f}")
+
+    def stats(self) -> Dict:
+        """Snapshot for the runner's summary"""
+        return {
+            'venue': self.adapter.name,
+            'symbol': self.symbol,
+            'fills': self.fills_count,
+            'volume': self.total_volume,
+            'open_orders': len(self.open_orders),
+            'position': self.position_size,
+            'pnl': self.current_balance - self.initial_balance,
+            'paused': self.pause_side if self.orders_paused else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Tick
+    # ------------------------------------------------------------------
+
+    async def tick(self):
+        """Poll top of book and fills, then run the grid decision"""
+        bbo, fills = await asyncio.gather(self._timed('bbo', self.adapter.get_bbo(self.symbol)), self._check_fills())
+        if bbo:
+            await self.on_market(bbo[0], bbo[1], fills)
+
+    async def on_market(self, bid: float, ask: float, fills: int = 0):
+        """
+        Grid decision logic for one market update
+
+        Args:
+            bid: Best bid
+            ask: Best ask
+            fills: Fills seen since the previous update
+        """
+        cfg = self.config
+        self.ticks += 1
+        mid = (bid + ask) / 2
+        self.price_history.append(mid)
+
+        roc = self._calculate_roc()
+        self._update_pause_state(roc)
+        if cfg.tight_spread:
+            self._update_tight_spread_mode(roc)
+
+        price_move_pct = abs(mid - self.grid_center) / self.grid_center * 100 if self.grid_center else 0
+        balance = await self._get_balance()
+        max_inventory = balance * (cfg.max_inventory_pct / 100)
+        inventory_ratio = abs(self.position_notional) / max_inventory if max_inventory > 0 else 0
+        not_fully_paused = not (self.orders_paused and self.pause_side == 'ALL')
+        since_refresh = self.clock() - self.last_refresh_time if self.last_refresh_time else 0
+        stale = self._check_stale_orders(mid)
+
+        reason = trigger = None
+        if stale:
+            reason, trigger = f"Stale order refresh: order at ${stale[0]:,.2f} is {stale[1]:.2f}% from mid", 'stale'
+        elif price_move_pct >= cfg.grid_reset_pct:
+            reason, trigger = f"Grid reset: price moved {price_move_pct:.3f}%", 'price_move'
+        elif inventory_ratio > cfg.inventory_reset_ratio:
+            reason, trigger = f"Grid reset: inventory at {inventory_ratio * 100:.0f}%", 'inventory'
+        elif not self.open_orders and not_fully_paused:
+            reason = "Grid reset: no active orders, re-placing grid" if self.grid_center else "Initial grid"
+            trigger = 'empty'
+        elif since_refresh >= cfg.time_refresh_interval:
+            reason, trigger = f"Time-based refresh: {since_refresh:.0f}s since last placement", 'timer'
+        elif fills > 0:
+            reason, trigger = f"Refresh after {fills} fill(s)", 'fill'
+
+        if self.metrics is not None:
+            for side, size, price in self._unpriced_fills:
+                self.metrics.fill(side, size, price, mid, now=self.clock())
+            self._unpriced_fills.clear()
+
+        if reason:
+            logger.info(f"[{self.label}]   {reason}")
+            if self.metrics is not None:
+                self.metrics.refresh(trigger)
+            await self._sync_position(mid)
+            await self._refresh_grid(mid, roc)
+            self.last_refresh_time = self.clock()
+
+        if self.metrics is not None:
+            bids = sum(1 for info in self.open_orders.values() if info['side'] == 'BUY')
+            self.metrics.state(
+                bids, len(self.open_orders) - bids, self.position_size, self.position_notional,
+                self.current_spread_bps, self.orders_paused,
+                pnl=self.current_balance - self.initial_balance, now=self.clock()
+            )
+
+        if self.ticks % cfg.status_interval == 0:
+            self._log_status(mid, bid, ask, roc)
+
+    # ------------------------------------------------------------------
+    # Signals
+    # ------------------------------------------------------------------
+
+    def _calculate_roc(self) -> float:
+        """ROC in bps over the full window (0 until the window is filled)"""
+        return self.price_history.roc_bps(self.config.roc_window)
+
+    def _calculate_dynamic_spread(self, roc: float) -> float:
+        """
+        Spread in bps from the ROC bands
+
+        Returns 0 when ROC is beyond the last band and the config has no
+        fallback spread (the venue pauses instead of quoting wide).
+        """
+        cfg = self.config
+        abs_roc = abs(roc)
+        spread = cfg.max_spread_bps
+        for roc_limit, band_spread in cfg.spread_bands:
+            if abs_roc < roc_limit:
+                spread = band_spread
+                break
+
+        if cfg.tight_spread and self.tight_spread_mode and abs_roc < cfg.tight_spread_exit_threshold_bps:
+            spread *= (1 - cfg.tight_spread_reduction_pct)
+        return spread
+
+    def _update_tight_spread_mode(self, roc: float):
+        """NP-002: enter tight mode after a calm stretch, leave it when ROC picks up"""
+        cfg = self.config
+        abs_roc = abs(roc)
+        if abs_roc < cfg.tight_spread_threshold_bps:
+            now = self.clock()
+            if self.low_roc_start_time is None:
+                self.low_roc_start_time = now
+            elapsed = now - self.low_roc_start_time
+            if elapsed >= cfg.tight_spread_activation_seconds and not self.tight_spread_mode:
+                self.tight_spread_mode = True
+                logger.info(f"[{self.label}]   📉 TIGHT_SPREAD mode: activated after {elapsed:.0f}s of calm (ROC: {roc:+.1f}bps)")
+        elif abs_roc > cfg.tight_spread_exit_threshold_bps:
+            if self.tight_spread_mode:
+                logger.info(f"[{self.label}]   📈 TIGHT_SPREAD mode: deactivated (ROC: {roc:+.1f}bps)")
+            self.tight_spread_mode = False
+            self.low_roc_start_time = None
+
+    def _update_pause_state(self, roc: float):
+        """Pause the side that trades against a trend, or everything on a strong trend"""
+        cfg = self.config
+        old_paused, old_side = self.orders_paused, self.pause_side
+        now = self.clock()
+
+        if abs(roc) > cfg.roc_threshold_bps * 2.0:
+            side = 'ALL'
+        elif roc > cfg.roc_threshold_bps:
+            side = 'SELL'  # don't sell into rallies
+        elif roc < -cfg.roc_threshold_bps:
+            side = 'BUY'   # don't buy into dumps
+        else:
+            side = None
+
+        if side:
+            if not self.orders_paused or self.pause_side != side:
+                self.pause_start_time = now
+            self.orders_paused = True
+            self.pause_side = side
+        elif self.orders_paused and self.pause_start_time:
+            if now - self.pause_start_time >= cfg.min_pause_duration:
+                self.orders_paused = False
+                self.pause_side = None
+                self.pause_start_time = None
+        else:
+            self.orders_paused = False
+            self.pause_side = None
+
+        if self.orders_paused and (not old_paused or old_side != self.pause_side):
+            if self.pause_side == 'ALL':
+                direction = "UP" if roc > 0 else "DOWN"
+                logger.warning(f"[{self.label}]   ⚡ STRONG TREND {direction} - PAUSE ALL GRID (ROC: {roc:+.2f} bps)")
+            else:
+                logger.info(f"[{self.label}]   PAUSE {self.pause_side} orders (ROC: {roc:+.2f} bps)")
+        elif not self.orders_paused and old_paused:
+            logger.info(f"[{self.label}]   RESUME orders (ROC: {roc:+.2f} bps)")
+
+    def _check_stale_orders(self, mid: float) -> Optional[Tuple[float, float]]:
+        """(price, distance %) of the first order further than stale_order_pct from mid"""
+        for info in self.open_orders.values():
+            price = info.get('price', 0)
+            if price > 0 and mid:
+                distance_pct = abs(price - mid) / mid * 100
+                if distance_pct > self.config.stale_order_pct:
+                    return price, distance_pct
+        return None
+
+    # ------------------------------------------------------------------
+    # Venue state
+    # ------------------------------------------------------------------
+
+    async def _timed(self, op: str, call: Awaitable):
+        """Await a venue call, recording its latency as `op` when metrics are on"""
+        if self.metrics is None:
+            return await call
+        with self.metrics.api(op):
+            return await call
+
+    def _count_orders(self, placed: int = 0, cancelled: int = 0, rejected: int = 0):
+        if self.metrics is not None:
+            self.metrics.orders(placed=placed, cancelled=cancelled, rejected=rejected)
+
+    async def _get_balance(self) -> float:
+        """Account value, cached for config.balance_max_age seconds"""
+        now = self.clock()
+        if self._balance_time is not None and now - self._balance_time < self.config.balance_max_age:
+            return self.current_balance
+        balance = await self._timed('balance', self.adapter.get_balance())
+        if balance is not None:
+            self.current_balance = balance
+        self._balance_time = now
+        return self.current_balance
+
+    async def _sync_position(self, mid: float):
+        size = await self._timed('position', self.adapter.get_position(self.symbol))
+        if size is not None:
+            self.position_size = size
+            self.position_notional = size * mid
+
+    async def _check_fills(self) -> int:
+        """
+        Reconcile tracked orders with the venue and count fills
+
+        Orders younger than fill_grace_seconds are left out: some venues take
+        a moment before new orders show up in their open-order listing.
+        """
+        now = self.clock()
+        tracked = {
+            oid: info for oid, info in self.open_orders.items()
+            if now - info['placed_at'] >= self.config.fill_grace_seconds
+        }
+        if not tracked:
+            return 0
+        sync = await self._timed('sync', self.adapter.sync_orders(self.symbol, tracked))
+        if sync is None:
+            return 0
+
+        fills = 0
+        for order_id, filled_size in sync.filled.items():
+            info = self.open_orders.pop(order_id, None)
+            if info is None:
+                continue
+            notional = filled_size * info['price']
+            self.total_volume += notional
+            self.fills_count += 1
+            fills += 1
+            if self.metrics is not None:
+                self._unpriced_fills.append((info['side'], filled_size, info['price']))
+            logger.info(f"[{self.label}]   FILL: {info['side']} {filled_size:.6f} @ ${info['price']:,.2f} (${notional:,.2f})")
+
+        # Gone without a fill (cancelled/expired elsewhere): stop tracking
+        for order_id in tracked:
+            if order_id not in sync.live and order_id not in sync.filled:
+                self.open_orders.pop(order_id, None)
+        return fills
+
+    # ------------------------------------------------------------------
+    # Grid
+    # ------------------------------------------------------------------
+
+    def _round_price(self, price: float) -> float:
+        tick = Decimal(str(self.market.tick_size))
+        return float((Decimal(str(price)) / tick).quantize(Decimal('1')) * tick)
+
+    def _round_size(self, size: float) -> float:
+        step = Decimal(str(self.market.step_size))
+        rounded = (Decimal(str(size)) / step).quantize(Decimal('1'), rounding=ROUND_DOWN) * step
+        return float(max(rounded, step))
+
+    def _side_multipliers(self, inv_ratio: float) -> Tuple[float, float]:
+        """(buy_mult, sell_mult) from signed inventory ratio"""
+        cfg = self.config
+        min_mult = self.market.min_notional / cfg.order_size_usd if cfg.order_size_usd > 0 else 1.0
+        if inv_ratio > cfg.inventory_reduce_ratio:  # Heavy LONG - sells only
+            logger.info(f"[{self.label}]   📉 REDUCE LONG MODE: {inv_ratio * 100:.0f}% inventory - sells only")
+            return 0.0, 1.5
+        if inv_ratio > cfg.inventory_skew_ratio:
+            return max(min_mult, 0.3), 1.3
+        if inv_ratio < -cfg.inventory_reduce_ratio:  # Heavy SHORT - buys only
+            logger.info(f"[{self.label}]   📈 REDUCE SHORT MODE: {inv_ratio * 100:.0f}% inventory - buys only")
+            return 1.5, 0.0
+        if inv_ratio < -cfg.inventory_skew_ratio:
+            return 1.3, max(min_mult, 0.3)
+        return 1.0, 1.0
+
+    def build_targets(self, mid: float, spread_bps: float, max_inventory: float) -> List[GridLevel]:
+        """
+        Target ladder around mid with inventory skew and limits applied
+
+        Args:
+            mid: Mid price
+            spread_bps: Level spacing in bps
+            max_inventory: Max absolute position notional (USD)
+
+        Returns:
+            GridLevels (inner levels first)
+        """
+        cfg = self.config
+        inv_ratio = self.position_notional / max_inventory if max_inventory > 0 else 0
+        buy_mult, sell_mult = self._side_multipliers(inv_ratio)
+        spread_pct = spread_bps / 10000
+
+        targets: List[GridLevel] = []
+        for side, mult, sign in (('BUY', buy_mult, -1), ('SELL', sell_mult, 1)):
+            if mult <= 0 or (self.orders_paused and self.pause_side == side):
+                continue
+            notional = cfg.order_size_usd * mult
+            if notional < self.market.min_notional:
+                continue
+            for i in range(1, cfg.num_levels + 1):
+                price = self._round_price(mid * (1 + sign * spread_pct * i))
+                size = self._round_size(notional / price)
+                actual = price * size
+                if actual < self.market.min_notional:
+                    continue
+                # BUY adds to the signed position, SELL subtracts
+                potential = self.position_notional - sign * actual
+                if -sign * potential > max_inventory:
+                    continue
+                targets.append(GridLevel(side, price, size, i))
+        return targets
+
+    async def _refresh_grid(self, mid: float, roc: float):
+        """Reconcile resting orders with the target ladder"""
+        cfg = self.config
+        spread = self._calculate_dynamic_spread(roc)
+
+        if (self.orders_paused and self.pause_side == 'ALL') or spread <= 0:
+            if self.open_orders and await self._timed('cancel_all', self.adapter.cancel_all(self.symbol)):
+                self._count_orders(cancelled=len(self.open_orders))
+                self.open_orders.clear()
+            self.grid_center = mid
+            logger.info(f"[{self.label}]   Grid SKIPPED: strong trend, all orders paused (ROC: {roc:+.1f}bps)")
+            return
+
+        self.current_spread_bps = spread
+        if spread != self.last_spread_bps:
+            if self.last_spread_bps:
+                direction = "WIDENED" if spread > self.last_spread_bps else "TIGHTENED"
+                logger.info(f"[{self.label}]   📊 SPREAD {direction}: {self.last_spread_bps:.1f} → {spread:.1f} bps (ROC: {roc:+.1f})")
+            self.last_spread_bps = spread
+
+        balance = await self._get_balance()
+        targets = self.build_targets(mid, spread, balance * (cfg.max_inventory_pct / 100))
+
+        now = self.clock()
+        live = self.open_orders
+        if cfg.order_max_age:
+            live = {oid: info for oid, info in live.items() if now - info['placed_at'] < cfg.order_max_age}
+        tolerance = max(self.market.tick_size, mid * spread / 10000 * cfg.reconcile_tolerance)
+        plan = plan_grid(targets, live, price_tolerance=tolerance)
+        plan.cancel += [oid for oid in self.open_orders if oid not in live]
+        self.grid_center = mid
+
+        if plan.changes == 0:
+            if self.metrics is not None:
+                self.metrics.requoted(self.clock())
+            return
+
+        if not self.adapter.supports_partial_cancel:
+            # Cancel-all venue: replace the whole grid
+            if self.open_orders and not await self._timed('cancel_all', self.adapter.cancel_all(self.symbol)):
+                return
+            self._count_orders(cancelled=len(self.open_orders))
+            self.open_orders.clear()
+            plan = ReconcilePlan(place=targets)
+
+        result = await execute_plan(
+            plan,
+            cancel_fn=lambda oid: self._timed('cancel', self.adapter.cancel_order(self.symbol, oid)),
+            place_fn=lambda level: self._timed('place', self.adapter.place_limit(self.symbol, level)),
+            cancel_batch_fn=lambda ids: self._timed('cancel_batch', self.adapter.cancel_orders(self.symbol, ids)),
+        )
+        for order_id in result.cancelled:
+            self.open_orders.pop(order_id, None)
+        for order_id, level in result.placed.items():
+            self.open_orders[order_id] = {**level.to_order_info(), 'placed_at': now}
+        self._count_orders(placed=len(result.placed), cancelled=len(result.cancelled),
+                           rejected=len(plan.place) - len(result.placed))
+        if self.metrics is not None:
+            self.metrics.requoted(self.clock())
+
+        logger.info(f"[{self.label}]   Grid: {len(result.placed)} orders placed around ${mid:,.2f} "
+                    f"(spread: {spread:.1f}bps) [{plan.summary()}]")
+
+    def _log_status(self, mid: float, bid: float, ask: float, roc: float):
+        elapsed = (self.clock() - self.start_time) / 60 if self.start_time else 0
+        market_spread = (ask - bid) / mid * 10000 if mid else 0
+        pause_status = f"PAUSE-{self.pause_side}" if self.orders_paused else "LIVE"
+        pnl = self.current_balance - self.initial_balance
+        logger.info(f"[{self.label}] [{elapsed:.1f}m] ${mid:,.2f} | Mkt: {market_spread:.1f}bps | "
+                    f"Bot: {self.current_spread_bps:.1f}bps | ROC: {roc:+.1f}bps | {pause_status}")
+        logger.info(f"[{self.label}]   Position: {self.position_size:.6f} (${self.position_notional:+,.2f}) | "
+                    f"Orders: {len(self.open_orders)} | Fills: {self.fills_count} | "
+                    f"Volume: ${self.total_volume:,.2f} | P&L: ${pnl:+.2f}")
@@ -0,0 +1,401 @@
+"""
+Grid Metrics - Prometheus-style counters, gauges and histograms for the grid MMs
+
+The grid bots used to report fills, volume and P&L as status log lines every
+30 ticks, which dashboards then re-scraped from the logs. MetricsRegistry is a
+small embedded registry (no prometheus_client dependency) rendered in the
+Prometheus text format, exported two ways:
+- start_http_server(port): GET /metrics from a daemon thread, so it works for
+  the synchronous REST loops as well as the asyncio engines
+- write_textfile(path): atomic rewrite for node_exporter's textfile collector
+
+GridMetrics binds the quoting-loop instruments to one (venue, symbol):
+quote uptime (share of time with both sides resting), time-to-requote after
+a fill, order API latency per operation, placed/cancelled/rejected orders,
+grid refreshes by trigger, inventory, and realized spread per fill (fill
+price vs the mid when the fill is seen, in bps, positive = earned).
+
+Usage:
+    registry = MetricsRegistry()
+    registry.start_http_server(9320)
+    metrics = GridMetrics(registry, "paradex", "BTC-USD-PERP")
+    with metrics.api("place"):
+        order_id = client.submit_order(order)
+    metrics.fill("BUY", size, price, mid)
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default scrape port for the grid MMs (override: GRID_METRICS_PORT, 0 = off)
+DEFAULT_PORT = 9320
+
+API_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REQUOTE_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+SPREAD_BPS_BUCKETS = (-20.0, -10.0, -5.0, -2.0, -1.0, 0.0, 1.0, 2.0, 5.0, 10.0, 20.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+class _Metric:
+    """One metric family: a value per label combination"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+        self._values: Dict[Tuple, object] = {}
+
+    def _key(self, labels: Dict) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines += self._render_samples(items)
+        return lines
+
+    def _render_samples(self, items) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in items]
+
+
+class Counter(_Metric):
+    """Monotonically increasing total"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    """Bucketed observations with sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock,
+                 buckets: Sequence[float]):
+        super().__init__(name, help_text, labelnames, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['buckets'][i] += 1
+                    break
+            state['sum'] += value
+            state['count'] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state['count'] if state else 0
+
+    def _render_samples(self, items) -> List[str]:
+        names = self.labelnames + ('le',)
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, state['buckets']):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(names, key + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(names, key + ('+Inf',))} {state['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families, rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _get(self, cls, name: str, help_text: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help_text, labelnames, self._lock, **kwargs)
+        elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = API_LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> bool:
+        """Write render() to path atomically (node_exporter textfile collector); True on success"""
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write metrics to {path}: {e}")
+            return False
+
+    def start_http_server(self, port: int, host: str = "127.0.0.1") -> bool:
+        """
+        Serve render() at http://host:port/metrics from a daemon thread
+
+        Returns:
+            False if port is 0, a server is already running or the port is taken
+        """
+        if not port or self._server is not None:
+            return False
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            logger.warning(f"⚠️ Metrics endpoint not started on {host}:{port}: {e}")
+            return False
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="grid-metrics", daemon=True).start()
+        self._server = server
+        logger.info(f"📈 Metrics at http://{host}:{port}/metrics")
+        return True
+
+    def stop_http_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class GridMetrics:
+    """Quoting-loop metrics for one (venue, symbol) grid"""
+
+    def __init__(self, registry: MetricsRegistry, venue: str, symbol: str):
+        """
+        Args:
+            registry: Shared registry (one per process; markets differ by labels)
+            venue: Venue label
+            symbol: Market label
+        """
+        self.registry = registry
+        self.labels = {'venue': venue, 'symbol': symbol}
+        base = ('venue', 'symbol')
+
+        self.fills = registry.counter("grid_fills_total", "Grid order fills", base + ('side',))
+        self.fill_volume = registry.counter("grid_fill_volume_usd_total", "Filled notional (USD)", base)
+        self.realized_spread = registry.histogram(
+            "grid_realized_spread_bps", "Fill price vs the mid when the fill is seen (bps, positive = earned)",
+            base, buckets=SPREAD_BPS_BUCKETS)
+        self.requote = registry.histogram(
+            "grid_requote_seconds", "Time from a fill to the grid being reconciled again", base,
+            buckets=REQUOTE_BUCKETS)
+        self.api_latency = registry.histogram(
+            "grid_api_latency_seconds", "Venue API call latency by operation", base + ('op',))
+        self.api_errors = registry.counter("grid_api_errors_total", "Venue API calls that raised", base + ('op',))
+        self.placed = registry.counter("grid_orders_placed_total", "Grid orders accepted by the venue", base)
+        self.cancelled = registry.counter("grid_orders_cancelled_total", "Grid orders cancelled", base)
+        self.rejected = registry.counter("grid_orders_rejected_total", "Grid orders the venue rejected", base)
+        self.refreshes = registry.counter("grid_refreshes_total", "Grid refreshes by trigger", base + ('trigger',))
+        self.quoted_seconds = registry.counter(
+            "grid_quoted_seconds_total", "Seconds with both sides of the grid resting", base)
+        self.observed_seconds = registry.counter(
+            "grid_observed_seconds_total", "Seconds the quoting loop has been running", base)
+        self.uptime = registry.gauge("grid_quote_uptime_ratio", "Share of time with both sides quoted", base)
+        self.inventory = registry.gauge("grid_inventory_usd", "Signed position notional (USD)", base)
+        self.position = registry.gauge("grid_position", "Signed position size (base units)", base)
+        self.open_orders = registry.gauge("grid_open_orders", "Resting grid orders", base + ('side',))
+        self.spread = registry.gauge("grid_spread_bps", "Current grid level spacing (bps)", base)
+        self.paused = registry.gauge("grid_paused", "1 while any side is paused on a trend", base)
+        self.pnl = registry.gauge("grid_pnl_usd", "Account value change since start (USD)", base)
+
+        self._fill_at: Optional[float] = None        # first fill not yet requoted
+        self._last_state: Optional[Tuple[float, bool]] = None   # (time, both sides quoted)
+        self._quoted = 0.0
+        self._observed = 0.0
+
+    @contextmanager
+    def api(self, op: str):
+        """Time a venue call as operation `op` (errors are counted and re-raised)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.api_errors.inc(op=op, **self.labels)
+            raise
+        finally:
+            self.api_latency.observe(time.perf_counter() - start, op=op, **self.labels)
+
+    def fill(self, side: str, size: float, price: float, mid: Optional[float] = None,
+             now: Optional[float] = None):
+        """
+        Record one fill
+
+        Args:
+            side: 'BUY' or 'SELL'
+            size: Filled size (base units)
+            price: Fill price
+            mid: Mid when the fill was seen (None skips the realized spread)
+            now: Clock time for time-to-requote (default: time.monotonic())
+        """
+        self.fills.inc(side=side, **self.labels)
+        self.fill_volume.inc(abs(size * price), **self.labels)
+        if mid:
+            sign = 1 if side == 'BUY' else -1
+            self.realized_spread.observe(sign * (mid - price) / mid * 10000, **self.labels)
+        if self._fill_at is None:
+            self._fill_at = time.monotonic() if now is None else now
+
+    def orders(self, placed: int = 0, cancelled: int = 0, rejected: int = 0):
+        """Count order placements, cancels and rejects"""
+        if placed:
+            self.placed.inc(placed, **self.labels)
+        if cancelled:
+            self.cancelled.inc(cancelled, **self.labels)
+        if rejected:
+            self.rejected.inc(rejected, **self.labels)
+
+    def refresh(self, trigger: str):
+        """Count a grid refresh ('fill', 'stale', 'price_move', 'inventory', 'empty', 'timer')"""
+        self.refreshes.inc(trigger=trigger, **self.labels)
+
+    def requoted(self, now: Optional[float] = None):
+        """The grid was reconciled: closes the time-to-requote window opened by a fill"""
+        if self._fill_at is not None:
+            now = time.monotonic() if now is None else now
+            self.requote.observe(max(0.0, now - self._fill_at), **self.labels)
+            self._fill_at = None
+
+    def state(
+        self,
+        bids: int,
+        asks: int,
+        position: float,
+        notional: float,
+        spread_bps: float,
+        paused: bool,
+        pnl: Optional[float] = None,
+        now: Optional[float] = None
+    ):
+        """
+        Update the gauges and quote uptime after a market update
+
+        Args:
+            bids: Resting buy orders
+            asks: Resting sell orders
+            position: Signed position size
+            notional: Signed position notional (USD)
+            spread_bps: Current level spacing
+            paused: Any side paused on a trend
+            pnl: Account value change since start
+            now: Clock time (default: time.monotonic())
+        """
+        now = time.monotonic() if now is None else now
+        quoted = bids > 0 and asks > 0
+        if self._last_state is not None:
+            last_time, last_quoted = self._last_state
+            elapsed = max(0.0, now - last_time)
+            self._observed += elapsed
+            self.observed_seconds.inc(elapsed, **self.labels)
+            if last_quoted:
+                self._quoted += elapsed
+                self.quoted_seconds.inc(elapsed, **self.labels)
+            if self._observed > 0:
+                self.uptime.set(self._quoted / self._observed, **self.labels)
+        self._last_state = (now, quoted)
+
+        self.open_orders.set(bids, side='BUY', **self.labels)
+        self.open_orders.set(asks, side='SELL', **self.labels)
+        self.position.set(position, **self.labels)
+        self.inventory.set(notional, **self.labels)
+        self.spread.set(spread_bps, **self.labels)
+        self.paused.set(1 if paused else 0, **self.labels)
+        if pnl is not None:
+            self.pnl.set(pnl, **self.labels)
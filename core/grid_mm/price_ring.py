@@ -0,0 +1,181 @@
+"""
+Price Ring - fixed-size NumPy history of timestamped mids
+
+Replaces the deque(maxlen=N) price_history the grid bots kept: appends are
+O(1) and the ROC / volatility / trend signals are computed with NumPy over
+any trailing window instead of list() + Python loops every tick.
+
+Every sample is written twice (at i and i + capacity), so the last n samples
+are always one contiguous slice - windows are zero-copy views even when the
+ring has wrapped.
+
+With a path, the ring lives in a memory-mapped file (put it under /dev/shm
+for a RAM-only one). A restarted bot reopens the file and keeps its warm-up
+window instead of waiting capacity seconds for ROC-based spreads again; a
+history whose newest sample is older than max_gap seconds is discarded,
+since a window spanning the downtime would give a bogus ROC.
+
+Usage:
+    history = PriceRing(360, path="data/grid_state/paradex_BTC-USD-PERP.ring")
+    history.append(mid)
+    roc = history.roc_bps(180)
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = 0x52494E4731  # "RING1"
+_HEADER = 4            # int64: magic, capacity, next write position, count
+_TS, _PRICE = 0, 1
+
+
+class PriceRing:
+    """Ring buffer of (timestamp, price) with vectorized window signals"""
+
+    def __init__(self, capacity: int, path: Optional[str] = None, max_gap: float = 60.0):
+        """
+        Args:
+            capacity: Samples kept (e.g. 360 = 6 minutes at 1/sec)
+            path: Memory-mapped backing file (None = in-memory only)
+            max_gap: Seconds; a persisted history older than this is discarded on load
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.path = path
+        self._mmap = None
+
+        if path:
+            self._header, self._data = self._open(path, capacity)
+        else:
+            self._header = np.zeros(_HEADER, dtype=np.int64)
+            self._data = np.zeros((2, 2 * capacity), dtype=np.float64)
+            self._header[0], self._header[1] = _MAGIC, capacity
+
+        if len(self) and time.time() - self.last_timestamp > max_gap:
+            logger.info(f"🗑️ Discarding stale price history in {path} "
+                        f"({time.time() - self.last_timestamp:.0f}s old)")
+            self.clear()
+        elif len(self):
+            logger.info(f"♻️ Restored {len(self)} price samples from {path}")
+
+    def _open(self, path: str, capacity: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        size = _HEADER * 8 + 2 * 2 * capacity * 8
+        fresh = not os.path.exists(path) or os.path.getsize(path) != size
+        if fresh:
+            with open(path, 'wb') as f:
+                f.truncate(size)
+        self._mmap = np.memmap(path, dtype=np.uint8, mode='r+', shape=(size,))
+        header = self._mmap[:_HEADER * 8].view(np.int64)
+        data = self._mmap[_HEADER * 8:].view(np.float64).reshape(2, 2 * capacity)
+        if fresh or header[0] != _MAGIC or header[1] != capacity:
+            header[:] = (_MAGIC, capacity, 0, 0)
+        return header, data
+
+    # ------------------------------------------------------------------
+    # Buffer
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return int(self._header[3])
+
+    def append(self, price: float, ts: Optional[float] = None):
+        """Add one sample (ts defaults to now, epoch seconds)"""
+        pos = int(self._header[2])
+        ts = time.time() if ts is None else ts
+        self._data[_TS, pos] = self._data[_TS, pos + self.capacity] = ts
+        self._data[_PRICE, pos] = self._data[_PRICE, pos + self.capacity] = price
+        self._header[2] = (pos + 1) % self.capacity
+        if self._header[3] < self.capacity:
+            self._header[3] += 1
+
+    def clear(self):
+        self._header[2] = self._header[3] = 0
+
+    def _window(self, row: int, n: Optional[int]) -> np.ndarray:
+        count = len(self)
+        n = count if n is None else min(n, count)
+        end = int(self._header[2]) + self.capacity
+        return self._data[row, end - n:end]
+
+    def prices(self, n: Optional[int] = None) -> np.ndarray:
+        """Last n prices, oldest first (a view - copy before keeping it)"""
+        return self._window(_PRICE, n)
+
+    def timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        """Last n timestamps, oldest first"""
+        return self._window(_TS, n)
+
+    def __getitem__(self, index: int) -> float:
+        """Sample by position like the deque it replaces ([0] oldest, [-1] newest)"""
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError("PriceRing index out of range")
+        return float(self.prices()[index])
+
+    @property
+    def last(self) -> Optional[float]:
+        return self[-1] if len(self) else None
+
+    @property
+    def last_timestamp(self) -> float:
+        return float(self.timestamps(1)[0]) if len(self) else 0.0
+
+    def samples_since(self, seconds: float, now: Optional[float] = None) -> int:
+        """Number of trailing samples within the last `seconds` (for time-based windows)"""
+        ts = self.timestamps()
+        cutoff = (time.time() if now is None else now) - seconds
+        return len(ts) - int(np.searchsorted(ts, cutoff, side='left'))
+
+    def flush(self):
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self):
+        self.flush()
+        self._mmap = None
+
+    # ------------------------------------------------------------------
+    # Signals (bps; 0.0 until the window has enough samples)
+    # ------------------------------------------------------------------
+
+    def roc_bps(self, n: int) -> float:
+        """Rate of change from the oldest to the newest of the last n samples"""
+        if n < 2 or len(self) < n:
+            return 0.0
+        window = self.prices(n)
+        past = window[0]
+        return float((window[-1] - past) / past * 10000) if past else 0.0
+
+    def mean_abs_return_bps(self, n: Optional[int] = None) -> float:
+        """Average absolute sample-to-sample return over the last n samples"""
+        window = self.prices(n)
+        if len(window) < 2 or not np.all(window[:-1]):
+            return 0.0
+        return float(np.mean(np.abs(np.diff(window) / window[:-1])) * 10000)
+
+    def realized_vol_bps(self, n: Optional[int] = None) -> float:
+        """Standard deviation of sample-to-sample log returns over the last n samples"""
+        window = self.prices(n)
+        if len(window) < 3 or np.any(window <= 0):
+            return 0.0
+        return float(np.std(np.diff(np.log(window)), ddof=1) * 10000)
+
+    def trend_bps(self, n: int) -> float:
+        """Mean of the newer half of the last n samples vs the older half"""
+        if n < 2 or len(self) < n:
+            return 0.0
+        window = self.prices(n)
+        half = n // 2
+        earlier = window[-2 * half:-half].mean()
+        recent = window[-half:].mean()
+        return float((recent - earlier) / earlier * 10000) if earlier else 0.0
@@ -0,0 +1,162 @@
+"""
+Grid Runner - Many grid engines, one process, one event loop
+
+Replaces one-process-per-bot: every (venue, symbol) pair becomes a
+GridEngine, engines on the same venue share one adapter (one SDK client and
+connection pool), and all of them tick concurrently on a single asyncio loop.
+An engine that fails to start is logged and skipped; the others keep quoting.
+With a MetricsRegistry every engine reports to it, labelled by venue/symbol.
+
+Usage:
+    runner = GridRunner()
+    runner.add("paradex", "BTC-USD-PERP")
+    runner.add("hibachi", "BTC/USDT-P")
+    await runner.run(duration=3600)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .adapters import ADAPTERS, VenueAdapter
+from .config import GridConfig, preset_for
+from .engine import GridEngine
+from .metrics import GridMetrics, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def parse_bot_spec(spec: str) -> Tuple[str, str]:
+    """
+    Parse 'venue:SYMBOL' (e.g. 'paradex:BTC-USD-PERP')
+
+    Returns:
+        (venue, symbol)
+    """
+    venue, sep, symbol = spec.partition(':')
+    if not sep or not symbol:
+        raise ValueError(f"Bad bot spec {spec!r} - expected venue:SYMBOL")
+    return venue.strip().lower(), symbol.strip()
+
+
+class GridRunner:
+    """Owns the venue adapters and runs every engine until stopped"""
+
+    def __init__(self, history_dir: Optional[str] = None, metrics: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            history_dir: Directory for the engines' memory-mapped price
+                histories (None = in-memory, warm-up restarts with the process)
+            metrics: Registry the engines report quoting metrics to (None = off)
+        """
+        self.history_dir = history_dir
+        self.metrics = metrics
+        self.adapters: Dict[str, VenueAdapter] = {}
+        self.engines: List[GridEngine] = []
+        self._stop = asyncio.Event()
+
+    def add(
+        self,
+        venue: str,
+        symbol: str,
+        config: Optional[GridConfig] = None,
+        adapter: Optional[VenueAdapter] = None
+    ) -> GridEngine:
+        """
+        Register a market to quote
+
+        Args:
+            venue: Key in ADAPTERS ('paradex', 'nado', 'hibachi', 'extended')
+            symbol: Venue market symbol
+            config: Strategy parameters (default: the venue preset)
+            adapter: Adapter for this market only (default: one adapter per
+                venue, created on first use and shared by later markets)
+
+        Returns:
+            The GridEngine
+        """
+        if adapter is None:
+            if venue not in self.adapters:
+                if venue not in ADAPTERS:
+                    raise ValueError(f"Unknown venue {venue!r} (expected one of {sorted(ADAPTERS)})")
+                self.adapters[venue] = ADAPTERS[venue]()
+            adapter = self.adapters[venue]
+
+        history_path = None
+        if self.history_dir:
+            history_path = os.path.join(self.history_dir, f"{adapter.name}_{symbol.replace('/', '_')}.ring")
+        metrics = GridMetrics(self.metrics, adapter.name, symbol) if self.metrics is not None else None
+        engine = GridEngine(adapter, symbol, config or preset_for(adapter.name), history_path=history_path,
+                            metrics=metrics)
+        self.engines.append(engine)
+        return engine
+
+    def stop(self):
+        """Ask every engine to cancel its orders and exit"""
+        self._stop.set()
+
+    async def run(self, duration: Optional[float] = None):
+        """
+        Connect venues, start engines and tick until stop() or duration
+
+        Args:
+            duration: Seconds to run (None = until stop())
+        """
+        adapters = self._engine_adapters()
+        results = await asyncio.gather(*(a.connect() for a in adapters), return_exceptions=True)
+        failed = set()
+        for adapter, result in zip(adapters, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {adapter.name} connect failed: {result}")
+                failed.add(id(adapter))
+
+        candidates = [e for e in self.engines if id(e.adapter) not in failed]
+        results = await asyncio.gather(*(e.start() for e in candidates), return_exceptions=True)
+        engines = []
+        for engine, result in zip(candidates, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ [{engine.label}] start failed: {result}")
+            else:
+                engines.append(engine)
+
+        if not engines:
+            logger.error("No grid engines started")
+            await self._close_adapters()
+            return
+
+        logger.info(f"✅ Running {len(engines)} grid engine(s) on one event loop: "
+                    f"{', '.join(e.label for e in engines)}")
+        timer = asyncio.get_running_loop().call_later(duration, self.stop) if duration else None
+        try:
+            await asyncio.gather(*(engine.run(self._stop) for engine in engines))
+        finally:
+            if timer:
+                timer.cancel()
+            self._log_summary(engines)
+            await self._close_adapters()
+
+    def _engine_adapters(self) -> List[VenueAdapter]:
+        """Distinct adapters in engine order"""
+        unique: Dict[int, VenueAdapter] = {}
+        for engine in self.engines:
+            unique.setdefault(id(engine.adapter), engine.adapter)
+        return list(unique.values())
+
+    async def _close_adapters(self):
+        for adapter in self._engine_adapters():
+            try:
+                await adapter.close()
+            except Exception as e:
+                logger.debug(f"{adapter.name} close error: {e}")
+
+    def _log_summary(self, engines: List[GridEngine]):
+        logger.info("=" * 70)
+        logger.info("GRID RUNNER SUMMARY")
+        for engine in engines:
+            s = engine.stats()
+            logger.info(f"  {engine.label}: fills {s['fills']} | volume ${s['volume']:,.2f} | P&L ${s['pnl']:+.2f}")
+        total_volume = sum(e.total_volume for e in engines)
+        total_fills = sum(e.fills_count for e in engines)
+        logger.info(f"  TOTAL: fills {total_fills} | volume ${total_volume:,.2f}")
+        logger.info("=" * 70)
@@ -0,0 +1,190 @@
+"""
+Tick Recording - top of book and public trades in a compact binary format
+
+Each record is one fixed-width row (TICK_DTYPE, 46 bytes): a BBO update or a
+trade print. Rows are buffered and appended to the file with ndarray.tofile,
+so a recording is readable at any time and loads back with one np.fromfile.
+
+Sources:
+- record_polling(): any VenueAdapter, BBO polled at a fixed interval
+- record_paradex_ws(): Paradex websocket bbo + trades channels (every
+  update and every print, which the queue-aware simulator needs)
+
+Usage:
+    with TickRecorder(tick_path("data/ticks", "paradex", "BTC-USD-PERP")) as recorder:
+        await record_paradex_ws(client, "BTC-USD-PERP", recorder, stop)
+    ticks = load_ticks(path)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BBO, TRADE = 0, 1
+
+TICK_DTYPE = np.dtype([
+    ('ts', '<f8'),          # epoch seconds
+    ('kind', 'u1'),         # BBO / TRADE
+    ('bid', '<f8'),
+    ('ask', '<f8'),
+    ('bid_size', '<f4'),
+    ('ask_size', '<f4'),
+    ('price', '<f8'),       # trade price
+    ('size', '<f4'),        # trade size
+    ('side', 'i1'),         # aggressor: +1 buy, -1 sell
+])
+
+
+def tick_path(directory: str, venue: str, symbol: str, start: Optional[datetime] = None) -> str:
+    """data/ticks/<venue>_<symbol>_<YYYYmmdd_HHMMSS>.ticks"""
+    stamp = (start or datetime.now()).strftime('%Y%m%d_%H%M%S')
+    return os.path.join(directory, f"{venue}_{symbol.replace('/', '_')}_{stamp}.ticks")
+
+
+def load_ticks(path: str) -> np.ndarray:
+    """Recording as a TICK_DTYPE array sorted by time"""
+    ticks = np.fromfile(path, dtype=TICK_DTYPE)
+    if len(ticks) and np.any(np.diff(ticks['ts']) < 0):
+        ticks = ticks[np.argsort(ticks['ts'], kind='stable')]
+    return ticks
+
+
+class TickRecorder:
+    """Buffered append-only writer for TICK_DTYPE records"""
+
+    def __init__(self, path: str, buffer_size: int = 4096):
+        """
+        Args:
+            path: Output file (appended to if it exists)
+            buffer_size: Records held in memory between writes
+        """
+        self.path = path
+        self._buffer = np.zeros(buffer_size, dtype=TICK_DTYPE)
+        self._count = 0
+        self.bbo_count = 0
+        self.trade_count = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _next(self, ts: Optional[float]) -> np.void:
+        if self._count == len(self._buffer):
+            self.flush()
+        row = self._buffer[self._count]
+        self._count += 1
+        row['ts'] = ts if ts is not None else time.time()
+        return row
+
+    def record_bbo(self, bid: float, ask: float, bid_size: float = 0.0, ask_size: float = 0.0,
+                   ts: Optional[float] = None):
+        """Append a top-of-book update"""
+        row = self._next(ts)
+        row['kind'] = BBO
+        row['bid'], row['ask'] = bid, ask
+        row['bid_size'], row['ask_size'] = bid_size, ask_size
+        self.bbo_count += 1
+
+    def record_trade(self, price: float, size: float, side: str, ts: Optional[float] = None):
+        """Append a public trade (side = aggressor 'BUY' / 'SELL')"""
+        row = self._next(ts)
+        row['kind'] = TRADE
+        row['price'], row['size'] = price, size
+        row['side'] = 1 if str(side).upper() == 'BUY' else -1
+        self.trade_count += 1
+
+    def flush(self):
+        """Append buffered records to the file"""
+        if not self._count:
+            return
+        with open(self.path, 'ab') as f:
+            self._buffer[:self._count].tofile(f)
+        self._count = 0
+
+    def close(self):
+        self.flush()
+        logger.info(f"💾 Recorded {self.bbo_count} BBO + {self.trade_count} trades to {self.path}")
+
+
+async def record_polling(adapter, symbol: str, recorder: TickRecorder, stop: asyncio.Event,
+                         interval: float = 0.5):
+    """
+    Record BBO from any VenueAdapter by polling (no trade prints)
+
+    Args:
+        adapter: Connected VenueAdapter
+        symbol: Venue market symbol
+        recorder: Output
+        stop: Set to end the recording
+        interval: Seconds between polls
+    """
+    while not stop.is_set():
+        bbo = await adapter.get_bbo(symbol)
+        if bbo:
+            recorder.record_bbo(bbo[0], bbo[1])
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def record_paradex_ws(client, market: str, recorder: TickRecorder, stop: asyncio.Event):
+    """
+    Record every BBO update and trade print from the Paradex websocket
+
+    Args:
+        client: paradex_py Paradex/ParadexSubkey (uses client.ws_client)
+        market: Market symbol (e.g. "BTC-USD-PERP")
+        recorder: Output
+        stop: Set to end the recording
+    """
+    from paradex_py.api.ws_client import ParadexWebsocketChannel
+
+    from dexes.paradex.market_stream import parse_bbo
+
+    def _data(message: Dict) -> Dict:
+        return (message or {}).get('params', {}).get('data') or {}
+
+    async def on_bbo(channel, message):
+        bbo = parse_bbo(_data(message))
+        if bbo:
+            recorder.record_bbo(bbo.bid, bbo.ask, bbo.bid_size, bbo.ask_size, ts=bbo.timestamp)
+
+    async def on_trade(channel, message):
+        data = _data(message)
+        try:
+            recorder.record_trade(
+                float(data['price']), float(data['size']), data.get('side', ''),
+                ts=float(data.get('created_at', time.time() * 1000)) / 1000
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping trade message {data}: {e}")
+
+    ws = client.ws_client
+    if not await ws.connect():
+        logger.error(f"❌ Paradex websocket connect failed for {market}")
+        return
+
+    params = {"market": market}
+    await ws.subscribe(ParadexWebsocketChannel.BBO, callback=on_bbo, params=params)
+    await ws.subscribe(ParadexWebsocketChannel.TRADES, callback=on_trade, params=params)
+    logger.info(f"📡 Recording bbo/trades for {market} -> {recorder.path}")
+    try:
+        await stop.wait()
+    finally:
+        try:
+            await ws.close()
+        except Exception as e:
+            logger.debug(f"Websocket close error: {e}")
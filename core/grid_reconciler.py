@@ -0,0 +1,181 @@
+"""
+Grid Reconciler - Diff a target grid ladder against live orders
+
+The grid market makers used to cancel every order and re-submit every level
+on each refresh. plan_grid() instead matches each target level to a live
+order on the same side whose price (and size) is still within tolerance.
+Matched orders stay on the book and keep their queue priority. Only the
+leftovers are cancelled and only the unmatched levels are placed.
+execute_plan() sends those cancels and placements concurrently.
+
+Live orders use the shape every grid bot already tracks:
+    open_orders = {order_id: {'side': 'BUY', 'price': 99950.0, 'size': 0.001}}
+
+Usage:
+    targets = [GridLevel('BUY', 99950.0, 0.001, 1), GridLevel('SELL', 100050.0, 0.001, 1)]
+    plan = plan_grid(targets, open_orders, price_tolerance=tick_size)
+    result = await execute_plan(plan, cancel_fn, place_fn)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GridLevel:
+    """One target quote"""
+    side: str  # 'BUY' or 'SELL'
+    price: float
+    size: float
+    level: int = 0
+
+    def to_order_info(self) -> Dict:
+        """Tracking dict stored in the bots' open_orders"""
+        return {'side': self.side, 'price': self.price, 'size': self.size, 'level': self.level}
+
+
+@dataclass
+class ReconcilePlan:
+    """Result of diffing target levels against live orders"""
+    keep: Dict[str, GridLevel] = field(default_factory=dict)  # order_id -> level it already satisfies
+    cancel: List[str] = field(default_factory=list)
+    place: List[GridLevel] = field(default_factory=list)
+
+    @property
+    def changes(self) -> int:
+        """Number of order API calls the plan needs (before batching)"""
+        return len(self.cancel) + len(self.place)
+
+    def summary(self) -> str:
+        """Short log string like 'keep 3 | cancel 1 | place 1'"""
+        return f"keep {len(self.keep)} | cancel {len(self.cancel)} | place {len(self.place)}"
+
+
+@dataclass
+class ReconcileResult:
+    """What execute_plan actually did"""
+    cancelled: List[str] = field(default_factory=list)
+    placed: Dict[str, GridLevel] = field(default_factory=dict)  # new order_id -> level
+    failed_cancels: List[str] = field(default_factory=list)
+    failed_places: List[GridLevel] = field(default_factory=list)
+
+
+def plan_grid(
+    targets: List[GridLevel],
+    live_orders: Dict[str, Dict],
+    price_tolerance: float,
+    size_tolerance_pct: float = 10.0
+) -> ReconcilePlan:
+    """
+    Match target levels to live orders
+
+    Each target takes the closest unmatched live order on the same side within
+    price_tolerance (absolute price) and size_tolerance_pct. Live orders left
+    unmatched are cancelled; targets left unmatched are placed.
+
+    Args:
+        targets: Desired ladder
+        live_orders: order_id -> {'side', 'price', 'size'}
+        price_tolerance: Max |live price - target price| to keep an order
+        size_tolerance_pct: Max size difference (% of target size) to keep an order
+
+    Returns:
+        ReconcilePlan
+    """
+    plan = ReconcilePlan()
+    unmatched = dict(live_orders)
+
+    # Inner levels first so they get the closest orders
+    for target in sorted(targets, key=lambda t: (t.side, t.level)):
+        best_id, best_diff = None, None
+        for order_id, info in unmatched.items():
+            if info.get('side') != target.side:
+                continue
+            price_diff = abs(float(info.get('price', 0)) - target.price)
+            if price_diff > price_tolerance:
+                continue
+            if target.size > 0:
+                size_diff_pct = abs(float(info.get('size', 0)) - target.size) / target.size * 100
+                if size_diff_pct > size_tolerance_pct:
+                    continue
+            if best_diff is None or price_diff < best_diff:
+                best_id, best_diff = order_id, price_diff
+
+        if best_id is None:
+            plan.place.append(target)
+        else:
+            plan.keep[best_id] = target
+            del unmatched[best_id]
+
+    plan.cancel = list(unmatched)
+    return plan
+
+
+async def execute_plan(
+    plan: ReconcilePlan,
+    cancel_fn: Callable[[str], Awaitable[Any]],
+    place_fn: Callable[[GridLevel], Awaitable[Optional[str]]],
+    max_concurrency: int = 8,
+    cancel_batch_fn: Optional[Callable[[List[str]], Awaitable[Any]]] = None
+) -> ReconcileResult:
+    """
+    Cancel then place concurrently
+
+    Cancels go first so freed margin/inventory is available to the new
+    levels and POST_ONLY placements can't collide with the orders they replace.
+
+    Args:
+        plan: Output of plan_grid
+        cancel_fn: async (order_id) -> truthy on success
+        place_fn: async (level) -> new order_id, or None on failure
+        max_concurrency: Max in-flight order requests
+        cancel_batch_fn: async (order_ids) -> truthy on success; used instead
+            of cancel_fn when the venue can cancel a list of ids in one call
+
+    Returns:
+        ReconcileResult
+    """
+    result = ReconcileResult()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(fn, arg):
+        async with semaphore:
+            return await fn(arg)
+
+    if plan.cancel:
+        if cancel_batch_fn is not None:
+            try:
+                ok = await cancel_batch_fn(list(plan.cancel))
+            except Exception as e:
+                logger.error(f"Batch cancel error: {e}")
+                ok = False
+            (result.cancelled if ok else result.failed_cancels).extend(plan.cancel)
+        else:
+            outcomes = await asyncio.gather(
+                *(_bounded(cancel_fn, oid) for oid in plan.cancel), return_exceptions=True
+            )
+            for order_id, outcome in zip(plan.cancel, outcomes):
+                if isinstance(outcome, Exception) or outcome is False:
+                    if isinstance(outcome, Exception):
+                        logger.debug(f"Cancel error for {order_id}: {outcome}")
+                    result.failed_cancels.append(order_id)
+                else:
+                    result.cancelled.append(order_id)
+
+    if plan.place:
+        outcomes = await asyncio.gather(
+            *(_bounded(place_fn, level) for level in plan.place), return_exceptions=True
+        )
+        for level, outcome in zip(plan.place, outcomes):
+            if isinstance(outcome, Exception) or not outcome:
+                if isinstance(outcome, Exception):
+                    logger.debug(f"{level.side} L{level.level} error: {outcome}")
+                result.failed_places.append(level)
+            else:
+                result.placed[outcome] = level
+
+    return result
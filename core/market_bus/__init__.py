@@ -0,0 +1,22 @@
+"""
+Host-wide market data bus
+
+One MarketDataDaemon per host polls each upstream (Binance candles/funding,
+Lighter candles, venue BBOs, OI, sentiment) once and publishes snapshots over
+a Unix socket; bots read them through MarketDataBusClient and fall back to
+their own fetchers when no daemon is running.
+"""
+
+from .client import MarketDataBusClient
+from .daemon import DEFAULT_SOCKET_PATH, MarketDataDaemon
+from .sources import Source, UpstreamFetchers, make_topic, parse_topic
+
+__all__ = [
+    'DEFAULT_SOCKET_PATH',
+    'MarketDataBusClient',
+    'MarketDataDaemon',
+    'Source',
+    'UpstreamFetchers',
+    'make_topic',
+    'parse_topic',
+]
@@ -0,0 +1,276 @@
+"""
+Market Data Bus Client
+Subscribe to the host's MarketDataDaemon instead of polling upstreams per bot
+
+Every accessor returns None when the daemon is not running, the topic has
+no snapshot yet, or the snapshot is older than the source's max age - the
+caller then falls back to fetching directly, so a bot behaves exactly as
+before when no daemon is up.
+
+Usage:
+    bus = MarketDataBusClient.from_env()   # None if no daemon socket on this host
+    if bus:
+        df = await bus.klines("binance", "ETHUSDT", "5m", limit=100)
+        oi = await bus.oi_snapshot(["ETH/USDT-P", "SOL/USDT-P"])
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from core.market_bus.daemon import DEFAULT_SOCKET_PATH
+from core.market_bus.sources import MAX_AGE, make_topic, parse_topic
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataBusClient:
+    """Latest-snapshot cache fed by the daemon's Unix socket"""
+
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, reconnect_interval: float = 30.0):
+        """
+        Args:
+            path: Daemon socket path
+            reconnect_interval: Seconds between reconnect attempts after the daemon goes away
+        """
+        self.path = path
+        self.reconnect_interval = reconnect_interval
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_attempt = 0.0
+        self._subscribed: set = set()
+        self._latest: Dict[str, Tuple[float, Any]] = {}
+        self._waiters: Dict[str, asyncio.Event] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["MarketDataBusClient"]:
+        """
+        Client for $MARKET_DATA_BUS (default socket path) if a daemon socket exists
+
+        MARKET_DATA_BUS=off disables the bus for this process.
+        """
+        path = os.getenv("MARKET_DATA_BUS", DEFAULT_SOCKET_PATH)
+        if path.lower() in ("off", "0", "false", "") or not os.path.exists(path):
+            return None
+        logger.info(f"📡 Using market data bus at {path}")
+        return cls(path)
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> bool:
+        """Connect (rate-limited while the daemon is down); True when connected"""
+        loop = asyncio.get_running_loop()
+        if self.connected and self._loop is loop:
+            return True
+        now = time.monotonic()
+        if self._last_attempt and now - self._last_attempt < self.reconnect_interval:
+            return False
+        self._last_attempt = now
+        # Drop the previous connection first (dead, or bound to another event loop)
+        await self.close()
+        try:
+            reader, self._writer = await asyncio.open_unix_connection(self.path)
+        except OSError as e:
+            logger.debug(f"Market data bus unavailable at {self.path}: {e}")
+            self._writer = None
+            return False
+        self._loop = loop
+        self._last_attempt = 0.0
+        self._reader_task = asyncio.create_task(self._read(reader, self._writer))
+        if self._subscribed:
+            self._send({"op": "subscribe", "topics": sorted(self._subscribed)})
+        return True
+
+    async def close(self):
+        task, writer = self._reader_task, self._writer
+        self._reader_task = self._writer = None
+        # Waiters are bound to the loop that created them
+        self._waiters.clear()
+        if task and not task.done():
+            try:
+                task.cancel()
+            except RuntimeError:  # its event loop is closed; the task can never run again
+                pass
+        if writer:
+            try:
+                writer.close()
+            except RuntimeError:
+                # Opened on an event loop that is already closed: end the connection
+                # at the socket so the daemon drops this subscriber
+                sock = writer.get_extra_info('socket')
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+
+    def _send(self, message: Dict):
+        self._writer.write(json.dumps(message).encode() + b"\n")
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if message.get("type") == "snapshot":
+                    topic = message["topic"]
+                    self._latest[topic] = (message["ts"], message["data"])
+                    event = self._waiters.pop(topic, None)
+                    if event:
+                        event.set()
+                elif message.get("type") == "stats":
+                    self._latest["__stats__"] = (time.time(), message["data"])
+                    event = self._waiters.pop("__stats__", None)
+                    if event:
+                        event.set()
+                elif message.get("type") == "error":
+                    logger.warning(f"⚠️ Market data bus: {message.get('error')} ({message.get('topic', '')})")
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError) as e:
+            logger.warning(f"⚠️ Market data bus connection lost: {e}")
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._writer = None
+
+    def _fresh(self, topic: str, max_age: Optional[float]) -> Optional[Any]:
+        entry = self._latest.get(topic)
+        if entry is None:
+            return None
+        ts, data = entry
+        limit = max_age if max_age is not None else MAX_AGE.get(parse_topic(topic)[0], 60.0)
+        return data if time.time() - ts <= limit else None
+
+    async def get_many(
+        self,
+        topics: Iterable[str],
+        timeout: float = 3.0,
+        max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Latest snapshots for several topics, subscribing on first use
+
+        Args:
+            topics: Topic names (see core/market_bus/sources.py)
+            timeout: Seconds to wait for topics that have no snapshot yet
+            max_age: Staleness limit override (default: MAX_AGE by kind)
+
+        Returns:
+            Dict of topic -> data (None for missing/stale), or None if the bus is down
+        """
+        topics = list(dict.fromkeys(topics))
+        if not await self.connect():
+            return None
+        new = [t for t in topics if t not in self._subscribed]
+        if new:
+            self._subscribed.update(new)
+            self._send({"op": "subscribe", "topics": new})
+
+        # Only wait for topics that have never had a snapshot: a stale one won't
+        # refresh within the timeout, so the caller should fall back right away
+        pending = [t for t in topics if t not in self._latest]
+        if pending and timeout > 0:
+            events = [self._waiters.setdefault(t, asyncio.Event()) for t in pending]
+            try:
+                await asyncio.wait_for(asyncio.gather(*(e.wait() for e in events)), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        result = {t: self._fresh(t, max_age) for t in topics}
+        found = sum(1 for v in result.values() if v is not None)
+        self.hits += found
+        self.misses += len(result) - found
+        return result
+
+    async def get(self, topic: str, timeout: float = 3.0, max_age: Optional[float] = None) -> Optional[Any]:
+        """Latest snapshot for one topic (None if unavailable or stale)"""
+        result = await self.get_many([topic], timeout, max_age)
+        return result.get(topic) if result else None
+
+    async def daemon_stats(self, timeout: float = 2.0) -> Optional[Dict]:
+        """The daemon's per-topic counters"""
+        if not await self.connect():
+            return None
+        event = self._waiters.setdefault("__stats__", asyncio.Event())
+        self._send({"op": "stats"})
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self._latest["__stats__"][1]
+
+    # ------------------------------------------------------------------
+    # Typed accessors
+    # ------------------------------------------------------------------
+
+    async def klines(self, venue: str, symbol: str, interval: str, limit: int = 100) -> Optional[pd.DataFrame]:
+        """
+        Candles as the DataFrame the fetchers build (timestamp, open, high, low, close, volume)
+
+        Args:
+            venue: 'binance' (Hibachi proxy) or 'lighter'
+            symbol: Venue symbol (e.g. 'ETHUSDT', 'SOL')
+            interval: Candle interval (e.g. '5m')
+            limit: Number of most recent candles
+
+        Returns:
+            DataFrame or None
+        """
+        rows = await self.get(make_topic('candles', venue, symbol, interval))
+        if not rows:
+            return None
+        df = pd.DataFrame(rows[-limit:], columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df
+
+    async def funding(self, venue: str, symbol: str) -> Optional[Dict]:
+        """Funding snapshot: funding_rate, mark_price, index_price, next_funding_time (ms)"""
+        return await self.get(make_topic('funding', venue, symbol))
+
+    async def bbo(self, venue: str, symbol: str) -> Optional[Tuple[float, float]]:
+        """(bid, ask) or None"""
+        data = await self.get(make_topic('bbo', venue, symbol))
+        return (data['bid'], data['ask']) if data else None
+
+    async def oi_snapshot(self, symbols: List[str]) -> Optional[Dict[str, Optional[float]]]:
+        """
+        OI for DEX symbols in any format, like OIDataFetcher.get_oi_snapshot
+
+        Returns:
+            Dict of symbol -> OI (None per symbol if unknown), or None if the bus is down
+        """
+        from llm_agent.data.oi_fetcher import OIDataFetcher
+
+        topics = {symbol: make_topic('oi', OIDataFetcher.normalize_symbol(symbol)) for symbol in symbols}
+        values = await self.get_many(topics.values())
+        if values is None:
+            return None
+        return {symbol: values.get(topic) for symbol, topic in topics.items()}
+
+    async def sentiment(self) -> Optional[Dict]:
+        """SentimentFetcher.fetch_all() result"""
+        return await self.get('sentiment', timeout=10.0)
+
+    def get_stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'connected': self.connected,
+            'topics': len(self._subscribed),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,267 @@
+"""
+Market Data Bus Daemon
+Polls each upstream topic once per host and fans snapshots out over a Unix socket
+
+Clients (MarketDataBusClient) send newline-delimited JSON requests:
+
+    {"op": "subscribe", "topics": ["candles:binance:ETHUSDT:5m", "oi:ETH"]}
+    {"op": "unsubscribe", "topics": [...]}
+    {"op": "stats"}
+
+and receive one line per snapshot:
+
+    {"type": "snapshot", "topic": "oi:ETH", "ts": 1735689600.0, "data": 1234567.0}
+
+A topic is polled while at least one client subscribes to it (plus an idle
+grace period so bots restarting between cycles don't drop it). New
+subscribers get the cached snapshot immediately.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from core.market_bus.sources import Source, UpstreamFetchers, parse_topic
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/pacifica_market_bus.sock"
+
+
+@dataclass
+class _Topic:
+    name: str
+    source: Source
+    args: List[str]
+    subscribers: Set["_Connection"] = field(default_factory=set)
+    data: Any = None
+    ts: float = 0.0
+    idle_since: Optional[float] = None
+    task: Optional[asyncio.Task] = None
+    fetches: int = 0
+    errors: int = 0
+
+
+class _Connection:
+    # A client this far behind is stuck; drop it rather than buffer forever
+    MAX_BUFFER = 16 * 1024 * 1024
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.topics: Set[str] = set()
+
+    def send(self, message: Dict):
+        if self.writer.is_closing():
+            return
+        if self.writer.transport.get_write_buffer_size() > self.MAX_BUFFER:
+            logger.warning("⚠️ Dropping market bus client (not reading)")
+            self.writer.close()
+            return
+        self.writer.write(json.dumps(message, separators=(',', ':')).encode() + b"\n")
+
+
+class MarketDataDaemon:
+    """Single upstream poller for every bot on the host"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SOCKET_PATH,
+        sources: Optional[Dict[str, Source]] = None,
+        idle_grace: float = 300.0,
+        candle_limit: int = 200
+    ):
+        """
+        Args:
+            path: Unix socket path
+            sources: Topic kind -> Source (default: UpstreamFetchers().sources())
+            idle_grace: Seconds a topic keeps polling after its last subscriber leaves
+            candle_limit: Candles kept per candles topic
+        """
+        self.path = path
+        self.idle_grace = idle_grace
+        self._fetchers = None
+        if sources is None:
+            self._fetchers = UpstreamFetchers(candle_limit=candle_limit)
+            sources = self._fetchers.sources()
+        self.sources = sources
+        self.topics: Dict[str, _Topic] = {}
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
+        self._batch_wake: Dict[str, asyncio.Event] = {}
+        self._connections: Set[_Connection] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.started_at = time.time()
+
+    async def start(self):
+        """Bind the socket (replacing a stale one)"""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        logger.info(f"✅ Market data bus listening on {self.path} ({', '.join(self.sources)})")
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        for task in [t.task for t in self.topics.values() if t.task] + list(self._batch_tasks.values()):
+            task.cancel()
+        for conn in list(self._connections):
+            conn.writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._fetchers:
+            await self._fetchers.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        conn = _Connection(writer)
+        self._connections.add(conn)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    conn.send({"type": "error", "error": "bad json"})
+                    continue
+                op = request.get("op")
+                if op == "subscribe":
+                    for name in request.get("topics", []):
+                        self._subscribe(conn, name)
+                elif op == "unsubscribe":
+                    for name in request.get("topics", []):
+                        self._unsubscribe(conn, name)
+                elif op == "stats":
+                    conn.send({"type": "stats", "data": self.get_stats()})
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for name in list(conn.topics):
+                self._unsubscribe(conn, name)
+            self._connections.discard(conn)
+            writer.close()
+
+    def _subscribe(self, conn: _Connection, name: str):
+        topic = self.topics.get(name)
+        if topic is None:
+            kind, args = parse_topic(name)
+            source = self.sources.get(kind)
+            if source is None:
+                conn.send({"type": "error", "topic": name, "error": f"unknown topic kind {kind!r}"})
+                return
+            topic = self.topics[name] = _Topic(name, source, args)
+        topic.subscribers.add(conn)
+        topic.idle_since = None
+        conn.topics.add(name)
+        if topic.ts:
+            conn.send({"type": "snapshot", "topic": name, "ts": topic.ts, "data": topic.data})
+        self._ensure_polling(topic)
+
+    def _unsubscribe(self, conn: _Connection, name: str):
+        conn.topics.discard(name)
+        topic = self.topics.get(name)
+        if topic is None:
+            return
+        topic.subscribers.discard(conn)
+        if not topic.subscribers:
+            topic.idle_since = time.time()
+
+    def _publish(self, topic: _Topic, data: Any):
+        topic.data, topic.ts = data, time.time()
+        message = {"type": "snapshot", "topic": topic.name, "ts": topic.ts, "data": data}
+        for conn in list(topic.subscribers):
+            conn.send(message)
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def _expired(self, topic: _Topic) -> bool:
+        return not topic.subscribers and topic.idle_since is not None \
+            and time.time() - topic.idle_since > self.idle_grace
+
+    def _ensure_polling(self, topic: _Topic):
+        source = topic.source
+        if source.batch:
+            task = self._batch_tasks.get(source.kind)
+            if task is None or task.done():
+                self._batch_wake[source.kind] = asyncio.Event()
+                self._batch_tasks[source.kind] = asyncio.create_task(self._poll_batch(source))
+            elif not topic.ts:
+                self._batch_wake[source.kind].set()  # fetch the newcomer now, not next interval
+        elif topic.task is None or topic.task.done():
+            topic.task = asyncio.create_task(self._poll_topic(topic))
+
+    async def _poll_topic(self, topic: _Topic):
+        while not self._expired(topic):
+            try:
+                data = await topic.source.fetch(*topic.args)
+                topic.fetches += 1
+                if data is not None:
+                    self._publish(topic, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                topic.errors += 1
+                logger.warning(f"⚠️ {topic.name} fetch failed: {e}")
+            await asyncio.sleep(topic.source.interval)
+        self.topics.pop(topic.name, None)
+        logger.info(f"💤 Stopped polling {topic.name} (no subscribers)")
+
+    async def _poll_batch(self, source: Source):
+        while True:
+            members = [t for t in self.topics.values() if t.source is source]
+            for topic in [t for t in members if self._expired(t)]:
+                self.topics.pop(topic.name, None)
+            members = [t for t in members if t.name in self.topics]
+            if not members:
+                break
+            wake = self._batch_wake[source.kind]
+            wake.clear()  # topics subscribed from here on miss this fetch and wake the next one
+            try:
+                values = await source.fetch([t.args for t in members])
+                for topic in members:
+                    topic.fetches += 1
+                    if values.get(topic.name) is not None:
+                        self._publish(topic, values[topic.name])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                for topic in members:
+                    topic.errors += 1
+                logger.warning(f"⚠️ {source.kind} batch fetch failed: {e}")
+            try:
+                await asyncio.wait_for(wake.wait(), source.interval)
+            except asyncio.TimeoutError:
+                pass
+        self._batch_tasks.pop(source.kind, None)
+
+    def get_stats(self) -> Dict:
+        """Per-topic subscriber/fetch counters"""
+        return {
+            'uptime': time.time() - self.started_at,
+            'clients': len(self._connections),
+            'topics': {
+                name: {
+                    'subscribers': len(t.subscribers),
+                    'fetches': t.fetches,
+                    'errors': t.errors,
+                    'age': time.time() - t.ts if t.ts else None,
+                } for name, t in self.topics.items()
+            },
+        }
@@ -0,0 +1,201 @@
+"""
+Market Data Bus Sources
+Upstream fetchers behind each bus topic, normalized to plain JSON
+
+Topics are "kind:arg:arg..." strings; every bot on the host that asks for
+the same topic shares one upstream poll:
+
+    candles:<venue>:<symbol>:<interval>   venue = binance | lighter
+    funding:binance:<symbol>
+    bbo:<venue>:<symbol>                  venue = binance | hibachi | paradex | extended
+    oi:<symbol>                           any DEX symbol format ("SOL", "SOL/USDT-P")
+    sentiment                             Fear & Greed + long/short + funding (SentimentFetcher)
+
+Candles are rows of [open_time_ms, open, high, low, close, volume].
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from dexes.http_session import PooledSession
+
+logger = logging.getLogger(__name__)
+
+BINANCE_FUTURES_URL = "https://fapi.binance.com"
+HIBACHI_DATA_API_URL = "https://data-api.hibachi.xyz"
+PARADEX_API_URL = "https://api.prod.paradex.trade/v1"
+EXTENDED_API_URL = "https://api.starknet.extended.exchange/api/v1"
+LIGHTER_API_URL = "https://mainnet.zklighter.elliot.ai"
+
+# Clients treat snapshots older than this (seconds, by topic kind) as missing
+MAX_AGE = {'candles': 120.0, 'funding': 600.0, 'bbo': 5.0, 'oi': 300.0, 'sentiment': 7200.0}
+
+INTERVAL_MS = {
+    "1m": 60_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "4h": 14_400_000, "12h": 43_200_000, "1d": 86_400_000,
+}
+
+
+def parse_topic(topic: str) -> Tuple[str, List[str]]:
+    """'candles:binance:BTCUSDT:5m' -> ('candles', ['binance', 'BTCUSDT', '5m'])"""
+    kind, *args = topic.split(':')
+    return kind, args
+
+
+def make_topic(kind: str, *args: Any) -> str:
+    return ':'.join([kind, *(str(a) for a in args)])
+
+
+@dataclass
+class Source:
+    """How one topic kind is fetched"""
+    kind: str
+    interval: float                 # seconds between upstream polls
+    fetch: Callable[..., Awaitable[Any]]
+    batch: bool = False             # fetch(list of arg lists) -> {topic: data}, one poll for all topics
+
+
+class UpstreamFetchers:
+    """Shared HTTP pool and the per-kind fetch functions used by the daemon"""
+
+    def __init__(self, candle_limit: int = 200):
+        """
+        Args:
+            candle_limit: Candles kept per candles topic (clients take the tail they need)
+        """
+        self.candle_limit = candle_limit
+        self._http = PooledSession(limit_per_host=8)
+        self._lighter_market_ids: Dict[str, int] = {}
+        self._oi_fetcher = None
+        self._sentiment = None
+        self.hibachi_url = os.getenv("HIBACHI_DATA_API_URL", HIBACHI_DATA_API_URL)
+        self.extended_url = os.getenv("EXTENDED_API_URL", EXTENDED_API_URL)
+        self.lighter_url = os.getenv("LIGHTER_API_URL", LIGHTER_API_URL)
+
+    async def close(self):
+        await self._http.close()
+
+    def sources(self) -> Dict[str, Source]:
+        """Default source table (poll intervals tuned to how fast each input moves)"""
+        return {
+            'candles': Source('candles', interval=20.0, fetch=self.candles),
+            'funding': Source('funding', interval=60.0, fetch=self.funding),
+            'bbo': Source('bbo', interval=1.0, fetch=self.bbo),
+            'oi': Source('oi', interval=60.0, fetch=self.oi, batch=True),
+            'sentiment': Source('sentiment', interval=900.0, fetch=self.sentiment),
+        }
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        async with self._http.request("GET", url, params=params) as resp:
+            if resp.status != 200:
+                logger.warning(f"⚠️ {url} -> HTTP {resp.status}")
+                return None
+            return await resp.json(content_type=None)
+
+    # ------------------------------------------------------------------
+    # Per-topic fetchers
+    # ------------------------------------------------------------------
+
+    async def candles(self, venue: str, symbol: str, interval: str) -> Optional[List[List[float]]]:
+        if venue == "binance":
+            data = await self._get_json(
+                f"{BINANCE_FUTURES_URL}/fapi/v1/klines",
+                {'symbol': symbol, 'interval': interval, 'limit': min(self.candle_limit, 1500)},
+            )
+            return [[int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])]
+                    for k in data] if data else None
+
+        if venue == "lighter":
+            market_id = await self._lighter_market_id(symbol)
+            if market_id is None:
+                return None
+            end = int(time.time() * 1000)
+            data = await self._get_json(f"{self.lighter_url}/api/v1/candlesticks", {
+                'market_id': market_id, 'resolution': interval, 'count_back': self.candle_limit,
+                'start_timestamp': end - self.candle_limit * INTERVAL_MS.get(interval, 900_000),
+                'end_timestamp': end,
+            })
+            candles = (data or {}).get('candlesticks') or []
+            return sorted(
+                [int(c['timestamp']), float(c['open']), float(c['high']), float(c['low']),
+                 float(c['close']), float(c.get('volume1', c.get('volume0', 0)))]
+                for c in candles
+            ) or None
+
+        logger.warning(f"⚠️ No candle source for venue {venue}")
+        return None
+
+    async def _lighter_market_id(self, symbol: str) -> Optional[int]:
+        if not self._lighter_market_ids:
+            data = await self._get_json(f"{self.lighter_url}/api/v1/orderBooks")
+            self._lighter_market_ids = {
+                m['symbol']: m['market_id'] for m in (data or {}).get('order_books', []) if 'market_id' in m
+            }
+        return self._lighter_market_ids.get(symbol)
+
+    async def funding(self, venue: str, symbol: str) -> Optional[Dict]:
+        if venue != "binance":
+            logger.warning(f"⚠️ No funding source for venue {venue}")
+            return None
+        data = await self._get_json(f"{BINANCE_FUTURES_URL}/fapi/v1/premiumIndex", {'symbol': symbol})
+        if not data:
+            return None
+        return {
+            'funding_rate': float(data.get('lastFundingRate', 0)),
+            'mark_price': float(data.get('markPrice', 0)),
+            'index_price': float(data.get('indexPrice', 0)),
+            'next_funding_time': int(data.get('nextFundingTime', 0)),
+        }
+
+    async def bbo(self, venue: str, symbol: str) -> Optional[Dict]:
+        if venue == "binance":
+            data = await self._get_json(f"{BINANCE_FUTURES_URL}/fapi/v1/ticker/bookTicker", {'symbol': symbol})
+            if data:
+                return {'bid': float(data['bidPrice']), 'ask': float(data['askPrice']),
+                        'bid_size': float(data['bidQty']), 'ask_size': float(data['askQty'])}
+        elif venue == "hibachi":
+            data = await self._get_json(f"{self.hibachi_url}/market/data/orderbook", {'symbol': symbol})
+            bids = ((data or {}).get('bid') or {}).get('levels') or []
+            asks = ((data or {}).get('ask') or {}).get('levels') or []
+            if bids and asks:
+                return {'bid': float(bids[0]['price']), 'ask': float(asks[0]['price']),
+                        'bid_size': float(bids[0]['quantity']), 'ask_size': float(asks[0]['quantity'])}
+        elif venue == "paradex":
+            data = await self._get_json(f"{PARADEX_API_URL}/bbo/{symbol}")
+            if data and data.get('bid') and data.get('ask'):
+                return {'bid': float(data['bid']), 'ask': float(data['ask']),
+                        'bid_size': float(data.get('bid_size', 0)), 'ask_size': float(data.get('ask_size', 0))}
+        elif venue == "extended":
+            data = await self._get_json(f"{self.extended_url}/info/markets/{symbol}/orderbook")
+            book = (data or {}).get('data') or {}
+            if book.get('bid') and book.get('ask'):
+                return {'bid': float(book['bid'][0]['price']), 'ask': float(book['ask'][0]['price']),
+                        'bid_size': float(book['bid'][0]['qty']), 'ask_size': float(book['ask'][0]['qty'])}
+        else:
+            logger.warning(f"⚠️ No BBO source for venue {venue}")
+        return None
+
+    async def sentiment(self) -> Optional[Dict]:
+        if self._sentiment is None:
+            from llm_agent.data.sentiment_fetcher import SentimentFetcher
+            self._sentiment = SentimentFetcher()
+        return await self._sentiment.fetch_all()
+
+    # ------------------------------------------------------------------
+    # Batched fetchers
+    # ------------------------------------------------------------------
+
+    async def oi(self, args_list: List[List[str]]) -> Dict[str, Optional[float]]:
+        """One OI snapshot (1 HyperLiquid bulk + parallel Binance) for every oi topic"""
+        if self._oi_fetcher is None:
+            from llm_agent.data.oi_fetcher import OIDataFetcher
+            self._oi_fetcher = OIDataFetcher()
+        symbols = [args[0] for args in args_list if args]
+        values = await asyncio.get_running_loop().run_in_executor(
+            None, self._oi_fetcher.fetch_snapshot, [self._oi_fetcher.normalize_symbol(s) for s in symbols]
+        )
+        return {make_topic('oi', s): values.get(self._oi_fetcher.normalize_symbol(s)) for s in symbols}
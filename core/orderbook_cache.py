@@ -0,0 +1,300 @@
+"""
+Order Book Cache - per-market books with cumulative depth indexes
+
+Each side of a cached book keeps its levels sorted best-first plus
+cumulative size and notional arrays, so the pre-trade questions are binary
+searches instead of a walk over every level:
+
+- size_within(limit_price): depth at or better than a price (size at slippage)
+- fill(size): VWAP / worst price to take a size (slippage for size)
+
+Books are replaced from REST snapshots (update) or patched level by level
+from a stream (apply_delta); the index is rebuilt lazily on the next query
+after a change. Concurrent requests for the same market share one fetch,
+and prefetch() lets a bot pull the books for its pending entries while it
+is still busy with something else.
+
+Usage:
+    cache = OrderBookCache(max_age=10.0)
+    book = await cache.get_or_fetch("SOL", lambda: fetch_orderbook("SOL"))
+    depth = book.asks.size_within(price * 1.02)
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Fetcher = Callable[[], Awaitable[Optional[Dict]]]
+
+
+class BookSide:
+    """One side of a book: levels sorted best-first with cumulative depth"""
+
+    def __init__(self, is_bid: bool, levels: Iterable = ()):
+        """
+        Args:
+            is_bid: True for bids (best = highest), False for asks (best = lowest)
+            levels: [[price, size], ...] or [{'price', 'size'}, ...] in any order
+        """
+        self.is_bid = is_bid
+        self._keys: List[float] = []     # sort keys: -price for bids, price for asks
+        self._sizes: Dict[float, float] = {}
+        self._dirty = True
+        for level in levels:
+            if isinstance(level, dict):
+                self.set_level(float(level['price']), float(level['size']))
+            elif len(level) >= 2:
+                self.set_level(float(level[0]), float(level[1]))
+
+    def set_level(self, price: float, size: float):
+        """Set the size resting at a price (0 removes the level)"""
+        key = -price if self.is_bid else price
+        if size > 0:
+            if key not in self._sizes:
+                bisect.insort(self._keys, key)
+            self._sizes[key] = size
+        elif key in self._sizes:
+            del self._sizes[key]
+            self._keys.pop(bisect.bisect_left(self._keys, key))
+        self._dirty = True
+
+    def _index(self):
+        if self._dirty:
+            keys = np.array(self._keys, dtype=float)
+            self._prices = -keys if self.is_bid else keys
+            sizes = np.array([self._sizes[k] for k in self._keys], dtype=float)
+            self._cum_size = np.cumsum(sizes)
+            self._cum_notional = np.cumsum(sizes * self._prices)
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def best(self) -> Optional[float]:
+        if not self._keys:
+            return None
+        return -self._keys[0] if self.is_bid else self._keys[0]
+
+    @property
+    def total_size(self) -> float:
+        self._index()
+        return float(self._cum_size[-1]) if len(self._cum_size) else 0.0
+
+    def size_within(self, limit_price: float) -> float:
+        """Total size at or better than limit_price (bids >= limit, asks <= limit)"""
+        if not self._keys:
+            return 0.0
+        self._index()
+        key = -limit_price if self.is_bid else limit_price
+        n = bisect.bisect_right(self._keys, key)
+        return float(self._cum_size[n - 1]) if n else 0.0
+
+    def fill(self, size: float) -> Tuple[float, Optional[float], Optional[float]]:
+        """
+        Take `size` from the book
+
+        Args:
+            size: Size in base units
+
+        Returns:
+            (filled size, VWAP, worst price touched); filled < size if the book is too thin
+        """
+        if not self._keys or size <= 0:
+            return 0.0, None, None
+        self._index()
+        n = int(np.searchsorted(self._cum_size, size, side='left'))
+        if n >= len(self._cum_size):
+            filled = float(self._cum_size[-1])
+            return filled, float(self._cum_notional[-1]) / filled, float(self._prices[-1])
+        before_size = self._cum_size[n - 1] if n else 0.0
+        before_notional = self._cum_notional[n - 1] if n else 0.0
+        notional = before_notional + (size - before_size) * self._prices[n]
+        return size, float(notional / size), float(self._prices[n])
+
+
+class OrderBook:
+    """Bids + asks for one market with the time they were last refreshed"""
+
+    def __init__(self, bids: Iterable = (), asks: Iterable = (), ts: Optional[float] = None):
+        self.bids = BookSide(True, bids)
+        self.asks = BookSide(False, asks)
+        self.ts = time.time() if ts is None else ts
+
+    def side_for(self, order_side: str) -> BookSide:
+        """Side a taker order consumes: BUY takes asks, SELL takes bids"""
+        return self.asks if order_side.upper() in ('BUY', 'LONG', 'BID') else self.bids
+
+    def age(self) -> float:
+        return time.time() - self.ts
+
+
+class OrderBookCache:
+    """Latest book per market, refreshed on demand and shared by concurrent callers"""
+
+    def __init__(self, max_age: float = 10.0):
+        """
+        Args:
+            max_age: Seconds a book stays usable for pre-trade checks
+        """
+        self.max_age = max_age
+        self._books: Dict[str, OrderBook] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.fetches = 0
+
+    def update(self, market: str, bids: Iterable, asks: Iterable, ts: Optional[float] = None) -> OrderBook:
+        """Replace a market's book from a full snapshot"""
+        book = self._books[market] = OrderBook(bids, asks, ts)
+        return book
+
+    def apply_delta(self, market: str, side: str, price: float, size: float, ts: Optional[float] = None) -> bool:
+        """
+        Patch one level of a cached book (size 0 removes it)
+
+        Args:
+            market: Market key
+            side: 'bid' or 'ask'
+            price: Level price
+            size: New resting size at that price
+
+        Returns:
+            False if there is no snapshot for the market to patch
+        """
+        book = self._books.get(market)
+        if book is None:
+            return False
+        (book.bids if side.lower().startswith('b') else book.asks).set_level(price, size)
+        book.ts = time.time() if ts is None else ts
+        return True
+
+    def get(self, market: str, max_age: Optional[float] = None) -> Optional[OrderBook]:
+        """Cached book if fresh enough, else None"""
+        book = self._books.get(market)
+        limit = self.max_age if max_age is None else max_age
+        if book is None or book.age() > limit:
+            return None
+        return book
+
+    async def get_or_fetch(self, market: str, fetch: Fetcher, max_age: Optional[float] = None) -> Optional[OrderBook]:
+        """
+        Fresh cached book, else one fetch shared by everyone asking for this market
+
+        Args:
+            market: Market key
+            fetch: Coroutine factory returning {'bids': [...], 'asks': [...]} or None
+            max_age: Freshness override
+
+        Returns:
+            OrderBook or None if the fetch failed
+        """
+        book = self.get(market, max_age)
+        if book is not None:
+            self.hits += 1
+            return book
+        inflight = self._inflight.get(market)
+        if inflight is None:
+            inflight = self._inflight[market] = asyncio.ensure_future(self._fetch(market, fetch))
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, market: str, fetch: Fetcher) -> Optional[OrderBook]:
+        try:
+            self.fetches += 1
+            data = await fetch()
+            if not data:
+                return None
+            return self.update(market, data.get('bids') or [], data.get('asks') or [])
+        except Exception as e:
+            logger.warning(f"Could not fetch orderbook for {market}: {e}")
+            return None
+        finally:
+            self._inflight.pop(market, None)
+
+    def prefetch(self, fetchers: Dict[str, Fetcher]):
+        """Start fetching every stale book in the background (returns immediately)"""
+        for market, fetch in fetchers.items():
+            if self.get(market) is None and market not in self._inflight:
+                self._inflight[market] = asyncio.ensure_future(self._fetch(market, fetch))
+
+    def get_stats(self) -> Dict:
+        return {'markets': len(self._books), 'hits': self.hits, 'fetches': self.fetches}
+
+
+def evaluate_liquidity(
+    book: Optional[OrderBook],
+    side: str,
+    size_usd: float,
+    current_price: float,
+    max_slippage: float = 0.02,
+    min_depth_ratio: float = 2.0,
+    unavailable_max_usd: float = 150.0
+) -> Dict:
+    """
+    LiquidityChecker verdict for one order against a cached book
+
+    Args:
+        book: Book for the order's market (None = unavailable)
+        side: 'BUY' or 'SELL'
+        size_usd: Order size in USD
+        current_price: Current market price
+        max_slippage: Depth counted within this fraction of current_price
+        min_depth_ratio: Required depth as a multiple of the order size
+        unavailable_max_usd: Largest order allowed when the book is unavailable
+
+    Returns:
+        Dict with has_liquidity, available_liquidity_usd, depth_ratio,
+        expected_slippage_pct (VWAP vs current price for the full size), reason
+    """
+    if book is None:
+        # If we can't fetch orderbook, allow reasonable orders on filtered markets
+        # With leverage-aware sizing, orders can be $60-120 depending on confidence
+        if size_usd <= unavailable_max_usd:
+            logger.warning(f"⚠️  Orderbook unavailable - allowing order (${size_usd:.2f}) on pre-filtered liquid market")
+            return {
+                'has_liquidity': True,
+                'available_liquidity_usd': size_usd,
+                'depth_ratio': 1.0,
+                'expected_slippage_pct': None,
+                'reason': 'Orderbook unavailable, allowing order on pre-filtered market'
+            }
+        return {
+            'has_liquidity': False,
+            'available_liquidity_usd': 0,
+            'depth_ratio': 0,
+            'expected_slippage_pct': None,
+            'reason': 'Orderbook unavailable and order size too large'
+        }
+
+    # BUY orders take the ASK side, SELL orders the BID side
+    levels = book.side_for(side)
+    is_buy = levels is book.asks
+    limit_price = current_price * (1 + max_slippage) if is_buy else current_price * (1 - max_slippage)
+    available_usd = levels.size_within(limit_price) * current_price
+    depth_ratio = available_usd / size_usd if size_usd > 0 else 0
+
+    filled, vwap, _ = levels.fill(size_usd / current_price)
+    slippage_pct = None
+    if vwap is not None and filled > 0:
+        slippage_pct = (vwap - current_price) / current_price * 100 * (1 if is_buy else -1)
+
+    has_liquidity = depth_ratio >= min_depth_ratio
+    reason = (
+        f"Orderbook has ${available_usd:.2f} available (ratio: {depth_ratio:.2f}x) "
+        f"for ${size_usd:.2f} order"
+    )
+    if not has_liquidity:
+        reason += f" - INSUFFICIENT (need {min_depth_ratio}x minimum)"
+
+    return {
+        'has_liquidity': has_liquidity,
+        'available_liquidity_usd': available_usd,
+        'depth_ratio': depth_ratio,
+        'expected_slippage_pct': slippage_pct,
+        'reason': reason
+    }
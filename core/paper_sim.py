@@ -0,0 +1,243 @@
+"""
+Paper Simulation - shared clock, fill models and recorded quotes
+
+Building blocks for the multi-venue paper trader (scripts/unified_paper_trade.py),
+where every venue runs its own fetch/exit task next to the decision task:
+
+- WallClock / ReplayClock: the one clock all venue tasks share. ReplayClock
+  is virtual time: once every task is waiting in clock.sleep(), time jumps
+  straight to the earliest wake-up, so a recorded 2-hour session replays in
+  as long as the work inside it takes (LLM calls, mostly).
+- FillModel: prices a simulated market order from a venue quote. MidFill
+  fills at the quote price (the original paper behaviour), TouchFill pays
+  the ask / hits the bid when the venue reports them. Both take slippage.
+- QuoteRecorder / RecordedFeed: a live run appends every venue fetch to a
+  JSONL file; a fast-forward run reads it back as a feed returning the latest
+  snapshot at or before the replay clock.
+
+ReplayClock assumes each task has at most one clock.sleep() pending (no
+gathering of sleeping sub-tasks); awaits on anything else (network, LLM)
+simply freeze the clock until they complete.
+
+Usage:
+    recording = load_recording("logs/paper_quotes/unified_20260101_120000.jsonl")
+    clock = ReplayClock(start=recording_span(recording)[0])
+    feed = RecordedFeed(recording["hibachi"], clock)
+    await clock.run([venue_loop(feed), decision_loop()])
+"""
+
+import asyncio
+import bisect
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Coroutine, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Snapshot = Tuple[float, Dict[str, Dict]]   # (ts, {symbol: quote})
+
+
+class WallClock:
+    """Real time: what live paper runs use"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+    async def run(self, coros: Iterable[Coroutine]):
+        """Run the tasks to completion"""
+        await asyncio.gather(*coros)
+
+
+class ReplayClock:
+    """Virtual time that skips ahead whenever every task is waiting on it"""
+
+    def __init__(self, start: float):
+        """
+        Args:
+            start: Epoch seconds the replay starts at
+        """
+        self._now = start
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []   # heap of (wake, seq, future)
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+
+    def time(self) -> float:
+        return self._now
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now)
+
+    async def sleep(self, seconds: float):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self._now + max(0.0, seconds), next(self._seq), future))
+        self._signal()
+        await future
+
+    def _signal(self):
+        if self._changed is not None:
+            self._changed.set()
+
+    async def run(self, coros: Iterable[Coroutine]):
+        """
+        Run the tasks to completion in virtual time
+
+        Raises:
+            The first exception raised by a task (the others are cancelled)
+        """
+        self._changed = asyncio.Event()
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        for task in tasks:
+            task.add_done_callback(lambda _: self._signal())
+        try:
+            while True:
+                failed = [t for t in tasks if t.done() and not t.cancelled() and t.exception()]
+                if failed:
+                    raise failed[0].exception()
+                alive = sum(not t.done() for t in tasks)
+                if alive == 0:
+                    break
+                waiting = sum(not f.done() for _, _, f in self._sleepers)
+                if waiting < alive:
+                    # Someone is still working (or about to sleep): wait for them
+                    self._changed.clear()
+                    await self._changed.wait()
+                    continue
+                wake, _, future = heapq.heappop(self._sleepers)
+                if future.done():  # sleeper was cancelled
+                    continue
+                self._now = max(self._now, wake)
+                future.set_result(None)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._changed = None
+
+
+class FillModel:
+    """Prices a simulated market order from a venue quote"""
+
+    def __init__(self, slippage_bps: float = 0.0):
+        """
+        Args:
+            slippage_bps: Extra adverse move on every fill, in basis points
+        """
+        self.slippage_bps = slippage_bps
+
+    def reference_price(self, buy: bool, quote: Dict) -> Optional[float]:
+        raise NotImplementedError
+
+    def price(self, buy: bool, quote: Dict) -> Optional[float]:
+        """
+        Fill price for a market order
+
+        Args:
+            buy: True for buys (open LONG / close SHORT)
+            quote: Venue quote ({'price', optional 'bid'/'ask'})
+
+        Returns:
+            Fill price, or None if the quote has no usable price
+        """
+        reference = self.reference_price(buy, quote)
+        if not reference:
+            return None
+        slip = self.slippage_bps / 10000
+        return reference * (1 + slip) if buy else reference * (1 - slip)
+
+
+class MidFill(FillModel):
+    """Fill at the quoted (mid/last) price"""
+
+    def reference_price(self, buy: bool, quote: Dict) -> Optional[float]:
+        return quote.get('price')
+
+
+class TouchFill(FillModel):
+    """Buy at the ask, sell at the bid; quote price when the venue has no BBO"""
+
+    def reference_price(self, buy: bool, quote: Dict) -> Optional[float]:
+        return quote.get('ask' if buy else 'bid') or quote.get('price')
+
+
+FILL_MODELS = {
+    'mid': MidFill,
+    'touch': TouchFill,
+}
+
+
+class QuoteRecorder:
+    """Append-only JSONL log of venue snapshots for later fast-forward runs"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._file = open(path, 'a')
+
+    def record(self, venue: str, ts: float, quotes: Dict[str, Dict]):
+        self._file.write(json.dumps({'ts': ts, 'venue': venue, 'quotes': quotes}) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def load_recording(path: str) -> Dict[str, List[Snapshot]]:
+    """
+    Read a QuoteRecorder file
+
+    Returns:
+        {venue: [(ts, quotes), ...]} sorted by time
+    """
+    recording: Dict[str, List[Snapshot]] = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping unreadable line in {path}")
+                continue
+            recording.setdefault(row['venue'], []).append((float(row['ts']), row['quotes']))
+    for snapshots in recording.values():
+        snapshots.sort(key=lambda s: s[0])
+    return recording
+
+
+def recording_span(recording: Dict[str, List[Snapshot]]) -> Tuple[float, float]:
+    """(first ts, last ts) across every venue in a recording"""
+    stamps = [ts for snapshots in recording.values() for ts, _ in snapshots]
+    if not stamps:
+        raise ValueError("Recording is empty")
+    return min(stamps), max(stamps)
+
+
+class RecordedFeed:
+    """Venue feed that serves a recording at the replay clock's time"""
+
+    def __init__(self, snapshots: List[Snapshot], clock):
+        """
+        Args:
+            snapshots: One venue's [(ts, quotes), ...] from load_recording()
+            clock: Clock whose time() selects the snapshot
+        """
+        self.snapshots = snapshots
+        self._times = [ts for ts, _ in snapshots]
+        self.clock = clock
+
+    async def fetch(self) -> Dict[str, Dict]:
+        """Latest snapshot at or before the clock ({} before the first one)"""
+        i = bisect.bisect_right(self._times, self.clock.time())
+        return dict(self.snapshots[i - 1][1]) if i else {}
@@ -19,6 +19,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict, field
 import threading
 
+from core.trade_store import TradeStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,8 +48,10 @@ class OutcomeTracker:
     """
     Tracks trade outcomes by symbol, direction, and confidence.
 
-    Thread-safe JSON persistence for tracking trade results across
-    bot restarts. Provides multi-dimensional statistics for analysis.
+    Trades live in the shared SQLite TradeStore (llm_outcomes table), so
+    statistics are indexed SQL aggregations instead of scans over the full
+    history. The tracker is identified by its log_file path; an existing JSON
+    log at that path is imported the first time the tracker is opened.
 
     Usage:
         tracker = OutcomeTracker(log_file="logs/strategies/llm_outcomes.json")
@@ -83,25 +87,46 @@ class OutcomeTracker:
         (0.95, 1.0, "very_high")
     ]
 
-    def __init__(self, log_file: str = None):
+    # SQL grouping expression per get_stats_by_dimension() dimension
+    DIMENSION_COLUMNS = {
+        "symbol": "base_symbol",
+        "direction": "direction",
+        "confidence_bracket": "confidence_bracket"
+    }
+
+    COLUMNS = [
+        "id", "open_time", "close_time", "symbol", "direction", "confidence",
+        "entry_price", "exit_price", "pnl_percent", "pnl_usd", "is_win",
+        "llm_reasoning", "hold_duration_seconds", "status", "tags"
+    ]
+
+    def __init__(self, log_file: str = None, db_path: str = None):
         """
         Initialize the outcome tracker.
 
         Args:
-            log_file: Path to JSON log file. Defaults to logs/strategies/
+            log_file: Path to JSON log file (tracker identity + one-time import source).
+                Defaults to logs/strategies/
+            db_path: SQLite store path (default: TRADE_STORE_DB or logs/trades.db)
         """
         self.log_file = log_file or self.DEFAULT_LOG_FILE
+        self.tracker_name = os.path.normpath(self.log_file)
         self._lock = threading.RLock()  # Reentrant lock to allow nested calls
-        self._data = self._load_or_create()
+        self.store = TradeStore.shared(db_path)
 
         # Ensure directory exists
         Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
 
+        self._migrate_json()
+        total = self.store.query_one(
+            "SELECT COUNT(*) AS n FROM llm_outcomes WHERE tracker = ?", (self.tracker_name,)
+        )["n"]
+
         logger.info(f"OutcomeTracker initialized: {self.log_file}")
-        logger.info(f"  Loaded {len(self._data['trades'])} historical trades")
+        logger.info(f"  Loaded {total} historical trades")
 
     def _load_or_create(self) -> Dict:
-        """Load existing data or create new structure"""
+        """Load existing JSON log data or create new structure"""
         if os.path.exists(self.log_file):
             try:
                 with open(self.log_file, 'r') as f:
@@ -122,13 +147,47 @@ class OutcomeTracker:
             "last_review_trade_count": 0
         }
 
-    def _save(self):
-        """Save data to disk (call within lock)"""
-        try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self._data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save outcome log: {e}")
+    def _migrate_json(self):
+        """One-time import of the legacy JSON log into the store"""
+        if self.store.get_meta(self.tracker_name, "next_id") is not None:
+            return
+
+        data = self._load_or_create()
+        with self._lock:
+            self._insert_trades(data["trades"])
+            for key in ("metadata", "next_id", "last_review_trade_count", "last_review_time"):
+                if key in data:
+                    self.store.set_meta(self.tracker_name, key, data[key])
+
+        if data["trades"]:
+            logger.info(f"  Migrated {len(data['trades'])} trades from {self.log_file} to {self.store.db_path}")
+
+    def _insert_trades(self, trades: List[Dict]):
+        """Insert or replace trade dicts"""
+        columns = self.COLUMNS + ["tracker", "base_symbol", "confidence_bracket"]
+        rows = []
+        for trade in trades:
+            row = [trade.get(c) for c in self.COLUMNS]
+            row[self.COLUMNS.index("tags")] = json.dumps(trade.get("tags") or {})
+            confidence = trade.get("confidence")
+            row += [
+                self.tracker_name,
+                trade["symbol"].split("/")[0],  # "SOL" from "SOL/USDT-P"
+                self._get_confidence_bracket(confidence if confidence is not None else 0.5)
+            ]
+            rows.append(row)
+        self.store.executemany(
+            f"INSERT OR REPLACE INTO llm_outcomes ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            rows
+        )
+
+    def _row_to_trade(self, row) -> Dict:
+        """Convert a database row to the TradeOutcome dict layout"""
+        trade = {c: row[c] for c in self.COLUMNS}
+        trade["is_win"] = None if trade["is_win"] is None else bool(trade["is_win"])
+        trade["tags"] = json.loads(trade["tags"]) if trade["tags"] else {}
+        return trade
 
     def _get_confidence_bracket(self, confidence: float) -> str:
         """Get the bracket name for a confidence value"""
@@ -160,9 +219,11 @@ class OutcomeTracker:
         Returns:
             trade_id: Unique ID for this trade
         """
-        with self._lock:
-            trade_id = self._data["next_id"]
-            self._data["next_id"] += 1
+        # Allocate the id and insert under one write lock: another process
+        # sharing the database must never be handed the same id
+        with self._lock, self.store.transaction(immediate=True):
+            trade_id = self.store.get_meta(self.tracker_name, "next_id", 1)
+            self.store.set_meta(self.tracker_name, "next_id", trade_id + 1)
 
             trade = TradeOutcome(
                 id=trade_id,
@@ -182,8 +243,7 @@ class OutcomeTracker:
                 tags=tags or {}
             )
 
-            self._data["trades"].append(asdict(trade))
-            self._save()
+            self._insert_trades([asdict(trade)])
 
             conf_bracket = self._get_confidence_bracket(confidence)
             logger.info(
@@ -210,16 +270,16 @@ class OutcomeTracker:
             Outcome dict with results, or None if trade not found
         """
         with self._lock:
-            trade = None
-            for t in self._data["trades"]:
-                if t["id"] == trade_id:
-                    trade = t
-                    break
+            row = self.store.query_one(
+                "SELECT * FROM llm_outcomes WHERE tracker = ? AND id = ?",
+                (self.tracker_name, trade_id)
+            )
 
-            if not trade:
+            if not row:
                 logger.error(f"[OUTCOME] Trade {trade_id} not found")
                 return None
 
+            trade = self._row_to_trade(row)
             if trade["status"] == "closed":
                 logger.warning(f"[OUTCOME] Trade {trade_id} already closed")
                 return None
@@ -242,15 +302,21 @@ class OutcomeTracker:
             hold_seconds = int((close_time - open_time).total_seconds())
 
             # Update trade
-            trade["close_time"] = close_time.isoformat()
-            trade["exit_price"] = exit_price
-            trade["pnl_percent"] = round(pnl_percent, 4)
-            trade["pnl_usd"] = round(pnl_usd, 4) if pnl_usd else None
-            trade["is_win"] = is_win
-            trade["hold_duration_seconds"] = hold_seconds
-            trade["status"] = "closed"
-
-            self._save()
+            self.store.execute(
+                "UPDATE llm_outcomes SET close_time = ?, exit_price = ?, pnl_percent = ?, "
+                "pnl_usd = ?, is_win = ?, hold_duration_seconds = ?, status = 'closed' "
+                "WHERE tracker = ? AND id = ?",
+                (
+                    close_time.isoformat(),
+                    exit_price,
+                    round(pnl_percent, 4),
+                    round(pnl_usd, 4) if pnl_usd else None,
+                    int(is_win),
+                    hold_seconds,
+                    self.tracker_name,
+                    trade_id
+                )
+            )
 
             emoji = "✅" if is_win else "❌"
             logger.info(
@@ -273,7 +339,46 @@ class OutcomeTracker:
     def get_open_trades(self) -> List[Dict]:
         """Get all currently open trades"""
         with self._lock:
-            return [t for t in self._data["trades"] if t["status"] == "open"]
+            rows = self.store.query(
+                "SELECT * FROM llm_outcomes WHERE tracker = ? AND status = 'open' ORDER BY id",
+                (self.tracker_name,)
+            )
+            return [self._row_to_trade(row) for row in rows]
+
+    def _aggregate_recent(self, group_by: List[str], n: int):
+        """
+        Aggregate the last n closed trades, grouped by columns
+
+        Returns:
+            Rows with the group columns plus count, wins, total_pnl_percent, total_pnl_usd
+        """
+        select_keys = "".join(f"{col}, " for col in group_by)
+        group_clause = f"GROUP BY {', '.join(group_by)} ORDER BY MIN(id)" if group_by else ""
+        return self.store.query(
+            f"""
+            WITH recent AS (
+                SELECT * FROM llm_outcomes
+                WHERE tracker = ? AND status = 'closed'
+                ORDER BY id DESC LIMIT ?
+            )
+            SELECT {select_keys}
+                COUNT(*) AS count,
+                COALESCE(SUM(is_win), 0) AS wins,
+                COALESCE(SUM(COALESCE(pnl_percent, 0)), 0) AS total_pnl_percent,
+                COALESCE(SUM(COALESCE(pnl_usd, 0)), 0) AS total_pnl_usd
+            FROM recent {group_clause}
+            """,
+            (self.tracker_name, n)
+        )
+
+    @staticmethod
+    def _with_derived(data: Dict) -> Dict:
+        """Add win_rate / avg_pnl_percent / avg_pnl_usd to an aggregate dict"""
+        count = data["count"]
+        data["win_rate"] = round(data["wins"] / count, 4) if count > 0 else 0
+        data["avg_pnl_percent"] = round(data["total_pnl_percent"] / count, 4) if count > 0 else 0
+        data["avg_pnl_usd"] = round(data["total_pnl_usd"] / count, 4) if count > 0 else 0
+        return data
 
     def get_stats_by_dimension(
         self,
@@ -290,52 +395,22 @@ class OutcomeTracker:
         Returns:
             Dict mapping dimension values to stats
         """
+        column = self.DIMENSION_COLUMNS.get(dimension)
         with self._lock:
-            closed = [t for t in self._data["trades"] if t["status"] == "closed"]
-            recent = closed[-n:] if len(closed) >= n else closed
-
-            if not recent:
-                return {}
-
-            stats = {}
-
-            for trade in recent:
-                if dimension == "symbol":
-                    # Normalize symbol (extract base)
-                    symbol = trade["symbol"]
-                    if "/" in symbol:
-                        key = symbol.split("/")[0]  # "SOL" from "SOL/USDT-P"
-                    else:
-                        key = symbol
-                elif dimension == "direction":
-                    key = trade["direction"]
-                elif dimension == "confidence_bracket":
-                    key = self._get_confidence_bracket(trade.get("confidence", 0.5))
-                else:
-                    key = "unknown"
-
-                if key not in stats:
-                    stats[key] = {
-                        "count": 0,
-                        "wins": 0,
-                        "total_pnl_percent": 0.0,
-                        "total_pnl_usd": 0.0
-                    }
-
-                stats[key]["count"] += 1
-                if trade.get("is_win"):
-                    stats[key]["wins"] += 1
-                stats[key]["total_pnl_percent"] += trade.get("pnl_percent", 0)
-                stats[key]["total_pnl_usd"] += trade.get("pnl_usd", 0) or 0
-
-            # Calculate derived metrics
-            for key, data in stats.items():
-                count = data["count"]
-                data["win_rate"] = round(data["wins"] / count, 4) if count > 0 else 0
-                data["avg_pnl_percent"] = round(data["total_pnl_percent"] / count, 4) if count > 0 else 0
-                data["avg_pnl_usd"] = round(data["total_pnl_usd"] / count, 4) if count > 0 else 0
-
-            return stats
+            rows = self._aggregate_recent([column] if column else [], n)
+
+        stats = {}
+        for row in rows:
+            if not row["count"]:
+                continue
+            key = row[column] if column else "unknown"
+            stats[key] = self._with_derived({
+                "count": row["count"],
+                "wins": row["wins"],
+                "total_pnl_percent": row["total_pnl_percent"],
+                "total_pnl_usd": row["total_pnl_usd"]
+            })
+        return stats
 
     def get_combo_stats(self, n: int = 50) -> Dict[str, Dict]:
         """
@@ -348,47 +423,20 @@ class OutcomeTracker:
             Dict mapping "SYMBOL_DIRECTION" to stats
         """
         with self._lock:
-            closed = [t for t in self._data["trades"] if t["status"] == "closed"]
-            recent = closed[-n:] if len(closed) >= n else closed
-
-            if not recent:
-                return {}
-
-            stats = {}
-
-            for trade in recent:
-                symbol = trade["symbol"]
-                if "/" in symbol:
-                    base = symbol.split("/")[0]
-                else:
-                    base = symbol
-
-                key = f"{base}_{trade['direction']}"
-
-                if key not in stats:
-                    stats[key] = {
-                        "symbol": base,
-                        "direction": trade["direction"],
-                        "count": 0,
-                        "wins": 0,
-                        "total_pnl_percent": 0.0,
-                        "total_pnl_usd": 0.0
-                    }
-
-                stats[key]["count"] += 1
-                if trade.get("is_win"):
-                    stats[key]["wins"] += 1
-                stats[key]["total_pnl_percent"] += trade.get("pnl_percent", 0)
-                stats[key]["total_pnl_usd"] += trade.get("pnl_usd", 0) or 0
-
-            # Calculate derived metrics
-            for key, data in stats.items():
-                count = data["count"]
-                data["win_rate"] = round(data["wins"] / count, 4) if count > 0 else 0
-                data["avg_pnl_percent"] = round(data["total_pnl_percent"] / count, 4) if count > 0 else 0
-                data["avg_pnl_usd"] = round(data["total_pnl_usd"] / count, 4) if count > 0 else 0
-
-            return stats
+            rows = self._aggregate_recent(["base_symbol", "direction"], n)
+
+        stats = {}
+        for row in rows:
+            key = f"{row['base_symbol']}_{row['direction']}"
+            stats[key] = self._with_derived({
+                "symbol": row["base_symbol"],
+                "direction": row["direction"],
+                "count": row["count"],
+                "wins": row["wins"],
+                "total_pnl_percent": row["total_pnl_percent"],
+                "total_pnl_usd": row["total_pnl_usd"]
+            })
+        return stats
 
     def get_overall_stats(self, n: int = 50) -> Dict:
         """
@@ -401,53 +449,51 @@ class OutcomeTracker:
             Dict with overall stats
         """
         with self._lock:
-            closed = [t for t in self._data["trades"] if t["status"] == "closed"]
-            recent = closed[-n:] if len(closed) >= n else closed
-
-            if not recent:
-                return {
-                    "total": 0,
-                    "wins": 0,
-                    "win_rate": 0.0,
-                    "total_pnl_percent": 0.0,
-                    "total_pnl_usd": 0.0,
-                    "avg_pnl_percent": 0.0,
-                    "avg_pnl_usd": 0.0,
-                    "sufficient_data": False
-                }
-
-            wins = sum(1 for t in recent if t.get("is_win"))
-            total_pnl_pct = sum(t.get("pnl_percent", 0) for t in recent)
-            total_pnl_usd = sum(t.get("pnl_usd", 0) or 0 for t in recent)
+            row = self._aggregate_recent([], n)[0]
 
+        total = row["count"]
+        if not total:
             return {
-                "total": len(recent),
-                "wins": wins,
-                "win_rate": round(wins / len(recent), 4),
-                "total_pnl_percent": round(total_pnl_pct, 4),
-                "total_pnl_usd": round(total_pnl_usd, 4),
-                "avg_pnl_percent": round(total_pnl_pct / len(recent), 4),
-                "avg_pnl_usd": round(total_pnl_usd / len(recent), 4),
-                "sufficient_data": len(recent) >= 10
+                "total": 0,
+                "wins": 0,
+                "win_rate": 0.0,
+                "total_pnl_percent": 0.0,
+                "total_pnl_usd": 0.0,
+                "avg_pnl_percent": 0.0,
+                "avg_pnl_usd": 0.0,
+                "sufficient_data": False
             }
 
+        return {
+            "total": total,
+            "wins": row["wins"],
+            "win_rate": round(row["wins"] / total, 4),
+            "total_pnl_percent": round(row["total_pnl_percent"], 4),
+            "total_pnl_usd": round(row["total_pnl_usd"], 4),
+            "avg_pnl_percent": round(row["total_pnl_percent"] / total, 4),
+            "avg_pnl_usd": round(row["total_pnl_usd"] / total, 4),
+            "sufficient_data": total >= 10
+        }
+
     def get_trade_count(self) -> int:
         """Get total number of closed trades"""
         with self._lock:
-            return sum(1 for t in self._data["trades"] if t["status"] == "closed")
+            return self.store.query_one(
+                "SELECT COUNT(*) AS n FROM llm_outcomes WHERE tracker = ? AND status = 'closed'",
+                (self.tracker_name,)
+            )["n"]
 
     def get_trades_since_last_review(self) -> int:
         """Get number of trades since last strategy review"""
         with self._lock:
-            last_review = self._data.get("last_review_trade_count", 0)
+            last_review = self.store.get_meta(self.tracker_name, "last_review_trade_count", 0)
             current = self.get_trade_count()
             return current - last_review
 
     def mark_review_complete(self):
         """Mark that a strategy review has been completed"""
         with self._lock:
-            current = sum(1 for t in self._data["trades"] if t["status"] == "closed")
-            self._data["last_review_trade_count"] = current
-            self._data["last_review_time"] = datetime.now().isoformat()
-            self._save()
+            current = self.get_trade_count()
+            self.store.set_meta(self.tracker_name, "last_review_trade_count", current)
+            self.store.set_meta(self.tracker_name, "last_review_time", datetime.now().isoformat())
             logger.info(f"[OUTCOME] Review marked complete at trade {current}")
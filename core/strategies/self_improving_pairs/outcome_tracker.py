@@ -2,9 +2,9 @@
 Outcome Tracker - Records and analyzes trade outcomes
 
 This component tracks actual trade results to determine if the LLM's
-direction calls were correct. It maintains a JSON log of all trades
-with entry/exit prices and calculates whether each direction choice
-was profitable.
+direction calls were correct. It keeps every trade with entry/exit
+prices in the shared SQLite TradeStore and calculates whether each
+direction choice was profitable.
 
 Exchange-agnostic: Works with any exchange that provides prices.
 """
@@ -18,6 +18,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import threading
 
+from core.trade_store import TradeStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,9 +44,11 @@ class OutcomeTracker:
     """
     Tracks trade outcomes and determines direction accuracy.
 
-    Thread-safe JSON persistence for tracking trade results across
-    bot restarts. Calculates whether the LLM picked the right asset
-    to long based on actual returns.
+    Trades live in the shared SQLite TradeStore (pair_outcomes table), so
+    rolling stats are SQL aggregations over the last n closed rows. The
+    tracker is identified by its log_file path; an existing JSON log at that
+    path is imported the first time the tracker is opened. Calculates whether
+    the LLM picked the right asset to long based on actual returns.
 
     Usage:
         tracker = OutcomeTracker(log_file="logs/strategies/pairs_outcomes.json")
@@ -70,25 +74,39 @@ class OutcomeTracker:
 
     DEFAULT_LOG_FILE = "logs/strategies/self_improving_pairs_outcomes.json"
 
-    def __init__(self, log_file: str = None):
+    COLUMNS = [
+        "id", "open_time", "close_time", "long_symbol", "short_symbol", "llm_reasoning",
+        "entry_prices", "exit_prices", "returns", "correct_direction", "spread_return", "status"
+    ]
+    JSON_COLUMNS = ("entry_prices", "exit_prices", "returns")
+
+    def __init__(self, log_file: str = None, db_path: str = None):
         """
         Initialize the outcome tracker.
 
         Args:
-            log_file: Path to JSON log file. Defaults to logs/strategies/
+            log_file: Path to JSON log file (tracker identity + one-time import source).
+                Defaults to logs/strategies/
+            db_path: SQLite store path (default: TRADE_STORE_DB or logs/trades.db)
         """
         self.log_file = log_file or self.DEFAULT_LOG_FILE
+        self.tracker_name = os.path.normpath(self.log_file)
         self._lock = threading.Lock()
-        self._data = self._load_or_create()
+        self.store = TradeStore.shared(db_path)
 
         # Ensure directory exists
         Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
 
+        self._migrate_json()
+        total = self.store.query_one(
+            "SELECT COUNT(*) AS n FROM pair_outcomes WHERE tracker = ?", (self.tracker_name,)
+        )["n"]
+
         logger.info(f"OutcomeTracker initialized: {self.log_file}")
-        logger.info(f"  Loaded {len(self._data['trades'])} historical trades")
+        logger.info(f"  Loaded {total} historical trades")
 
     def _load_or_create(self) -> Dict:
-        """Load existing data or create new structure"""
+        """Load existing JSON log data or create new structure"""
         if os.path.exists(self.log_file):
             try:
                 with open(self.log_file, 'r') as f:
@@ -110,13 +128,44 @@ class OutcomeTracker:
             "next_id": 1
         }
 
-    def _save(self):
-        """Save data to disk (call within lock)"""
-        try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self._data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save outcome log: {e}")
+    def _migrate_json(self):
+        """One-time import of the legacy JSON log into the store"""
+        if self.store.get_meta(self.tracker_name, "next_id") is not None:
+            return
+
+        data = self._load_or_create()
+        self._insert_trades(data["trades"])
+        for key in ("metadata", "next_id", "last_review_trade_count", "last_review_time"):
+            if key in data:
+                self.store.set_meta(self.tracker_name, key, data[key])
+
+        if data["trades"]:
+            logger.info(f"  Migrated {len(data['trades'])} trades from {self.log_file} to {self.store.db_path}")
+
+    def _insert_trades(self, trades: List[Dict]):
+        """Insert or replace trade dicts"""
+        columns = ["tracker"] + self.COLUMNS
+        rows = []
+        for trade in trades:
+            row = [self.tracker_name]
+            for c in self.COLUMNS:
+                value = trade.get(c)
+                row.append(json.dumps(value) if c in self.JSON_COLUMNS and value is not None else value)
+            rows.append(row)
+        self.store.executemany(
+            f"INSERT OR REPLACE INTO pair_outcomes ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            rows
+        )
+
+    def _row_to_trade(self, row) -> Dict:
+        """Convert a database row to the TradeOutcome dict layout"""
+        trade = {c: row[c] for c in self.COLUMNS}
+        for c in self.JSON_COLUMNS:
+            trade[c] = json.loads(trade[c]) if trade[c] is not None else None
+        if trade["correct_direction"] is not None:
+            trade["correct_direction"] = bool(trade["correct_direction"])
+        return trade
 
     def record_entry(
         self,
@@ -137,9 +186,11 @@ class OutcomeTracker:
         Returns:
             trade_id: Unique ID for this trade (use to record exit)
         """
-        with self._lock:
-            trade_id = self._data["next_id"]
-            self._data["next_id"] += 1
+        # Allocate the id and insert under one write lock: another process
+        # sharing the database must never be handed the same id
+        with self._lock, self.store.transaction(immediate=True):
+            trade_id = self.store.get_meta(self.tracker_name, "next_id", 1)
+            self.store.set_meta(self.tracker_name, "next_id", trade_id + 1)
 
             trade = TradeOutcome(
                 id=trade_id,
@@ -156,8 +207,7 @@ class OutcomeTracker:
                 status="open"
             )
 
-            self._data["trades"].append(asdict(trade))
-            self._save()
+            self._insert_trades([asdict(trade)])
 
             logger.info(f"[OUTCOME] Trade {trade_id} opened: Long {long_symbol}, Short {short_symbol}")
             return trade_id
@@ -179,16 +229,16 @@ class OutcomeTracker:
         """
         with self._lock:
             # Find the trade
-            trade = None
-            for t in self._data["trades"]:
-                if t["id"] == trade_id:
-                    trade = t
-                    break
+            row = self.store.query_one(
+                "SELECT * FROM pair_outcomes WHERE tracker = ? AND id = ?",
+                (self.tracker_name, trade_id)
+            )
 
-            if not trade:
+            if not row:
                 logger.error(f"[OUTCOME] Trade {trade_id} not found")
                 return None
 
+            trade = self._row_to_trade(row)
             if trade["status"] == "closed":
                 logger.warning(f"[OUTCOME] Trade {trade_id} already closed")
                 return None
@@ -227,7 +277,7 @@ class OutcomeTracker:
             trade["correct_direction"] = correct_direction
             trade["status"] = "closed"
 
-            self._save()
+            self._insert_trades([trade])
 
             direction_emoji = "✅" if correct_direction else "❌"
             logger.info(
@@ -248,10 +298,12 @@ class OutcomeTracker:
     def get_open_trade(self) -> Optional[Dict]:
         """Get the currently open trade, if any"""
         with self._lock:
-            for trade in reversed(self._data["trades"]):
-                if trade["status"] == "open":
-                    return trade
-            return None
+            row = self.store.query_one(
+                "SELECT * FROM pair_outcomes WHERE tracker = ? AND status = 'open' "
+                "ORDER BY id DESC LIMIT 1",
+                (self.tracker_name,)
+            )
+            return self._row_to_trade(row) if row else None
 
     def get_rolling_stats(self, n: int = 10) -> Dict:
         """
@@ -264,71 +316,81 @@ class OutcomeTracker:
             Dict with accuracy metrics and direction breakdown
         """
         with self._lock:
-            # Get last n closed trades
-            closed_trades = [t for t in self._data["trades"] if t["status"] == "closed"]
-            recent = closed_trades[-n:] if len(closed_trades) >= n else closed_trades
-
-            if not recent:
-                return {
-                    "total": 0,
-                    "correct": 0,
-                    "accuracy": 0.0,
-                    "avg_spread_return": 0.0,
-                    "eth_bias": {"count": 0, "correct": 0, "accuracy": 0.0},
-                    "btc_bias": {"count": 0, "correct": 0, "accuracy": 0.0},
-                    "sufficient_data": False
-                }
-
-            total = len(recent)
-            correct = sum(1 for t in recent if t.get("correct_direction", False))
-            accuracy = correct / total if total > 0 else 0.0
-
-            # Average spread return
-            spread_returns = [t.get("spread_return", 0) for t in recent]
-            avg_spread = sum(spread_returns) / len(spread_returns) if spread_returns else 0.0
-
-            # Breakdown by direction (which asset was longed)
-            eth_trades = [t for t in recent if "ETH" in t.get("long_symbol", "").upper()]
-            btc_trades = [t for t in recent if "BTC" in t.get("long_symbol", "").upper()]
-
-            eth_correct = sum(1 for t in eth_trades if t.get("correct_direction", False))
-            btc_correct = sum(1 for t in btc_trades if t.get("correct_direction", False))
+            row = self.store.query_one(
+                """
+                WITH recent AS (
+                    SELECT * FROM pair_outcomes
+                    WHERE tracker = ? AND status = 'closed'
+                    ORDER BY id DESC LIMIT ?
+                )
+                SELECT
+                    COUNT(*) AS total,
+                    COALESCE(SUM(correct_direction = 1), 0) AS correct,
+                    COALESCE(AVG(COALESCE(spread_return, 0)), 0) AS avg_spread,
+                    COALESCE(SUM(UPPER(long_symbol) LIKE '%ETH%'), 0) AS eth_count,
+                    COALESCE(SUM(UPPER(long_symbol) LIKE '%ETH%' AND correct_direction = 1), 0) AS eth_correct,
+                    COALESCE(SUM(UPPER(long_symbol) LIKE '%BTC%'), 0) AS btc_count,
+                    COALESCE(SUM(UPPER(long_symbol) LIKE '%BTC%' AND correct_direction = 1), 0) AS btc_correct
+                FROM recent
+                """,
+                (self.tracker_name, n)
+            )
 
+        total = row["total"]
+        if not total:
             return {
-                "total": total,
-                "correct": correct,
-                "accuracy": round(accuracy, 4),
-                "avg_spread_return": round(avg_spread, 4),
-                "eth_bias": {
-                    "count": len(eth_trades),
-                    "correct": eth_correct,
-                    "accuracy": round(eth_correct / len(eth_trades), 4) if eth_trades else 0.0
-                },
-                "btc_bias": {
-                    "count": len(btc_trades),
-                    "correct": btc_correct,
-                    "accuracy": round(btc_correct / len(btc_trades), 4) if btc_trades else 0.0
-                },
-                "sufficient_data": total >= 5
+                "total": 0,
+                "correct": 0,
+                "accuracy": 0.0,
+                "avg_spread_return": 0.0,
+                "eth_bias": {"count": 0, "correct": 0, "accuracy": 0.0},
+                "btc_bias": {"count": 0, "correct": 0, "accuracy": 0.0},
+                "sufficient_data": False
             }
 
+        correct = row["correct"]
+        eth_count, eth_correct = row["eth_count"], row["eth_correct"]
+        btc_count, btc_correct = row["btc_count"], row["btc_correct"]
+
+        return {
+            "total": total,
+            "correct": correct,
+            "accuracy": round(correct / total, 4),
+            "avg_spread_return": round(row["avg_spread"], 4),
+            "eth_bias": {
+                "count": eth_count,
+                "correct": eth_correct,
+                "accuracy": round(eth_correct / eth_count, 4) if eth_count else 0.0
+            },
+            "btc_bias": {
+                "count": btc_count,
+                "correct": btc_correct,
+                "accuracy": round(btc_correct / btc_count, 4) if btc_count else 0.0
+            },
+            "sufficient_data": total >= 5
+        }
+
     def get_trade_count(self) -> int:
         """Get total number of closed trades"""
         with self._lock:
-            return sum(1 for t in self._data["trades"] if t["status"] == "closed")
+            return self._closed_count()
+
+    def _closed_count(self) -> int:
+        return self.store.query_one(
+            "SELECT COUNT(*) AS n FROM pair_outcomes WHERE tracker = ? AND status = 'closed'",
+            (self.tracker_name,)
+        )["n"]
 
     def get_trades_since_last_review(self) -> int:
         """Get number of trades since last strategy review"""
         with self._lock:
-            last_review = self._data.get("last_review_trade_count", 0)
-            current_count = sum(1 for t in self._data["trades"] if t["status"] == "closed")
-            return current_count - last_review
+            last_review = self.store.get_meta(self.tracker_name, "last_review_trade_count", 0)
+            return self._closed_count() - last_review
 
     def mark_review_complete(self):
         """Mark that a strategy review has been completed"""
         with self._lock:
-            current_count = sum(1 for t in self._data["trades"] if t["status"] == "closed")
-            self._data["last_review_trade_count"] = current_count
-            self._data["last_review_time"] = datetime.now().isoformat()
-            self._save()
+            current_count = self._closed_count()
+            self.store.set_meta(self.tracker_name, "last_review_trade_count", current_count)
+            self.store.set_meta(self.tracker_name, "last_review_time", datetime.now().isoformat())
             logger.info(f"[OUTCOME] Review marked complete at trade {current_count}")
@@ -207,7 +207,7 @@ class SelfImprovingPairsStrategy:
 
         try:
             # Call LLM
-            result = self.llm_client.query(prompt)
+            result = await self.llm_client.aquery(prompt)
             if not result or not result.get('content'):
                 logger.warning("[STRATEGY] Empty LLM response, using default direction")
                 return self._get_default_direction()
@@ -0,0 +1,255 @@
+"""
+Trade Store - Embedded SQLite storage for trades and strategy outcomes
+
+One WAL-mode database shared by TradeTracker, both self-improving
+OutcomeTrackers and SelfLearning. Each component keeps its own table and
+queries it with indexed SQL instead of re-parsing a JSON file and scanning
+every trade in Python.
+
+Tables:
+- trades: TradeTracker rows (one per entry, updated on exit), keyed by dex
+- llm_outcomes: self_improving_llm OutcomeTracker rows, keyed by tracker name
+- pair_outcomes: self_improving_pairs OutcomeTracker rows, keyed by tracker name
+- tracker_meta: small key/value state (next_id, last review count, ...)
+
+Database location: TRADE_STORE_DB env var, else logs/trades.db.
+Existing JSON logs are imported once, the first time a component opens an
+empty namespace (see scripts/general/migrate_trade_store.py for a bulk run).
+
+Usage:
+    store = TradeStore.shared()
+    rows = store.query("SELECT symbol, COUNT(*) FROM trades WHERE dex = ? GROUP BY symbol", ("hibachi",))
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "logs/trades.db"
+DB_PATH_ENV = "TRADE_STORE_DB"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dex TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    order_key TEXT NOT NULL DEFAULT '',
+    order_id TEXT,
+    symbol TEXT,
+    side TEXT,
+    size REAL,
+    entry_price REAL,
+    exit_price REAL,
+    pnl REAL,
+    pnl_pct REAL,
+    fees REAL,
+    exit_timestamp TEXT,
+    exit_reason TEXT,
+    status TEXT,
+    notes TEXT,
+    confidence REAL,
+    UNIQUE (dex, timestamp, order_key)
+);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades (dex, symbol, status);
+CREATE INDEX IF NOT EXISTS idx_trades_side ON trades (dex, side);
+CREATE INDEX IF NOT EXISTS idx_trades_status ON trades (dex, status);
+CREATE INDEX IF NOT EXISTS idx_trades_entry_time ON trades (dex, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trades_exit_time ON trades (dex, exit_timestamp);
+
+CREATE TABLE IF NOT EXISTS llm_outcomes (
+    tracker TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    open_time TEXT,
+    close_time TEXT,
+    symbol TEXT,
+    base_symbol TEXT,
+    direction TEXT,
+    confidence REAL,
+    confidence_bracket TEXT,
+    entry_price REAL,
+    exit_price REAL,
+    pnl_percent REAL,
+    pnl_usd REAL,
+    is_win INTEGER,
+    llm_reasoning TEXT,
+    hold_duration_seconds INTEGER,
+    status TEXT,
+    tags TEXT,
+    PRIMARY KEY (tracker, id)
+);
+CREATE INDEX IF NOT EXISTS idx_llm_status ON llm_outcomes (tracker, status, id);
+CREATE INDEX IF NOT EXISTS idx_llm_symbol ON llm_outcomes (tracker, base_symbol);
+CREATE INDEX IF NOT EXISTS idx_llm_direction ON llm_outcomes (tracker, direction);
+CREATE INDEX IF NOT EXISTS idx_llm_open_time ON llm_outcomes (tracker, open_time);
+CREATE INDEX IF NOT EXISTS idx_llm_close_time ON llm_outcomes (tracker, close_time);
+
+CREATE TABLE IF NOT EXISTS pair_outcomes (
+    tracker TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    open_time TEXT,
+    close_time TEXT,
+    long_symbol TEXT,
+    short_symbol TEXT,
+    llm_reasoning TEXT,
+    entry_prices TEXT,
+    exit_prices TEXT,
+    returns TEXT,
+    correct_direction INTEGER,
+    spread_return REAL,
+    status TEXT,
+    PRIMARY KEY (tracker, id)
+);
+CREATE INDEX IF NOT EXISTS idx_pair_status ON pair_outcomes (tracker, status, id);
+CREATE INDEX IF NOT EXISTS idx_pair_long_symbol ON pair_outcomes (tracker, long_symbol);
+CREATE INDEX IF NOT EXISTS idx_pair_open_time ON pair_outcomes (tracker, open_time);
+CREATE INDEX IF NOT EXISTS idx_pair_close_time ON pair_outcomes (tracker, close_time);
+
+CREATE TABLE IF NOT EXISTS tracker_meta (
+    tracker TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (tracker, key)
+);
+"""
+
+
+def resolve_db_path(db_path: Optional[str] = None) -> str:
+    """Database path: explicit argument, else TRADE_STORE_DB, else logs/trades.db"""
+    return str(db_path or os.getenv(DB_PATH_ENV) or DEFAULT_DB_PATH)
+
+
+class TradeStore:
+    """Thread-safe SQLite connection (WAL mode) with the trade/outcome schema"""
+
+    _instances: Dict[str, "TradeStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (and create if needed) the trade store
+
+        Args:
+            db_path: SQLite file path (default: TRADE_STORE_DB or logs/trades.db)
+        """
+        self.db_path = resolve_db_path(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0  # open transaction() blocks on this connection
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL: readers never block the writer, and several bots can share the file
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        logger.info(f"TradeStore opened: {self.db_path}")
+
+    @classmethod
+    def shared(cls, db_path: Optional[str] = None) -> "TradeStore":
+        """
+        Get the process-wide store for a database path
+
+        Args:
+            db_path: SQLite file path (default: TRADE_STORE_DB or logs/trades.db)
+
+        Returns:
+            TradeStore instance (one per resolved path)
+        """
+        path = os.path.abspath(resolve_db_path(db_path))
+        with cls._instances_lock:
+            store = cls._instances.get(path)
+            if store is None:
+                store = cls(path)
+                cls._instances[path] = store
+            return store
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """
+        Run several statements atomically; yields the connection
+
+        Nested blocks (including execute/set_meta calls) join the outermost
+        transaction, which commits once at the end.
+
+        Args:
+            immediate: Take the database write lock up front (BEGIN IMMEDIATE),
+                so a read-then-write can't interleave with another process
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._conn
+                finally:
+                    self._depth -= 1
+                return
+
+            self._depth = 1
+            try:
+                if immediate and not self._conn.in_transaction:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                self._depth = 0
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        """
+        Execute one write statement and commit
+
+        Returns:
+            Number of rows changed
+        """
+        with self.transaction() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def executemany(self, sql: str, rows: Iterable[Sequence]) -> int:
+        """Execute a write statement for many rows in one transaction"""
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def query(self, sql: str, params: Sequence = ()) -> List[sqlite3.Row]:
+        """Run a read query and return all rows"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence = ()) -> Optional[sqlite3.Row]:
+        """Run a read query and return the first row (or None)"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def get_meta(self, tracker: str, key: str, default: Any = None) -> Any:
+        """Read a JSON value from tracker_meta"""
+        row = self.query_one(
+            "SELECT value FROM tracker_meta WHERE tracker = ? AND key = ?", (tracker, key)
+        )
+        return json.loads(row["value"]) if row else default
+
+    def set_meta(self, tracker: str, key: str, value: Any):
+        """Write a JSON value to tracker_meta"""
+        self.execute(
+            "INSERT INTO tracker_meta (tracker, key, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (tracker, key) DO UPDATE SET value = excluded.value",
+            (tracker, key, json.dumps(value))
+        )
+
+    def close(self):
+        """Close the connection"""
+        with self._lock:
+            self._conn.close()
+        with self._instances_lock:
+            for path, store in list(self._instances.items()):
+                if store is self:
+                    del self._instances[path]
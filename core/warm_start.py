@@ -0,0 +1,177 @@
+"""
+Warm Start - periodic snapshot of a bot's warm caches, restored at startup
+
+A watchdog restart used to throw away everything a bot had built up: symbol
+lists and market metadata, incremental indicator state, macro/Deep42
+context, fast-exit trailing stops. Each of those is registered here as a
+section with a capture and a restore function; the store pickles all
+sections to one file every `interval` seconds (and on shutdown) and feeds
+them back at startup.
+
+Staleness is checked per section: a section older than its max_age, or a
+file written with a different SNAPSHOT_VERSION, is ignored and that
+component warms up the normal way. A restored section that is saved again
+unchanged keeps its original age, so a bot that keeps restarting still
+re-fetches (e.g. its symbol list) once max_age is up. Bump SNAPSHOT_VERSION
+when a section's payload changes shape.
+
+Snapshots are written by the bot itself (atomic rename) to
+logs/warm_state/<bot>.pkl, or $WARM_START_DIR/<bot>.pkl. They are pickles,
+so never point WARM_START_DIR at a directory other users can write.
+
+Usage:
+    warm = WarmStartStore("hibachi")
+    warm.register("symbols", fetcher.get_state, fetcher.set_state, max_age=6 * 3600)
+    warm.restore()
+    task = asyncio.create_task(warm.run())   # periodic saves
+    ...
+    task.cancel()
+    warm.save()
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_DIR = "logs/warm_state"
+DIR_ENV = "WARM_START_DIR"
+
+
+@dataclass
+class _Section:
+    name: str
+    capture: Callable[[], Any]
+    restore: Callable[[Any], None]
+    max_age: float
+
+
+class WarmStartStore:
+    """Versioned snapshot/restore of a bot's in-memory state"""
+
+    def __init__(self, bot_name: str, directory: Optional[str] = None, interval: float = 60.0):
+        """
+        Args:
+            bot_name: Snapshot file name (one file per bot)
+            directory: Snapshot directory (default: $WARM_START_DIR or logs/warm_state)
+            interval: Seconds between periodic saves in run()
+        """
+        directory = directory or os.getenv(DIR_ENV) or DEFAULT_DIR
+        self.path = os.path.join(directory, f"{bot_name}.pkl")
+        self.interval = interval
+        self._sections: Dict[str, _Section] = {}
+        self.last_save: Optional[float] = None
+        self.restored: List[str] = []
+        self._restored_states: Dict[str, tuple] = {}  # name -> (pickled state, saved_at)
+
+    def register(
+        self,
+        name: str,
+        capture: Callable[[], Any],
+        restore: Callable[[Any], None],
+        max_age: float
+    ):
+        """
+        Add a section to the snapshot
+
+        Args:
+            name: Section key
+            capture: Returns the picklable state (None = nothing worth saving)
+            restore: Applies a previously captured state
+            max_age: Seconds after which a saved state is too stale to restore
+        """
+        self._sections[name] = _Section(name, capture, restore, max_age)
+
+    def save(self) -> bool:
+        """Capture every section and write the snapshot atomically; True on success"""
+        now = time.time()
+        sections = {}
+        for section in self._sections.values():
+            try:
+                state = section.capture()
+            except Exception as e:
+                logger.warning(f"⚠️ Warm start: capturing {section.name} failed: {e}")
+                continue
+            if state is not None:
+                sections[section.name] = {'saved_at': self._saved_at(section.name, state, now), 'state': state}
+
+        snapshot = {'version': SNAPSHOT_VERSION, 'saved_at': now, 'sections': sections}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"❌ Warm start snapshot to {self.path} failed: {e}")
+            return False
+        self.last_save = now
+        logger.debug(f"💾 Warm start snapshot saved ({', '.join(sections) or 'empty'})")
+        return True
+
+    def _saved_at(self, name: str, state: Any, now: float) -> float:
+        """Original snapshot time while a restored section is still unchanged"""
+        # Compared pickled: restored objects may be the very ones mutated since
+        restored = self._restored_states.get(name)
+        if restored is None:
+            return now
+        if pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL) == restored[0]:
+            return restored[1]
+        del self._restored_states[name]
+        return now
+
+    def restore(self) -> List[str]:
+        """
+        Apply the saved snapshot to every registered section that is still fresh
+
+        Returns:
+            Names of the sections restored
+        """
+        self.restored = []
+        if not os.path.exists(self.path):
+            return self.restored
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Warm start snapshot {self.path} unreadable, starting cold: {e}")
+            return self.restored
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            logger.info(f"Warm start snapshot {self.path} is from another version, starting cold")
+            return self.restored
+
+        now = time.time()
+        skipped = []
+        for name, saved in snapshot.get('sections', {}).items():
+            section = self._sections.get(name)
+            if section is None:
+                continue
+            age = now - saved['saved_at']
+            if age > section.max_age:
+                skipped.append(f"{name} ({age / 60:.0f}m old)")
+                continue
+            try:
+                section.restore(saved['state'])
+                self.restored.append(name)
+                self._restored_states[name] = (
+                    pickle.dumps(saved['state'], protocol=pickle.HIGHEST_PROTOCOL), saved['saved_at'])
+            except Exception as e:
+                skipped.append(f"{name} ({e})")
+
+        age = now - snapshot.get('saved_at', now)
+        logger.info(f"♻️ Warm start: restored {', '.join(self.restored) or 'nothing'} from a {age:.0f}s-old snapshot"
+                    + (f" | stale/failed: {', '.join(skipped)}" if skipped else ""))
+        return self.restored
+
+    async def run(self):
+        """Save every `interval` seconds until cancelled (call save() on shutdown)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.save()
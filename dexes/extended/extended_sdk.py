@@ -7,7 +7,6 @@ Base URL: https://api.starknet.extended.exchange/api/v1
 """
 
 import asyncio
-import aiohttp
 import logging
 import os
 from typing import Dict, Optional, List
@@ -15,10 +14,15 @@ from decimal import Decimal
 from datetime import datetime
 from dotenv import load_dotenv
 
+from dexes.http_session import PooledSession
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+EXTENDED_API_URL = "https://api.starknet.extended.exchange/api/v1"
+EXTENDED_TESTNET_API_URL = "https://api.starknet.sepolia.extended.exchange/api/v1"
+
 
 class ExtendedSDK:
     """REST API wrapper for Extended Exchange trading"""
@@ -29,7 +33,9 @@ class ExtendedSDK:
         stark_private_key: Optional[str] = None,
         stark_public_key: Optional[str] = None,
         vault: Optional[int] = None,
-        testnet: bool = False
+        testnet: bool = False,
+        max_connections_per_host: int = 10,
+        base_url: Optional[str] = None
     ):
         """
         Initialize Extended SDK
@@ -40,11 +46,12 @@ class ExtendedSDK:
             stark_public_key: Stark public key
             vault: Vault/position ID
             testnet: Use testnet instead of mainnet
+            max_connections_per_host: Keep-alive pool size per host
+            base_url: API root override (default: $EXTENDED_API_URL, then
+                mainnet/testnet), e.g. a local mock venue
         """
-        if testnet:
-            self.base_url = "https://api.starknet.sepolia.extended.exchange/api/v1"
-        else:
-            self.base_url = "https://api.starknet.extended.exchange/api/v1"
+        default_url = EXTENDED_TESTNET_API_URL if testnet else EXTENDED_API_URL
+        self.base_url = base_url or os.getenv("EXTENDED_API_URL") or default_url
 
         self.api_key = api_key
         self.stark_private_key = stark_private_key
@@ -56,6 +63,30 @@ class ExtendedSDK:
         self._markets_cache_time = None
         self._cache_ttl = 300  # 5 minutes
 
+        # One keep-alive pool for the lifetime of the SDK (opened on first request)
+        # The shared rate budget belongs to the live API key, not to local venues
+        live = self.base_url == default_url
+        self._http = PooledSession(limit_per_host=max_connections_per_host, rate_limit="extended" if live else None)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP connection pool"""
+        await self._http.close()
+
+    def get_latency_stats(self) -> Dict[str, Dict]:
+        """
+        Get per-endpoint request latency counters
+
+        Returns:
+            Dict of "METHOD /path" -> {count, errors, avg_ms, min_ms, max_ms, last_ms}
+        """
+        return self._http.get_latency_stats()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
         return {
@@ -87,29 +118,29 @@ class ExtendedSDK:
         headers = self._get_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=data
-                ) as resp:
-                    if resp.status == 200:
-                        result = await resp.json()
-                        if result.get("status") == "OK":
-                            return result.get("data")
-                        else:
-                            error = result.get("error", {})
-                            logger.error(f"API Error: {error.get('message', 'Unknown error')}")
-                            return None
-                    elif resp.status == 429:
-                        logger.warning("Rate limited by Extended API")
-                        return None
+            async with self._http.request(
+                method,
+                url,
+                endpoint=endpoint,
+                headers=headers,
+                params=params,
+                json=data
+            ) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    if result.get("status") == "OK":
+                        return result.get("data")
                     else:
-                        error_text = await resp.text()
-                        logger.error(f"HTTP Error {resp.status}: {error_text}")
+                        error = result.get("error", {})
+                        logger.error(f"API Error: {error.get('message', 'Unknown error')}")
                         return None
+                elif resp.status == 429:
+                    logger.warning("Rate limited by Extended API")
+                    return None
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"HTTP Error {resp.status}: {error_text}")
+                    return None
 
         except Exception as e:
             logger.error(f"Request failed: {e}")
@@ -590,4 +621,7 @@ if __name__ == "__main__":
             for c in candles[:5]:
                 print(f"  O:{c.get('o')} H:{c.get('h')} L:{c.get('l')} C:{c.get('c')}")
 
+        print(f"\nLatency: {sdk.get_latency_stats()}")
+        await sdk.close()
+
     asyncio.run(test())
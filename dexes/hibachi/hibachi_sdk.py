@@ -4,7 +4,6 @@ REST API implementation with HMAC authentication
 """
 
 import asyncio
-import aiohttp
 import hmac
 import hashlib
 import time
@@ -13,20 +12,41 @@ import os
 import logging
 import base64
 import struct
+import threading
 from typing import Dict, Optional, List
 from dotenv import load_dotenv
 
+from dexes.http_session import PooledSession
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+HIBACHI_API_URL = "https://api.hibachi.xyz"
+HIBACHI_DATA_API_URL = "https://data-api.hibachi.xyz"
+
 
 class HibachiSDK:
     """REST API wrapper for Hibachi trading"""
 
-    def __init__(self, api_key: str, api_secret: str, account_id: Optional[str] = None):
-        self.base_url = "https://api.hibachi.xyz"
-        self.data_api_url = "https://data-api.hibachi.xyz"
+    # Last order nonce issued in this process (shared by every SDK instance,
+    # since they may sign for the same account)
+    _last_nonce = 0
+    _nonce_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        account_id: Optional[str] = None,
+        max_connections_per_host: int = 10,
+        base_url: Optional[str] = None,
+        data_api_url: Optional[str] = None
+    ):
+        # Override with HIBACHI_API_URL / HIBACHI_DATA_API_URL to point at
+        # a local mock venue (dexes/mock_exchange)
+        self.base_url = base_url or os.getenv("HIBACHI_API_URL") or HIBACHI_API_URL
+        self.data_api_url = data_api_url or os.getenv("HIBACHI_DATA_API_URL") or HIBACHI_DATA_API_URL
         self.api_key = api_key
         # Per official Hibachi TypeScript SDK (sdk_hmac.ts), use raw string bytes
         # Buffer.from('your-private-key') in Node.js = UTF-8 encoding by default
@@ -34,6 +54,30 @@ class HibachiSDK:
         self._account_id = account_id  # Account ID from Hibachi UI (Settings → API Keys)
         logger.debug(f"SDK initialized with secret length: {len(self.api_secret_bytes)} bytes")
 
+        # One keep-alive pool for the lifetime of the SDK (opened on first request)
+        # The shared rate budget belongs to the live API key, not to local venues
+        live = self.base_url == HIBACHI_API_URL
+        self._http = PooledSession(limit_per_host=max_connections_per_host, rate_limit="hibachi" if live else None)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP connection pool"""
+        await self._http.close()
+
+    def get_latency_stats(self) -> Dict[str, Dict]:
+        """
+        Get per-endpoint request latency counters
+
+        Returns:
+            Dict of "METHOD /path" -> {count, errors, avg_ms, min_ms, max_ms, last_ms}
+        """
+        return self._http.get_latency_stats()
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Generate headers for Hibachi API
@@ -72,20 +116,20 @@ class HibachiSDK:
         headers = self._get_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=data if data else None
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"API Error {resp.status}: {error_text}")
-                        return {"error": error_text, "status": resp.status}
+            async with self._http.request(
+                method,
+                url,
+                endpoint=endpoint,
+                headers=headers,
+                params=params,
+                json=data if data else None
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"API Error {resp.status}: {error_text}")
+                    return {"error": error_text, "status": resp.status}
 
         except Exception as e:
             logger.error(f"Request failed: {e}")
@@ -340,6 +384,22 @@ class HibachiSDK:
             logger.error(f"Error getting price: {e}")
             return None
 
+    async def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several markets in one concurrent batch
+
+        Requests share the keep-alive pool, so the batch takes about one
+        round-trip instead of one per symbol.
+
+        Args:
+            symbols: Market symbols (e.g., ["BTC/USDT-P", "ETH/USDT-P"])
+
+        Returns:
+            Dict of symbol -> price (symbols without a price are omitted)
+        """
+        prices = await asyncio.gather(*(self.get_price(symbol) for symbol in symbols))
+        return {symbol: price for symbol, price in zip(symbols, prices) if price is not None}
+
     async def get_market_info(self, symbol: str) -> Optional[Dict]:
         """
         Get market info for a specific symbol
@@ -357,6 +417,18 @@ class HibachiSDK:
         logger.error(f"Market not found: {symbol}")
         return None
 
+    @classmethod
+    def _next_nonce(cls) -> int:
+        """
+        Millisecond-timestamp nonce, strictly increasing across concurrent orders
+
+        Returns:
+            max(now in ms, last nonce + 1)
+        """
+        with cls._nonce_lock:
+            cls._last_nonce = max(int(time.time() * 1000), cls._last_nonce + 1)
+            return cls._last_nonce
+
     def _pack_order_buffer(
         self,
         nonce: int,
@@ -480,8 +552,8 @@ class HibachiSDK:
                 logger.error(f"Cannot create order: contract ID not found for {symbol}")
                 return None
 
-            # Generate nonce
-            nonce = int(time.time() * 1000)
+            # Generate nonce (unique even for orders placed in the same millisecond)
+            nonce = self._next_nonce()
 
             # Convert quantity to integer with proper decimals
             # Quantity = amount × 10^decimals
@@ -535,17 +607,16 @@ class HibachiSDK:
             logger.info(f"Creating order: {symbol} {'BUY' if is_buy else 'SELL'} {amount}")
             logger.debug(f"Order data: {order_data}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=order_data) as resp:
-                    if resp.status == 200:
-                        response = await resp.json()
-                        logger.info(f"✅ Order created: {response}")
-                        return response
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"Failed to create order - API Error {resp.status}: {error_text}")
-                        # Return error dict so executor can detect and retry
-                        return {'error': error_text, 'status': resp.status}
+            async with self._http.request("POST", url, headers=headers, json=order_data) as resp:
+                if resp.status == 200:
+                    response = await resp.json()
+                    logger.info(f"✅ Order created: {response}")
+                    return response
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"Failed to create order - API Error {resp.status}: {error_text}")
+                    # Return error dict so executor can detect and retry
+                    return {'error': error_text, 'status': resp.status}
 
         except Exception as e:
             logger.error(f"Error creating order: {e}")
@@ -591,8 +662,8 @@ class HibachiSDK:
                 logger.error(f"Cannot create order: contract ID not found for {symbol}")
                 return None
 
-            # Generate nonce
-            nonce = int(time.time() * 1000)
+            # Generate nonce (unique even for orders placed in the same millisecond)
+            nonce = self._next_nonce()
 
             # Convert quantity to integer with underlying decimals
             quantity_int = int(amount * (10 ** underlying_decimals))
@@ -644,16 +715,15 @@ class HibachiSDK:
 
             logger.info(f"Creating LIMIT order: {symbol} {'BUY' if is_buy else 'SELL'} {amount} @ ${price}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=order_data) as resp:
-                    if resp.status == 200:
-                        response = await resp.json()
-                        logger.info(f"✅ Limit order created: {response}")
-                        return response
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"Failed to create limit order - API Error {resp.status}: {error_text}")
-                        return {'error': error_text, 'status': resp.status}
+            async with self._http.request("POST", url, headers=headers, json=order_data) as resp:
+                if resp.status == 200:
+                    response = await resp.json()
+                    logger.info(f"✅ Limit order created: {response}")
+                    return response
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"Failed to create limit order - API Error {resp.status}: {error_text}")
+                    return {'error': error_text, 'status': resp.status}
 
         except Exception as e:
             logger.error(f"Error creating limit order: {e}")
@@ -687,20 +757,40 @@ class HibachiSDK:
 
             url = f"{self.base_url}{endpoint}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=headers, json=cancel_data) as resp:
-                    if resp.status == 200:
-                        logger.info(f"✅ Order {order_id} cancelled")
-                        return True
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"Failed to cancel order - API Error {resp.status}: {error_text}")
-                        return False
+            async with self._http.request("DELETE", url, headers=headers, json=cancel_data) as resp:
+                if resp.status == 200:
+                    logger.info(f"✅ Order {order_id} cancelled")
+                    return True
+                else:
+                    error_text = await resp.text()
+                    logger.error(f"Failed to cancel order - API Error {resp.status}: {error_text}")
+                    return False
 
         except Exception as e:
             logger.error(f"Error canceling order: {e}")
             return False
 
+    async def cancel_all_orders(self, symbol: Optional[str] = None) -> int:
+        """
+        Cancel every open order (optionally for one symbol), concurrently
+
+        Args:
+            symbol: Optional symbol filter (e.g., "BTC/USDT-P")
+
+        Returns:
+            Number of orders cancelled
+        """
+        orders = await self.get_orders(symbol)
+        order_ids = [
+            o.get('orderId') for o in orders
+            if o.get('orderId') is not None
+            and str(o.get('status', '')).upper() not in ('FILLED', 'CANCELLED', 'REJECTED')
+        ]
+        if not order_ids:
+            return 0
+        results = await asyncio.gather(*(self.cancel_order(oid) for oid in order_ids))
+        return sum(1 for ok in results if ok)
+
     async def get_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         """
         Get all orders (open and recent)
@@ -709,23 +799,37 @@ class HibachiSDK:
             symbol: Optional symbol filter (e.g., "BTC/USDT-P")
 
         Returns:
-            List of order dictionaries
+            List of order dictionaries ([] on error - use fetch_orders to tell
+            a failed request from an empty book)
+        """
+        orders = await self.fetch_orders(symbol)
+        return orders if orders is not None else []
+
+    async def fetch_orders(self, symbol: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Get all orders (open and recent), reporting failures
+
+        Args:
+            symbol: Optional symbol filter (e.g., "BTC/USDT-P")
+
+        Returns:
+            List of order dictionaries, or None if the request failed
         """
         try:
             # Get account ID
             account_id = self.get_account_id()
             if not account_id:
                 logger.error("Cannot get orders: account ID not set. Use set_account_id() or pass to constructor.")
-                return []
+                return None
 
             params = {"accountId": account_id}
             if symbol:
                 params["symbol"] = symbol
 
             response = await self._request("GET", "/trade/orders", params=params)
-            if "error" in response:
+            if isinstance(response, dict) and "error" in response:
                 logger.error(f"Failed to get orders: {response['error']}")
-                return []
+                return None
 
             # Response may be direct list or dict with "orders" key
             if isinstance(response, list):
@@ -734,7 +838,36 @@ class HibachiSDK:
 
         except Exception as e:
             logger.error(f"Error getting orders: {e}")
-            return []
+            return None
+
+    async def get_order(self, order_id: str) -> Optional[Dict]:
+        """
+        Get one order's details, including finished orders
+
+        Args:
+            order_id: Order ID
+
+        Returns:
+            Order dictionary (with 'status'), or None on error
+        """
+        try:
+            account_id = self.get_account_id()
+            if not account_id:
+                logger.error("Cannot get order: account ID not set. Use set_account_id() or pass to constructor.")
+                return None
+
+            response = await self._request("GET", "/trade/order", params={"accountId": account_id, "orderId": order_id})
+            if not isinstance(response, dict):
+                logger.error(f"Failed to get order {order_id}: unexpected response")
+                return None
+            if "error" in response:
+                logger.error(f"Failed to get order {order_id}: {response['error']}")
+                return None
+            return response
+
+        except Exception as e:
+            logger.error(f"Error getting order {order_id}: {e}")
+            return None
 
 
 async def test_connection():
@@ -815,6 +948,9 @@ async def test_connection():
     else:
         print("❌ Failed to get orderbook")
 
+    print(f"\nLatency: {sdk.get_latency_stats()}")
+    await sdk.close()
+
 
 if __name__ == "__main__":
     asyncio.run(test_connection())
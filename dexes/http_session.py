@@ -0,0 +1,200 @@
+"""
+Pooled HTTP Session
+Long-lived aiohttp connection pool shared by the REST SDK wrappers
+
+Each SDK instance owns one PooledSession. The underlying ClientSession is
+created lazily on first use (it must be bound to a running event loop) and
+reused for every request, so keep-alive connections, TLS sessions and DNS
+lookups survive between calls instead of being rebuilt per request.
+"""
+
+import asyncio
+import time
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class EndpointLatency:
+    """Running latency counters for one endpoint"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def record(self, elapsed_ms: float, ok: bool = True):
+        """Record one request"""
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict:
+        """Export counters as a plain dict"""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'min_ms': self.min_ms or 0.0,
+            'max_ms': self.max_ms,
+            'last_ms': self.last_ms
+        }
+
+
+class PooledSession:
+    """Keep-alive aiohttp session with per-host connection cap and latency stats"""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        timeout: float = 30.0,
+        rate_limit: Optional[str] = None
+    ):
+        """
+        Initialize pool settings (no sockets are opened until first request)
+
+        Args:
+            limit: Max total open connections
+            limit_per_host: Max open connections per host
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_cache_ttl: Seconds DNS results are cached
+            timeout: Total per-request timeout in seconds
+            rate_limit: Shared rate-limit budget for this API key (e.g. 'hibachi');
+                requests wait for a token and a 429 backs off every bot on the host
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latency: Dict[str, EndpointLatency] = {}
+
+        self.rate_limit = rate_limit
+        self._limiter = None
+        if rate_limit:
+            from utils.shared_rate_limiter import get_rate_limiter
+            self._limiter = get_rate_limiter()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared ClientSession, creating it if needed
+
+        A session is bound to the loop it was created on. Callers that drive
+        the SDK from several asyncio.run() calls get a fresh pool per loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            await self._release_stale_session()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._loop = loop
+            logger.debug(f"Opened HTTP pool (limit_per_host={self.limit_per_host})")
+        return self._session
+
+    async def _release_stale_session(self):
+        """
+        Close a session created on another event loop instead of leaking its pool
+
+        If that loop is still running (another thread) the close is scheduled
+        there; if it is gone, aiohttp marks the connector closed and drops the
+        pooled keep-alive connections without touching the dead loop.
+        """
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+        try:
+            if loop is not None and loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                await session.close()
+        except Exception as e:
+            logger.debug(f"Error closing stale HTTP pool: {e}")
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, endpoint: Optional[str] = None, **kwargs):
+        """
+        Issue a request on the pooled session and record its latency
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            endpoint: Label for latency stats (defaults to the URL path)
+            **kwargs: Passed through to aiohttp (headers, params, json, ...)
+
+        Yields:
+            aiohttp.ClientResponse
+        """
+        label = f"{method.upper()} {endpoint or urlsplit(url).path}"
+        session = await self.get_session()
+        if self._limiter:
+            await self._limiter.acquire(self.rate_limit, bot_name=label)
+        start = time.perf_counter()
+        ok = False
+        try:
+            async with session.request(method, url, **kwargs) as resp:
+                if resp.status == 429 and self._limiter:
+                    self._limiter.penalize(self.rate_limit, self._retry_after(resp))
+                yield resp
+                ok = resp.status < 400
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._latency.setdefault(label, EndpointLatency()).record(elapsed_ms, ok)
+
+    @staticmethod
+    def _retry_after(resp, default: float = 1.0) -> float:
+        """Seconds from a Retry-After header (default if missing/unparseable)"""
+        try:
+            return float(resp.headers.get('Retry-After', default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_latency_stats(self) -> Dict[str, Dict]:
+        """
+        Get per-endpoint latency counters
+
+        Returns:
+            Dict of "METHOD /path" -> {count, errors, avg_ms, min_ms, max_ms, last_ms}
+        """
+        return {label: stats.to_dict() for label, stats in self._latency.items()}
+
+    def reset_latency_stats(self):
+        """Clear all latency counters"""
+        self._latency.clear()
+
+    async def close(self):
+        """Close the pool and release all connections"""
+        if self._session is not None and self._loop is not asyncio.get_running_loop():
+            await self._release_stale_session()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
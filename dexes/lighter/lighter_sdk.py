@@ -14,12 +14,15 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+LIGHTER_API_URL = "https://mainnet.zklighter.elliot.ai"
+
 
 class LighterSDK:
     """Simple wrapper for Lighter trading"""
 
-    def __init__(self, private_key: str, account_index: int, api_key_index: int):
-        self.url = "https://mainnet.zklighter.elliot.ai"
+    def __init__(self, private_key: str, account_index: int, api_key_index: int, url: Optional[str] = None):
+        # Override with LIGHTER_API_URL to point at a local mock venue (dexes/mock_exchange)
+        self.url = url or os.getenv("LIGHTER_API_URL") or LIGHTER_API_URL
         self.private_key = private_key
         self.account_index = account_index
         self.api_key_index = api_key_index
@@ -260,7 +263,7 @@ class LighterSDK:
             # Fetch latest 1m candle
             import lighter
             import time
-            config = lighter.Configuration(host='https://mainnet.zklighter.elliot.ai')
+            config = lighter.Configuration(host=self.url)
             async with lighter.ApiClient(config) as api_client:
                 api = lighter.CandlestickApi(api_client)
                 # Get 1 candle from 1m resolution (most recent)
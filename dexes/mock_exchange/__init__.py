@@ -0,0 +1,6 @@
+"""Local mock venue (matching engine + Hibachi/Extended/Lighter/Paradex REST dialects)"""
+from .engine import MockExchange, MockMarket
+from .server import MockExchangeServer
+from .venues import VENUES, default_markets
+
+__all__ = ['MockExchange', 'MockExchangeServer', 'MockMarket', 'VENUES', 'default_markets']
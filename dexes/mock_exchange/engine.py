@@ -0,0 +1,472 @@
+"""
+Mock Exchange Engine
+In-memory perpetuals venue: price-time priority order books, accounts,
+positions, fees, funding accrual and a house market maker
+
+The engine is venue-agnostic; dexes/mock_exchange/server.py puts each
+venue's REST dialect (Hibachi, Extended, Lighter, Paradex) in front of one
+MockExchange per venue.
+
+Order books keep one FIFO queue per price and a sorted price list per
+side (bisect), so submit/cancel/match stay O(log levels) and the engine
+handles tens of thousands of orders per second in one process.
+
+Usage:
+    exchange = MockExchange([MockMarket("BTC/USDT-P", price=100000.0, tick_size=0.1)])
+    exchange.open_account("acct-1", balance=10000.0)
+    order = exchange.submit("acct-1", "BTC/USDT-P", "BUY", 0.01, price=99990.0)
+    exchange.step()   # random-walk the house quotes, accrue funding when due
+"""
+
+import bisect
+import itertools
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOUSE = "__house__"
+
+OPEN, FILLED, CANCELLED, REJECTED = "OPEN", "FILLED", "CANCELLED", "REJECTED"
+
+# Account orders kept for status lookups after they leave the book
+ORDER_HISTORY_SIZE = 10000
+
+
+@dataclass
+class MockMarket:
+    """One perpetual market and the house liquidity quoted on it"""
+    symbol: str
+    price: float                      # initial reference (mark) price
+    tick_size: float = 0.01
+    step_size: float = 0.0001
+    min_notional: float = 1.0
+    market_id: int = 0                # numeric id (Lighter market_index, Hibachi contract id)
+    size_decimals: int = 4
+    price_decimals: int = 2
+    maker_fee: float = 0.0            # fraction of notional (negative = rebate)
+    taker_fee: float = 0.0005
+    funding_rate: float = 0.0001      # per funding interval, longs pay when positive
+    # House liquidity
+    house_levels: int = 10
+    house_level_size: float = 1.0
+    house_spread_bps: float = 1.0     # mid to first level
+    house_step_bps: float = 1.0       # between levels
+    volatility_bps: float = 1.0       # std dev of the reference per step()
+
+
+@dataclass
+class Order:
+    """A live or finished order"""
+    order_id: str
+    account_id: str
+    symbol: str
+    side: str                 # BUY / SELL
+    size: float
+    price: Optional[float]    # None for market orders
+    order_type: str = "LIMIT"
+    post_only: bool = False
+    reduce_only: bool = False
+    client_id: Optional[str] = None
+    remaining: float = 0.0
+    status: str = OPEN
+    filled_notional: float = 0.0
+    created_at: float = 0.0
+
+    @property
+    def filled(self) -> float:
+        return self.size - self.remaining
+
+    @property
+    def avg_fill_price(self) -> float:
+        return self.filled_notional / self.filled if self.filled > 0 else 0.0
+
+
+@dataclass
+class Position:
+    """Signed position in one market"""
+    size: float = 0.0
+    entry_price: float = 0.0
+    realized_pnl: float = 0.0
+    funding_paid: float = 0.0
+
+
+@dataclass
+class Fill:
+    """One execution (one row per side)"""
+    fill_id: int
+    order_id: str
+    account_id: str
+    symbol: str
+    side: str
+    price: float
+    size: float
+    fee: float
+    liquidity: str            # MAKER / TAKER
+    timestamp: float
+
+
+@dataclass
+class Account:
+    """Cash balance, positions and order index for one account"""
+    account_id: str
+    balance: float
+    positions: Dict[str, Position] = field(default_factory=dict)
+    orders: Dict[str, Order] = field(default_factory=dict)   # open orders
+    fills: Deque[Fill] = field(default_factory=lambda: deque(maxlen=1000))
+
+
+class OrderBook:
+    """Price-time priority book for one market"""
+
+    def __init__(self):
+        self.levels: Dict[str, Dict[float, Deque[Order]]] = {'BUY': {}, 'SELL': {}}
+        self.prices: Dict[str, List[float]] = {'BUY': [], 'SELL': []}  # ascending
+
+    def best(self, side: str) -> Optional[float]:
+        prices = self.prices[side]
+        if not prices:
+            return None
+        return prices[-1] if side == 'BUY' else prices[0]
+
+    def add(self, order: Order):
+        levels = self.levels[order.side]
+        queue = levels.get(order.price)
+        if queue is None:
+            queue = levels[order.price] = deque()
+            bisect.insort(self.prices[order.side], order.price)
+        queue.append(order)
+
+    def remove(self, order: Order):
+        levels = self.levels[order.side]
+        queue = levels.get(order.price)
+        if queue is None:
+            return
+        try:
+            queue.remove(order)
+        except ValueError:
+            return
+        if not queue:
+            self._drop_level(order.side, order.price)
+
+    def _drop_level(self, side: str, price: float):
+        del self.levels[side][price]
+        prices = self.prices[side]
+        i = bisect.bisect_left(prices, price)
+        if i < len(prices) and prices[i] == price:
+            prices.pop(i)
+
+    def depth(self, side: str, limit: int = 20) -> List[Tuple[float, float]]:
+        """[(price, size)] best first"""
+        prices = self.prices[side]
+        chosen = reversed(prices[-limit:]) if side == 'BUY' else prices[:limit]
+        return [(p, sum(o.remaining for o in self.levels[side][p])) for p in chosen]
+
+
+class MockExchange:
+    """Matching engine + accounts for one mock venue"""
+
+    def __init__(
+        self,
+        markets: Iterable[MockMarket],
+        funding_interval: float = 3600.0,
+        seed: Optional[int] = None,
+        clock=time.time
+    ):
+        """
+        Args:
+            markets: Markets to list
+            funding_interval: Seconds between funding payments
+            seed: Random seed for the house price walk
+            clock: Time source (epoch seconds)
+        """
+        self.markets: Dict[str, MockMarket] = {m.symbol: m for m in markets}
+        self.by_id: Dict[int, MockMarket] = {m.market_id: m for m in self.markets.values()}
+        self.books: Dict[str, OrderBook] = {s: OrderBook() for s in self.markets}
+        self.reference: Dict[str, float] = {s: m.price for s, m in self.markets.items()}
+        self.last_price: Dict[str, float] = dict(self.reference)
+        self.accounts: Dict[str, Account] = {}
+        self.orders: Dict[str, Order] = {}   # every open order by id
+        self._history: "OrderedDict[str, Order]" = OrderedDict()  # recent account orders, any status
+        self.funding_interval = funding_interval
+        self.clock = clock
+        self._next_funding = clock() + funding_interval
+        self._rng = random.Random(seed)
+        self._order_ids = itertools.count(1)
+        self._fill_ids = itertools.count(1)
+
+        # Stats
+        self.orders_submitted = 0
+        self.fill_count = 0
+        self.volume = 0.0
+
+        self.accounts[HOUSE] = Account(HOUSE, balance=float('inf'))
+        for symbol in self.markets:
+            self._requote(symbol)
+
+    # ------------------------------------------------------------------
+    # Accounts
+    # ------------------------------------------------------------------
+
+    def open_account(self, account_id: str, balance: float = 10000.0) -> Account:
+        """Create (or return) an account"""
+        account = self.accounts.get(account_id)
+        if account is None:
+            account = self.accounts[account_id] = Account(account_id, balance)
+        return account
+
+    def account(self, account_id: str) -> Account:
+        """Account by id (auto-created with the default balance)"""
+        return self.accounts.get(account_id) or self.open_account(account_id)
+
+    def mark_price(self, symbol: str) -> float:
+        bid, ask = self.bbo(symbol)
+        if bid is not None and ask is not None:
+            return (bid + ask) / 2
+        return self.last_price[symbol]
+
+    def unrealized_pnl(self, account: Account) -> float:
+        return sum(
+            pos.size * (self.mark_price(symbol) - pos.entry_price)
+            for symbol, pos in account.positions.items() if pos.size
+        )
+
+    def equity(self, account: Account) -> float:
+        return account.balance + self.unrealized_pnl(account)
+
+    # ------------------------------------------------------------------
+    # Market data
+    # ------------------------------------------------------------------
+
+    def bbo(self, symbol: str) -> Tuple[Optional[float], Optional[float]]:
+        book = self.books[symbol]
+        return book.best('BUY'), book.best('SELL')
+
+    def depth(self, symbol: str, limit: int = 20) -> Dict[str, List[Tuple[float, float]]]:
+        book = self.books[symbol]
+        return {'bids': book.depth('BUY', limit), 'asks': book.depth('SELL', limit)}
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        account_id: str,
+        symbol: str,
+        side: str,
+        size: float,
+        price: Optional[float] = None,
+        order_type: str = "LIMIT",
+        post_only: bool = False,
+        reduce_only: bool = False,
+        client_id: Optional[str] = None
+    ) -> Order:
+        """
+        Submit an order; it matches immediately against the opposite side
+
+        Market (and IOC) orders cancel whatever does not fill. POST_ONLY
+        orders that would cross are rejected. Reduce-only orders are cut to
+        the position size.
+
+        Returns:
+            Order (status OPEN / FILLED / CANCELLED / REJECTED)
+        """
+        self.orders_submitted += 1
+        side = side.upper()
+        order = Order(
+            order_id=str(next(self._order_ids)), account_id=account_id, symbol=symbol, side=side,
+            size=size, price=price, order_type=order_type.upper(), post_only=post_only,
+            reduce_only=reduce_only, client_id=client_id, remaining=size, created_at=self.clock(),
+        )
+        if account_id != HOUSE:
+            self._history[order.order_id] = order
+            if len(self._history) > ORDER_HISTORY_SIZE:
+                self._history.popitem(last=False)
+        market = self.markets.get(symbol)
+        account = self.account(account_id)
+        if market is None or size <= 0 or side not in ('BUY', 'SELL'):
+            order.status = REJECTED
+            return order
+
+        if reduce_only:
+            position = account.positions.get(symbol)
+            held = position.size if position else 0.0
+            reducible = -held if side == 'BUY' else held
+            if reducible <= 0:
+                order.status = REJECTED
+                return order
+            order.remaining = order.size = min(size, reducible)
+
+        book = self.books[symbol]
+        opposite = 'SELL' if side == 'BUY' else 'BUY'
+        best = book.best(opposite)
+        crosses = best is not None and (
+            price is None or (price >= best if side == 'BUY' else price <= best)
+        )
+        if post_only and crosses:
+            order.status = REJECTED
+            return order
+
+        if crosses:
+            self._match(order, book, opposite, market)
+
+        if order.remaining <= 1e-12:
+            order.remaining = 0.0
+            order.status = FILLED
+        elif price is None or order.order_type in ('MARKET', 'IOC'):
+            order.status = CANCELLED if order.filled else REJECTED
+        else:
+            book.add(order)
+            account.orders[order.order_id] = order
+            self.orders[order.order_id] = order
+        return order
+
+    def cancel(self, order_id: str, account_id: Optional[str] = None) -> bool:
+        """Cancel an open order (False if unknown, finished or another account's)"""
+        order = self.orders.get(order_id)
+        if order is None or (account_id is not None and order.account_id != account_id):
+            return False
+        self._close(order, CANCELLED)
+        return True
+
+    def cancel_all(self, account_id: str, symbol: Optional[str] = None) -> int:
+        """Cancel an account's open orders (optionally one market)"""
+        account = self.account(account_id)
+        orders = [o for o in account.orders.values() if symbol is None or o.symbol == symbol]
+        for order in orders:
+            self._close(order, CANCELLED)
+        return len(orders)
+
+    def get_order(self, order_id: str, account_id: Optional[str] = None) -> Optional[Order]:
+        """Open or recently finished account order (None if unknown or another account's)"""
+        order = self.orders.get(order_id) or self._history.get(order_id)
+        if order is None or (account_id is not None and order.account_id != account_id):
+            return None
+        return order
+
+    def open_orders(self, account_id: str, symbol: Optional[str] = None) -> List[Order]:
+        return [o for o in self.account(account_id).orders.values() if symbol is None or o.symbol == symbol]
+
+    def _close(self, order: Order, status: str):
+        order.status = status
+        self.books[order.symbol].remove(order)
+        self.orders.pop(order.order_id, None)
+        self.accounts[order.account_id].orders.pop(order.order_id, None)
+
+    def _match(self, taker: Order, book: OrderBook, side: str, market: MockMarket):
+        """Fill taker against resting orders on side, best price first"""
+        levels, prices = book.levels[side], book.prices[side]
+        while taker.remaining > 1e-12 and prices:
+            price = prices[-1] if side == 'BUY' else prices[0]
+            if taker.price is not None and (price > taker.price if taker.side == 'BUY' else price < taker.price):
+                break
+            queue = levels[price]
+            while queue and taker.remaining > 1e-12:
+                maker = queue[0]
+                size = min(taker.remaining, maker.remaining)
+                self._execute(maker, size, price, market.maker_fee, 'MAKER')
+                self._execute(taker, size, price, market.taker_fee, 'TAKER')
+                self.fill_count += 1
+                self.volume += size * price
+                if maker.remaining <= 1e-12:
+                    maker.remaining = 0.0
+                    maker.status = FILLED
+                    queue.popleft()
+                    self.orders.pop(maker.order_id, None)
+                    self.accounts[maker.account_id].orders.pop(maker.order_id, None)
+            if not queue:
+                book._drop_level(side, price)
+        self.last_price[market.symbol] = taker.avg_fill_price or self.last_price[market.symbol]
+
+    def _execute(self, order: Order, size: float, price: float, fee_rate: float, liquidity: str):
+        order.remaining -= size
+        order.filled_notional += size * price
+        account = self.accounts[order.account_id]
+        fee = size * price * fee_rate
+        if order.account_id != HOUSE:
+            account.balance -= fee
+            self._apply_fill(account, order.symbol, size if order.side == 'BUY' else -size, price)
+            account.fills.append(Fill(
+                fill_id=next(self._fill_ids), order_id=order.order_id, account_id=order.account_id,
+                symbol=order.symbol, side=order.side, price=price, size=size, fee=fee,
+                liquidity=liquidity, timestamp=self.clock(),
+            ))
+
+    @staticmethod
+    def _apply_fill(account: Account, symbol: str, delta: float, price: float):
+        """Update position and realize P&L for the closed part"""
+        pos = account.positions.setdefault(symbol, Position())
+        if pos.size == 0 or (pos.size > 0) == (delta > 0):
+            new_size = pos.size + delta
+            pos.entry_price = (pos.entry_price * pos.size + price * delta) / new_size
+            pos.size = new_size
+            return
+
+        closing = min(abs(delta), abs(pos.size))
+        pnl = closing * (price - pos.entry_price) * (1 if pos.size > 0 else -1)
+        pos.realized_pnl += pnl
+        account.balance += pnl
+        pos.size += delta
+        if abs(pos.size) <= 1e-12:
+            pos.size, pos.entry_price = 0.0, 0.0
+        elif (pos.size > 0) == (delta > 0):
+            pos.entry_price = price  # flipped through zero
+
+    # ------------------------------------------------------------------
+    # House liquidity and funding
+    # ------------------------------------------------------------------
+
+    def _requote(self, symbol: str):
+        """Replace the house ladder around the reference price"""
+        market = self.markets[symbol]
+        self.cancel_all(HOUSE, symbol)
+        ref = self.reference[symbol]
+        tick = market.tick_size
+        for side, sign in (('BUY', -1), ('SELL', 1)):
+            for i in range(market.house_levels):
+                offset_bps = market.house_spread_bps + i * market.house_step_bps
+                raw = ref * (1 + sign * offset_bps / 10000)
+                steps = (raw / tick) // 1 if side == 'BUY' else -((-raw / tick) // 1)
+                price = round(steps * tick, 10)
+                self.submit(HOUSE, symbol, side, market.house_level_size, price=price)
+
+    def set_reference(self, symbol: str, price: float):
+        """Move a market's reference price and requote (tests / scripted moves)"""
+        self.reference[symbol] = price
+        self._requote(symbol)
+
+    def step(self):
+        """Random-walk every reference price, requote and accrue funding when due"""
+        for symbol, market in self.markets.items():
+            if market.volatility_bps:
+                self.reference[symbol] *= 1 + self._rng.gauss(0, market.volatility_bps) / 10000
+            self._requote(symbol)
+        if self.clock() >= self._next_funding:
+            self.accrue_funding()
+            self._next_funding += self.funding_interval
+
+    def accrue_funding(self):
+        """Charge one funding payment on every position (longs pay a positive rate)"""
+        for account_id, account in self.accounts.items():
+            if account_id == HOUSE:
+                continue
+            for symbol, pos in account.positions.items():
+                if not pos.size:
+                    continue
+                payment = pos.size * self.mark_price(symbol) * self.markets[symbol].funding_rate
+                account.balance -= payment
+                pos.funding_paid += payment
+
+    def get_stats(self) -> Dict:
+        return {
+            'orders_submitted': self.orders_submitted,
+            'open_orders': len(self.orders),
+            'fills': self.fill_count,
+            'volume': self.volume,
+            'accounts': len(self.accounts) - 1,
+        }
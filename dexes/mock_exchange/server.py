@@ -0,0 +1,164 @@
+"""
+Mock Exchange Server
+Local aiohttp server hosting a mock Hibachi, Extended, Lighter and Paradex
+
+Each venue gets its own MockExchange behind its own URL prefix, so the
+unchanged SDKs run against it by swapping their base URL (see env_vars()).
+A background task steps every venue (house quotes random-walk, funding
+accrues), and middleware injects latency, jitter and errors to exercise
+retry/timeout paths without touching a live venue.
+
+Usage:
+    async with MockExchangeServer(latency=0.02, error_rate=0.01) as server:
+        sdk = HibachiSDK("key", "secret", "1", base_url=server.base_url("hibachi"),
+                         data_api_url=server.base_url("hibachi"))
+        await sdk.create_limit_order("BTC/USDT-P", True, 0.001, 99000)
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, Iterable, Optional
+
+from aiohttp import web
+
+from dexes.mock_exchange.engine import MockExchange
+from dexes.mock_exchange.venues import VENUES, default_markets
+
+logger = logging.getLogger(__name__)
+
+
+class MockExchangeServer:
+    """One HTTP server, one MockExchange per venue"""
+
+    def __init__(
+        self,
+        venues: Iterable[str] = tuple(VENUES),
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        step_interval: float = 1.0,
+        funding_interval: float = 3600.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            venues: Venues to host (keys of VENUES)
+            host: Bind address
+            port: Bind port (0 = pick a free one)
+            latency: Seconds added to every response
+            jitter: Extra uniform random delay, 0..jitter seconds
+            error_rate: Fraction of requests answered with error_status
+            error_status: HTTP status for injected errors
+            step_interval: Seconds between house requotes / funding checks (0 = never)
+            funding_interval: Seconds between funding payments
+            seed: Random seed (price walks and error injection)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.step_interval = step_interval
+        self.exchanges: Dict[str, MockExchange] = {
+            venue: MockExchange(default_markets(venue), funding_interval=funding_interval, seed=seed)
+            for venue in venues
+        }
+        self._rng = random.Random(seed)
+        self._fail_next = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._stepper: Optional[asyncio.Task] = None
+
+        # Stats
+        self.requests = 0
+        self.injected_errors = 0
+
+        self.app = web.Application(middlewares=[self._inject])
+        for venue in self.exchanges:
+            prefix, build_routes = VENUES[venue]
+            sub = web.Application()
+            sub.add_routes(build_routes(self.exchanges[venue]))
+            self.app.add_subapp(prefix, sub)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def start(self):
+        """Bind the server and start stepping the venues"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        if self.step_interval:
+            self._stepper = asyncio.create_task(self._step_loop())
+        logger.info(f"✅ Mock exchange listening on http://{self.host}:{self.port} ({', '.join(self.exchanges)})")
+
+    async def stop(self):
+        if self._stepper:
+            self._stepper.cancel()
+            try:
+                await self._stepper
+            except asyncio.CancelledError:
+                pass
+            self._stepper = None
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _step_loop(self):
+        while True:
+            await asyncio.sleep(self.step_interval)
+            for exchange in self.exchanges.values():
+                exchange.step()
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        self.requests += 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._fail_next > 0 or (self.error_rate and self._rng.random() < self.error_rate):
+            self._fail_next = max(0, self._fail_next - 1)
+            self.injected_errors += 1
+            return web.json_response({"error": "Injected failure"}, status=self.error_status)
+        return await handler(request)
+
+    def fail_next(self, count: int = 1, status: Optional[int] = None):
+        """Answer the next count requests with an error (status defaults to error_status)"""
+        self._fail_next = count
+        if status is not None:
+            self.error_status = status
+
+    def base_url(self, venue: str) -> str:
+        """Root URL the venue's SDK should use in place of its production host"""
+        prefix = VENUES[venue][0]
+        if venue == "lighter":
+            prefix = prefix[:-len("/api/v1")]  # the lighter client appends /api/v1 itself
+        return f"http://{self.host}:{self.port}{prefix}"
+
+    def env_vars(self) -> Dict[str, str]:
+        """Environment overrides that point the SDKs at this server"""
+        env = {}
+        if "hibachi" in self.exchanges:
+            env["HIBACHI_API_URL"] = env["HIBACHI_DATA_API_URL"] = self.base_url("hibachi")
+        if "extended" in self.exchanges:
+            env["EXTENDED_API_URL"] = self.base_url("extended")
+        if "lighter" in self.exchanges:
+            env["LIGHTER_API_URL"] = self.base_url("lighter")
+        return env
+
+    def get_stats(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'injected_errors': self.injected_errors,
+            'venues': {venue: exchange.get_stats() for venue, exchange in self.exchanges.items()},
+        }
@@ -0,0 +1,558 @@
+"""
+Mock Exchange Venue Dialects
+REST routes that speak each venue's wire format on top of a MockExchange
+
+Only the endpoints this repo's SDKs and grid adapters call are served, in
+the response shapes those clients parse (see dexes/hibachi/hibachi_sdk.py,
+dexes/extended/extended_sdk.py, dexes/lighter/lighter_sdk.py and
+core/grid_mm/adapters.py). Signatures are not verified; the account is taken
+from the field each venue uses to identify it.
+"""
+
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+from aiohttp import web
+
+from dexes.mock_exchange.engine import CANCELLED, FILLED, OPEN, REJECTED, MockExchange, MockMarket, Order
+
+RouteBuilder = Callable[[MockExchange], List[web.RouteDef]]
+
+
+def default_markets(venue: str) -> List[MockMarket]:
+    """BTC, ETH and SOL listed under the venue's own symbol naming"""
+    base = [
+        # (asset, price, tick, step, market_id)
+        ("BTC", 100000.0, 0.1, 0.0001, 1),
+        ("ETH", 3500.0, 0.01, 0.001, 2),
+        ("SOL", 200.0, 0.001, 0.01, 3),
+    ]
+    naming = {
+        "hibachi": "{}/USDT-P",
+        "extended": "{}-USD",
+        "lighter": "{}",
+        "paradex": "{}-USD-PERP",
+    }[venue]
+    markets = []
+    for asset, price, tick, step, market_id in base:
+        markets.append(MockMarket(
+            symbol=naming.format(asset), price=price, tick_size=tick, step_size=step,
+            min_notional=10.0, market_id=market_id,
+            size_decimals=len(f"{step:f}".rstrip('0').split('.')[1]),
+            price_decimals=len(f"{tick:f}".rstrip('0').split('.')[1]),
+            house_level_size=round(20000 / price, 4),
+        ))
+    return markets
+
+
+def _num(value: float) -> str:
+    """Venue-style decimal string"""
+    return f"{value:.10f}".rstrip('0').rstrip('.') or "0"
+
+
+def _error(message: str, status: int = 400) -> web.Response:
+    return web.json_response({"error": message}, status=status)
+
+
+async def _body(request: web.Request) -> Dict:
+    try:
+        return await request.json()
+    except Exception:
+        return {}
+
+
+# ----------------------------------------------------------------------
+# Hibachi (api.hibachi.xyz + data-api.hibachi.xyz on one prefix)
+# ----------------------------------------------------------------------
+
+HIBACHI_STATUS = {OPEN: "PLACED", FILLED: "FILLED", CANCELLED: "CANCELLED", REJECTED: "REJECTED"}
+
+
+def hibachi_routes(ex: MockExchange) -> List[web.RouteDef]:
+    def order_json(o: Order) -> Dict:
+        return {
+            "orderId": o.order_id, "symbol": o.symbol, "side": "BID" if o.side == 'BUY' else "ASK",
+            "orderType": o.order_type, "price": _num(o.price or 0), "totalQuantity": _num(o.size),
+            "availableQuantity": _num(o.remaining), "status": HIBACHI_STATUS[o.status],
+        }
+
+    async def exchange_info(request):
+        return web.json_response({"futureContracts": [
+            {
+                "id": m.market_id, "symbol": m.symbol, "status": "LIVE",
+                "underlyingDecimals": m.size_decimals + 4, "settlementDecimals": 6,
+                "tickSize": _num(m.tick_size), "minOrderSize": _num(m.step_size),
+                "minNotional": _num(m.min_notional),
+            } for m in ex.markets.values()
+        ]})
+
+    async def orderbook(request):
+        symbol = request.query.get("symbol", "")
+        if symbol not in ex.markets:
+            return _error(f"Unknown symbol {symbol}")
+        depth = ex.depth(symbol, int(request.query.get("depth", 20)))
+        return web.json_response({
+            "bid": {"levels": [{"price": _num(p), "quantity": _num(q)} for p, q in depth['bids']]},
+            "ask": {"levels": [{"price": _num(p), "quantity": _num(q)} for p, q in depth['asks']]},
+        })
+
+    async def prices(request):
+        symbol = request.query.get("symbol", "")
+        if symbol not in ex.markets:
+            return _error(f"Unknown symbol {symbol}")
+        bid, ask = ex.bbo(symbol)
+        return web.json_response({
+            "symbol": symbol, "markPrice": _num(ex.mark_price(symbol)),
+            "tradePrice": _num(ex.last_price[symbol]), "bidPrice": _num(bid or 0), "askPrice": _num(ask or 0),
+            "fundingRateEstimation": {"estimatedFundingRate": _num(ex.markets[symbol].funding_rate)},
+        })
+
+    async def balance(request):
+        account = ex.account(request.query.get("accountId", ""))
+        return web.json_response({"balance": _num(ex.equity(account))})
+
+    async def account_info(request):
+        account = ex.account(request.query.get("accountId", ""))
+        return web.json_response({
+            "balance": _num(ex.equity(account)),
+            "positions": [
+                {
+                    "symbol": symbol, "quantity": _num(abs(pos.size)),
+                    "direction": "Long" if pos.size > 0 else "Short", "openPrice": _num(pos.entry_price),
+                    "unrealizedTradingPnl": _num(pos.size * (ex.mark_price(symbol) - pos.entry_price)),
+                } for symbol, pos in account.positions.items() if pos.size
+            ],
+        })
+
+    used_nonces = set()  # (accountId, nonce): the venue rejects replays
+
+    async def place(request):
+        data = await _body(request)
+        if data.get("nonce") is not None:
+            key = (str(data.get("accountId", "")), data["nonce"])
+            if key in used_nonces:
+                return _error("Nonce already used")
+            used_nonces.add(key)
+        price = data.get("price")
+        order = ex.submit(
+            str(data.get("accountId", "")), data.get("symbol", ""),
+            'BUY' if data.get("side") == "BID" else 'SELL', float(data.get("quantity", 0)),
+            price=float(price) if price is not None and data.get("orderType") != "MARKET" else None,
+            order_type=data.get("orderType", "LIMIT"),
+        )
+        if order.status == REJECTED:
+            return _error("Order rejected")
+        return web.json_response({"orderId": order.order_id})
+
+    async def cancel(request):
+        data = await _body(request)
+        if not ex.cancel(str(data.get("orderId")), str(data.get("accountId", ""))):
+            return _error("Order not found")
+        return web.json_response({})
+
+    async def orders(request):
+        account_id = request.query.get("accountId", "")
+        return web.json_response([order_json(o) for o in ex.open_orders(account_id, request.query.get("symbol"))])
+
+    async def order(request):
+        found = ex.get_order(request.query.get("orderId", ""), request.query.get("accountId", ""))
+        return web.json_response(order_json(found)) if found else _error("Order not found", 404)
+
+    return [
+        web.get("/market/exchange-info", exchange_info),
+        web.get("/market/data/orderbook", orderbook),
+        web.get("/market/data/prices", prices),
+        web.get("/capital/balance", balance),
+        web.get("/trade/account/info", account_info),
+        web.post("/trade/order", place),
+        web.delete("/trade/order", cancel),
+        web.get("/trade/order", order),
+        web.get("/trade/orders", orders),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Extended (/api/v1, {"status": "OK", "data": ...} envelope)
+# ----------------------------------------------------------------------
+
+EXTENDED_STATUS = {OPEN: "NEW", FILLED: "FILLED", CANCELLED: "CANCELLED", REJECTED: "REJECTED"}
+
+
+def extended_routes(ex: MockExchange) -> List[web.RouteDef]:
+    def ok(data) -> web.Response:
+        return web.json_response({"status": "OK", "data": data})
+
+    def fail(message: str, status: int = 400) -> web.Response:
+        return web.json_response({"status": "ERROR", "error": {"code": status, "message": message}}, status=status)
+
+    def account_of(request):
+        return ex.account(request.headers.get("X-Api-Key", ""))
+
+    def stats(symbol: str) -> Dict:
+        bid, ask = ex.bbo(symbol)
+        return {
+            "lastPrice": _num(ex.last_price[symbol]), "markPrice": _num(ex.mark_price(symbol)),
+            "indexPrice": _num(ex.reference[symbol]), "bidPrice": _num(bid or 0), "askPrice": _num(ask or 0),
+            "fundingRate": _num(ex.markets[symbol].funding_rate),
+        }
+
+    def order_json(o: Order) -> Dict:
+        return {
+            "id": o.order_id, "externalId": o.client_id, "market": o.symbol, "side": o.side,
+            "type": o.order_type, "price": _num(o.price or 0), "qty": _num(o.size),
+            "filledQty": _num(o.filled), "averagePrice": _num(o.avg_fill_price), "status": EXTENDED_STATUS[o.status],
+        }
+
+    async def markets(request):
+        wanted = set(request.query.getall("market", []))
+        return ok([
+            {
+                "name": m.symbol, "status": "ACTIVE", "active": True, "assetName": m.symbol.split("-")[0],
+                "assetPrecision": m.size_decimals, "collateralAssetName": "USD",
+                "tradingConfig": {
+                    "minOrderSize": _num(m.step_size), "minOrderSizeChange": _num(m.step_size),
+                    "minPriceChange": _num(m.tick_size),
+                },
+                "marketStats": stats(m.symbol),
+            } for m in ex.markets.values() if not wanted or m.symbol in wanted
+        ])
+
+    async def market_stats(request):
+        symbol = request.match_info["market"]
+        return ok(stats(symbol)) if symbol in ex.markets else fail(f"Unknown market {symbol}", 404)
+
+    async def orderbook(request):
+        symbol = request.match_info["market"]
+        if symbol not in ex.markets:
+            return fail(f"Unknown market {symbol}", 404)
+        depth = ex.depth(symbol)
+        return ok({
+            "market": symbol,
+            "bid": [{"qty": _num(q), "price": _num(p)} for p, q in depth['bids']],
+            "ask": [{"qty": _num(q), "price": _num(p)} for p, q in depth['asks']],
+        })
+
+    async def funding(request):
+        symbol = request.match_info["market"]
+        if symbol not in ex.markets:
+            return fail(f"Unknown market {symbol}", 404)
+        return ok([{"m": symbol, "T": int(ex.clock() * 1000), "f": _num(ex.markets[symbol].funding_rate)}])
+
+    async def balance(request):
+        account = account_of(request)
+        return ok({
+            "balance": _num(account.balance), "equity": _num(ex.equity(account)),
+            "availableForTrade": _num(ex.equity(account)), "unrealisedPnl": _num(ex.unrealized_pnl(account)),
+        })
+
+    async def positions(request):
+        account = account_of(request)
+        wanted = set(request.query.getall("market", []))
+        return ok([
+            {
+                "market": symbol, "side": "LONG" if pos.size > 0 else "SHORT", "size": _num(abs(pos.size)),
+                "openPrice": _num(pos.entry_price), "markPrice": _num(ex.mark_price(symbol)),
+                "unrealisedPnl": _num(pos.size * (ex.mark_price(symbol) - pos.entry_price)),
+                "realisedPnl": _num(pos.realized_pnl),
+            } for symbol, pos in account.positions.items() if pos.size and (not wanted or symbol in wanted)
+        ])
+
+    async def orders(request):
+        account = account_of(request)
+        wanted = set(request.query.getall("market", []))
+        return ok([order_json(o) for o in account.orders.values() if not wanted or o.symbol in wanted])
+
+    async def place(request):
+        data = await _body(request)
+        price = data.get("price")
+        order_type = data.get("type", "LIMIT")
+        order = ex.submit(
+            request.headers.get("X-Api-Key", ""), data.get("market", ""), data.get("side", ""),
+            float(data.get("qty", data.get("size", 0))),
+            price=float(price) if price is not None and order_type != "MARKET" else None,
+            order_type=order_type, post_only=bool(data.get("postOnly")),
+            reduce_only=bool(data.get("reduceOnly")), client_id=data.get("id") or data.get("clientId"),
+        )
+        if order.status == REJECTED:
+            return fail("Order rejected")
+        return ok({"id": order.order_id, "externalId": order.client_id})
+
+    async def cancel(request):
+        if not ex.cancel(request.match_info["order_id"], request.headers.get("X-Api-Key", "")):
+            return fail("Order not found", 404)
+        return ok({})
+
+    async def mass_cancel(request):
+        data = await _body(request)
+        account_id = request.headers.get("X-Api-Key", "")
+        for symbol in data.get("markets") or [None]:
+            ex.cancel_all(account_id, symbol)
+        for order_id in data.get("orderIds") or []:
+            ex.cancel(str(order_id), account_id)
+        return ok({})
+
+    return [
+        web.get("/info/markets", markets),
+        web.get("/info/markets/{market}/stats", market_stats),
+        web.get("/info/markets/{market}/orderbook", orderbook),
+        web.get("/info/{market}/funding", funding),
+        web.get("/user/balance", balance),
+        web.get("/user/positions", positions),
+        web.get("/user/orders", orders),
+        web.post("/user/order", place),
+        web.post("/user/orders", place),
+        web.delete("/user/order/{order_id}", cancel),
+        web.post("/user/order/massCancel", mass_cancel),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Lighter (/api/v1, integer-scaled amounts in signed tx_info)
+# ----------------------------------------------------------------------
+
+LIGHTER_CREATE_ORDER, LIGHTER_CANCEL_ORDER, LIGHTER_CANCEL_ALL = 14, 15, 16
+LIGHTER_IOC, LIGHTER_POST_ONLY = 0, 2
+
+
+def lighter_routes(ex: MockExchange) -> List[web.RouteDef]:
+    def ok(**data) -> web.Response:
+        return web.json_response({"code": 200, **data})
+
+    def market_of(market_id) -> Optional[MockMarket]:
+        try:
+            return ex.by_id.get(int(market_id))
+        except (TypeError, ValueError):
+            return None
+
+    async def order_books(request):
+        return ok(order_books=[
+            {
+                "symbol": m.symbol, "market_id": m.market_id, "status": "active",
+                "supported_size_decimals": m.size_decimals, "supported_price_decimals": m.price_decimals,
+                "min_base_amount": _num(m.step_size), "min_quote_amount": _num(m.min_notional),
+                "taker_fee": _num(m.taker_fee * 100), "maker_fee": _num(m.maker_fee * 100),
+            } for m in ex.markets.values()
+        ])
+
+    async def order_book_orders(request):
+        market = market_of(request.query.get("market_id"))
+        if market is None:
+            return _error("Unknown market")
+        depth = ex.depth(market.symbol, int(request.query.get("limit", 20)))
+        return ok(
+            bids=[{"price": _num(p), "remaining_base_amount": _num(q)} for p, q in depth['bids']],
+            asks=[{"price": _num(p), "remaining_base_amount": _num(q)} for p, q in depth['asks']],
+        )
+
+    async def account(request):
+        index = request.query.get("value", "")
+        acct = ex.account(index)
+        positions = []
+        for symbol, pos in acct.positions.items():
+            market = ex.markets[symbol]
+            mark = ex.mark_price(symbol)
+            positions.append({
+                "market_id": market.market_id, "symbol": symbol, "sign": 1 if pos.size >= 0 else -1,
+                "position": _num(abs(pos.size)), "avg_entry_price": _num(pos.entry_price),
+                "position_value": _num(abs(pos.size) * mark),
+                "unrealized_pnl": _num(pos.size * (mark - pos.entry_price)),
+                "realized_pnl": _num(pos.realized_pnl),
+            })
+        equity = ex.equity(acct)
+        return ok(total=1, accounts=[{
+            "index": int(index) if index.isdigit() else 0, "available_balance": _num(equity),
+            "collateral": _num(acct.balance), "total_asset_value": _num(equity), "positions": positions,
+        }])
+
+    async def active_orders(request):
+        market = market_of(request.query.get("market_id"))
+        orders = ex.open_orders(request.query.get("account_index", ""), market.symbol if market else None)
+        return ok(orders=[
+            {
+                "order_index": int(o.order_id), "client_order_index": int(o.client_id or 0),
+                "market_index": ex.markets[o.symbol].market_id, "is_ask": o.side == 'SELL',
+                "price": _num(o.price or 0), "initial_base_amount": _num(o.size),
+                "remaining_base_amount": _num(o.remaining), "status": "open",
+            } for o in orders
+        ])
+
+    async def candlesticks(request):
+        market = market_of(request.query.get("market_id"))
+        if market is None:
+            return _error("Unknown market")
+        price = ex.last_price[market.symbol]
+        return ok(resolution=request.query.get("resolution", "1m"), candlesticks=[{
+            "timestamp": int(ex.clock() * 1000), "open": price, "high": price, "low": price,
+            "close": price, "volume0": 0, "volume1": 0,
+        }])
+
+    async def next_nonce(request):
+        return ok(nonce=int(time.time() * 1000))
+
+    async def send_tx(request):
+        form = await request.post()
+        try:
+            tx_type = int(form.get("tx_type", 0))
+            tx = json.loads(form.get("tx_info", "{}"))
+        except (TypeError, ValueError):
+            return _error("Malformed tx")
+        account_id = str(tx.get("AccountIndex", ""))
+        market = market_of(tx.get("MarketIndex"))
+
+        if tx_type == LIGHTER_CREATE_ORDER:
+            if market is None:
+                return _error("Unknown market")
+            tif = tx.get("TimeInForce")
+            is_market = tx.get("Type") == 1 or tif == LIGHTER_IOC
+            order = ex.submit(
+                account_id, market.symbol, 'SELL' if tx.get("IsAsk") else 'BUY',
+                int(tx.get("BaseAmount", 0)) / 10 ** market.size_decimals,
+                price=int(tx.get("Price", 0)) / 10 ** market.price_decimals,
+                order_type="IOC" if is_market else "LIMIT", post_only=tif == LIGHTER_POST_ONLY,
+                reduce_only=bool(tx.get("ReduceOnly")), client_id=str(tx.get("ClientOrderIndex", 0)),
+            )
+            if order.status == REJECTED:
+                return _error("Order rejected")
+        elif tx_type == LIGHTER_CANCEL_ORDER:
+            if not ex.cancel(str(tx.get("Index")), account_id):
+                return _error("Order not found")
+        elif tx_type == LIGHTER_CANCEL_ALL:
+            ex.cancel_all(account_id)
+        else:
+            return _error(f"Unsupported tx_type {tx_type}")
+        return ok(tx_hash=f"{tx_type:02x}{int(time.time() * 1e6):x}")
+
+    return [
+        web.get("/orderBooks", order_books),
+        web.get("/orderBookOrders", order_book_orders),
+        web.get("/account", account),
+        web.get("/accountActiveOrders", active_orders),
+        web.get("/candlesticks", candlesticks),
+        web.get("/nextNonce", next_nonce),
+        web.post("/sendTx", send_tx),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Paradex (/v1, {"results": [...]} lists, bearer-token accounts)
+# ----------------------------------------------------------------------
+
+PARADEX_STATUS = {OPEN: "OPEN", FILLED: "CLOSED", CANCELLED: "CLOSED", REJECTED: "CLOSED"}
+
+
+def paradex_routes(ex: MockExchange) -> List[web.RouteDef]:
+    def account_id(request) -> str:
+        return request.headers.get("Authorization", "").replace("Bearer ", "")
+
+    def order_json(o: Order) -> Dict:
+        return {
+            "id": o.order_id, "client_id": o.client_id or "", "market": o.symbol, "side": o.side,
+            "type": o.order_type, "size": _num(o.size), "remaining_size": _num(o.remaining),
+            "price": _num(o.price or 0), "avg_fill_price": _num(o.avg_fill_price),
+            "status": PARADEX_STATUS[o.status],
+            "cancel_reason": "POST_ONLY_WOULD_CROSS" if o.status == REJECTED and o.post_only else "",
+            "created_at": int(o.created_at * 1000),
+        }
+
+    async def auth(request):
+        return web.json_response({"jwt_token": request.headers.get("PARADEX-STARKNET-ACCOUNT", "mock")})
+
+    async def markets(request):
+        return web.json_response({"results": [
+            {
+                "symbol": m.symbol, "base_currency": m.symbol.split("-")[0], "quote_currency": "USD",
+                "asset_kind": "PERP", "price_tick_size": _num(m.tick_size),
+                "order_size_increment": _num(m.step_size), "min_notional": _num(m.min_notional),
+            } for m in ex.markets.values()
+        ]})
+
+    async def bbo(request):
+        symbol = request.match_info["market"]
+        if symbol not in ex.markets:
+            return _error(f"Unknown market {symbol}", 404)
+        depth = ex.depth(symbol, 1)
+        if not depth['bids'] or not depth['asks']:
+            return _error(f"No BBO for {symbol}", 404)
+        (bid, bid_size), (ask, ask_size) = depth['bids'][0], depth['asks'][0]
+        return web.json_response({
+            "market": symbol, "bid": _num(bid), "bid_size": _num(bid_size),
+            "ask": _num(ask), "ask_size": _num(ask_size), "last_updated_at": int(ex.clock() * 1000),
+        })
+
+    async def account(request):
+        acct = ex.account(account_id(request))
+        equity = ex.equity(acct)
+        return web.json_response({
+            "account": account_id(request), "account_value": _num(equity),
+            "free_collateral": _num(equity), "total_collateral": _num(acct.balance), "status": "ACTIVE",
+        })
+
+    async def positions(request):
+        acct = ex.account(account_id(request))
+        return web.json_response({"results": [
+            {
+                "market": symbol, "side": "LONG" if pos.size > 0 else "SHORT", "size": _num(pos.size),
+                "average_entry_price": _num(pos.entry_price), "status": "OPEN" if pos.size else "CLOSED",
+                "unrealized_pnl": _num(pos.size * (ex.mark_price(symbol) - pos.entry_price)),
+                "realized_positional_pnl": _num(pos.realized_pnl),
+                "unrealized_funding_pnl": _num(-pos.funding_paid),
+            } for symbol, pos in acct.positions.items()
+        ]})
+
+    async def orders(request):
+        return web.json_response({"results": [
+            order_json(o) for o in ex.open_orders(account_id(request), request.query.get("market"))
+        ]})
+
+    async def place(request):
+        data = await _body(request)
+        order_type = data.get("type", "LIMIT")
+        instruction = data.get("instruction", "GTC")
+        price = data.get("price")
+        order = ex.submit(
+            account_id(request), data.get("market", ""), data.get("side", ""), float(data.get("size", 0)),
+            price=float(price) if price not in (None, "0") and order_type != "MARKET" else None,
+            order_type="IOC" if instruction == "IOC" else order_type, post_only=instruction == "POST_ONLY",
+            reduce_only="REDUCE_ONLY" in (data.get("flags") or []), client_id=data.get("client_id"),
+        )
+        return web.json_response(order_json(order), status=201)
+
+    async def cancel(request):
+        if not ex.cancel(request.match_info["order_id"], account_id(request)):
+            return _error("ORDER_ID_NOT_FOUND", 404)
+        return web.Response(status=204)
+
+    async def cancel_batch(request):
+        data = await _body(request)
+        results = [
+            {"id": oid, "status": "QUEUED_FOR_CANCELLATION" if ex.cancel(str(oid), account_id(request)) else "NOT_FOUND"}
+            for oid in data.get("order_ids") or []
+        ]
+        return web.json_response({"results": results})
+
+    async def cancel_all(request):
+        ex.cancel_all(account_id(request), request.query.get("market"))
+        return web.Response(status=204)
+
+    return [
+        web.post("/auth", auth),
+        web.get("/markets", markets),
+        web.get("/bbo/{market}", bbo),
+        web.get("/account", account),
+        web.get("/positions", positions),
+        web.get("/orders", orders),
+        web.post("/orders", place),
+        web.delete("/orders/batch", cancel_batch),
+        web.delete("/orders/{order_id}", cancel),
+        web.delete("/orders", cancel_all),
+    ]
+
+
+# venue -> (URL prefix, route builder)
+VENUES: Dict[str, tuple] = {
+    "hibachi": ("/hibachi", hibachi_routes),
+    "extended": ("/extended/api/v1", extended_routes),
+    "lighter": ("/lighter/api/v1", lighter_routes),
+    "paradex": ("/paradex/v1", paradex_routes),
+}
@@ -0,0 +1,20 @@
+"""Paradex websocket market stream and local paper client"""
+from .local_client import LocalParadexClient
+from .market_stream import (
+    BBOUpdate,
+    FillUpdate,
+    LocalMarketFeed,
+    MarketStream,
+    OrderUpdate,
+    ParadexMarketStream,
+)
+
+__all__ = [
+    'BBOUpdate',
+    'FillUpdate',
+    'LocalMarketFeed',
+    'LocalParadexClient',
+    'MarketStream',
+    'OrderUpdate',
+    'ParadexMarketStream',
+]
@@ -0,0 +1,221 @@
+"""
+Local Paradex Client
+Paper stand-in for paradex_py's REST api_client, driven by LocalMarketFeed
+
+Implements the api_client calls the grid market maker uses (account,
+markets, BBO, positions, orders, single and batch submit/cancel) against
+in-memory state. Resting limit orders fill when the local feed's BBO trades
+through them; market orders fill at the current touch. Nothing leaves the
+process.
+
+Usage:
+    client = LocalParadexClient("BTC-USD-PERP", balance=100.0)
+    feed = LocalMarketFeed("BTC-USD-PERP", exchange=client)
+    await feed.start()
+    client.api_client.submit_order(order)
+"""
+
+import itertools
+import logging
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from .market_stream import BBOUpdate, FillUpdate, MarketEvent, OrderUpdate
+
+logger = logging.getLogger(__name__)
+
+
+def _enum_value(value) -> str:
+    return str(getattr(value, 'value', value)).upper()
+
+
+class LocalParadexClient:
+    """In-memory paper exchange exposing the paradex_py api_client surface"""
+
+    MAKER_FEE = -0.00005  # Paradex maker rebate
+    TAKER_FEE = 0.0003
+    CLOSED_HISTORY = 10000
+
+    def __init__(
+        self,
+        market: str,
+        balance: float = 100.0,
+        tick_size: float = 1.0,
+        step_size: float = 0.0001,
+        min_notional: float = 10.0
+    ):
+        """
+        Args:
+            market: Market symbol
+            balance: Starting account value (USD)
+            tick_size: Price tick reported by fetch_markets
+            step_size: Size increment reported by fetch_markets
+            min_notional: Min order notional reported by fetch_markets
+        """
+        self.market = market
+        self.api_client = self  # grid code calls client.api_client.<method>
+        self.ws_client = None
+        self.cash = balance
+        self.tick_size = tick_size
+        self.step_size = step_size
+        self.min_notional = min_notional
+
+        self.position_size = 0.0
+        self.entry_price = 0.0
+        self.last_bbo: Optional[BBOUpdate] = None
+        self.orders: Dict[str, Dict] = {}
+        self.closed: Dict[str, Dict] = {}  # recently finished orders, for fetch_order
+        self._ids = itertools.count(1)
+
+    # ------------------------------------------------------------------
+    # api_client surface
+    # ------------------------------------------------------------------
+
+    def fetch_account_summary(self):
+        mid = self.last_bbo.mid if self.last_bbo else self.entry_price
+        unrealized = self.position_size * (mid - self.entry_price)
+        return SimpleNamespace(account_value=str(self.cash + unrealized))
+
+    def fetch_markets(self) -> Dict:
+        return {'results': [{
+            'symbol': self.market,
+            'price_tick_size': str(self.tick_size),
+            'order_size_increment': str(self.step_size),
+            'min_notional': str(self.min_notional),
+        }]}
+
+    def fetch_bbo(self, market: str) -> Optional[Dict]:
+        if not self.last_bbo:
+            return None
+        return {'bid': str(self.last_bbo.bid), 'ask': str(self.last_bbo.ask)}
+
+    def fetch_positions(self) -> Dict:
+        if self.position_size == 0:
+            return {'results': []}
+        return {'results': [{
+            'market': self.market,
+            'size': str(self.position_size),
+            'average_entry_price': str(self.entry_price),
+        }]}
+
+    def fetch_orders(self, params: Optional[Dict] = None) -> Dict:
+        return {'results': [dict(order) for order in self.orders.values()]}
+
+    def fetch_order(self, order_id: str) -> Dict:
+        order = self.orders.get(str(order_id)) or self.closed.get(str(order_id))
+        if order is None:
+            raise ValueError(f"order {order_id} not found")
+        return dict(order)
+
+    def submit_order(self, order) -> Dict:
+        side = _enum_value(order.order_side)
+        size = float(order.size)
+        order_id = str(next(self._ids))
+
+        if _enum_value(order.order_type) == 'MARKET':
+            if not self.last_bbo:
+                return {'status': 'REJECTED', 'reason': 'no market data'}
+            price = self.last_bbo.ask if side == 'BUY' else self.last_bbo.bid
+            self._apply_fill(side, price, size, self.TAKER_FEE)
+            return {'id': order_id, 'status': 'CLOSED', 'avg_fill_price': str(price)}
+
+        price = float(order.limit_price)
+        if self.last_bbo and 'POST_ONLY' in _enum_value(getattr(order, 'instruction', '')):
+            crosses = (side == 'BUY' and price >= self.last_bbo.ask) or (side == 'SELL' and price <= self.last_bbo.bid)
+            if crosses:
+                return {'id': order_id, 'status': 'CLOSED', 'cancel_reason': 'POST_ONLY_WOULD_CROSS'}
+
+        self.orders[order_id] = {
+            'id': order_id,
+            'client_id': getattr(order, 'client_id', None),
+            'market': self.market,
+            'side': side,
+            'price': str(price),
+            'size': str(size),
+            'remaining_size': str(size),
+            'filled_size': '0',
+            'status': 'OPEN',
+        }
+        return dict(self.orders[order_id])
+
+    def submit_orders_batch(self, orders: List) -> Dict:
+        results = [self.submit_order(order) for order in orders]
+        for order, result in zip(orders, results):
+            result['client_id'] = getattr(order, 'client_id', None)
+        return {'orders': [r for r in results if r.get('status') == 'OPEN'],
+                'errors': [None if r.get('status') == 'OPEN' else r for r in results]}
+
+    def cancel_order(self, order_id: str):
+        order = self.orders.pop(str(order_id), None)
+        if order:
+            self._close(order, cancel_reason='USER_CANCELED')
+
+    def _close(self, order: Dict, cancel_reason: str = ''):
+        remaining = order['remaining_size'] if cancel_reason else '0'
+        self.closed[order['id']] = {**order, 'status': 'CLOSED', 'remaining_size': remaining,
+                                    'filled_size': str(float(order['size']) - float(remaining)),
+                                    'cancel_reason': cancel_reason}
+        if len(self.closed) > self.CLOSED_HISTORY:
+            self.closed.pop(next(iter(self.closed)))
+
+    def cancel_orders_batch(self, order_ids: Optional[List[str]] = None) -> Dict:
+        results = []
+        for order_id in order_ids or []:
+            found = str(order_id) in self.orders
+            self.cancel_order(order_id)
+            results.append({'id': str(order_id), 'status': 'QUEUED_FOR_CANCELLATION' if found else 'NOT_FOUND'})
+        return {'results': results}
+
+    # ------------------------------------------------------------------
+    # Matching (called by LocalMarketFeed on every BBO)
+    # ------------------------------------------------------------------
+
+    def match(self, bbo: BBOUpdate) -> List[MarketEvent]:
+        """
+        Fill resting orders the new BBO trades through
+
+        Args:
+            bbo: Latest top of book
+
+        Returns:
+            FillUpdate + CLOSED OrderUpdate for every filled order
+        """
+        self.last_bbo = bbo
+        events: List[MarketEvent] = []
+        now = time.time()
+
+        for order_id, order in list(self.orders.items()):
+            side, price, size = order['side'], float(order['price']), float(order['size'])
+            if not ((side == 'BUY' and bbo.ask <= price) or (side == 'SELL' and bbo.bid >= price)):
+                continue
+            del self.orders[order_id]
+            self._close(order)
+            self._apply_fill(side, price, size, self.MAKER_FEE)
+            events.append(FillUpdate(f"local-fill-{order_id}", order_id, side, price, size, now))
+            events.append(OrderUpdate(order_id, 'CLOSED', side, price, size, 0.0, price, '', now))
+
+        return events
+
+    def _apply_fill(self, side: str, price: float, size: float, fee_rate: float):
+        """Update position, average entry and cash for one fill"""
+        signed = size if side == 'BUY' else -size
+        self.cash -= price * size * fee_rate
+
+        if self.position_size == 0 or (self.position_size > 0) == (signed > 0):
+            # Opening or adding: weighted average entry
+            new_size = self.position_size + signed
+            self.entry_price = (self.entry_price * abs(self.position_size) + price * size) / abs(new_size)
+            self.position_size = new_size
+            return
+
+        # Reducing / flipping: realize P&L on the closed part
+        closed = min(abs(signed), abs(self.position_size))
+        direction = 1 if self.position_size > 0 else -1
+        self.cash += closed * (price - self.entry_price) * direction
+        self.position_size += signed
+        if abs(self.position_size) < 1e-12:
+            self.position_size = 0.0
+            self.entry_price = 0.0
+        elif (self.position_size > 0) != (direction > 0):
+            self.entry_price = price
@@ -0,0 +1,368 @@
+"""
+Paradex Market Stream
+Websocket BBO / order / fill events for the Paradex grid market maker
+
+The grid bot used to poll fetch_bbo + fetch_orders over REST once a second,
+so it reacted to fills and price moves up to a second late and spent two
+requests per tick. ParadexMarketStream subscribes to the bbo.<market>,
+orders.<market> and fills.<market> channels through paradex_py's websocket
+client and hands the bot typed events from a single asyncio queue.
+
+LocalMarketFeed has the same interface and generates a random-walk BBO.
+Paired with LocalParadexClient (paper REST client that fills resting orders
+the price walks through) the event-driven loop runs without credentials,
+network access or real orders.
+
+Usage:
+    stream = ParadexMarketStream(client, "BTC-USD-PERP")
+    await stream.start()
+    event = await stream.next_event(timeout=1.0)
+    if isinstance(event, BBOUpdate):
+        ...
+    if stream.is_stale(max_age=5.0):
+        ...  # fall back to REST polling
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BBOUpdate:
+    """Top of book"""
+    bid: float
+    ask: float
+    bid_size: float = 0.0
+    ask_size: float = 0.0
+    timestamp: float = 0.0
+
+    @property
+    def mid(self) -> float:
+        return (self.bid + self.ask) / 2
+
+
+@dataclass
+class OrderUpdate:
+    """Order status change (NEW / OPEN / CLOSED)"""
+    order_id: str
+    status: str
+    side: str
+    price: float
+    size: float
+    remaining_size: float
+    avg_fill_price: float = 0.0
+    cancel_reason: str = ""
+    timestamp: float = 0.0
+
+    @property
+    def filled_size(self) -> float:
+        return max(self.size - self.remaining_size, 0.0)
+
+
+@dataclass
+class FillUpdate:
+    """One execution against one of our orders"""
+    fill_id: str
+    order_id: str
+    side: str
+    price: float
+    size: float
+    timestamp: float = 0.0
+
+
+MarketEvent = Union[BBOUpdate, OrderUpdate, FillUpdate]
+
+
+def _float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_bbo(data: Dict) -> Optional[BBOUpdate]:
+    """Parse a bbo.<market> payload (None if either side is missing)"""
+    bid, ask = _float(data.get('bid')), _float(data.get('ask'))
+    if bid <= 0 or ask <= 0:
+        return None
+    return BBOUpdate(
+        bid=bid,
+        ask=ask,
+        bid_size=_float(data.get('bid_size')),
+        ask_size=_float(data.get('ask_size')),
+        timestamp=_float(data.get('last_updated_at'), time.time() * 1000) / 1000
+    )
+
+
+def parse_order(data: Dict) -> OrderUpdate:
+    """Parse an orders.<market> payload"""
+    size = _float(data.get('size'))
+    return OrderUpdate(
+        order_id=str(data.get('id')),
+        status=data.get('status', ''),
+        side=str(data.get('side', '')).upper(),
+        price=_float(data.get('price')),
+        size=size,
+        remaining_size=_float(data.get('remaining_size'), size),
+        avg_fill_price=_float(data.get('avg_fill_price')),
+        cancel_reason=data.get('cancel_reason') or '',
+        timestamp=_float(data.get('last_updated_at'), time.time() * 1000) / 1000
+    )
+
+
+def parse_fill(data: Dict) -> FillUpdate:
+    """Parse a fills.<market> payload"""
+    return FillUpdate(
+        fill_id=str(data.get('id')),
+        order_id=str(data.get('order_id')),
+        side=str(data.get('side', '')).upper(),
+        price=_float(data.get('price')),
+        size=_float(data.get('size')),
+        timestamp=_float(data.get('created_at'), time.time() * 1000) / 1000
+    )
+
+
+# Batch cancel statuses meaning the order is (being) cancelled
+CANCEL_ACCEPTED = ('QUEUED_FOR_CANCELLATION', 'CANCELLED', 'CANCELED')
+
+
+def parse_batch_cancel(response, order_ids: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split a batch cancel by what the DELETE /orders/batch response confirms
+
+    Args:
+        response: cancel_orders_batch() return value ({'results': [{'id', 'status'}, ...]})
+        order_ids: Order ids sent in the batch
+
+    Returns:
+        (cancelled ids, ids the response doesn't mention - retry them one by one).
+        Ids reported ALREADY_CLOSED / NOT_FOUND are in neither list; order sync
+        settles them. A response without results confirms nothing.
+    """
+    results = response.get('results') if isinstance(response, dict) else None
+    if not isinstance(results, list):
+        return [], list(order_ids)
+    statuses = {str(r.get('id')): str(r.get('status', '')).upper() for r in results if isinstance(r, dict)}
+    cancelled = [oid for oid in order_ids if statuses.get(str(oid)) in CANCEL_ACCEPTED]
+    missing = [oid for oid in order_ids if str(oid) not in statuses]
+    return cancelled, missing
+
+
+class MarketStream:
+    """Event queue + staleness tracking shared by the live and local feeds"""
+
+    def __init__(self, market: str, max_queue: int = 10000):
+        """
+        Args:
+            market: Market symbol (e.g. "BTC-USD-PERP")
+            max_queue: Max buffered events (oldest BBOs are dropped when full)
+        """
+        self.market = market
+        self.connected = False
+        self.last_event_time: Optional[float] = None
+        self.last_bbo: Optional[BBOUpdate] = None
+        self.events_received = 0
+        self.events_dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+
+    async def start(self):
+        raise NotImplementedError
+
+    async def stop(self):
+        self.connected = False
+
+    def _publish(self, event: MarketEvent):
+        """Queue an event (called from feed callbacks on the event loop)"""
+        self.events_received += 1
+        self.last_event_time = time.monotonic()
+        if isinstance(event, BBOUpdate):
+            self.last_bbo = event
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # BBOs are superseded by the next one; order/fill events are not
+            if isinstance(event, BBOUpdate):
+                self.events_dropped += 1
+                return
+            self._drop_oldest_bbo()
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Nothing but order/fill events queued: REST reconciliation picks this one up
+                self.events_dropped += 1
+                logger.warning(f"⚠️ {self.market} event queue full of order/fill events - dropped {type(event).__name__}")
+
+    def _drop_oldest_bbo(self):
+        kept = []
+        dropped = False
+        while not self._queue.empty():
+            queued = self._queue.get_nowait()
+            if not dropped and isinstance(queued, BBOUpdate):
+                dropped = True
+                self.events_dropped += 1
+                continue
+            kept.append(queued)
+        for queued in kept:
+            self._queue.put_nowait(queued)
+
+    async def next_event(self, timeout: float = 1.0) -> Optional[MarketEvent]:
+        """
+        Wait for the next event
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            Event, or None on timeout
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def is_stale(self, max_age: float = 5.0) -> bool:
+        """True if disconnected or nothing arrived for max_age seconds"""
+        if not self.connected or self.last_event_time is None:
+            return True
+        return time.monotonic() - self.last_event_time > max_age
+
+
+class ParadexMarketStream(MarketStream):
+    """BBO, order and fill events from the Paradex websocket API"""
+
+    def __init__(self, client, market: str, max_queue: int = 10000):
+        """
+        Args:
+            client: Authenticated paradex_py Paradex/ParadexSubkey (uses client.ws_client)
+            market: Market symbol (e.g. "BTC-USD-PERP")
+            max_queue: Max buffered events
+        """
+        super().__init__(market, max_queue)
+        self.client = client
+
+    async def start(self):
+        """Connect and subscribe to bbo, orders and fills for the market"""
+        from paradex_py.api.ws_client import ParadexWebsocketChannel
+
+        ws = self.client.ws_client
+        self.connected = bool(await ws.connect())
+        if not self.connected:
+            logger.warning(f"⚠️  Paradex websocket connect failed for {self.market}")
+            return
+
+        params = {"market": self.market}
+        await ws.subscribe(ParadexWebsocketChannel.BBO, callback=self._on_bbo, params=params)
+        await ws.subscribe(ParadexWebsocketChannel.ORDERS, callback=self._on_order, params=params)
+        await ws.subscribe(ParadexWebsocketChannel.FILLS, callback=self._on_fill, params=params)
+        logger.info(f"📡 Paradex stream: subscribed bbo/orders/fills for {self.market}")
+
+    async def stop(self):
+        """Close the websocket"""
+        self.connected = False
+        try:
+            await self.client.ws_client.close()
+        except Exception as e:
+            logger.debug(f"Websocket close error: {e}")
+
+    @staticmethod
+    def _data(message: Dict) -> Dict:
+        return (message or {}).get('params', {}).get('data') or {}
+
+    async def _on_bbo(self, channel, message: Dict):
+        event = parse_bbo(self._data(message))
+        if event:
+            self._publish(event)
+
+    async def _on_order(self, channel, message: Dict):
+        data = self._data(message)
+        if data.get('market', self.market) == self.market:
+            self._publish(parse_order(data))
+
+    async def _on_fill(self, channel, message: Dict):
+        data = self._data(message)
+        if data.get('market', self.market) == self.market:
+            self._publish(parse_fill(data))
+
+
+class LocalMarketFeed(MarketStream):
+    """
+    Stand-in feed for testing the event-driven loop offline
+
+    Emits a random-walk BBO every interval seconds. With an exchange (e.g.
+    LocalParadexClient) attached, each BBO is also matched against its resting
+    orders and the resulting FillUpdate / CLOSED OrderUpdate events are queued
+    in the same order the exchange sends them.
+    """
+
+    def __init__(
+        self,
+        market: str,
+        start_price: float = 100000.0,
+        spread_bps: float = 1.0,
+        volatility_bps: float = 2.0,
+        interval: float = 0.25,
+        exchange=None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            market: Market symbol
+            start_price: Initial mid price
+            spread_bps: Quoted spread (bps of mid)
+            volatility_bps: Std dev of each mid step (bps)
+            interval: Seconds between BBO updates
+            exchange: Object with match(bbo) -> List[MarketEvent] (enables simulated fills)
+            seed: Random seed for reproducible walks
+        """
+        super().__init__(market)
+        self.mid = start_price
+        self.spread_bps = spread_bps
+        self.volatility_bps = volatility_bps
+        self.interval = interval
+        self.exchange = exchange
+        self._rng = random.Random(seed)
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start emitting BBO updates"""
+        self.connected = True
+        self.step()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"🧪 Local feed: {self.market} from ${self.mid:,.2f} every {self.interval}s")
+
+    async def stop(self):
+        """Stop the generator task"""
+        self.connected = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while self.connected:
+            await asyncio.sleep(self.interval)
+            self.step()
+
+    def step(self) -> BBOUpdate:
+        """Move the mid one random step, emit the BBO and any fills it causes"""
+        self.mid *= 1 + self._rng.gauss(0, self.volatility_bps) / 10000
+        half = self.mid * self.spread_bps / 20000
+        bbo = BBOUpdate(bid=self.mid - half, ask=self.mid + half, bid_size=1.0, ask_size=1.0, timestamp=time.time())
+        self._publish(bbo)
+        if self.exchange is not None:
+            for event in self.exchange.match(bbo):
+                self._publish(event)
+        return bbo
+
+    def push(self, event: MarketEvent):
+        """Inject an event (tests)"""
+        self._publish(event)
@@ -42,7 +42,9 @@ from extended_agent.execution.strategy_e_self_improving_pairs import StrategyESe
 from extended_agent.execution.fast_exit_monitor import FastExitMonitor
 from extended_agent.data.extended_aggregator import ExtendedMarketDataAggregator
 from llm_agent.data.sentiment_fetcher import SentimentFetcher
+from core.market_bus import MarketDataBusClient
 from llm_agent.shared_learning import SharedLearning
+from core.cycle_profiler import CycleProfiler
 
 # Load environment variables from project root
 project_root_env = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
@@ -105,6 +107,7 @@ class ExtendedTradingBot:
 
         # Initialize Extended SDK via executor factory
         self.trade_tracker = TradeTracker(dex="extended")
+        self.profiler = CycleProfiler("extended")  # per-phase cycle timings (logs/metrics + local HTTP)
 
         # Create executor (handles SDK init internally)
         self.executor = create_extended_executor_from_env(
@@ -142,7 +145,8 @@ class ExtendedTradingBot:
         logger.info(f"LLM Model: {model}")
 
         # Initialize Sentiment Fetcher (Fear & Greed, funding rates)
-        self.sentiment_fetcher = SentimentFetcher()
+        # Reads the host market data bus snapshot when a daemon is up
+        self.sentiment_fetcher = SentimentFetcher(market_bus=MarketDataBusClient.from_env())
         logger.info("📊 Sentiment Fetcher initialized (Fear & Greed + funding)")
 
         # Initialize Shared Learning (cross-bot insights with Hibachi)
@@ -247,11 +251,11 @@ class ExtendedTradingBot:
             logger.info("=" * 60)
             logger.info("EXTENDED BOT - STRATEGY B: FIXED TP/SL + FAST EXIT")
             logger.info(f"  TP: +{self.exit_rules.TAKE_PROFIT_PCT}%  |  SL: -{self.exit_rules.STOP_LOSS_PCT}%  |  Max Hold: {self.exit_rules.MAX_HOLD_HOURS}h (if profitable)")
-            logger.info("  Fast Exit: 30s monitoring (FREE - no LLM)")
+            logger.info(f"  Fast Exit: {FastExitMonitor.CHECK_INTERVAL_SECONDS}s monitoring (FREE - no LLM)")
             logger.info("  Philosophy: Fixed targets based on backtest (2025-12-02)")
             logger.info("=" * 60)
 
-        # Initialize Fast Exit Monitor (checks every 30s, NO LLM cost)
+        # Initialize Fast Exit Monitor (checks every 5s, NO LLM cost)
         self.fast_exit_monitor = FastExitMonitor(
             executor=self.executor,
             exit_rules=self.exit_rules,
@@ -275,9 +279,11 @@ class ExtendedTradingBot:
         logger.info("=" * 80)
 
         try:
+            self.profiler.phase("markets")
             # Fetch all market data
             logger.info("Fetching market data from Extended...")
             market_data_dict = await self.aggregator.fetch_all_markets()
+            self.profiler.add_stages(self.aggregator.fetch_engine.stage_timings, prefix="markets.")
 
             if not market_data_dict:
                 logger.warning("No market data available - skipping cycle")
@@ -285,6 +291,7 @@ class ExtendedTradingBot:
 
             logger.info(f"Fetched data for {len(market_data_dict)} markets")
 
+            self.profiler.phase("positions")
             # Get current positions from executor
             logger.info("Fetching current positions...")
             raw_positions = await self.executor._fetch_open_positions()
@@ -343,6 +350,7 @@ class ExtendedTradingBot:
 
             # ═══════════════════════════════════════════════════════════════
             # STRATEGY B/C EXIT RULES (skip for Strategy D)
+            self.profiler.phase("exits")
             # Check hard exit rules BEFORE LLM decision
             # ═══════════════════════════════════════════════════════════════
             if self.exit_rules:
@@ -417,6 +425,7 @@ class ExtendedTradingBot:
                 logger.info("=" * 60)
                 logger.info("")
 
+            self.profiler.phase("prompt")
             # Format market table
             market_table = self.aggregator.format_market_table(market_data_dict)
 
@@ -648,8 +657,9 @@ class ExtendedTradingBot:
             for attempt in range(self.llm_agent.max_retries + 1):
                 logger.info(f"   LLM query attempt {attempt + 1}/{self.llm_agent.max_retries + 1}...")
 
+                self.profiler.phase("llm")
                 # Query model
-                result = self.llm_agent.model_client.query(
+                result = await self.llm_agent.model_client.aquery(
                     prompt=prompt,
                     max_tokens=500,
                     temperature=0.1
@@ -672,6 +682,7 @@ class ExtendedTradingBot:
                 logger.info("=" * 80)
                 logger.info("")
 
+                self.profiler.phase("parse")
                 # Try parsing multiple decisions
                 parsed_decisions = self.llm_agent.response_parser.parse_multiple_decisions(result["content"])
                 if parsed_decisions is None or len(parsed_decisions) == 0:
@@ -689,6 +700,7 @@ class ExtendedTradingBot:
                         )
                     continue
 
+                self.profiler.phase("validation")
                 # Validate all decisions
                 logger.info("")
                 logger.info("=" * 80)
@@ -795,6 +807,7 @@ class ExtendedTradingBot:
             logger.info("")
             logger.info(f"LLM DECISIONS: {len(decisions)} decision(s) | Cost: ${total_cost:.4f}")
 
+            self.profiler.phase("execution")
             # Execute each decision
             for i, decision in enumerate(decisions, 1):
                 action = decision.get('action')
@@ -860,9 +873,10 @@ class ExtendedTradingBot:
         # Start fast exit monitor as background task (only for strategies with exit rules)
         if self.exit_rules and self.strategy not in ["D", "E"]:
             self.fast_exit_task = asyncio.create_task(self.fast_exit_monitor.run())
-            logger.info("Fast exit monitor started (30s price checks + trailing)")
+            logger.info(f"Fast exit monitor started ({FastExitMonitor.CHECK_INTERVAL_SECONDS}s price checks + trailing)")
         else:
             logger.info("Fast exit monitor disabled for pairs strategies")
+        await self.profiler.serve_http()
 
         try:
             while True:
@@ -875,7 +889,11 @@ class ExtendedTradingBot:
                 if cycle_count % 6 == 0 and self.exit_rules:  # Every 30 minutes
                     self.fast_exit_monitor.log_stats()
 
-                await self.run_once()
+                with self.profiler.cycle():
+                    await self.run_once()
+
+                # Positions may have been opened/closed this cycle
+                self.fast_exit_monitor.notify_positions_changed()
 
                 logger.info(f"Waiting {self.check_interval}s until next cycle...")
                 await asyncio.sleep(self.check_interval)
@@ -893,11 +911,20 @@ class ExtendedTradingBot:
             if self.fast_exit_task:
                 self.fast_exit_task.cancel()
         finally:
-            # Close SDK client
+            await self.profiler.close()
+            # Close SDK client, the data fetcher's and the LLM client's HTTP pools
             try:
                 await self.executor.client.close()
             except Exception:
                 pass
+            try:
+                await self.aggregator.extended.sdk.close()
+            except Exception:
+                pass
+            try:
+                await self.llm_agent.model_client.close()
+            except Exception:
+                pass
 
 
 def main():
@@ -6,7 +6,7 @@ Symbols fetched dynamically from Extended API via SDK
 """
 
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 # Import shared components
@@ -16,6 +16,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from llm_agent.data.macro_fetcher import MacroContextFetcher
 from llm_agent.data.indicator_calculator import IndicatorCalculator
+from llm_agent.data.oi_fetcher import OIDataFetcher
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
 from extended_agent.data.extended_fetcher import ExtendedDataFetcher
 
 logger = logging.getLogger(__name__)
@@ -38,7 +40,8 @@ class ExtendedMarketDataAggregator:
         sdk=None,
         interval: str = "5m",  # 5m candles for HF scalping
         candle_limit: int = 100,
-        macro_refresh_hours: int = 12
+        macro_refresh_hours: int = 12,
+        max_concurrency: int = 10
     ):
         """
         Initialize Extended market data aggregator
@@ -49,6 +52,7 @@ class ExtendedMarketDataAggregator:
             interval: Candle interval (default: 5m for HF scalping)
             candle_limit: Number of candles to fetch (default: 100)
             macro_refresh_hours: Hours between macro context refreshes (default: 12)
+            max_concurrency: Max in-flight per-symbol fetches (default: 10)
         """
         self.interval = interval
         self.candle_limit = candle_limit
@@ -56,12 +60,16 @@ class ExtendedMarketDataAggregator:
         # Extended data fetcher with SDK
         self.extended = ExtendedDataFetcher(sdk=sdk)
 
-        # Shared components (macro context, indicators)
+        # Shared components (macro context, indicators, OI snapshot fallback)
         self.macro_fetcher = MacroContextFetcher(
             cambrian_api_key=cambrian_api_key,
             refresh_interval_hours=macro_refresh_hours
         )
         self.indicator_calc = IndicatorCalculator()
+        self.oi_fetcher = OIDataFetcher()
+
+        # Concurrent per-symbol fetches + executor for blocking indicator work
+        self.fetch_engine = ConcurrentFetchEngine(max_concurrency=max_concurrency)
 
         logger.info(f"✅ ExtendedMarketDataAggregator initialized (interval={interval}, candles={candle_limit})")
 
@@ -115,13 +123,13 @@ class ExtendedMarketDataAggregator:
         oi = extended_data.get('oi')
         volume_24h = extended_data.get('volume_24h')
 
-        # Calculate indicators if we have kline data
-        if kline_df is not None and not kline_df.empty:
-            kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-            indicators = self.indicator_calc.get_latest_values(kline_df)
+        # Calculate indicators if we have kline data (CPU work runs in the executor)
+        computed = await self.fetch_engine.run_blocking(self._compute_indicators, kline_df)
+        if computed:
+            kline_df, indicators, calculated_volume = computed
             # Use calculated volume if API volume not available
             if not volume_24h:
-                volume_24h = self._calculate_24h_volume(kline_df)
+                volume_24h = calculated_volume
         else:
             # No kline data - use current price only
             indicators = {'price': current_price}
@@ -166,22 +174,43 @@ class ExtendedMarketDataAggregator:
                 logger.warning(f"No valid Extended symbols in provided list")
                 return {}
 
-        # Use fetcher's async method
-        results = await self.extended.fetch_all_markets(
-            symbols=symbols,
-            interval=self.interval,
-            limit=self.candle_limit
-        )
+        engine = self.fetch_engine
+        engine.reset_timings()
+
+        with engine.stage("total"):
+            # Candles + stats (price, funding, OI) for every symbol at once
+            with engine.stage("candles"):
+                results = await self.extended.fetch_all_markets(
+                    symbols=symbols,
+                    interval=self.interval,
+                    limit=self.candle_limit,
+                    fetch_engine=engine
+                )
+
+            # Indicator math is CPU-bound - keep it off the event loop
+            with engine.stage("indicators"):
+                computed = await engine.map(
+                    list(results),
+                    lambda s: engine.run_blocking(self._compute_indicators, results[s].get('kline_df'))
+                )
+
+            # Extended stats carry venue OI; fill gaps from the shared Binance/HyperLiquid snapshot
+            missing_oi = [s for s, data in results.items() if not data.get('oi')]
+            if missing_oi:
+                with engine.stage("oi"):
+                    oi_map = await engine.run_blocking(self.oi_fetcher.get_oi_snapshot, missing_oi)
+                for symbol, oi in oi_map.items():
+                    # Snapshot OI is in base units; Extended reports USD notional
+                    price = results[symbol].get('current_price')
+                    results[symbol]['oi'] = oi * price if oi and price else None
 
-        # Process each result to add indicators
         for symbol, data in results.items():
-            kline_df = data.get('kline_df')
-            if kline_df is not None and not kline_df.empty:
-                kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-                indicators = self.indicator_calc.get_latest_values(kline_df)
-                volume_24h = data.get('volume_24h') or self._calculate_24h_volume(kline_df)
+            if symbol in computed:
+                kline_df, indicators, calculated_volume = computed[symbol]
+                volume_24h = data.get('volume_24h') or calculated_volume
             else:
                 # No kline data - use current price only
+                kline_df = data.get('kline_df')
                 indicators = {'price': data.get('current_price')}
                 volume_24h = data.get('volume_24h')
 
@@ -190,6 +219,7 @@ class ExtendedMarketDataAggregator:
             data['price'] = data.get('current_price') or indicators.get('price')
             data['kline_df'] = kline_df
 
+        logger.info(f"⏱️ Extended data stages: {engine.format_stage_timings()}")
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Extended markets")
         return results
 
@@ -246,6 +276,22 @@ class ExtendedMarketDataAggregator:
 
         return "\n".join(lines)
 
+    def _compute_indicators(self, kline_df) -> Optional[Tuple]:
+        """
+        Calculate indicators and 24h volume for one symbol (blocking, runs in executor)
+
+        Args:
+            kline_df: OHLCV DataFrame
+
+        Returns:
+            (kline_df with indicators, latest indicator values, 24h volume) or None if no candles
+        """
+        if kline_df is None or kline_df.empty:
+            return None
+        kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
+        indicators = self.indicator_calc.get_latest_values(kline_df)
+        return kline_df, indicators, self._calculate_24h_volume(kline_df)
+
     def _calculate_24h_volume(self, kline_df) -> Optional[float]:
         """Calculate 24h volume from candles"""
         if kline_df is None or kline_df.empty:
@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from dexes.extended.extended_sdk import ExtendedSDK, create_extended_sdk_from_env
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
 
 logger = logging.getLogger(__name__)
 
@@ -213,7 +214,8 @@ class ExtendedDataFetcher:
         self,
         symbols: Optional[List[str]] = None,
         interval: str = "5m",
-        limit: int = 100
+        limit: int = 100,
+        fetch_engine: Optional[ConcurrentFetchEngine] = None
     ) -> Dict[str, Dict]:
         """
         Fetch market data for multiple symbols concurrently
@@ -222,6 +224,7 @@ class ExtendedDataFetcher:
             symbols: List of symbols (default: all available)
             interval: Candle interval
             limit: Number of candles per symbol
+            fetch_engine: Engine bounding concurrent requests (default: 10 in flight)
 
         Returns:
             Dict mapping symbol -> market data
@@ -231,24 +234,12 @@ class ExtendedDataFetcher:
         if symbols is None:
             symbols = self.available_symbols
 
-        # Limit concurrent requests to avoid rate limiting
-        results = {}
-        batch_size = 10
-
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            tasks = [self.fetch_market_data(s, interval, limit) for s in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for symbol, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error fetching {symbol}: {result}")
-                elif result:
-                    results[symbol] = result
-
-            # Small delay between batches to avoid rate limits
-            if i + batch_size < len(symbols):
-                await asyncio.sleep(0.5)
+        # Limit concurrent requests to avoid rate limiting (a rolling cap, not fixed batches)
+        engine = fetch_engine or ConcurrentFetchEngine(max_concurrency=10)
+        results = await engine.map(
+            symbols,
+            lambda s: self.fetch_market_data(s, interval, limit)
+        )
 
         logger.info(f"Fetched data for {len(results)}/{len(symbols)} Extended markets")
         return results
@@ -3,20 +3,24 @@ Fast Exit Monitor for Extended Bot
 Based on 2025-11-28 optimization request
 
 PURPOSE:
-- Check positions every 30 seconds (vs 5 min LLM cycles)
+- Check positions every 5 seconds (vs 5 min LLM cycles)
 - Exit immediately when TP/SL/trailing stops hit
 - NO LLM calls = FREE (just price API calls)
 - Designed to capture quick moves that would otherwise be missed
 
 ARCHITECTURE:
 - Runs as asyncio task alongside main bot loop
+- One positions call per tick carries mark prices for ALL open positions,
+  so a check costs one round-trip regardless of position count
+- Tracker entry data cached in memory by symbol (re-read only for new
+  positions or after notify_positions_changed)
 - Uses existing StrategyBExitRules for exit logic (with trailing stops!)
 - Only checks prices and executes closes
 - Does NOT make new entries (that's the LLM's job)
 
 STRATEGY B SPECIFIC:
 - Trailing stop monitoring is CRITICAL for "let runners run"
-- Need to update peak P/L tracking every 30 seconds
+- Need to update peak P/L tracking every 5 seconds
 - Trail activation at +2%, trail distance 1.5%
 
 COST IMPACT:
@@ -26,12 +30,14 @@ COST IMPACT:
 
 LATENCY IMPROVEMENT:
 - Before: 0-300s delay to exit (5 min average)
-- After: 0-30s delay to exit (15s average)
-- 10x faster reaction to TP/SL/trailing hits
+- After: 0-5s delay to exit (2.5s average)
+- Check duration recorded per tick (see get_stats)
 """
 
 import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -40,7 +46,7 @@ logger = logging.getLogger(__name__)
 
 class FastExitMonitor:
     """
-    Fast exit monitoring loop for Extended - checks positions every 30 seconds
+    Fast exit monitoring loop for Extended - checks positions every 5 seconds
 
     Separates exit monitoring from LLM decision cycles for faster reactions.
     Especially important for Strategy B's trailing stops!
@@ -48,7 +54,7 @@ class FastExitMonitor:
     """
 
     MONITOR_NAME = "FAST_EXIT_MONITOR_V1_EXTENDED"
-    CHECK_INTERVAL_SECONDS = 30  # Check every 30 seconds
+    CHECK_INTERVAL_SECONDS = 5  # Check every 5 seconds
 
     def __init__(
         self,
@@ -78,6 +84,12 @@ class FastExitMonitor:
         self.last_check_time = None
         self.running = False
 
+        # Tracker entry data keyed by symbol: {'side', 'entry_price', 'tracker_data'}
+        self._entries: Dict[str, Dict] = {}
+
+        # Check latency (ms) over the last 500 ticks
+        self._check_times_ms = deque(maxlen=500)
+
         logger.info("=" * 60)
         logger.info(f"FAST EXIT MONITOR: {self.MONITOR_NAME}")
         logger.info(f"  Check Interval: {self.CHECK_INTERVAL_SECONDS}s")
@@ -86,6 +98,30 @@ class FastExitMonitor:
         logger.info(f"  Cost: $0 (no LLM calls)")
         logger.info("=" * 60)
 
+    def notify_positions_changed(self):
+        """Re-read tracker entry data on the next tick (call after opening/closing)"""
+        self._entries.clear()
+
+    def _get_entry(self, symbol: str, side: str, position: Dict) -> Optional[Dict]:
+        """Cached entry data for an open position (tracker lookup only on first sight)"""
+        entry = self._entries.get(symbol)
+        if entry is not None and entry['side'] == side:
+            return entry
+
+        # Get entry price from tracker
+        tracker_data = self.tracker.get_open_trade_for_symbol(symbol)
+        entry_price = tracker_data.get('entry_price', 0) if tracker_data else 0
+
+        if not entry_price or entry_price <= 0:
+            entry_price = position.get('entry_price', 0)
+
+        if not entry_price or entry_price <= 0:
+            return None
+
+        entry = {'side': side, 'entry_price': entry_price, 'tracker_data': tracker_data}
+        self._entries[symbol] = entry
+        return entry
+
     async def check_positions_once(self) -> List[Dict]:
         """
         Single check of all positions against exit rules
@@ -94,11 +130,18 @@ class FastExitMonitor:
             List of positions that were closed
         """
         closed_positions = []
+        start = time.perf_counter()
 
         try:
-            # Fetch current positions
+            # Fetch current positions (includes mark prices for all of them)
             positions = await self.executor._fetch_open_positions()
 
+            # Forget entries for positions that are gone
+            open_symbols = {p.get('symbol') for p in positions or [] if float(p.get('size', 0)) != 0}
+            for symbol in list(self._entries):
+                if symbol not in open_symbols:
+                    del self._entries[symbol]
+
             if not positions:
                 return closed_positions
 
@@ -111,15 +154,11 @@ class FastExitMonitor:
 
                 side = position.get('side', 'LONG')
 
-                # Get entry price from tracker
-                tracker_data = self.tracker.get_open_trade_for_symbol(symbol)
-                entry_price = tracker_data.get('entry_price', 0) if tracker_data else 0
-
-                if not entry_price or entry_price <= 0:
-                    entry_price = position.get('entry_price', 0)
-
-                if not entry_price or entry_price <= 0:
+                entry = self._get_entry(symbol, side, position)
+                if entry is None:
                     continue
+                entry_price = entry['entry_price']
+                tracker_data = entry['tracker_data']
 
                 # Get current price from position data (Extended provides mark_price)
                 current_price = position.get('mark_price', 0)
@@ -188,6 +227,7 @@ class FastExitMonitor:
 
                         # Unregister from exit rules tracking
                         self.exit_rules.unregister_position(symbol)
+                        self._entries.pop(symbol, None)
                     else:
                         logger.error(f"   ❌ Fast exit failed: {result.get('error')}")
                 else:
@@ -198,12 +238,14 @@ class FastExitMonitor:
 
         except Exception as e:
             logger.error(f"[FAST-EXIT] Error checking positions: {e}")
+        finally:
+            self._check_times_ms.append((time.perf_counter() - start) * 1000)
 
         return closed_positions
 
     async def run(self):
         """
-        Continuous monitoring loop - runs every 30 seconds
+        Continuous monitoring loop - runs every CHECK_INTERVAL_SECONDS
 
         This runs as a separate asyncio task from the main bot loop.
         """
@@ -220,7 +262,7 @@ class FastExitMonitor:
                 self.last_check_time = datetime.now()
 
                 # Log less frequently to avoid spam
-                if self.checks_performed % 10 == 1:  # Every 5 minutes
+                if self.checks_performed % 60 == 1:  # Every 5 minutes
                     logger.info(
                         f"[FAST-EXIT] Check #{self.checks_performed} | "
                         f"Exits: {self.exits_triggered} | "
@@ -256,9 +298,23 @@ class FastExitMonitor:
             "exits_triggered": self.exits_triggered,
             "trailing_activations": self.trailing_activations,
             "check_interval_seconds": self.CHECK_INTERVAL_SECONDS,
+            "positions_tracked": len(self._entries),
+            **self._check_latency(),
             "last_check_time": self.last_check_time.isoformat() if self.last_check_time else None
         }
 
+    def _check_latency(self) -> Dict:
+        """Check duration stats (ms) over recent ticks"""
+        times = sorted(self._check_times_ms)
+        if not times:
+            return {"last_check_ms": None, "avg_check_ms": None, "p95_check_ms": None, "max_check_ms": None}
+        return {
+            "last_check_ms": round(self._check_times_ms[-1], 1),
+            "avg_check_ms": round(sum(times) / len(times), 1),
+            "p95_check_ms": round(times[int(0.95 * (len(times) - 1))], 1),
+            "max_check_ms": round(times[-1], 1),
+        }
+
     def log_stats(self):
         """Log current statistics"""
         stats = self.get_stats()
@@ -268,5 +324,10 @@ class FastExitMonitor:
         logger.info(f"  Checks: {stats['checks_performed']}")
         logger.info(f"  Exits: {stats['exits_triggered']}")
         logger.info(f"  Trailing Activations: {stats['trailing_activations']}")
+        if stats['avg_check_ms'] is not None:
+            logger.info(
+                f"  Check Time: avg {stats['avg_check_ms']:.0f}ms | p95 {stats['p95_check_ms']:.0f}ms | "
+                f"max {stats['max_check_ms']:.0f}ms ({stats['positions_tracked']} positions)"
+            )
         logger.info(f"  Last Check: {stats['last_check_time'] or 'Never'}")
         logger.info("-" * 40)
@@ -284,7 +284,7 @@ REASON: ETH showing stronger RSI recovery while SOL momentum fading
 
         try:
             # Call LLM (query is sync, not async)
-            result = self.llm_agent.model_client.query(prompt)
+            result = await self.llm_agent.model_client.aquery(prompt)
             if not result or not result.get('content'):
                 logger.warning("[PAIRS-LLM] Empty response from LLM")
                 return (self.LONG_ASSET, self.SHORT_ASSET, "LLM empty response - using default")
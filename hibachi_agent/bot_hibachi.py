@@ -40,6 +40,8 @@ from llm_agent.data.sentiment_fetcher import SentimentFetcher
 from llm_agent.shared_learning import SharedLearning
 from llm_agent.self_learning import SelfLearning
 from llm_agent.adaptive import AdaptiveManager
+from core.warm_start import WarmStartStore
+from core.cycle_profiler import CycleProfiler
 import pandas as pd
 
 # Load environment variables from project root
@@ -122,9 +124,6 @@ class HibachiTradingBot:
         )
         logger.info("✅ Using Hibachi DEX data")
 
-        # Initialize symbols
-        asyncio.run(self.aggregator.hibachi._initialize_symbols())
-
         # Initialize LLM agent (same as Lighter/Pacifica)
         self.llm_agent = LLMTradingAgent(
             deepseek_api_key=deepseek_api_key,
@@ -169,7 +168,7 @@ class HibachiTradingBot:
         # Keep legacy hard_exit_rules for backward compatibility (maps to strategy A)
         self.hard_exit_rules = self.exit_rules
 
-        # Initialize Fast Exit Monitor (checks every 30s, NO LLM cost)
+        # Initialize Fast Exit Monitor (checks every 5s, NO LLM cost)
         # This catches TP/SL faster than the 5-min LLM cycles
         self.fast_exit_monitor = FastExitMonitor(
             sdk=self.hibachi_sdk,
@@ -180,11 +179,29 @@ class HibachiTradingBot:
         )
         self.fast_exit_task = None  # Will be set when run() starts
 
+        # Warm start: symbols, indicator state, macro/Deep42 context and trailing
+        # stops from the last snapshot, so a watchdog restart skips the warm-up
+        self.profiler = CycleProfiler("hibachi")  # per-phase cycle timings (logs/metrics + local HTTP)
+        self.warm_start = WarmStartStore("hibachi")
+        self.warm_start.register("symbols", self.aggregator.hibachi.get_state,
+                                 self.aggregator.hibachi.set_state, max_age=6 * 3600)
+        self.warm_start.register("indicators", self.aggregator.indicator_engine.get_state,
+                                 self.aggregator.indicator_engine.set_state, max_age=2 * 3600)
+        self.warm_start.register("macro", self.aggregator.macro_fetcher.get_state,
+                                 self.aggregator.macro_fetcher.set_state, max_age=12 * 3600)
+        self.warm_start.register("fast_exit", self.fast_exit_monitor.get_state,
+                                 self.fast_exit_monitor.set_state, max_age=4 * 3600)
+        self.warm_start.restore()
+        self.warm_start_task = None
+
+        # Initialize symbols (no API call when restored from the snapshot)
+        asyncio.run(self.aggregator.hibachi._initialize_symbols())
+
         # Initialize Whale Signal Fetcher (0x023a - $28M proven trader)
         self.whale_signal = WhaleSignalFetcher()
 
         # Initialize Sentiment Fetcher (Fear & Greed, funding rates)
-        self.sentiment_fetcher = SentimentFetcher()
+        self.sentiment_fetcher = SentimentFetcher(market_bus=self.aggregator.market_bus)
         logger.info("📊 Sentiment Fetcher initialized (Fear & Greed + funding)")
 
         # Initialize Shared Learning (cross-bot insights with Extended)
@@ -271,7 +288,7 @@ class HibachiTradingBot:
             logger.info("  Auto-block: <30% win rate combos")
             logger.info("  Auto-reduce: <40% win rate combos")
             logger.info("  Deep42 + Whale Signal: Still active")
-            logger.info("  Fast Exit: 30s monitoring (FREE)")
+            logger.info(f"  Fast Exit: {FastExitMonitor.CHECK_INTERVAL_SECONDS}s monitoring (FREE)")
             logger.info("=" * 60)
 
             # Wire up FastExitMonitor to record exits for self-improving learning
@@ -281,7 +298,7 @@ class HibachiTradingBot:
             logger.info("HIBACHI BOT v7 - DEEP42 BIAS + WHALE SIGNAL")
             logger.info("  TP: +4%  |  SL: -2%  |  Max Hold: 2 hours")
             logger.info("  Deep42: Live directional bias (4h cache)")
-            logger.info("  Fast Exit: 30s monitoring (FREE - no LLM)")
+            logger.info(f"  Fast Exit: {FastExitMonitor.CHECK_INTERVAL_SECONDS}s monitoring (FREE - no LLM)")
             logger.info("  Whale Signal: 0x023a positions as LLM context")
             logger.info("  Min confidence: 0.7 (raised from 0.6)")
             logger.info("=" * 60)
@@ -433,9 +450,11 @@ class HibachiTradingBot:
         logger.info("=" * 80)
 
         try:
+            self.profiler.phase("markets")
             # Fetch all market data
             logger.info("📊 Fetching market data from Hibachi...")
             market_data_dict = await self.aggregator.fetch_all_markets()
+            self.profiler.add_stages(self.aggregator.stage_timings, prefix="markets.")
 
             if not market_data_dict:
                 logger.warning("⚠️  No market data available - skipping cycle")
@@ -446,6 +465,7 @@ class HibachiTradingBot:
             # HIBACHI: Skip macro context - not useful for high-frequency scalping
             # macro_context = self.aggregator.get_macro_context()  # DISABLED
 
+            self.profiler.phase("positions")
             # Get current positions from executor
             logger.info("📊 Fetching current positions...")
             raw_positions = await self.executor._fetch_open_positions()
@@ -530,6 +550,7 @@ class HibachiTradingBot:
                         'direction': direction
                     })
 
+            self.profiler.phase("exits")
             # Check hard exit rules BEFORE LLM decision (force closes override LLM)
             # EXCEPT for Strategy D (pairs trade) - pairs should close together, not individually
             logger.info("🛡️  Checking hard exit rules...")
@@ -656,6 +677,7 @@ class HibachiTradingBot:
             if forced_closes:
                 logger.info(f"   📊 Executed {len(forced_closes)} forced closes via hard rules")
 
+            self.profiler.phase("prompt")
             # HIBACHI: No macro context needed for high-frequency scalping
             # Removed v1/v2 check - Hibachi always uses pure technicals
 
@@ -974,6 +996,20 @@ class HibachiTradingBot:
             if changed_symbols:
                 logger.info(f"📊 Significant changes in: {', '.join(changed_symbols)}")
 
+            # Skip LLM call if the quantized market state (price/RSI/MACD buckets,
+            # positions, Deep42 bias) matches a decision made within the TTL -
+            # those decisions were already acted on
+            decision_cache = self.llm_agent.decision_cache
+            decision_key = decision_cache.fingerprint(
+                market_data_dict,
+                open_positions=open_positions,
+                recently_closed_symbols=recently_closed,
+                context=deep42_bias or ""
+            )
+            if decision_cache.get(decision_key) is not None:
+                logger.info("💤 Market state unchanged since last LLM decision - skipping LLM call")
+                return
+
             # Get trading decision from LLM (same pattern as Lighter bot)
             logger.info("🤖 Getting trading decision from LLM...")
 
@@ -985,8 +1021,9 @@ class HibachiTradingBot:
             for attempt in range(self.llm_agent.max_retries + 1):
                 logger.info(f"   LLM query attempt {attempt + 1}/{self.llm_agent.max_retries + 1}...")
 
+                self.profiler.phase("llm")
                 # Query model
-                result = self.llm_agent.model_client.query(
+                result = await self.llm_agent.model_client.aquery(
                     prompt=prompt,
                     max_tokens=500,
                     temperature=0.1
@@ -1009,6 +1046,7 @@ class HibachiTradingBot:
                 logger.info("=" * 80)
                 logger.info("")
 
+                self.profiler.phase("parse")
                 # Try parsing multiple decisions
                 parsed_decisions = self.llm_agent.response_parser.parse_multiple_decisions(result["content"])
                 if parsed_decisions is None or len(parsed_decisions) == 0:
@@ -1026,6 +1064,7 @@ class HibachiTradingBot:
                         )
                     continue
 
+                self.profiler.phase("validation")
                 # Validate all decisions
                 logger.info("")
                 logger.info("=" * 80)
@@ -1137,6 +1176,7 @@ class HibachiTradingBot:
 
                 if valid_decisions:
                     decisions = valid_decisions
+                    decision_cache.put(decision_key, valid_decisions)
                     break
                 else:
                     if parsed_decisions:
@@ -1160,6 +1200,7 @@ class HibachiTradingBot:
             logger.info("")
             logger.info(f"💡 LLM DECISIONS: {len(decisions)} decision(s) | Cost: ${total_cost:.4f}")
 
+            self.profiler.phase("execution")
             # Execute each decision
             for i, decision in enumerate(decisions, 1):
                 action = decision.get('action')
@@ -1358,7 +1399,7 @@ class HibachiTradingBot:
         logger.info("🚀 Starting Hibachi trading bot...")
         logger.info(f"   Mode: {['LIVE', 'DRY-RUN'][self.dry_run]}")
         logger.info(f"   Check Interval: {self.check_interval}s (LLM decisions)")
-        logger.info(f"   Fast Exit: 30s (price-only, FREE)")
+        logger.info(f"   Fast Exit: {FastExitMonitor.CHECK_INTERVAL_SECONDS}s (price-only, FREE)")
         logger.info(f"   Position Size: ${self.position_size}")
 
         cycle_count = 0
@@ -1366,9 +1407,11 @@ class HibachiTradingBot:
         # Start fast exit monitor as background task (skip for pairs strategies)
         if self.strategy.upper() != "D":
             self.fast_exit_task = asyncio.create_task(self.fast_exit_monitor.run())
-            logger.info("⚡ Fast exit monitor started (30s price checks)")
+            logger.info(f"⚡ Fast exit monitor started ({FastExitMonitor.CHECK_INTERVAL_SECONDS}s batched price checks)")
         else:
             logger.info("⏸️  Fast exit monitor disabled for pairs strategy")
+        self.warm_start_task = asyncio.create_task(self.warm_start.run())
+        await self.profiler.serve_http()
 
         try:
             while True:
@@ -1381,7 +1424,11 @@ class HibachiTradingBot:
                 if cycle_count % 6 == 0:  # Every 30 minutes
                     self.fast_exit_monitor.log_stats()
 
-                await self.run_once()
+                with self.profiler.cycle():
+                    await self.run_once()
+
+                # Positions may have been opened/closed this cycle
+                self.fast_exit_monitor.notify_positions_changed()
 
                 logger.info(f"⏳ Waiting {self.check_interval}s until next cycle...")
                 await asyncio.sleep(self.check_interval)
@@ -1396,6 +1443,12 @@ class HibachiTradingBot:
             self.fast_exit_monitor.stop()
             if self.fast_exit_task:
                 self.fast_exit_task.cancel()
+        finally:
+            self.warm_start_task.cancel()
+            self.warm_start.save()
+            await self.profiler.close()
+            await self.hibachi_sdk.close()
+            await self.llm_agent.model_client.close()
 
 
 def main():
@@ -5,9 +5,13 @@ Uses Hibachi DEX data
 Symbols fetched dynamically from Hibachi API via SDK
 
 HIB-005 (2026-01-22): Added indicator caching to reduce redundant calculations
+Indicators are kept up to date incrementally per symbol (IncrementalIndicatorEngine)
+instead of being recomputed over every candle each cycle
 """
 
+import asyncio
 import logging
+import time
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 import hashlib
@@ -20,8 +24,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from llm_agent.data.macro_fetcher import MacroContextFetcher
 from llm_agent.data.indicator_calculator import IndicatorCalculator
+from llm_agent.data.incremental_indicators import IncrementalIndicatorEngine
 from llm_agent.data.oi_fetcher import OIDataFetcher
 from hibachi_agent.data.hibachi_fetcher import HibachiDataFetcher
+from core.market_bus import MarketDataBusClient
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +56,8 @@ class HibachiMarketDataAggregator:
         sdk=None,
         interval: str = "5m",  # 5m candles for HF scalping (was 15m)
         candle_limit: int = 100,
-        macro_refresh_hours: int = 12
+        macro_refresh_hours: int = 12,
+        market_bus: Optional[MarketDataBusClient] = None
     ):
         """
         Initialize Hibachi market data aggregator
@@ -61,12 +68,16 @@ class HibachiMarketDataAggregator:
             interval: Candle interval (default: 5m for HF scalping)
             candle_limit: Number of candles to fetch (default: 100)
             macro_refresh_hours: Hours between macro context refreshes (default: 12)
+            market_bus: Host market data bus (default: the local daemon if one is running)
         """
         self.interval = interval
         self.candle_limit = candle_limit
 
+        # Candles/funding/OI come from the host's market data bus when a daemon is up
+        self.market_bus = market_bus or MarketDataBusClient.from_env()
+
         # Hibachi data fetcher with SDK
-        self.hibachi = HibachiDataFetcher(sdk=sdk)
+        self.hibachi = HibachiDataFetcher(sdk=sdk, market_bus=self.market_bus)
 
         # Shared components (macro context, indicators, OI)
         self.macro_fetcher = MacroContextFetcher(
@@ -74,6 +85,7 @@ class HibachiMarketDataAggregator:
             refresh_interval_hours=macro_refresh_hours
         )
         self.indicator_calc = IndicatorCalculator()
+        self.indicator_engine = IncrementalIndicatorEngine(timeframe="5m")
         self.oi_fetcher = OIDataFetcher()
 
         # HIB-005: Indicator caching
@@ -83,6 +95,9 @@ class HibachiMarketDataAggregator:
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Seconds per stage of the last fetch_all_markets() (same keys as ConcurrentFetchEngine)
+        self.stage_timings: Dict[str, float] = {}
+
         logger.info(f"✅ HibachiMarketDataAggregator initialized (interval={interval}, candles={candle_limit})")
         logger.info(f"   📦 Indicator cache: {self._cache_ttl_seconds}s TTL, {self._price_change_threshold*100:.1f}% price threshold")
 
@@ -194,16 +209,15 @@ class HibachiMarketDataAggregator:
 
         # Calculate indicators if we have kline data
         if kline_df is not None and not kline_df.empty:
-            kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-            indicators = self.indicator_calc.get_latest_values(kline_df)
+            indicators = self.indicator_engine.update(symbol, kline_df)
             volume_24h = self._calculate_24h_volume(kline_df)
         else:
             # No kline data - use current price only
             indicators = {'price': current_price}
             volume_24h = None
 
-        # Fetch OI (may not be available for all Hibachi markets)
-        oi = self.oi_fetcher.fetch_oi(symbol)
+        oi_map = await self._oi_snapshot([symbol])
+        oi = oi_map.get(symbol)
 
         return {
             "symbol": symbol,
@@ -243,12 +257,19 @@ class HibachiMarketDataAggregator:
                 logger.warning(f"No valid Hibachi symbols in provided list")
                 return {}
 
-        # Use fetcher's async method
-        results = await self.hibachi.fetch_all_markets(
-            symbols=symbols,
-            interval=self.interval,
-            limit=self.candle_limit
+        # Use fetcher's async method; OI snapshot for all symbols is fetched alongside
+        self.stage_timings = {}
+        stage_start = time.perf_counter()
+        results, oi_map = await asyncio.gather(
+            self.hibachi.fetch_all_markets(
+                symbols=symbols,
+                interval=self.interval,
+                limit=self.candle_limit
+            ),
+            self._oi_snapshot(symbols)
         )
+        self.stage_timings['candles'] = time.perf_counter() - stage_start
+        stage_start = time.perf_counter()
 
         # Process each result to add indicators (with caching - HIB-005)
         for symbol, data in results.items():
@@ -269,8 +290,8 @@ class HibachiMarketDataAggregator:
                 self._cache_misses += 1
                 kline_df = data.get('kline_df')
                 if kline_df is not None and not kline_df.empty:
-                    kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-                    indicators = self.indicator_calc.get_latest_values(kline_df)
+                    # Only candles newer than the last update are folded in
+                    indicators = self.indicator_engine.update(symbol, kline_df)
                     volume_24h = self._calculate_24h_volume(kline_df)
                 else:
                     # No kline data - use current price only
@@ -286,9 +307,9 @@ class HibachiMarketDataAggregator:
                 # Update cache
                 self._update_cache(symbol, indicators, current_price, kline_df)
 
-            oi = self.oi_fetcher.fetch_oi(symbol)
-            data['oi'] = oi
+            data['oi'] = oi_map.get(symbol)
             data['price'] = current_price or data['indicators'].get('price')
+        self.stage_timings['indicators'] = time.perf_counter() - stage_start
 
         # Log cache stats periodically
         total_requests = self._cache_hits + self._cache_misses
@@ -298,6 +319,16 @@ class HibachiMarketDataAggregator:
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Hibachi markets")
         return results
 
+    async def _oi_snapshot(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """OI from the market data bus, else the shared per-cycle snapshot (blocking HTTP - run in executor)"""
+        if self.market_bus:
+            oi_map = await self.market_bus.oi_snapshot(symbols)
+            if oi_map is not None and any(v is not None for v in oi_map.values()):
+                return oi_map
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.oi_fetcher.get_oi_snapshot, symbols
+        )
+
     def has_significant_change(self, market_data: Dict[str, Dict], threshold_pct: float = 0.5) -> Tuple[bool, List[str]]:
         """
         HIB-005: Check if any market has significant change warranting LLM analysis.
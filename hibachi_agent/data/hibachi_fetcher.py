@@ -11,6 +11,7 @@ import pandas as pd
 from typing import Optional, Dict, List
 from datetime import datetime
 from hibachi_agent.data.binance_proxy import BinanceFuturesProxy
+from core.market_bus import make_topic
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +22,17 @@ class HibachiDataFetcher:
     Uses Binance Futures as proxy for candle data (Hibachi doesn't provide historical candles)
     """
 
-    def __init__(self, sdk=None):
+    def __init__(self, sdk=None, market_bus=None):
         """
         Initialize Hibachi data fetcher
 
         Args:
             sdk: HibachiSDK instance
+            market_bus: MarketDataBusClient to read Binance candles/funding from
+                (falls back to the Binance proxy when the bus has no data)
         """
         self.sdk = sdk
+        self.market_bus = market_bus
         self.available_symbols = []
         self._initialized = False
         # Binance proxy for candle data
@@ -59,6 +63,18 @@ class HibachiDataFetcher:
         except Exception as e:
             logger.error(f"Error initializing Hibachi symbols (will retry): {e}")
 
+    def get_state(self) -> Optional[Dict]:
+        """Symbol list for a warm start (None until initialized)"""
+        if not self._initialized:
+            return None
+        return {'available_symbols': list(self.available_symbols)}
+
+    def set_state(self, state: Dict):
+        """Restore a get_state() snapshot (skips the get_markets call at startup)"""
+        if state.get('available_symbols'):
+            self.available_symbols = list(state['available_symbols'])
+            self._initialized = True
+
     async def fetch_kline(
         self,
         symbol: str,
@@ -81,6 +97,12 @@ class HibachiDataFetcher:
         """
         await self._initialize_symbols()
 
+        binance_symbol = self.binance_proxy.hibachi_to_binance(symbol)
+        if self.market_bus and binance_symbol:
+            klines = await self.market_bus.klines("binance", binance_symbol, interval, limit)
+            if klines is not None and len(klines) > 0:
+                return klines
+
         # Use Binance proxy for candle data
         try:
             klines = await self.binance_proxy.fetch_klines(symbol, interval, limit)
@@ -126,6 +148,12 @@ class HibachiDataFetcher:
         Returns:
             Funding rate or None
         """
+        binance_symbol = self.binance_proxy.hibachi_to_binance(symbol)
+        if self.market_bus and binance_symbol:
+            funding_data = await self.market_bus.funding("binance", binance_symbol)
+            if funding_data:
+                return funding_data.get('funding_rate')
+
         try:
             funding_data = await self.binance_proxy.fetch_funding_rate(symbol)
             if funding_data:
@@ -183,6 +211,16 @@ class HibachiDataFetcher:
         """
         results = {}
 
+        if self.market_bus:
+            # Subscribe every topic in one round-trip so the daemon fetches them together
+            topics = []
+            for symbol in symbols:
+                binance_symbol = self.binance_proxy.hibachi_to_binance(symbol)
+                if binance_symbol:
+                    topics += [make_topic('candles', 'binance', binance_symbol, interval),
+                               make_topic('funding', 'binance', binance_symbol)]
+            await self.market_bus.get_many(topics)
+
         for symbol in symbols:
             data = await self.fetch_market_data(symbol, interval, limit)
             if data:
@@ -3,13 +3,17 @@ Fast Exit Monitor for Hibachi Bot
 Based on 2025-11-28 optimization request
 
 PURPOSE:
-- Check positions every 30 seconds (vs 5 min LLM cycles)
+- Check positions every 5 seconds (vs 5 min LLM cycles)
 - Exit immediately when TP/SL hit
 - NO LLM calls = FREE (just price API calls)
 - Designed to capture quick moves that would otherwise be missed
 
 ARCHITECTURE:
 - Runs as asyncio task alongside main bot loop
+- Position set + tracker entry data cached in memory, refreshed every 30s
+  or right after the bot signals a position change (notify_positions_changed)
+- Each tick reads prices for ALL open positions in one concurrent batch,
+  so a check costs one round-trip regardless of position count
 - Uses existing StrategyAExitRules for exit logic
 - Only checks prices and executes closes
 - Does NOT make new entries (that's the LLM's job)
@@ -21,12 +25,14 @@ COST IMPACT:
 
 LATENCY IMPROVEMENT:
 - Before: 0-300s delay to exit (5 min average)
-- After: 0-30s delay to exit (15s average)
-- 10x faster reaction to TP/SL hits
+- After: 0-5s delay to exit (2.5s average)
+- Check duration recorded per tick (see get_stats)
 """
 
 import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -35,14 +41,15 @@ logger = logging.getLogger(__name__)
 
 class FastExitMonitor:
     """
-    Fast exit monitoring loop - checks positions every 30 seconds
+    Fast exit monitoring loop - checks positions every 5 seconds
 
     Separates exit monitoring from LLM decision cycles for faster reactions.
     NO LLM calls = FREE operation.
     """
 
     MONITOR_NAME = "FAST_EXIT_MONITOR_V1"
-    CHECK_INTERVAL_SECONDS = 30  # Check every 30 seconds
+    CHECK_INTERVAL_SECONDS = 5       # Price check tick
+    POSITION_REFRESH_SECONDS = 30    # Re-read positions/entries at least this often
 
     def __init__(
         self,
@@ -77,6 +84,14 @@ class FastExitMonitor:
         self.last_check_time = None
         self.running = False
 
+        # Open positions keyed by symbol: {'side', 'entry_price', 'tracker_data'}
+        self._entries: Dict[str, Dict] = {}
+        self._entries_loaded_at: Optional[float] = None
+        self._positions_dirty = True
+
+        # Check latency (ms) over the last 500 ticks
+        self._check_times_ms = deque(maxlen=500)
+
         # HIB-002: Trailing stop tracking
         # Maps symbol -> {'breakeven_activated': bool, 'trailing_stop_pct': float, 'peak_pnl_pct': float}
         self.trailing_stops: Dict[str, Dict] = {}
@@ -156,41 +171,94 @@ class FastExitMonitor:
             del self.trailing_stops[symbol]
             logger.debug(f"[TRAILING] Cleared tracking for {symbol}")
 
+    def get_state(self) -> Dict:
+        """Trailing stop tracking for a warm start"""
+        return {'trailing_stops': {symbol: dict(t) for symbol, t in self.trailing_stops.items()}}
+
+    def set_state(self, state: Dict):
+        """Restore get_state() trailing stops (closed positions drop out on the next refresh)"""
+        self.trailing_stops.update(state.get('trailing_stops', {}))
+
+    def notify_positions_changed(self):
+        """Re-read positions and entry data on the next tick (call after opening/closing)"""
+        self._positions_dirty = True
+
+    async def refresh_positions(self) -> Dict[str, Dict]:
+        """
+        Load open positions and their tracker entry data into the in-memory cache
+
+        Returns:
+            Dict of symbol -> {'side', 'entry_price', 'tracker_data'}
+        """
+        positions = await self.executor._fetch_open_positions()
+
+        entries = {}
+        for position in positions or []:
+            symbol = position.get('symbol')
+            quantity = float(position.get('quantity', 0))
+
+            if quantity == 0:
+                continue
+
+            direction = position.get('direction', 'Long')
+            side = 'LONG' if direction == 'Long' else 'SHORT'
+
+            # Get tracker data for entry price
+            tracker_data = self.tracker.get_open_trade_for_symbol(symbol)
+            entry_price = tracker_data.get('entry_price', 0) if tracker_data else 0
+
+            if not entry_price or entry_price <= 0:
+                continue
+
+            entries[symbol] = {
+                'side': side,
+                'entry_price': entry_price,
+                'tracker_data': tracker_data
+            }
+
+        # Positions closed elsewhere (LLM cycle, exchange) drop their trailing state
+        for symbol in list(self.trailing_stops):
+            if symbol not in entries:
+                self.clear_trailing_stop(symbol)
+
+        self._entries = entries
+        self._entries_loaded_at = time.monotonic()
+        self._positions_dirty = False
+        return entries
+
     async def check_positions_once(self) -> List[Dict]:
         """
         Single check of all positions against exit rules
 
+        Positions come from the in-memory cache (refreshed when stale or
+        flagged); prices for all of them are fetched in one concurrent batch.
+
         Returns:
             List of positions that were closed
         """
         closed_positions = []
+        start = time.perf_counter()
 
         try:
-            # Fetch current positions
-            positions = await self.executor._fetch_open_positions()
-
-            if not positions:
+            stale = (
+                self._entries_loaded_at is None
+                or time.monotonic() - self._entries_loaded_at >= self.POSITION_REFRESH_SECONDS
+            )
+            if self._positions_dirty or stale:
+                await self.refresh_positions()
+
+            if not self._entries:
                 return closed_positions
 
-            for position in positions:
-                symbol = position.get('symbol')
-                quantity = float(position.get('quantity', 0))
-
-                if quantity == 0:
-                    continue
+            # One batched read for every open position
+            prices = await self.sdk.get_prices(list(self._entries))
 
-                direction = position.get('direction', 'Long')
-                side = 'LONG' if direction == 'Long' else 'SHORT'
+            for symbol, entry in list(self._entries.items()):
+                side = entry['side']
+                entry_price = entry['entry_price']
+                tracker_data = entry['tracker_data']
 
-                # Get tracker data for entry price
-                tracker_data = self.tracker.get_open_trade_for_symbol(symbol)
-                entry_price = tracker_data.get('entry_price', 0) if tracker_data else 0
-
-                if not entry_price or entry_price <= 0:
-                    continue
-
-                # Fetch current price
-                current_price = await self.sdk.get_price(symbol)
+                current_price = prices.get(symbol)
                 if not current_price:
                     continue
 
@@ -272,6 +340,7 @@ class FastExitMonitor:
 
                         # HIB-002: Clear trailing stop tracking for closed position
                         self.clear_trailing_stop(symbol)
+                        self._entries.pop(symbol, None)
                     else:
                         logger.error(f"   ❌ Fast exit failed: {result.get('error')}")
                 else:
@@ -280,12 +349,14 @@ class FastExitMonitor:
 
         except Exception as e:
             logger.error(f"[FAST-EXIT] Error checking positions: {e}")
+        finally:
+            self._check_times_ms.append((time.perf_counter() - start) * 1000)
 
         return closed_positions
 
     async def run(self):
         """
-        Continuous monitoring loop - runs every 30 seconds
+        Continuous monitoring loop - runs every CHECK_INTERVAL_SECONDS
 
         This runs as a separate asyncio task from the main bot loop.
         """
@@ -302,7 +373,7 @@ class FastExitMonitor:
                 self.last_check_time = datetime.now()
 
                 # Log less frequently to avoid spam
-                if self.checks_performed % 10 == 1:  # Every 5 minutes
+                if self.checks_performed % 60 == 1:  # Every 5 minutes
                     logger.info(f"[FAST-EXIT] Check #{self.checks_performed} | Exits triggered: {self.exits_triggered}")
 
                 closed = await self.check_positions_once()
@@ -333,9 +404,23 @@ class FastExitMonitor:
             "checks_performed": self.checks_performed,
             "exits_triggered": self.exits_triggered,
             "check_interval_seconds": self.CHECK_INTERVAL_SECONDS,
+            "positions_tracked": len(self._entries),
+            **self._check_latency(),
             "last_check_time": self.last_check_time.isoformat() if self.last_check_time else None
         }
 
+    def _check_latency(self) -> Dict:
+        """Check duration stats (ms) over recent ticks"""
+        times = sorted(self._check_times_ms)
+        if not times:
+            return {"last_check_ms": None, "avg_check_ms": None, "p95_check_ms": None, "max_check_ms": None}
+        return {
+            "last_check_ms": round(self._check_times_ms[-1], 1),
+            "avg_check_ms": round(sum(times) / len(times), 1),
+            "p95_check_ms": round(times[int(0.95 * (len(times) - 1))], 1),
+            "max_check_ms": round(times[-1], 1),
+        }
+
     def log_stats(self):
         """Log current statistics"""
         stats = self.get_stats()
@@ -344,5 +429,10 @@ class FastExitMonitor:
         logger.info(f"  Status: {'Running' if stats['running'] else 'Stopped'}")
         logger.info(f"  Checks: {stats['checks_performed']}")
         logger.info(f"  Exits: {stats['exits_triggered']}")
+        if stats['avg_check_ms'] is not None:
+            logger.info(
+                f"  Check Time: avg {stats['avg_check_ms']:.0f}ms | p95 {stats['p95_check_ms']:.0f}ms | "
+                f"max {stats['max_check_ms']:.0f}ms ({stats['positions_tracked']} positions)"
+            )
         logger.info(f"  Last Check: {stats['last_check_time'] or 'Never'}")
         logger.info("-" * 40)
@@ -277,7 +277,7 @@ REASON: ETH showing stronger RSI recovery and positive MACD divergence
 
         try:
             # Call LLM (query is sync, not async)
-            result = self.llm_agent.model_client.query(prompt)
+            result = await self.llm_agent.model_client.aquery(prompt)
             if not result or not result.get('content'):
                 logger.warning("[PAIRS-LLM] Empty response from LLM")
                 return (self.ASSET_A, self.ASSET_B, "LLM empty response - using default")
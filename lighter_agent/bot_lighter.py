@@ -30,6 +30,8 @@ from dexes.lighter.lighter_sdk import LighterSDK
 from lighter_agent.execution.lighter_executor import LighterTradeExecutor
 from lighter_agent.execution.hard_exit_rules import HardExitRules
 from lighter_agent.data.lighter_aggregator import LighterMarketDataAggregator
+from core.warm_start import WarmStartStore
+from core.cycle_profiler import CycleProfiler
 
 # Load environment variables from project root
 project_root_env = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
@@ -159,6 +161,16 @@ class LighterTradingBot:
         )
         logger.info("✅ Hard exit rules enabled: 2h min hold, +2% target, -1.5% stop")
 
+        # Warm start: market metadata/IDs and macro/Deep42 context from the last
+        # snapshot, so a watchdog restart skips the warm-up API calls
+        self._warm_markets = None  # applied once the SDK exists (_ensure_sdk_initialized)
+        self.profiler = CycleProfiler("lighter")  # per-phase cycle timings (logs/metrics + local HTTP)
+        self.warm_start = WarmStartStore("lighter")
+        self.warm_start.register("markets", self._get_market_state, self._set_market_state, max_age=6 * 3600)
+        self.warm_start.register("macro", self.aggregator.macro_fetcher.get_state,
+                                 self.aggregator.macro_fetcher.set_state, max_age=12 * 3600)
+        self.warm_start.restore()
+
         logger.info("✅ Lighter Trading Bot initialized successfully")
         
         # Log prompt version
@@ -221,6 +233,16 @@ class LighterTradingBot:
             return "NORMAL"
 
 
+    def _get_market_state(self) -> Optional[Dict]:
+        """Market metadata + fetcher symbol/ID maps for the warm start snapshot"""
+        fetcher_state = self.aggregator.lighter.get_state()
+        if not self.lighter_sdk or not self.lighter_sdk._market_metadata or not fetcher_state:
+            return self._warm_markets
+        return {'metadata': self.lighter_sdk._market_metadata, 'fetcher': fetcher_state}
+
+    def _set_market_state(self, state: Dict):
+        self._warm_markets = state
+
     async def _ensure_sdk_initialized(self):
         """Initialize SDK in async context (lazy initialization)"""
         if self.lighter_sdk is None:
@@ -240,6 +262,11 @@ class LighterTradingBot:
             self.aggregator.candlestick_api = lighter.CandlestickApi(self.lighter_sdk.api_client)
             self.aggregator.funding_api = lighter.FundingApi(self.lighter_sdk.api_client)
 
+            # Restored market metadata skips the orderBooks call and per-symbol lookups
+            if self._warm_markets:
+                self.lighter_sdk._market_metadata = self._warm_markets['metadata']
+                self.aggregator.lighter.set_state(self._warm_markets['fetcher'])
+
             # Initialize symbols eagerly now that SDK is available
             await self.aggregator.lighter._initialize_symbols()
 
@@ -278,6 +305,7 @@ class LighterTradingBot:
 
         try:
 
+            self.profiler.phase("positions")
             # Get ALL positions from Lighter API (for reference)
             positions_result = await self.lighter_sdk.get_positions()
             all_exchange_positions = []
@@ -332,6 +360,7 @@ class LighterTradingBot:
                 logger.info(f"│ No open positions")
                 logger.info(f"└─ 0 positions")
 
+            self.profiler.phase("markets")
             # Fetch market data (condensed logging with timestamp)
             fetch_start = datetime.now()
             logger.info("")
@@ -339,6 +368,7 @@ class LighterTradingBot:
             logger.info("│ ⏳ Fetching markets from Lighter...")
 
             all_market_data_dict = await self.aggregator.fetch_all_markets()
+            self.profiler.add_stages(self.aggregator.fetch_engine.stage_timings, prefix="markets.")
 
             fetch_end = datetime.now()
             fetch_duration = (fetch_end - fetch_start).total_seconds()
@@ -365,6 +395,7 @@ class LighterTradingBot:
             lighter_symbols = list(market_data_dict.keys())
             logger.info(f"📊 Analyzing {len(lighter_symbols)} Lighter markets: {', '.join(lighter_symbols)}")
 
+            self.profiler.phase("exits")
             # Check hard exit rules BEFORE LLM decision (force closes override LLM)
             logger.info("")
             forced_closes = []
@@ -450,6 +481,7 @@ class LighterTradingBot:
             else:
                 logger.info("✅ No hard rule triggers - all positions within targets")
 
+            self.profiler.phase("prompt")
             # Detect market regime (Nov 7 learning: Oversold flush days are golden)
             market_regime = self._detect_market_regime(market_data_dict)
             if market_regime == "OVERSOLD_FLUSH":
@@ -560,8 +592,9 @@ class LighterTradingBot:
             for attempt in range(self.llm_agent.max_retries + 1):
                 logger.info(f"LLM query attempt {attempt + 1}/{self.llm_agent.max_retries + 1}...")
 
+                self.profiler.phase("llm")
                 # Query model (same parameters as Pacifica)
-                result = self.llm_agent.model_client.query(
+                result = await self.llm_agent.model_client.aquery(
                     prompt=prompt,
                     max_tokens=500,
                     temperature=0.1
@@ -584,6 +617,7 @@ class LighterTradingBot:
                 logger.info("=" * 80)
                 logger.info("")
 
+                self.profiler.phase("parse")
                 # Try parsing multiple decisions (same parser as Pacifica)
                 parsed_decisions = self.llm_agent.response_parser.parse_multiple_decisions(result["content"])
                 if parsed_decisions is None or len(parsed_decisions) == 0:
@@ -605,6 +639,7 @@ class LighterTradingBot:
                         )
                     continue
 
+                self.profiler.phase("validation")
                 # Validate all decisions (same validation as Pacifica)
                 logger.info("")
                 logger.info("=" * 80)
@@ -758,6 +793,13 @@ class LighterTradingBot:
             elif not isinstance(decisions, list):
                 decisions = [decisions]  # Backward compatibility
 
+            # Pull orderbooks for new entries in the background while decisions are
+            # logged and executed, so the pre-trade liquidity check hits the cache
+            if not self.executor.dry_run:
+                self.executor.liquidity_checker.prefetch(
+                    d.get('symbol') for d in decisions if d.get('action') in ("BUY", "SELL")
+                )
+
             # Clean LLM decision output with FULL reasoning (not truncated)
             prompt_version = self.llm_agent.prompt_formatter.get_prompt_version()
             total_cost = sum(d.get('cost', 0) for d in decisions)
@@ -818,6 +860,7 @@ class LighterTradingBot:
 
             logger.info("└─" + "─" * 76)
 
+            self.profiler.phase("execution")
             # Execute decisions (clean output)
             logger.info("")
             logger.info("┌─ EXECUTION " + "─" * 64)
@@ -885,10 +928,13 @@ class LighterTradingBot:
         prompt_version = self.llm_agent.prompt_formatter.get_prompt_version()
         logger.info(f"📝 Active Prompt Version: {prompt_version}")
         logger.info(f"Position size: ${self.position_size}")
+        warm_start_task = asyncio.create_task(self.warm_start.run())
+        await self.profiler.serve_http()
 
         try:
             while True:
-                await self.run_once()
+                with self.profiler.cycle():
+                    await self.run_once()
 
                 # Calculate and display next cycle time
                 next_cycle_time = datetime.now() + timedelta(seconds=self.check_interval)
@@ -904,6 +950,11 @@ class LighterTradingBot:
             logger.info("Bot stopped by user (Ctrl+C)")
         except Exception as e:
             logger.error(f"Bot crashed: {e}", exc_info=True)
+        finally:
+            warm_start_task.cancel()
+            self.warm_start.save()
+            await self.profiler.close()
+            await self.llm_agent.model_client.close()
 
 
 def main():
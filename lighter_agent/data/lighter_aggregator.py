@@ -5,8 +5,9 @@ Uses Lighter DEX data instead of Pacifica
 Symbols fetched dynamically from Lighter API via SDK
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 # Import shared components
@@ -17,7 +18,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from llm_agent.data.macro_fetcher import MacroContextFetcher
 from llm_agent.data.indicator_calculator import IndicatorCalculator
 from llm_agent.data.oi_fetcher import OIDataFetcher
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
 from lighter_agent.data.lighter_fetcher import LighterDataFetcher
+from core.market_bus import MarketDataBusClient
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,9 @@ class LighterMarketDataAggregator:
         sdk=None,
         interval: str = "15m",
         candle_limit: int = 100,
-        macro_refresh_hours: int = 12
+        macro_refresh_hours: int = 12,
+        max_concurrency: int = 4,
+        market_bus: Optional[MarketDataBusClient] = None
     ):
         """
         Initialize Lighter market data aggregator
@@ -46,12 +51,17 @@ class LighterMarketDataAggregator:
             interval: Candle interval (default: 15m)
             candle_limit: Number of candles to fetch (default: 100)
             macro_refresh_hours: Hours between macro context refreshes (default: 12)
+            max_concurrency: Max in-flight per-symbol fetches (default: 4)
+            market_bus: Host market data bus (default: the local daemon if one is running)
         """
         self.interval = interval
         self.candle_limit = candle_limit
 
+        # Candles/OI come from the host's market data bus when a daemon is up
+        self.market_bus = market_bus or MarketDataBusClient.from_env()
+
         # Lighter data fetcher with SDK for dynamic symbol loading
-        self.lighter = LighterDataFetcher(sdk=sdk)
+        self.lighter = LighterDataFetcher(sdk=sdk, market_bus=self.market_bus)
 
         # Will be set by bot when SDK is initialized
         self.candlestick_api = None
@@ -65,6 +75,9 @@ class LighterMarketDataAggregator:
         self.indicator_calc = IndicatorCalculator()
         self.oi_fetcher = OIDataFetcher()
 
+        # Concurrent per-symbol fetches + executor for blocking indicator/OI work
+        self.fetch_engine = ConcurrentFetchEngine(max_concurrency=max_concurrency)
+
         logger.info(f"✅ LighterMarketDataAggregator initialized (interval={interval}, candles={candle_limit})")
 
     @property
@@ -92,8 +105,8 @@ class LighterMarketDataAggregator:
             logger.warning(f"Symbol {symbol} not available on Lighter (available: {', '.join(self.lighter_markets)})")
             return None
 
-        # Fetch Lighter data (not Pacifica!) - requires SDK
-        if not self.candlestick_api:
+        # Fetch Lighter data (not Pacifica!) - requires SDK or the market data bus
+        if not self.candlestick_api and not self.market_bus:
             logger.warning(f"CandlestickApi not initialized - cannot fetch data for {symbol}")
             return None
 
@@ -113,20 +126,18 @@ class LighterMarketDataAggregator:
         funding_rate = lighter_data['funding_rate']
         current_price = lighter_data['current_price']
 
-        # Calculate indicators
-        if kline_df is not None and not kline_df.empty:
-            kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-            indicators = self.indicator_calc.get_latest_values(kline_df)
-
-            # Calculate 24h volume from recent candles
-            volume_24h = self._calculate_24h_volume(kline_df)
+        # Indicators (CPU) and OI (blocking HTTP) run in the executor, concurrently
+        computed, oi_map = await asyncio.gather(
+            self.fetch_engine.run_blocking(self._compute_indicators, kline_df),
+            self._oi_snapshot([symbol])
+        )
+        oi = oi_map.get(symbol)
+        if computed:
+            kline_df, indicators, volume_24h = computed
         else:
             indicators = {}
             volume_24h = None
 
-        # Fetch OI (may not be available for all Lighter markets)
-        oi = self.oi_fetcher.fetch_oi(symbol)
-
         return {
             "symbol": symbol,
             "price": current_price or indicators.get('price'),
@@ -169,37 +180,62 @@ class LighterMarketDataAggregator:
                 logger.warning(f"No valid Lighter symbols in provided list")
                 return {}
 
-        if not self.candlestick_api:
+        if not self.candlestick_api and not self.market_bus:
             logger.warning("CandlestickApi not initialized - cannot fetch market data")
             return {}
 
-        # Use fetcher's async method
-        results = await self.lighter.fetch_all_markets(
-            symbols=symbols,
-            interval=self.interval,
-            limit=self.candle_limit,
-            candlestick_api=self.candlestick_api,
-            funding_api=self.funding_api
-        )
+        engine = self.fetch_engine
+        engine.reset_timings()
+
+        async def _fetch_candles() -> Dict[str, Dict]:
+            with engine.stage("candles"):
+                return await self.lighter.fetch_all_markets(
+                    symbols=symbols,
+                    interval=self.interval,
+                    limit=self.candle_limit,
+                    candlestick_api=self.candlestick_api,
+                    funding_api=self.funding_api,
+                    fetch_engine=engine
+                )
+
+        async def _fetch_oi() -> Dict[str, Optional[float]]:
+            # One shared snapshot per cycle (1 HyperLiquid bulk + parallel Binance)
+            with engine.stage("oi"):
+                return await self._oi_snapshot(symbols)
+
+        with engine.stage("total"):
+            # Candle/funding requests and OI requests fan out at the same time
+            results, oi_map = await asyncio.gather(_fetch_candles(), _fetch_oi())
+
+            # Indicator math is CPU-bound - keep it off the event loop
+            with engine.stage("indicators"):
+                computed = await engine.map(
+                    list(results),
+                    lambda s: engine.run_blocking(self._compute_indicators, results[s].get('kline_df'))
+                )
 
-        # Process each result to add indicators
         for symbol, data in results.items():
-            kline_df = data.get('kline_df')
-            if kline_df is not None and not kline_df.empty:
-                kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-                indicators = self.indicator_calc.get_latest_values(kline_df)
-                volume_24h = self._calculate_24h_volume(kline_df)
-                oi = self.oi_fetcher.fetch_oi(symbol)
-                
-                data['indicators'] = indicators
-                data['volume_24h'] = volume_24h
-                data['oi'] = oi
-                data['price'] = data.get('current_price') or indicators.get('price')
-                data['kline_df'] = kline_df
-
+            if symbol not in computed:
+                continue
+            kline_df, indicators, volume_24h = computed[symbol]
+            data['indicators'] = indicators
+            data['volume_24h'] = volume_24h
+            data['oi'] = oi_map.get(symbol)
+            data['price'] = data.get('current_price') or indicators.get('price')
+            data['kline_df'] = kline_df
+
+        logger.info(f"⏱️ Lighter data stages: {engine.format_stage_timings()}")
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Lighter markets")
         return results
 
+    async def _oi_snapshot(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """OI from the market data bus, else the shared per-cycle snapshot (blocking HTTP - run in executor)"""
+        if self.market_bus:
+            oi_map = await self.market_bus.oi_snapshot(symbols)
+            if oi_map is not None and any(v is not None for v in oi_map.values()):
+                return oi_map
+        return await self.fetch_engine.run_blocking(self.oi_fetcher.get_oi_snapshot, symbols)
+
     def get_macro_context(self, force_refresh: bool = False) -> str:
         """Get macro market context (same as Pacifica aggregator)"""
         return self.macro_fetcher.get_macro_context(force_refresh=force_refresh)
@@ -253,6 +289,22 @@ class LighterMarketDataAggregator:
 
         return "\n".join(lines)
 
+    def _compute_indicators(self, kline_df) -> Optional[Tuple]:
+        """
+        Calculate indicators and 24h volume for one symbol (blocking, runs in executor)
+
+        Args:
+            kline_df: OHLCV DataFrame
+
+        Returns:
+            (kline_df with indicators, latest indicator values, 24h volume) or None if no candles
+        """
+        if kline_df is None or kline_df.empty:
+            return None
+        kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
+        indicators = self.indicator_calc.get_latest_values(kline_df)
+        return kline_df, indicators, self._calculate_24h_volume(kline_df)
+
     def _calculate_24h_volume(self, kline_df) -> Optional[float]:
         """Calculate 24h volume from candles (same as Pacifica aggregator)"""
         if kline_df is None or kline_df.empty:
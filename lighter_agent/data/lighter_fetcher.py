@@ -3,7 +3,9 @@ Lighter DEX Data Fetcher
 Pure Lighter SDK implementation with Cambrian API fallback
 
 Symbols fetched dynamically from Lighter API via SDK
-Falls back to Cambrian API for candlestick data when Lighter is geo-blocked
+Candles are read from the host market data bus when available, else from the
+SDK (or Lighter's public REST API when no SDK client is set), falling back to
+the Cambrian API when Lighter is geo-blocked
 """
 
 import asyncio
@@ -16,10 +18,14 @@ from datetime import datetime
 import time
 from dotenv import load_dotenv
 
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+LIGHTER_API_URL = "https://mainnet.zklighter.elliot.ai"
+
 # Cambrian token address mapping for fallback (Solana SPL token addresses)
 # Only tokens verified to have active OHLCV data on Cambrian
 CAMBRIAN_TOKEN_ADDRESSES = {
@@ -46,14 +52,17 @@ class LighterDataFetcher:
     Symbols and market IDs fetched dynamically from API
     """
 
-    def __init__(self, sdk=None):
+    def __init__(self, sdk=None, market_bus=None):
         """
         Initialize Lighter data fetcher
 
         Args:
             sdk: LighterSDK instance for fetching market metadata
+            market_bus: MarketDataBusClient to read candles from (falls back to
+                the SDK when the bus has no data)
         """
         self.sdk = sdk
+        self.market_bus = market_bus
         self.available_symbols = []  # Will be populated from API
         self.market_ids = {}  # Will be populated from API
         self._initialized = False
@@ -82,6 +91,24 @@ class LighterDataFetcher:
         self._initialized = True
         logger.info(f"✅ Initialized Lighter fetcher with {len(self.available_symbols)} markets from API: {self.available_symbols}")
 
+    def get_state(self) -> Optional[Dict]:
+        """Symbols, market IDs and geo-block flag for a warm start (None until initialized)"""
+        if not self._initialized:
+            return None
+        return {
+            'available_symbols': list(self.available_symbols),
+            'market_ids': dict(self.market_ids),
+            'candlesticks_blocked': self._candlesticks_blocked,
+        }
+
+    def set_state(self, state: Dict):
+        """Restore a get_state() snapshot (skips the per-symbol market ID lookups)"""
+        if state.get('available_symbols') and state.get('market_ids'):
+            self.available_symbols = list(state['available_symbols'])
+            self.market_ids = dict(state['market_ids'])
+            self._candlesticks_blocked = state.get('candlesticks_blocked', False)
+            self._initialized = True
+
     def _fetch_cambrian_candlesticks(self, symbol: str, interval: str = "15m", limit: int = 100) -> Optional[pd.DataFrame]:
         """
         Fallback: Fetch candlestick data from Cambrian API when Lighter is blocked
@@ -168,6 +195,65 @@ class LighterDataFetcher:
             logger.error(f"Cambrian fallback error for {symbol}: {e}")
             return None
 
+    def _fetch_rest_candlesticks(self, symbol: str, market_id: int, interval: str = "15m", limit: int = 100) -> Optional[pd.DataFrame]:
+        """
+        Fetch candlestick data from Lighter's public REST API (no CandlestickApi client)
+
+        Args:
+            symbol: Trading symbol (e.g., "SOL")
+            market_id: Lighter market ID
+            interval: Candle interval
+            limit: Number of candles
+
+        Returns:
+            DataFrame with OHLCV data or None
+        """
+        try:
+            end_timestamp = int(time.time() * 1000)
+            interval_minutes = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "4h": 240, "12h": 720, "1d": 1440, "1w": 10080}.get(interval, 15)
+            response = requests.get(
+                f"{os.getenv('LIGHTER_API_URL', LIGHTER_API_URL)}/api/v1/candlesticks",
+                params={
+                    "market_id": market_id,
+                    "resolution": interval,
+                    "start_timestamp": end_timestamp - (limit * interval_minutes * 60 * 1000),
+                    "end_timestamp": end_timestamp,
+                    "count_back": limit
+                },
+                timeout=30
+            )
+
+            if response.status_code == 403:
+                logger.warning(f"⚠️ Lighter candlesticks blocked (403) - switching to Cambrian fallback")
+                self._candlesticks_blocked = True
+                return self._fetch_cambrian_candlesticks(symbol, interval, limit)
+            if response.status_code != 200:
+                logger.debug(f"Lighter REST candlesticks for {symbol}: HTTP {response.status_code}")
+                return None
+
+            candles = (response.json() or {}).get('candlesticks') or []
+            if not candles:
+                logger.warning(f"No candlestick data returned for {symbol}")
+                return None
+
+            df = pd.DataFrame([{
+                'timestamp': candle['timestamp'],
+                'open': float(candle['open']),
+                'high': float(candle['high']),
+                'low': float(candle['low']),
+                'close': float(candle['close']),
+                'volume': float(candle.get('volume1', candle.get('volume0', 0)))
+            } for candle in candles])
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', errors='coerce')
+            df = df.sort_values('timestamp').reset_index(drop=True)
+
+            logger.info(f"✅ Fetched {len(df)} candles for {symbol} ({interval}) from Lighter REST")
+            return df
+
+        except Exception as e:
+            logger.debug(f"Error fetching Lighter REST candles for {symbol}: {e}")
+            return None
+
     async def update_position_prices(self) -> Dict[str, float]:
         """
         Fetch current prices from account positions
@@ -222,19 +308,26 @@ class LighterDataFetcher:
         # Ensure symbols are initialized
         await self._initialize_symbols()
 
+        if self.market_bus:
+            df = await self.market_bus.klines("lighter", symbol, interval, limit)
+            if df is not None and not df.empty:
+                return df
+
         market_id = self.market_ids.get(symbol)
         if not market_id:
             logger.warning(f"Market ID not found for {symbol} (available: {self.available_symbols})")
             return None
 
-        if not candlestick_api:
-            logger.warning(f"Lighter CandlestickApi not provided - cannot fetch data for {symbol}")
-            return None
-
         # If we know candlesticks are blocked, skip to fallback
         if self._candlesticks_blocked:
             return self._fetch_cambrian_candlesticks(symbol, interval, limit)
 
+        # No SDK client (bus-only setup with the daemon down) - fetch directly over REST
+        if not candlestick_api:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._fetch_rest_candlesticks, symbol, market_id, interval, limit
+            )
+
         try:
             # Resolution must be lowercase: "1m", "5m", "15m", "30m", "1h", "4h", "12h", "1d", "1w"
             valid_resolutions = ["1m", "5m", "15m", "30m", "1h", "4h", "12h", "1d", "1w"]
@@ -394,9 +487,15 @@ class LighterDataFetcher:
         Returns:
             Dict with keys: symbol, kline_df, funding_rate, current_price
         """
-        kline_df = await self.fetch_kline(symbol, interval, limit, candlestick_api)
-        funding_rate = await self.fetch_funding_rate(symbol, funding_api) if funding_api else None
-        current_price = await self.fetch_current_price(symbol, candlestick_api) if candlestick_api else None
+        async def _none():
+            return None
+
+        # Candles, funding and price are independent requests - issue them together
+        kline_df, funding_rate, current_price = await asyncio.gather(
+            self.fetch_kline(symbol, interval, limit, candlestick_api),
+            self.fetch_funding_rate(symbol, funding_api) if funding_api else _none(),
+            self.fetch_current_price(symbol, candlestick_api) if candlestick_api else _none()
+        )
 
         return {
             "symbol": symbol,
@@ -425,10 +524,11 @@ class LighterDataFetcher:
         interval: str = "15m",
         limit: int = 100,
         candlestick_api=None,
-        funding_api=None
+        funding_api=None,
+        fetch_engine: Optional[ConcurrentFetchEngine] = None
     ) -> Dict[str, Dict]:
         """
-        Fetch market data for all Lighter markets
+        Fetch market data for all Lighter markets concurrently
 
         Args:
             symbols: List of symbols to fetch (default: all Lighter markets from API)
@@ -436,6 +536,7 @@ class LighterDataFetcher:
             limit: Number of candles (default: 100)
             candlestick_api: Lighter CandlestickApi instance (required)
             funding_api: Lighter FundingApi instance (optional)
+            fetch_engine: Engine bounding concurrent requests (default: 4 in flight)
 
         Returns:
             Dict mapping symbol -> market data dict
@@ -461,8 +562,10 @@ class LighterDataFetcher:
             # Filter to only Lighter markets (from API)
             symbols = [s for s in symbols if s in self.available_symbols]
 
-        results = {}
-        for i, symbol in enumerate(symbols):
+        # Concurrency cap replaces the old 100ms-per-symbol sleep for 429 avoidance
+        engine = fetch_engine or ConcurrentFetchEngine(max_concurrency=4)
+
+        async def _fetch(symbol: str) -> Optional[Dict]:
             data = await self.fetch_market_data(
                 symbol,
                 interval,
@@ -471,11 +574,10 @@ class LighterDataFetcher:
                 funding_api=funding_api
             )
             if data and data.get('kline_df') is not None:
-                results[symbol] = data
+                return data
+            return None
 
-            # Rate limiting: 100ms delay between requests to avoid 429 errors
-            if i < len(symbols) - 1:
-                await asyncio.sleep(0.1)
+        results = await engine.map(symbols, _fetch)
 
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Lighter markets")
         return results
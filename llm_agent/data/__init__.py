@@ -6,19 +6,25 @@ Components:
 - OIDataFetcher: Open Interest from Binance Futures + HyperLiquid
 - MacroContextFetcher: Market context from Deep42 + CoinGecko + Fear & Greed
 - IndicatorCalculator: Technical indicators using ta library
+- IncrementalIndicatorEngine: Streaming per-symbol indicators (O(1) per new candle)
 - MarketDataAggregator: Orchestrates all data sources
+- ConcurrentFetchEngine: Bounded concurrent per-symbol fetches for DEX aggregators
 """
 
 from .oi_fetcher import OIDataFetcher
 from .macro_fetcher import MacroContextFetcher
 from .pacifica_fetcher import PacificaDataFetcher
 from .indicator_calculator import IndicatorCalculator
+from .incremental_indicators import IncrementalIndicatorEngine
 from .aggregator import MarketDataAggregator
+from .fetch_engine import ConcurrentFetchEngine
 
 __all__ = [
     'OIDataFetcher',
     'MacroContextFetcher',
     'PacificaDataFetcher',
     'IndicatorCalculator',
-    'MarketDataAggregator'
+    'IncrementalIndicatorEngine',
+    'MarketDataAggregator',
+    'ConcurrentFetchEngine'
 ]
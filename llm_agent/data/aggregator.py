@@ -140,6 +140,9 @@ class MarketDataAggregator:
 
         logger.info(f"Fetching market data for {len(symbols)} symbols...")
 
+        # Prime the shared OI snapshot so fetch_oi() below is a cache lookup
+        self.oi_fetcher.get_oi_snapshot(symbols)
+
         # Fetch Pacifica data for all markets
         results = {}
         for symbol in symbols:
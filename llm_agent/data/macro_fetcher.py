@@ -43,6 +43,20 @@ class MacroContextFetcher:
         self._btc_last_fetch: Optional[datetime] = None
         self._btc_interval = timedelta(hours=4)
 
+    def get_state(self) -> Dict:
+        """Cached macro/regime/BTC contexts with their fetch times (for a warm start)"""
+        return {
+            'context': (self._cached_context, self._last_fetch),
+            'regime': (self._cached_regime, self._regime_last_fetch),
+            'btc': (self._cached_btc, self._btc_last_fetch),
+        }
+
+    def set_state(self, state: Dict):
+        """Restore get_state() caches; each still expires on its own refresh interval"""
+        self._cached_context, self._last_fetch = state['context']
+        self._cached_regime, self._regime_last_fetch = state['regime']
+        self._cached_btc, self._btc_last_fetch = state['btc']
+
     def _should_refresh(self) -> bool:
         """Check if cache should be refreshed"""
         if self._cached_context is None or self._last_fetch is None:
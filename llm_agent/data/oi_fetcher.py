@@ -10,15 +10,84 @@ Coverage: 26/28 Pacifica markets (92.9%)
 Usage:
     fetcher = OIDataFetcher()
     oi_values = fetcher.fetch_all_oi(pacifica_symbols)
+
+    # Snapshot mode: whole universe in one pass, shared across aggregators per cycle
+    oi_values = fetcher.get_oi_snapshot(["SOL", "ETH/USDT-P", "BTC-USD"])
 """
 
+import re
+import time
+import threading
 import requests
 import logging
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class OISnapshotCache:
+    """
+    Process-wide OI snapshot keyed by cycle
+
+    A cycle is a ttl_seconds time bucket. Every aggregator in the process reads
+    the same snapshot during a cycle; the first reader that needs a symbol not
+    yet in the snapshot fetches it, everyone else gets a dict lookup.
+    """
+
+    def __init__(self, ttl_seconds: int = 60):
+        self.ttl_seconds = ttl_seconds
+        self._cycle: Optional[int] = None
+        self._values: Dict[str, Optional[float]] = {}
+        # Held across the fetch so concurrent readers don't duplicate it
+        self.lock = threading.RLock()
+
+    def current_cycle(self) -> int:
+        """Get the cycle key for the current time"""
+        return int(time.time() // self.ttl_seconds)
+
+    def lookup(self, base_symbols: List[str]) -> Tuple[Dict[str, Optional[float]], List[str]]:
+        """
+        Look up symbols in the current cycle's snapshot
+
+        Args:
+            base_symbols: Normalized symbols (e.g. "SOL")
+
+        Returns:
+            (cached values, symbols missing from the snapshot)
+        """
+        with self.lock:
+            if self._cycle != self.current_cycle():
+                self._cycle = self.current_cycle()
+                self._values = {}
+            cached = {s: self._values[s] for s in base_symbols if s in self._values}
+            missing = [s for s in base_symbols if s not in self._values]
+            return cached, missing
+
+    def store(self, values: Dict[str, Optional[float]]):
+        """
+        Merge fetched values into the current cycle's snapshot
+
+        None (failed or unavailable) values are not stored, so the next reader
+        retries them instead of seeing no OI until the cycle rolls over.
+        """
+        with self.lock:
+            if self._cycle != self.current_cycle():
+                self._cycle = self.current_cycle()
+                self._values = {}
+            self._values.update({s: v for s, v in values.items() if v is not None})
+
+    def clear(self):
+        """Drop the snapshot"""
+        with self.lock:
+            self._cycle = None
+            self._values = {}
+
+
+# Shared by every OIDataFetcher in the process (Hibachi/Lighter/Pacifica/Extended)
+_SHARED_SNAPSHOT = OISnapshotCache()
+
+
 class OIDataFetcher:
     """Fetch Open Interest data from multiple sources"""
 
@@ -51,10 +120,29 @@ class OIDataFetcher:
         "kPEPE": "PEPE",  # Not available on HyperLiquid
     }
 
-    def __init__(self):
+    def __init__(self, snapshot_cache: Optional[OISnapshotCache] = None, max_workers: int = 8):
+        """
+        Initialize OI fetcher
+
+        Args:
+            snapshot_cache: Snapshot cache (default: process-wide shared cache)
+            max_workers: Parallel Binance requests when building a snapshot
+        """
         self.binance_url = "https://fapi.binance.com/fapi/v1/openInterest"
         self.hyperliquid_url = "https://api.hyperliquid.xyz/info"
         self._hl_cache = None  # Cache HyperLiquid data (updates every call)
+        self._hl_cache_time = 0.0
+        self.snapshot_cache = snapshot_cache or _SHARED_SNAPSHOT
+        self.max_workers = max_workers
+
+    @staticmethod
+    def normalize_symbol(symbol: str) -> str:
+        """
+        Map a DEX symbol to its base asset
+
+        Examples: "SOL/USDT-P" -> "SOL", "BTC-USD" -> "BTC", "ETH-USD-PERP" -> "ETH"
+        """
+        return re.split(r"[/-]", symbol, maxsplit=1)[0]
 
     def fetch_binance_oi(self, symbol: str) -> Optional[float]:
         """
@@ -136,13 +224,21 @@ class OIDataFetcher:
         Returns:
             OI value or None if unavailable
         """
-        # Use cache if available
-        if self._hl_cache is None:
-            self._hl_cache = self.fetch_hyperliquid_data()
+        hl_map = self._hyperliquid_map()
 
         # Handle kBONK/kPEPE naming
         hl_symbol = self.HYPERLIQUID_SYMBOL_MAP.get(symbol, symbol)
-        return self._hl_cache.get(hl_symbol)
+        return hl_map.get(hl_symbol)
+
+    def _hyperliquid_map(self) -> Dict[str, float]:
+        """HyperLiquid OI map, refreshed once per snapshot cycle (failed fetches are not cached)"""
+        if not self._hl_cache or time.time() - self._hl_cache_time > self.snapshot_cache.ttl_seconds:
+            hl_map = self.fetch_hyperliquid_data()
+            if not hl_map:
+                return {}
+            self._hl_cache = hl_map
+            self._hl_cache_time = time.time()
+        return self._hl_cache
 
     def fetch_oi(self, symbol: str) -> Optional[float]:
         """
@@ -154,13 +250,19 @@ class OIDataFetcher:
         Returns:
             OI value or None if unavailable
         """
+        # Current cycle's snapshot (if an aggregator already took one)
+        base = self.normalize_symbol(symbol)
+        cached, _ = self.snapshot_cache.lookup([base])
+        if base in cached:
+            return cached[base]
+
         # Try Binance first (faster, more reliable)
-        oi = self.fetch_binance_oi(symbol)
+        oi = self.fetch_binance_oi(base)
         if oi is not None:
             return oi
 
         # Fallback to HyperLiquid
-        oi = self.get_hyperliquid_oi(symbol)
+        oi = self.get_hyperliquid_oi(base)
         if oi is not None:
             return oi
 
@@ -178,15 +280,63 @@ class OIDataFetcher:
         Returns:
             Dict mapping symbol → OI value (None if unavailable)
         """
-        # Pre-fetch HyperLiquid data (single API call)
-        self._hl_cache = self.fetch_hyperliquid_data()
+        return self.get_oi_snapshot(symbols)
+
+    def fetch_snapshot(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Fetch OI for a whole symbol universe in one pass
+
+        One HyperLiquid metaAndAssetCtxs call covers every market; Binance
+        openInterest calls for the mapped symbols run in parallel. Binance
+        values take priority, HyperLiquid fills the rest.
+
+        Args:
+            symbols: Normalized symbols (e.g. "SOL")
+
+        Returns:
+            Dict mapping symbol -> OI value (None if unavailable)
+        """
+        binance_symbols = [s for s in symbols if s in self.BINANCE_SYMBOL_MAP]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            hl_future = pool.submit(self._hyperliquid_map)
+            binance_values = dict(zip(binance_symbols, pool.map(self.fetch_binance_oi, binance_symbols)))
+            hl_map = hl_future.result()
 
-        # Fetch OI for each symbol
         results = {}
         for symbol in symbols:
-            results[symbol] = self.fetch_oi(symbol)
+            oi = binance_values.get(symbol)
+            if oi is None:
+                oi = hl_map.get(self.HYPERLIQUID_SYMBOL_MAP.get(symbol, symbol))
+            results[symbol] = oi
+
+        found = sum(1 for v in results.values() if v is not None)
+        logger.info(f"✅ OI snapshot: {found}/{len(symbols)} symbols "
+                    f"({len(binance_symbols)} Binance parallel + 1 HyperLiquid bulk)")
+        return results
 
-        # Clear cache after batch
-        self._hl_cache = None
+    def get_oi_snapshot(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get OI for many symbols from the shared per-cycle snapshot
 
-        return results
+        Only symbols missing from the current cycle's snapshot are fetched, so
+        several aggregators in one process share a single round of HTTP calls.
+        Safe to call from executor threads.
+
+        Args:
+            symbols: DEX symbols in any format ("SOL", "SOL/USDT-P", "SOL-USD")
+
+        Returns:
+            Dict mapping each requested symbol -> OI value (None if unavailable)
+        """
+        bases = {symbol: self.normalize_symbol(symbol) for symbol in symbols}
+        unique_bases = list(dict.fromkeys(bases.values()))
+
+        with self.snapshot_cache.lock:
+            cached, missing = self.snapshot_cache.lookup(unique_bases)
+            if missing:
+                fetched = self.fetch_snapshot(missing)
+                self.snapshot_cache.store(fetched)
+                cached.update(fetched)
+
+        return {symbol: cached.get(base) for symbol, base in bases.items()}
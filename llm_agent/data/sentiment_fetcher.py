@@ -9,6 +9,10 @@ Sources:
 - Social sentiment indicators
 
 Update frequency: Every 1-6 hours
+
+When the host runs a market data bus (core/market_bus), fetch_all reads the
+daemon's 'sentiment' snapshot and only polls the sources itself when the
+bus is down or the snapshot is stale.
 """
 
 import asyncio
@@ -31,12 +35,15 @@ class SentimentFetcher:
     Fetches and aggregates crypto market sentiment from multiple sources
     """
 
-    def __init__(self, cache_ttl_minutes: int = 60):
+    def __init__(self, cache_ttl_minutes: int = 60, market_bus=None):
         """
         Args:
             cache_ttl_minutes: How long to cache sentiment data (default 1 hour)
+            market_bus: MarketDataBusClient to read the host's sentiment snapshot
+                from (falls back to the sources when the bus has no data)
         """
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
+        self.market_bus = market_bus
         self._cache: Optional[Dict] = None
         self._cache_time: Optional[datetime] = None
 
@@ -185,6 +192,10 @@ class SentimentFetcher:
         """
         # Check cache first
         if not force_refresh:
+            if self.market_bus:
+                shared = await self.market_bus.sentiment()
+                if shared:
+                    return shared
             cached = self._load_cache()
             if cached:
                 logger.info("Using cached sentiment data")
@@ -6,16 +6,20 @@ Components (Phase 2):
 - PromptFormatter: Format market data for LLM prompts
 - ResponseParser: Parse and validate LLM decisions
 - LLMTradingAgent: Main LLM decision engine
+- DecisionCache: Reuse decisions while the market state is unchanged
 """
 
 from .model_client import ModelClient
 from .prompt_formatter import PromptFormatter
 from .response_parser import ResponseParser
 from .trading_agent import LLMTradingAgent
+from .decision_cache import DecisionCache, DecisionCacheConfig
 
 __all__ = [
     'ModelClient',
     'PromptFormatter',
     'ResponseParser',
-    'LLMTradingAgent'
+    'LLMTradingAgent',
+    'DecisionCache',
+    'DecisionCacheConfig'
 ]
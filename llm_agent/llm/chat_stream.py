@@ -0,0 +1,243 @@
+"""
+Async Chat Completion Streaming
+Shared transport for ModelClient / MultiModelClient async queries
+
+Requests go through a PooledSession (keep-alive connections, shared
+per-provider rate limit) with `stream: true`. Server-sent events are parsed
+as they arrive, so callers can watch the answer grow through on_token and
+stop reading once they have what they need. The whole call - rate-limit
+wait, retries and backoff - runs under one deadline, and cancelling the
+awaiting task closes the connection immediately.
+
+Usage:
+    result = await stream_chat_with_retries(http, url, headers, payload, label="deepseek-chat",
+                                            provider="deepseek", deadline=30)
+    if result:
+        print(result.content, result.usage)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# on_token(delta, text_so_far) -> True to stop reading the stream
+TokenCallback = Callable[[str, str], Optional[bool]]
+
+
+class ChatStreamError(Exception):
+    """Non-retryable provider error (e.g. 402 insufficient balance)"""
+
+
+@dataclass
+class ChatResult:
+    """One completed (or early-stopped) chat completion"""
+    content: str = ""
+    reasoning: str = ""
+    usage: Dict = field(default_factory=dict)
+    finish_reason: Optional[str] = None
+    stopped_early: bool = False
+    first_token_ms: Optional[float] = None
+    total_ms: float = 0.0
+
+
+def extract_answer(content: str, reasoning: str) -> str:
+    """
+    Answer text from a response that may be in reasoning mode
+
+    Qwen3 models can leave `content` empty and put everything in
+    reasoning_content; the answer then follows the </think> tag.
+    """
+    if content or not reasoning:
+        return content
+    logger.info(f"Qwen reasoning mode - reasoning: {len(reasoning)} chars")
+    answer = reasoning.split("</think>")[-1].strip() if "</think>" in reasoning else reasoning
+    logger.info(f"Extracted content from reasoning: {len(answer)} chars")
+    return answer
+
+
+def estimate_usage(prompt: str, completion: str) -> Dict:
+    """Token counts (~4 chars/token) for streams that ended without a usage chunk"""
+    prompt_tokens = len(prompt) // 4
+    completion_tokens = len(completion) // 4
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+        'estimated': True,
+    }
+
+
+def normalize_cache_usage(usage: Dict) -> Dict:
+    """
+    Add provider-neutral prompt cache counts to a usage dict
+
+    DeepSeek reports prompt_cache_hit_tokens / prompt_cache_miss_tokens;
+    OpenRouter reports prompt_tokens_details.cached_tokens. Both become
+    `cached_tokens` and `uncached_tokens` (cached + uncached = prompt_tokens).
+
+    Args:
+        usage: Usage dict from the provider (modified in place)
+
+    Returns:
+        The same dict
+    """
+    prompt_tokens = usage.get('prompt_tokens', 0) or 0
+    if 'prompt_cache_hit_tokens' in usage:
+        cached = usage.get('prompt_cache_hit_tokens') or 0
+    else:
+        cached = (usage.get('prompt_tokens_details') or {}).get('cached_tokens') or 0
+    cached = min(cached, prompt_tokens)
+    usage['cached_tokens'] = cached
+    usage['uncached_tokens'] = prompt_tokens - cached
+    return usage
+
+
+async def stream_chat(http, url: str, headers: Dict, payload: Dict,
+                      on_token: Optional[TokenCallback] = None) -> ChatResult:
+    """
+    One streaming request
+
+    Args:
+        http: PooledSession
+        url: Chat completions endpoint
+        headers: Request headers
+        payload: Request body (stream fields are added)
+        on_token: Called with each content delta; return True to stop early
+
+    Returns:
+        ChatResult
+
+    Raises:
+        aiohttp.ClientResponseError: HTTP error status (status attribute set)
+    """
+    import aiohttp
+
+    body = {**payload, 'stream': True, 'stream_options': {'include_usage': True}}
+    result = ChatResult()
+    start = time.perf_counter()
+
+    async with http.request('POST', url, endpoint='chat/completions', headers=headers, json=body) as resp:
+        if resp.status != 200:
+            text = await resp.text()
+            raise aiohttp.ClientResponseError(
+                resp.request_info, resp.history, status=resp.status, message=text[:500]
+            )
+
+        async for raw in resp.content:
+            line = raw.decode('utf-8', errors='replace').strip()
+            if not line.startswith('data:'):
+                continue  # blank keep-alives and ': PROCESSING' comments
+            data = line[5:].strip()
+            if data == '[DONE]':
+                break
+            try:
+                chunk = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+            if chunk.get('error'):
+                raise aiohttp.ClientResponseError(
+                    resp.request_info, resp.history,
+                    status=int(chunk['error'].get('code', 500) or 500),
+                    message=str(chunk['error'].get('message', ''))[:500],
+                )
+            if chunk.get('usage'):
+                result.usage = chunk['usage']
+
+            for choice in chunk.get('choices') or []:
+                delta = choice.get('delta') or {}
+                reasoning = delta.get('reasoning_content') or delta.get('reasoning')
+                if reasoning:
+                    result.reasoning += reasoning
+                text = delta.get('content')
+                if text:
+                    if result.first_token_ms is None:
+                        result.first_token_ms = (time.perf_counter() - start) * 1000
+                    result.content += text
+                    if on_token and on_token(text, result.content):
+                        result.stopped_early = True
+                if choice.get('finish_reason'):
+                    result.finish_reason = choice['finish_reason']
+
+            if result.stopped_early:
+                break
+
+    result.total_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+async def stream_chat_with_retries(
+    http,
+    url: str,
+    headers: Dict,
+    payload: Dict,
+    label: str,
+    provider: str,
+    max_retries: int = 2,
+    deadline: float = 60.0,
+    on_token: Optional[TokenCallback] = None,
+    limiter=None
+) -> Optional[ChatResult]:
+    """
+    Streaming request with the clients' retry policy, under one deadline
+
+    Retries: 429 -> penalize the shared limiter and back off 30s/60s/120s;
+    other errors -> 2s pause. 402 is not retried. Backoff never sleeps past
+    the deadline.
+
+    Args:
+        http: PooledSession
+        url: Chat completions endpoint
+        headers: Request headers
+        payload: Request body
+        label: Model name for logs
+        provider: Rate-limit budget name
+        max_retries: Retries after the first attempt
+        deadline: Seconds for the whole call
+        on_token: See stream_chat
+        limiter: SharedRateLimiter to penalize on 429
+
+    Returns:
+        ChatResult, or None when every attempt failed or the deadline passed
+    """
+    import aiohttp
+
+    end = time.monotonic() + deadline
+    for attempt in range(max_retries + 1):
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            break
+        logger.info(f"{label} API request (attempt {attempt + 1}/{max_retries + 1}, stream)...")
+        try:
+            return await asyncio.wait_for(stream_chat(http, url, headers, payload, on_token), timeout=remaining)
+        except asyncio.TimeoutError:
+            logger.error(f"{label} request deadline reached ({deadline:.0f}s)")
+            return None
+        except aiohttp.ClientResponseError as e:
+            if e.status == 402:
+                logger.error(f"{label} insufficient balance (402)")
+                return None
+            if e.status == 429:
+                backoff = min(30 * (2 ** attempt), 120)
+                logger.warning(f"{label} rate limit (429), waiting {backoff}s...")
+                if limiter is not None:
+                    limiter.penalize(provider, backoff)
+            else:
+                backoff = 2
+                logger.error(f"{label} API error: HTTP {e.status} {e.message}")
+        except Exception as e:
+            backoff = 2
+            logger.error(f"{label} API error: {e}")
+
+        if attempt < max_retries:
+            wait = min(backoff, end - time.monotonic())
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+
+    logger.error(f"{label}: all attempts failed")
+    return None
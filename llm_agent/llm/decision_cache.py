@@ -0,0 +1,231 @@
+"""
+LLM Decision Cache
+Short-circuits LLM queries when the market state has not meaningfully changed
+
+The market state is reduced to a quantized fingerprint: log-scale price
+buckets, RSI buckets, MACD histogram buckets (in bps of price), the open
+position set with P&L buckets, recently closed symbols and a hash of the
+slow context (Deep42 / macro). Two cycles with the same fingerprint within
+the TTL would send the LLM an equivalent prompt, so the cycle is skipped
+(default) instead of paying for another query. Reuse mode replays only the
+passive NOTHING/HOLD decisions: a cached BUY/SELL/CLOSE was already acted
+on and is never re-executed.
+
+Usage:
+    cache = DecisionCache(DecisionCacheConfig(ttl_seconds=600))
+    key = cache.fingerprint(market_data, open_positions, context="...")
+    decisions = cache.get(key)
+    if decisions is None:
+        decisions = query_llm()
+        cache.put(key, decisions)
+    print(cache.get_stats())
+"""
+
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Decisions that are safe to replay from the cache (no order is placed)
+PASSIVE_ACTIONS = ("NOTHING", "HOLD")
+
+
+@dataclass
+class DecisionCacheConfig:
+    """Quantization and reuse policy for the decision cache"""
+    enabled: bool = True
+    ttl_seconds: float = 600.0       # Reuse window for a fingerprint
+    mode: str = "skip"               # "skip" (return no decisions), or "reuse" cached NOTHING/HOLD decisions
+    price_bucket_pct: float = 0.25   # Log-scale price bucket width
+    rsi_bucket: float = 5.0          # RSI points per bucket
+    macd_bucket_bps: float = 2.0     # MACD histogram bucket, in bps of price
+    pnl_bucket_pct: float = 1.0      # Open position P&L bucket, in % of entry notional
+    max_entries: int = 64
+
+
+class DecisionCache:
+    """TTL cache of LLM decisions keyed by a quantized market-state fingerprint"""
+
+    def __init__(self, config: Optional[DecisionCacheConfig] = None):
+        """
+        Initialize decision cache
+
+        Args:
+            config: Quantization/TTL settings (default: DecisionCacheConfig())
+        """
+        self.config = config or DecisionCacheConfig()
+        self._entries: Dict[str, Tuple[float, List[Dict]]] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.saved_cost = 0.0
+
+    def _bucket(self, value, width: float) -> Optional[int]:
+        """Integer bucket for a value (None for missing/NaN)"""
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        if math.isnan(value) or width <= 0:
+            return None
+        return math.floor(value / width)
+
+    def _price_bucket(self, price) -> Optional[int]:
+        """Log-scale bucket so the width is the same percentage at any price"""
+        try:
+            price = float(price)
+        except (TypeError, ValueError):
+            return None
+        if not price > 0:
+            return None
+        return math.floor(math.log(price) / math.log1p(self.config.price_bucket_pct / 100))
+
+    @staticmethod
+    def _position_pnl_pct(pos: Dict) -> Optional[float]:
+        """Open P&L in % of entry notional (None if the position lacks the inputs)"""
+        try:
+            if pos.get('pnl_pct') is not None:
+                return float(pos['pnl_pct']) * 100  # bots pass it as a decimal
+            entry, size = float(pos.get('entry_price') or 0), abs(float(pos.get('size') or 0))
+            if pos.get('pnl') is not None and entry > 0 and size > 0:
+                return float(pos['pnl']) / (entry * size) * 100
+            current = float(pos.get('current_price') or pos.get('mark_price') or 0)
+            if entry > 0 and current > 0:
+                sign = -1 if str(pos.get('side', '')).upper() in ('SHORT', 'SELL') else 1
+                return sign * (current - entry) / entry * 100
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    def _market_key(self, data: Dict) -> Tuple:
+        """Quantized state of one market"""
+        indicators = data.get('indicators') or {}
+        price = data.get('price') or data.get('current_price') or indicators.get('price')
+
+        macd_bucket = None
+        histogram = indicators.get('macd_diff')
+        if histogram is None and indicators.get('macd') is not None and indicators.get('macd_signal') is not None:
+            histogram = indicators['macd'] - indicators['macd_signal']
+        try:
+            if histogram is not None and price:
+                macd_bucket = self._bucket(float(histogram) / float(price) * 10000, self.config.macd_bucket_bps)
+        except (TypeError, ValueError):
+            macd_bucket = None
+
+        return (
+            self._price_bucket(price),
+            self._bucket(indicators.get('rsi'), self.config.rsi_bucket),
+            macd_bucket,
+        )
+
+    def fingerprint(
+        self,
+        market_data: Dict[str, Dict],
+        open_positions: Optional[List[Dict]] = None,
+        recently_closed_symbols: Optional[List[str]] = None,
+        context: str = ""
+    ) -> str:
+        """
+        Hash the quantized market state
+
+        Args:
+            market_data: Dict from aggregator.fetch_all_markets()
+            open_positions: Open position dicts (symbol, side, and pnl_pct or pnl/entry_price/size)
+            recently_closed_symbols: Symbols closed recently
+            context: Slow-changing prompt context (Deep42, macro) - any change invalidates
+
+        Returns:
+            Hex digest identifying the state
+        """
+        markets = tuple(
+            (symbol, self._market_key(data))
+            for symbol, data in sorted(market_data.items())
+            if data
+        )
+        positions = tuple(sorted(
+            (
+                str(pos.get('symbol')),
+                str(pos.get('side')),
+                self._bucket(self._position_pnl_pct(pos), self.config.pnl_bucket_pct),
+            )
+            for pos in (open_positions or [])
+        ))
+        closed = tuple(sorted(recently_closed_symbols or []))
+        context_hash = hashlib.sha1((context or "").encode()).hexdigest()
+
+        state = repr((markets, positions, closed, context_hash))
+        return hashlib.sha1(state.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Cached decisions for a fingerprint
+
+        Returns:
+            [] in skip mode; in reuse mode the cached NOTHING/HOLD decisions
+            marked cached=True with zero cost. None on a miss
+        """
+        if not self.config.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > self.config.ttl_seconds:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        stored_at, decisions = entry
+        self.hits += 1
+        self.saved_cost += sum(d.get('cost', 0) for d in decisions)
+        age = time.time() - stored_at
+        logger.info(
+            f"♻️ Decision cache hit ({age:.0f}s old, {len(decisions)} decisions, "
+            f"hit rate {self.hit_rate:.0%}) - skipping LLM query"
+        )
+
+        if self.config.mode != "reuse":
+            return []
+        return [
+            {**d, 'cost': 0.0, 'cached': True}
+            for d in decisions
+            if str(d.get('action', '')).upper() in PASSIVE_ACTIONS
+        ]
+
+    def put(self, key: str, decisions: List[Dict]):
+        """Store decisions for a fingerprint"""
+        if not self.config.enabled:
+            return
+
+        now = time.time()
+        if len(self._entries) >= self.config.max_entries:
+            self._entries = {
+                k: v for k, v in self._entries.items()
+                if now - v[0] <= self.config.ttl_seconds
+            }
+            if len(self._entries) >= self.config.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+        self._entries[key] = (now, list(decisions))
+
+    def clear(self):
+        """Drop all cached decisions (e.g. after a trade executes)"""
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict:
+        """Get cache hit/miss metrics"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'saved_cost': self.saved_cost,
+            'entries': len(self._entries),
+        }
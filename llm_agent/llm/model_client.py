@@ -8,6 +8,9 @@ Usage:
 
     # Qwen via OpenRouter (Alpha Arena winner!)
     client = ModelClient(api_key="openrouter_key", model="qwen-max")
+
+    # From async bots: pooled, streaming, never blocks the event loop
+    result = await client.aquery(prompt, deadline=30)
 """
 
 import requests
@@ -16,6 +19,12 @@ import time
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 
+from dexes.http_session import PooledSession
+
+from .chat_stream import (
+    TokenCallback, estimate_usage, extract_answer, normalize_cache_usage, stream_chat_with_retries
+)
+
 logger = logging.getLogger(__name__)
 
 # Model configurations
@@ -26,6 +35,7 @@ MODEL_CONFIGS = {
         "url": "https://api.deepseek.com/v1/chat/completions",
         "model_id": "deepseek-chat",
         "input_cost_per_1k": 0.00014,
+        "cached_input_cost_per_1k": 0.000014,  # context cache hit
         "output_cost_per_1k": 0.00028,
         "default_max_tokens": 500,
     },
@@ -34,6 +44,7 @@ MODEL_CONFIGS = {
         "url": "https://api.deepseek.com/v1/chat/completions",
         "model_id": "deepseek-reasoner",
         "input_cost_per_1k": 0.00055,
+        "cached_input_cost_per_1k": 0.00014,  # context cache hit
         "output_cost_per_1k": 0.00220,
         "default_max_tokens": 500,
     },
@@ -90,10 +101,14 @@ class ModelClient:
         self._spend_reset_time = datetime.now() + timedelta(days=1)
         self._last_request_time = None
 
-        # Rate limiting
+        # Provider prefix cache accounting (see PromptFormatter stable prefix)
+        self._cached_prompt_tokens = 0
+        self._uncached_prompt_tokens = 0
+
+        # Rate limiting (token bucket per provider, shared with other bots)
         try:
-            from utils.shared_rate_limiter import SharedRateLimiter
-            self.shared_limiter = SharedRateLimiter()
+            from utils.shared_rate_limiter import get_rate_limiter
+            self.shared_limiter = get_rate_limiter()
             self._use_shared_limiter = True
             logger.info("✅ Using shared rate limiter")
         except ImportError:
@@ -101,6 +116,9 @@ class ModelClient:
             self._use_shared_limiter = False
             self._min_request_interval = 1.0
 
+        # Async transport: keep-alive pool, requests drawn from the provider's shared budget
+        self._http = PooledSession(limit_per_host=4, timeout=timeout, rate_limit=self.provider)
+
         logger.info(f"✅ ModelClient initialized: {model} via {self.provider}")
 
     def _reset_daily_spend_if_needed(self):
@@ -123,7 +141,7 @@ class ModelClient:
     def _rate_limit(self):
         """Enforce minimum time between requests"""
         if self._use_shared_limiter and self.shared_limiter:
-            self.shared_limiter.wait_if_needed(bot_name="Hibachi")
+            self.shared_limiter.wait_if_needed(bot_name="Hibachi", endpoint=self.provider)
         else:
             if self._last_request_time is not None:
                 elapsed = time.time() - self._last_request_time
@@ -132,15 +150,63 @@ class ModelClient:
             self._last_request_time = time.time()
 
     def _calculate_cost(self, usage: Dict) -> float:
-        """Calculate cost from token usage"""
-        prompt_tokens = usage.get("prompt_tokens", 0)
+        """Calculate cost from token usage (cached prompt tokens at the cache-hit price)"""
+        normalize_cache_usage(usage)
+        cached_tokens = usage["cached_tokens"]
+        uncached_tokens = usage["uncached_tokens"]
         completion_tokens = usage.get("completion_tokens", 0)
 
-        input_cost = (prompt_tokens / 1000) * self.config["input_cost_per_1k"]
+        cached_rate = self.config.get("cached_input_cost_per_1k", self.config["input_cost_per_1k"])
+        input_cost = (uncached_tokens / 1000) * self.config["input_cost_per_1k"]
+        input_cost += (cached_tokens / 1000) * cached_rate
         output_cost = (completion_tokens / 1000) * self.config["output_cost_per_1k"]
 
+        self._cached_prompt_tokens += cached_tokens
+        self._uncached_prompt_tokens += uncached_tokens
+
         return input_cost + output_cost
 
+    def get_cache_stats(self) -> Dict:
+        """Prompt tokens served from the provider's prefix cache since startup"""
+        total = self._cached_prompt_tokens + self._uncached_prompt_tokens
+        return {
+            "cached_tokens": self._cached_prompt_tokens,
+            "uncached_tokens": self._uncached_prompt_tokens,
+            "hit_rate": self._cached_prompt_tokens / total if total else 0.0,
+        }
+
+    def _headers(self) -> Dict:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Add OpenRouter-specific headers
+        if self.provider == "openrouter":
+            headers["HTTP-Referer"] = "https://github.com/trading-bot"
+            headers["X-Title"] = "Trading Bot"
+        return headers
+
+    def _payload(self, prompt: str, max_tokens: int, temperature: float) -> Dict:
+        # For Qwen models, disable thinking mode to get direct responses
+        # Qwen 3 uses extended thinking by default which returns empty content
+        actual_prompt = prompt
+        if self.provider == "openrouter" and "qwen" in self.config["model_id"].lower():
+            # Add /no_think to disable extended thinking mode
+            actual_prompt = f"/no_think\n{prompt}"
+
+        return {
+            "model": self.config["model_id"],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": actual_prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
     def query(
         self,
         prompt: str,
@@ -172,35 +238,8 @@ class ModelClient:
         # Rate limiting
         self._rate_limit()
 
-        # Prepare headers
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        # Add OpenRouter-specific headers
-        if self.provider == "openrouter":
-            headers["HTTP-Referer"] = "https://github.com/trading-bot"
-            headers["X-Title"] = "Trading Bot"
-
-        # For Qwen models, disable thinking mode to get direct responses
-        # Qwen 3 uses extended thinking by default which returns empty content
-        actual_prompt = prompt
-        if self.provider == "openrouter" and "qwen" in self.config["model_id"].lower():
-            # Add /no_think to disable extended thinking mode
-            actual_prompt = f"/no_think\n{prompt}"
-
-        payload = {
-            "model": self.config["model_id"],
-            "messages": [
-                {
-                    "role": "user",
-                    "content": actual_prompt
-                }
-            ],
-            "max_tokens": max_tokens,
-            "temperature": temperature
-        }
+        headers = self._headers()
+        payload = self._payload(prompt, max_tokens, temperature)
 
         try:
             logger.info(f"{self.model} API request (attempt {retry_count + 1}/{self.max_retries + 1})...")
@@ -245,7 +284,8 @@ class ModelClient:
 
                     logger.info(
                         f"✅ {self.model} response received "
-                        f"(tokens: {usage.get('total_tokens')}, cost: ${cost:.4f}, "
+                        f"(tokens: {usage.get('total_tokens')}, cached: {usage.get('cached_tokens', 0)}, "
+                        f"cost: ${cost:.4f}, "
                         f"daily total: ${self._daily_spend:.4f})"
                     )
 
@@ -261,6 +301,8 @@ class ModelClient:
             elif response.status_code == 429:
                 wait_time = min(30 * (2 ** retry_count), 120)
                 logger.warning(f"{self.model} rate limit (429), waiting {wait_time}s...")
+                if self._use_shared_limiter and self.shared_limiter:
+                    self.shared_limiter.penalize(self.provider, wait_time)
                 time.sleep(wait_time)
 
                 if retry_count < self.max_retries:
@@ -303,6 +345,72 @@ class ModelClient:
             else:
                 return None
 
+    async def aquery(
+        self,
+        prompt: str,
+        max_tokens: int = None,
+        temperature: float = 0.1,
+        deadline: Optional[float] = None,
+        on_token: Optional[TokenCallback] = None
+    ) -> Optional[Dict]:
+        """
+        Async, streaming version of query()
+
+        Runs on a pooled keep-alive session and never blocks the event loop,
+        so price monitoring and exits keep running during a long LLM call.
+        Cancelling the awaiting task aborts the request.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Max tokens to generate (uses model default if None)
+            temperature: Sampling temperature (0.1 for deterministic)
+            deadline: Seconds for the whole call incl. retries (default: timeout)
+            on_token: Called as on_token(delta, text_so_far) for each streamed
+                chunk; return True to stop reading (answer already complete)
+
+        Returns:
+            Dict with keys: content, usage, cost, first_token_ms, stopped_early
+            None if all retries failed or the deadline passed
+        """
+        if max_tokens is None:
+            max_tokens = self.config["default_max_tokens"]
+
+        estimated_cost = ((len(prompt) / 4 + max_tokens) / 1000) * self.config["output_cost_per_1k"]
+        self._check_spend_limit(estimated_cost)
+
+        result = await stream_chat_with_retries(
+            self._http, self.url, self._headers(), self._payload(prompt, max_tokens, temperature),
+            label=self.model, provider=self.provider, max_retries=self.max_retries,
+            deadline=deadline or self.timeout, on_token=on_token, limiter=self.shared_limiter,
+        )
+        if result is None:
+            return None
+
+        content = extract_answer(result.content, result.reasoning)
+        usage = result.usage or estimate_usage(prompt, content)
+        cost = self._calculate_cost(usage)
+        self._daily_spend += cost
+
+        logger.info(
+            f"✅ {self.model} response received "
+            f"(tokens: {usage.get('total_tokens')}, cached: {usage.get('cached_tokens', 0)}, "
+            f"cost: ${cost:.4f}, "
+            f"daily total: ${self._daily_spend:.4f}, first token: {result.first_token_ms or 0:.0f}ms, "
+            f"total: {result.total_ms:.0f}ms{', stopped early' if result.stopped_early else ''})"
+        )
+
+        return {
+            "content": content,
+            "usage": usage,
+            "cost": cost,
+            "first_token_ms": result.first_token_ms,
+            "stopped_early": result.stopped_early
+        }
+
+    async def close(self):
+        """Close the async connection pool"""
+        await self._http.close()
+
     def get_daily_spend(self) -> float:
         """Get current daily spend in USD"""
         self._reset_daily_spend_if_needed()
@@ -9,6 +9,7 @@ Usage:
         model="qwen-max"  # or "deepseek-chat"
     )
     response = client.query(prompt="Your trading prompt here")
+    response = await client.aquery(prompt="...", deadline=30)  # async bots
 
 Alpha Arena Winner: Qwen 3 MAX (+22.3% return, 43 trades in 17 days)
 - Low frequency, high confidence trades
@@ -21,6 +22,12 @@ import time
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 
+from dexes.http_session import PooledSession
+
+from .chat_stream import (
+    TokenCallback, estimate_usage, extract_answer, normalize_cache_usage, stream_chat_with_retries
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +39,7 @@ MODEL_CONFIGS = {
         "url": "https://api.deepseek.com/v1/chat/completions",
         "model_id": "deepseek-chat",
         "input_cost_per_1k": 0.00014,
+        "cached_input_cost_per_1k": 0.000014,  # context cache hit
         "output_cost_per_1k": 0.00028,
     },
     "deepseek-reasoner": {
@@ -39,6 +47,7 @@ MODEL_CONFIGS = {
         "url": "https://api.deepseek.com/v1/chat/completions",
         "model_id": "deepseek-reasoner",
         "input_cost_per_1k": 0.00055,
+        "cached_input_cost_per_1k": 0.00014,  # context cache hit
         "output_cost_per_1k": 0.00220,
     },
     # Qwen models via OpenRouter - Alpha Arena winner!
@@ -116,6 +125,20 @@ class MultiModelClient:
         self._last_request_time = None
         self._min_request_interval = 1.0
 
+        # Provider prefix cache accounting (see PromptFormatter stable prefix)
+        self._cached_prompt_tokens = 0
+        self._uncached_prompt_tokens = 0
+
+        # Rate limiting (token bucket per provider, shared with other bots)
+        try:
+            from utils.shared_rate_limiter import get_rate_limiter
+            self.shared_limiter = get_rate_limiter()
+        except ImportError:
+            self.shared_limiter = None
+
+        # Async transport: one keep-alive pool per provider (switch_model may change it)
+        self._pools: Dict[str, PooledSession] = {}
+
         logger.info(f"✅ MultiModelClient initialized: {model} via {self.provider}")
 
     def switch_model(self, model: str):
@@ -163,7 +186,10 @@ class MultiModelClient:
             )
 
     def _rate_limit(self):
-        """Enforce minimum time between requests"""
+        """Enforce the provider's request budget"""
+        if self.shared_limiter:
+            self.shared_limiter.wait_if_needed(bot_name=self.model, endpoint=self.provider)
+            return
         if self._last_request_time is not None:
             elapsed = time.time() - self._last_request_time
             if elapsed < self._min_request_interval:
@@ -171,15 +197,56 @@ class MultiModelClient:
         self._last_request_time = time.time()
 
     def _calculate_cost(self, usage: Dict) -> float:
-        """Calculate cost from token usage"""
-        prompt_tokens = usage.get("prompt_tokens", 0)
+        """Calculate cost from token usage (cached prompt tokens at the cache-hit price)"""
+        normalize_cache_usage(usage)
+        cached_tokens = usage["cached_tokens"]
+        uncached_tokens = usage["uncached_tokens"]
         completion_tokens = usage.get("completion_tokens", 0)
 
-        input_cost = (prompt_tokens / 1000) * self.config["input_cost_per_1k"]
+        cached_rate = self.config.get("cached_input_cost_per_1k", self.config["input_cost_per_1k"])
+        input_cost = (uncached_tokens / 1000) * self.config["input_cost_per_1k"]
+        input_cost += (cached_tokens / 1000) * cached_rate
         output_cost = (completion_tokens / 1000) * self.config["output_cost_per_1k"]
 
+        self._cached_prompt_tokens += cached_tokens
+        self._uncached_prompt_tokens += uncached_tokens
+
         return input_cost + output_cost
 
+    def get_cache_stats(self) -> Dict:
+        """Prompt tokens served from the provider's prefix cache since startup"""
+        total = self._cached_prompt_tokens + self._uncached_prompt_tokens
+        return {
+            "cached_tokens": self._cached_prompt_tokens,
+            "uncached_tokens": self._uncached_prompt_tokens,
+            "hit_rate": self._cached_prompt_tokens / total if total else 0.0,
+        }
+
+    def _headers(self) -> Dict:
+        headers = {
+            "Authorization": f"Bearer {self._get_api_key()}",
+            "Content-Type": "application/json"
+        }
+
+        # Add OpenRouter-specific headers
+        if self.provider == "openrouter":
+            headers["HTTP-Referer"] = "https://github.com/trading-bot"
+            headers["X-Title"] = "Trading Bot"
+        return headers
+
+    def _payload(self, prompt: str, max_tokens: int, temperature: float) -> Dict:
+        return {
+            "model": self.config["model_id"],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+
     def query(
         self,
         prompt: str,
@@ -207,28 +274,8 @@ class MultiModelClient:
         # Rate limiting
         self._rate_limit()
 
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self._get_api_key()}",
-            "Content-Type": "application/json"
-        }
-
-        # Add OpenRouter-specific headers
-        if self.provider == "openrouter":
-            headers["HTTP-Referer"] = "https://github.com/trading-bot"
-            headers["X-Title"] = "Trading Bot"
-
-        payload = {
-            "model": self.config["model_id"],
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": max_tokens,
-            "temperature": temperature
-        }
+        headers = self._headers()
+        payload = self._payload(prompt, max_tokens, temperature)
 
         try:
             logger.info(f"{self.model} API request (attempt {retry_count + 1}/{self.max_retries + 1})...")
@@ -253,7 +300,8 @@ class MultiModelClient:
 
                     logger.info(
                         f"✅ {self.model} response received "
-                        f"(tokens: {usage.get('total_tokens')}, cost: ${cost:.4f}, "
+                        f"(tokens: {usage.get('total_tokens')}, cached: {usage.get('cached_tokens', 0)}, "
+                        f"cost: ${cost:.4f}, "
                         f"daily: ${self._daily_spend:.4f})"
                     )
 
@@ -270,6 +318,8 @@ class MultiModelClient:
             elif response.status_code == 429:
                 wait_time = min(30 * (2 ** retry_count), 120)
                 logger.warning(f"{self.model} rate limit (429), waiting {wait_time}s...")
+                if self.shared_limiter:
+                    self.shared_limiter.penalize(self.provider, wait_time)
                 time.sleep(wait_time)
 
                 if retry_count < self.max_retries:
@@ -312,6 +362,71 @@ class MultiModelClient:
             else:
                 return None
 
+    async def aquery(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        deadline: Optional[float] = None,
+        on_token: Optional[TokenCallback] = None
+    ) -> Optional[Dict]:
+        """
+        Async, streaming version of query() (see ModelClient.aquery)
+
+        Args:
+            prompt: User prompt
+            max_tokens: Max tokens to generate
+            temperature: Sampling temperature (0.1 for deterministic)
+            deadline: Seconds for the whole call incl. retries (default: timeout)
+            on_token: on_token(delta, text_so_far); return True to stop early
+
+        Returns:
+            Dict with keys: content, usage, cost, model, first_token_ms, stopped_early
+            None if all retries failed or the deadline passed
+        """
+        estimated_cost = ((len(prompt) / 4 + max_tokens) / 1000) * self.config["output_cost_per_1k"]
+        self._check_spend_limit(estimated_cost)
+
+        pool = self._pools.get(self.provider)
+        if pool is None:
+            pool = self._pools[self.provider] = PooledSession(
+                limit_per_host=4, timeout=self.timeout, rate_limit=self.provider
+            )
+
+        result = await stream_chat_with_retries(
+            pool, self.config["url"], self._headers(), self._payload(prompt, max_tokens, temperature),
+            label=self.model, provider=self.provider, max_retries=self.max_retries,
+            deadline=deadline or self.timeout, on_token=on_token, limiter=self.shared_limiter,
+        )
+        if result is None:
+            return None
+
+        content = extract_answer(result.content, result.reasoning)
+        usage = result.usage or estimate_usage(prompt, content)
+        cost = self._calculate_cost(usage)
+        self._daily_spend += cost
+
+        logger.info(
+            f"✅ {self.model} response received "
+            f"(tokens: {usage.get('total_tokens')}, cached: {usage.get('cached_tokens', 0)}, "
+            f"cost: ${cost:.4f}, "
+            f"daily: ${self._daily_spend:.4f}, first token: {result.first_token_ms or 0:.0f}ms)"
+        )
+
+        return {
+            "content": content,
+            "usage": usage,
+            "cost": cost,
+            "model": self.model,
+            "first_token_ms": result.first_token_ms,
+            "stopped_early": result.stopped_early
+        }
+
+    async def close(self):
+        """Close the async connection pools"""
+        for pool in self._pools.values():
+            await pool.close()
+
     def get_daily_spend(self) -> float:
         """Get current daily spend in USD"""
         self._reset_daily_spend_if_needed()
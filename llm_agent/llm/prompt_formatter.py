@@ -1,10 +1,15 @@
 """
 LLM Prompt Formatter
-Formats market data into 3-section prompts for trading decisions
+Formats market data into prompts for trading decisions
 
-Section 1: Macro Context (cached 12h)
-Section 2: Market Data Table (all 28 markets, fresh)
-Section 3: Open Positions (if any)
+Sections are ordered by how often they change, so consecutive prompts share
+the longest possible byte-identical prefix and provider-side prefix caching
+(DeepSeek context cache, OpenRouter prompt cache) can reuse it:
+
+Stable prefix: Strategy guidance + instructions (rendered once per DEX)
+Slow context:  Deep42 analysis (hourly-6h), macro context (cached 12h)
+Dynamic tail:  Hourly review, learning/sentiment, token analyses,
+               market data table, open positions, history, balance
 
 Usage:
     formatter = PromptFormatter()
@@ -15,9 +20,10 @@ Usage:
     )
 """
 
+import hashlib
 import logging
 import os
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +52,11 @@ class PromptFormatter:
             except Exception as e:
                 logger.warning(f"Failed to load strategy file {strategy_file}: {e}")
 
+        # Rendered stable blocks, keyed by their inputs (see format_trading_prompt)
+        self._block_cache: Dict[Tuple, str] = {}
+        self._last_prefix_hash: Optional[str] = None
+        self.last_prompt_stats: Dict = {}
+
     def get_prompt_version(self) -> str:
         """
         Detect which prompt version is currently active by comparing
@@ -191,6 +202,10 @@ class PromptFormatter:
         """
         Format complete trading prompt for LLM
 
+        Sections are emitted stable-first (see module docstring). The
+        strategy/instructions prefix and the Deep42 block are rendered once
+        and reused, so unchanged context is byte-identical across cycles.
+
         Args:
             macro_context: Formatted macro context string
             market_table: Formatted market data table
@@ -202,9 +217,31 @@ class PromptFormatter:
         Returns:
             Complete formatted prompt string
         """
-        sections = []
+        # Stable prefix: strategy guidance + instructions
+        analyzed_tokens_list = analyzed_tokens if analyzed_tokens else []
+        sections = [self._cached_block(
+            ("prefix", dex_name, len(analyzed_tokens_list)),
+            lambda: self._format_static_prefix(dex_name, len(analyzed_tokens_list))
+        )]
+
+        # Slow context: Deep42 (hourly-6h) and macro context (12h cache)
+        if deep42_context:
+            if isinstance(deep42_context, dict):
+                deep42_key = ("deep42",) + tuple(sorted((k, str(v)) for k, v in deep42_context.items()))
+            else:
+                deep42_key = ("deep42", deep42_context)
+            sections.append(self._cached_block(deep42_key, lambda: self._format_deep42_context(deep42_context)))
+            sections.append("")
 
-        # Section 0: Hourly Deep Research Review (if provided - appears FIRST for emphasis)
+        if macro_context:
+            sections.append(macro_context)
+            sections.append("")
+
+        prefix = "\n".join(sections)
+
+        # Dynamic tail - everything below changes from cycle to cycle
+
+        # Hourly Deep Research Review (only on hourly cycles)
         if hourly_review:
             sections.append(hourly_review)
             sections.append("")
@@ -217,57 +254,45 @@ class PromptFormatter:
             sections.append("Apply the insights from your analysis to make better decisions in this cycle.")
             sections.append("")
 
-        # Section 1: Custom Deep42 Context (if provided)
-        if deep42_context:
-            # Handle both string and dict formats
-            if isinstance(deep42_context, dict):
-                # Format multi-timeframe Deep42 context
-                deep42_str = "=" * 80 + "\n"
-                deep42_str += "DEEP42 MULTI-TIMEFRAME ANALYSIS\n"
-                deep42_str += "=" * 80 + "\n\n"
-
-                if "regime" in deep42_context:
-                    deep42_str += "📊 MARKET REGIME (Updated Hourly):\n"
-                    deep42_str += deep42_context["regime"] + "\n\n"
-
-                if "btc_health" in deep42_context:
-                    deep42_str += "₿ BTC HEALTH INDICATOR (Updated Every 4h):\n"
-                    deep42_str += deep42_context["btc_health"] + "\n\n"
+        # Self-Learning Insights (if provided)
+        if learning_context:
+            sections.append(learning_context)
+            sections.append("")
+            sections.append("⚠️ USE THESE INSIGHTS: Favor symbols with good win rates, avoid poor performers.")
+            sections.append("")
 
-                if "macro" in deep42_context:
-                    deep42_str += "🌐 MACRO MARKET CONTEXT (Updated Every 6h):\n"
-                    deep42_str += deep42_context["macro"] + "\n"
+        # Cross-Bot Learning Insights (shared between Hibachi and Extended)
+        if shared_learning_context:
+            sections.append("=" * 80)
+            sections.append(shared_learning_context)
+            sections.append("=" * 80)
+            sections.append("")
 
-                deep42_str += "=" * 80
-                sections.append(deep42_str)
-            else:
-                # String format (legacy)
-                sections.append(deep42_context)
+        # Market Sentiment Context (Fear & Greed, Funding, etc.)
+        if sentiment_context:
+            sections.append("=" * 80)
+            sections.append(sentiment_context)
+            sections.append("=" * 80)
             sections.append("")
 
-        # Section 2: Token Analyses (if provided)
+        # Token Analyses (if provided)
         if token_analyses:
             sections.append(token_analyses)
             sections.append("")
 
-        # Section 3: Position Evaluations (if provided)
+        # Position Evaluations (if provided)
         if position_evaluations:
             sections.append(position_evaluations)
             sections.append("")
 
-        # Section 4: Macro Context (optional)
-        if macro_context:
-            sections.append(macro_context)
-            sections.append("")
-
-        # Section 5: Market Data Table
+        # Market Data Table
         sections.append("=" * 80)
         sections.append("MARKET DATA (28 Pacifica Perpetuals)")
         sections.append("=" * 80)
         sections.append(market_table)
         sections.append("")
 
-        # Section 6: Open Positions
+        # Open Positions
         if open_positions:
             positions_str = self.format_open_positions(open_positions)
         else:
@@ -275,47 +300,92 @@ class PromptFormatter:
 
         sections.append(positions_str)
         sections.append("")
-        
-        # Section 7: Trade History (if provided)
+
+        # Trade History (if provided)
         if trade_history:
             sections.append(trade_history)
             sections.append("")
-        
-        # Section 8: Recently Closed Symbols Warning (if provided)
+
+        # Recently Closed Symbols Warning (if provided)
         if recently_closed_symbols:
             sections.append(f"⚠️ IMPORTANT: These symbols were recently closed (within last 2h): {', '.join(recently_closed_symbols)}")
             sections.append("Avoid immediately reopening positions in these symbols unless there's a STRONG reversal signal.")
             sections.append("")
 
-        # Section 9: Account Balance (if provided)
+        # Account Balance (if provided)
         if account_balance is not None:
             sections.append("=" * 80)
             sections.append(f"💰 ACCOUNT BALANCE: ${account_balance:.2f}")
             sections.append("=" * 80)
             sections.append("")
 
-        # Section 10: Self-Learning Insights (if provided)
-        if learning_context:
-            sections.append(learning_context)
-            sections.append("")
-            sections.append("⚠️ USE THESE INSIGHTS: Favor symbols with good win rates, avoid poor performers.")
-            sections.append("")
+        prompt = "\n".join(sections)
 
-        # Section 10b: Market Sentiment Context (Fear & Greed, Funding, etc.)
-        if sentiment_context:
-            sections.append("=" * 80)
-            sections.append(sentiment_context)
-            sections.append("=" * 80)
-            sections.append("")
+        # Track whether the cacheable prefix matches the previous prompt
+        prefix_hash = hashlib.sha1(prefix.encode()).hexdigest()[:12]
+        prefix_reused = prefix_hash == self._last_prefix_hash
+        self._last_prefix_hash = prefix_hash
+        self.last_prompt_stats = {
+            "prompt_chars": len(prompt),
+            "prefix_chars": len(prefix),
+            "prefix_hash": prefix_hash,
+            "prefix_reused": prefix_reused,
+        }
+
+        logger.info(
+            f"Formatted prompt: {len(prompt)} characters (~{len(prompt)//4} tokens), "
+            f"stable prefix: {len(prefix)} chars ({'unchanged' if prefix_reused else 'new'})"
+        )
+        return prompt
 
-        # Section 10c: Cross-Bot Learning Insights (shared between Hibachi and Extended)
-        if shared_learning_context:
-            sections.append("=" * 80)
-            sections.append(shared_learning_context)
-            sections.append("=" * 80)
-            sections.append("")
+    def _cached_block(self, key: Tuple, render) -> str:
+        """Return a rendered block, rendering it only the first time its inputs are seen"""
+        block = self._block_cache.get(key)
+        if block is None:
+            if len(self._block_cache) >= 32:
+                self._block_cache.clear()
+            block = render()
+            self._block_cache[key] = block
+        return block
+
+    def _format_deep42_context(self, deep42_context) -> str:
+        """Format Deep42 context (multi-timeframe dict or legacy string)"""
+        if not isinstance(deep42_context, dict):
+            return deep42_context
+
+        deep42_str = "=" * 80 + "\n"
+        deep42_str += "DEEP42 MULTI-TIMEFRAME ANALYSIS\n"
+        deep42_str += "=" * 80 + "\n\n"
+
+        if "regime" in deep42_context:
+            deep42_str += "📊 MARKET REGIME (Updated Hourly):\n"
+            deep42_str += deep42_context["regime"] + "\n\n"
+
+        if "btc_health" in deep42_context:
+            deep42_str += "₿ BTC HEALTH INDICATOR (Updated Every 4h):\n"
+            deep42_str += deep42_context["btc_health"] + "\n\n"
+
+        if "macro" in deep42_context:
+            deep42_str += "🌐 MACRO MARKET CONTEXT (Updated Every 6h):\n"
+            deep42_str += deep42_context["macro"] + "\n"
+
+        deep42_str += "=" * 80
+        return deep42_str
+
+    def _format_static_prefix(self, dex_name: Optional[str], market_count: int) -> str:
+        """
+        Strategy guidance and instructions - identical on every cycle
+
+        Args:
+            dex_name: DEX name for platform-specific guidance
+            market_count: Number of markets in the data table
 
-        # Section 11: Strategy guidance (DEX-specific or from file)
+        Returns:
+            Prefix string
+        """
+        sections = []
+
+        # Strategy guidance (DEX-specific or from file)
         # If strategy file was loaded, use that instead of default DEX guidance
         if self._strategy_content:
             sections.append(self._strategy_content)
@@ -441,7 +511,7 @@ You are an AGGRESSIVE SELECTIVE TRADER hunting PRIME SETUPS ONLY.
             sections.append(lighter_guidance)
             sections.append("")
 
-        # Section 11: Hibachi-specific dynamic leverage strategy
+        # Hibachi-specific dynamic leverage strategy
         if dex_name == "Hibachi":
             hibachi_guidance = """
 ═══════════════════════════════════════════════════════════════════════════
@@ -641,14 +711,11 @@ MAKE MULTIPLE DECISIONS. Open 5-10 positions if setups exist.
             sections.append("")
 
         # Instructions
-        analyzed_tokens_list = analyzed_tokens if analyzed_tokens else []
-        analyzed_tokens_str = ", ".join(analyzed_tokens_list) if analyzed_tokens_list else "N/A"
-        
         instructions = f"""You are an autonomous trading agent analyzing cryptocurrency markets.
 
 **AVAILABLE DATA:**
 
-You have complete market data for ALL {len(analyzed_tokens_list)} Pacifica markets:
+You have complete market data for ALL {market_count} Pacifica markets:
 
 1. **Market Data Table** (shown below) - Complete technical indicators for every market:
    - Price and 24h volume
@@ -677,7 +744,7 @@ You have complete market data for ALL {len(analyzed_tokens_list)} Pacifica marke
 
 **YOUR TASK:**
 
-Review ALL {len(analyzed_tokens_list)} markets in the data table below. For each market, examine the data:
+Review ALL {market_count} markets in the data table below. For each market, examine the data:
 - Technical indicators (RSI, MACD, SMA, volume, price action)
 - Market sentiment (funding rates, open interest)
 - Relative strength compared to other markets
@@ -728,10 +795,7 @@ REASON: Open long position has hit target, RSI now neutral, taking profit before
 
         sections.append(instructions)
 
-        prompt = "\n".join(sections)
-
-        logger.info(f"Formatted prompt: {len(prompt)} characters (~{len(prompt)//4} tokens)")
-        return prompt
+        return "\n".join(sections)
 
     def create_system_message(self) -> str:
         """
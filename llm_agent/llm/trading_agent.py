@@ -9,8 +9,8 @@ Usage:
     aggregator = MarketDataAggregator(cambrian_api_key="...")
     agent = LLMTradingAgent(deepseek_api_key="...")
 
-    # Get trading decision
-    decision = agent.get_trading_decision(
+    # Get trading decision (inside a coroutine)
+    decision = await agent.get_trading_decision(
         aggregator=aggregator,
         open_positions=[]
     )
@@ -21,6 +21,7 @@ Usage:
         print(f"Reason: {decision['reason']}")
 """
 
+import inspect
 import logging
 from typing import Optional, Dict, List
 
@@ -28,6 +29,7 @@ from .model_client import ModelClient
 from .response_parser import ResponseParser
 from .deep42_tool import Deep42Tool
 from .token_analysis_tool import TokenAnalysisTool
+from .decision_cache import DecisionCache, DecisionCacheConfig
 from ..config_prompts import get_prompt_formatter, get_active_strategy_info, PROMPT_STRATEGIES  # V2 config system (one level up)
 
 logger = logging.getLogger(__name__)
@@ -44,7 +46,8 @@ class LLMTradingAgent:
         max_retries: int = 2,
         daily_spend_limit: float = 10.0,
         max_positions: int = 3,
-        prompt_strategy: str = None  # Override config if specified
+        prompt_strategy: str = None,  # Override config if specified
+        decision_cache: Optional[DecisionCacheConfig] = None
     ):
         """
         Initialize LLM trading agent
@@ -57,6 +60,7 @@ class LLMTradingAgent:
             daily_spend_limit: Max USD to spend per day (default: $10)
             max_positions: Max open positions allowed (default: 3)
             prompt_strategy: Prompt strategy override (e.g., v8_pure_pnl)
+            decision_cache: Decision cache settings (default: enabled, 10 min TTL)
         """
         self.max_retries = max_retries
         self.max_positions = max_positions
@@ -110,6 +114,9 @@ class LLMTradingAgent:
         # Track recently selected tokens to encourage variety (keep last 20)
         self.recently_selected_tokens = []
 
+        # Reuse decisions while the quantized market state is unchanged
+        self.decision_cache = DecisionCache(decision_cache)
+
         logger.info(f"✅ LLMTradingAgent initialized (model={model}, max_positions={max_positions})")
 
     def _get_deep42_context(self) -> str:
@@ -135,7 +142,7 @@ class LLMTradingAgent:
 {answer}
 """
 
-    def _select_tokens_to_analyze(self, available_tokens: List[str], num_tokens: int = 3) -> List[str]:
+    async def _select_tokens_to_analyze(self, available_tokens: List[str], num_tokens: int = 3) -> List[str]:
         """
         Ask LLM to select tokens to analyze in depth
 
@@ -188,7 +195,7 @@ Respond with ONLY the {num_tokens} token symbols separated by commas, no other t
 Example: PUMP, DOGE, ENA"""
 
         try:
-            result = self.model_client.query(
+            result = await self.model_client.aquery(
                 prompt=selection_prompt,
                 max_tokens=50,
                 temperature=0.8  # Increased from 0.4 to 0.8 for more variety and creativity
@@ -300,7 +307,7 @@ Open Position Evaluations:
 {"".join(evaluations)}
 """
 
-    def get_trading_decision(
+    async def get_trading_decision(
         self,
         aggregator,  # MarketDataAggregator instance
         open_positions: Optional[List[Dict]] = None,
@@ -337,11 +344,26 @@ Open Position Evaluations:
         # Step 3: Fetch market data for ALL Pacifica symbols with full technical indicators
         logger.info("Fetching market data for ALL Pacifica markets with indicators...")
         market_data = aggregator.fetch_all_markets()
+        if inspect.isawaitable(market_data):  # async aggregators (e.g. PacificaMarketDataAggregator)
+            market_data = await market_data
         
         # Get all available Pacifica symbols from the market data
         all_symbols = list(market_data.keys())
         logger.info(f"Analyzing ALL {len(all_symbols)} Pacifica markets: {', '.join(all_symbols)}")
 
+        # Skip the LLM when nothing meaningful moved since a recent decision
+        # (hourly review / forced refresh cycles always query)
+        cache_key = self.decision_cache.fingerprint(
+            market_data,
+            open_positions=open_positions,
+            recently_closed_symbols=recently_closed_symbols,
+            context=f"{deep42_context}\n{macro_context}"
+        )
+        if not hourly_review and not force_macro_refresh:
+            cached_decisions = self.decision_cache.get(cache_key)
+            if cached_decisions is not None:
+                return cached_decisions
+
         # Step 4: Format market table with all data (candles, RSI, MACD, SMA, etc.)
         market_table = aggregator.format_market_table(market_data)
 
@@ -395,7 +417,7 @@ Open Position Evaluations:
             logger.info(f"LLM query attempt {attempt + 1}/{self.max_retries + 1}...")
 
             # Query model (increase max_tokens for multiple decisions)
-            result = self.model_client.query(
+            result = await self.model_client.aquery(
                 prompt=prompt,
                 max_tokens=500,  # Increased for multiple decisions
                 temperature=0.1
@@ -464,7 +486,7 @@ Open Position Evaluations:
                 logger.info(f"✅ Valid trading decisions: {len(valid_decisions)} decisions")
                 
                 # Return list of decisions with metadata
-                return [
+                decisions = [
                     {
                         "action": parsed["action"],
                         "symbol": parsed["symbol"],
@@ -476,6 +498,8 @@ Open Position Evaluations:
                     }
                     for parsed in valid_decisions
                 ]
+                self.decision_cache.put(cache_key, decisions)
+                return decisions
             else:
                 logger.warning(f"All {len(parsed_decisions)} decisions failed validation")
 
@@ -487,6 +511,10 @@ Open Position Evaluations:
         logger.error("All LLM query/parse attempts failed, falling back to NOTHING")
         return None  # Return None on failure
 
+    def get_decision_cache_stats(self) -> Dict:
+        """Get decision cache hit/miss metrics"""
+        return self.decision_cache.get_stats()
+
     def get_daily_spend(self) -> float:
         """Get current daily spend"""
         return self.model_client.get_daily_spend()
@@ -8,6 +8,10 @@ Features:
 - Worst performing patterns to avoid
 - Time-based performance (hour of day)
 - Confidence calibration (was high confidence accurate?)
+
+With a SQLite-backed TradeTracker (the default) the per-symbol/side/
+confidence breakdowns are indexed SQL aggregations over the shared
+TradeStore; otherwise the tracker's in-memory trades are scanned.
 """
 
 import json
@@ -35,6 +39,9 @@ class SelfLearning:
             min_trades_for_insight: Minimum trades needed before generating insights
         """
         self.tracker = trade_tracker
+        # SQLite-backed trackers expose their TradeStore; aggregate there
+        self.store = getattr(trade_tracker, 'trade_store', None)
+        self.dex = getattr(trade_tracker, 'dex', None)
         self.min_trades = min_trades_for_insight
         self.insights_cache = None
         self.cache_time = None
@@ -102,9 +109,70 @@ class SelfLearning:
             logger.error(f"Failed to read user notes: {e}")
             return []
 
+    # SQL bucket expressions matching the Python fallbacks below
+    SIDE_SQL = (
+        "CASE WHEN UPPER(side) IN ('BUY', 'LONG') THEN 'LONG' "
+        "WHEN UPPER(side) IN ('SELL', 'SHORT') THEN 'SHORT' END"
+    )
+    CONFIDENCE_SQL = (
+        "CASE WHEN COALESCE(NULLIF(confidence, 0), 0.5) < 0.6 THEN 'low (0.5-0.6)' "
+        "WHEN COALESCE(NULLIF(confidence, 0), 0.5) < 0.75 THEN 'medium (0.6-0.75)' "
+        "WHEN COALESCE(NULLIF(confidence, 0), 0.5) < 0.9 THEN 'high (0.75-0.9)' "
+        "ELSE 'very_high (0.9+)' END"
+    )
+
+    def _grouped_stats(self, hours: int, key_sql: str) -> Dict[str, Dict]:
+        """
+        Win/loss/P&L per group of closed trades, aggregated in SQL
+
+        Args:
+            hours: Lookback period (by exit time)
+            key_sql: SQL expression for the group key (NULL keys group under None,
+                like the Python fallbacks)
+
+        Returns:
+            Dict mapping key to {wins, losses, total, win_rate, avg_pnl, total_pnl}
+        """
+        cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
+        rows = self.store.query(
+            f"""
+            SELECT {key_sql} AS key,
+                   COUNT(*) AS total,
+                   SUM(COALESCE(pnl, 0) > 0) AS wins,
+                   SUM(COALESCE(pnl, 0)) AS total_pnl
+            FROM trades
+            WHERE dex = ? AND status = 'closed' AND exit_timestamp >= ?
+            GROUP BY key
+            ORDER BY MIN(id)
+            """,
+            (self.dex, cutoff)
+        )
+
+        results = {}
+        for row in rows:
+            total = row['total']
+            results[row['key']] = {
+                'wins': row['wins'],
+                'losses': total - row['wins'],
+                'total': total,
+                'win_rate': row['wins'] / total if total > 0 else 0,
+                'avg_pnl': row['total_pnl'] / total if total > 0 else 0,
+                'total_pnl': row['total_pnl']
+            }
+        return results
+
     def _get_closed_trades(self, hours: int = 168) -> List[Dict]:
         """Get closed trades from last N hours (default: 7 days)"""
         cutoff = datetime.now() - timedelta(hours=hours)
+
+        if self.store is not None:
+            rows = self.store.query(
+                "SELECT * FROM trades WHERE dex = ? AND status = 'closed' "
+                "AND exit_timestamp >= ? ORDER BY id",
+                (self.dex, cutoff.isoformat())
+            )
+            return [dict(row) for row in rows]
+
         closed = []
 
         for trade in self.tracker.trades:
@@ -125,6 +193,9 @@ class SelfLearning:
         Returns:
             Dict mapping symbol to {wins, losses, win_rate, avg_pnl, total_pnl}
         """
+        if self.store is not None:
+            return self._grouped_stats(hours, "symbol")
+
         trades = self._get_closed_trades(hours)
         symbol_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'pnls': []})
 
@@ -160,6 +231,11 @@ class SelfLearning:
         Returns:
             Dict with 'LONG' and 'SHORT' stats
         """
+        if self.store is not None:
+            # Unknown sides are skipped, as in the fallback below
+            stats = self._grouped_stats(hours, self.SIDE_SQL)
+            return {side: s for side, s in stats.items() if side is not None}
+
         trades = self._get_closed_trades(hours)
         side_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'pnls': []})
 
@@ -200,8 +276,6 @@ class SelfLearning:
         Returns:
             Dict with confidence brackets and their actual win rates
         """
-        trades = self._get_closed_trades(hours)
-
         # Bucket by confidence ranges
         buckets = {
             'low (0.5-0.6)': {'wins': 0, 'total': 0},
@@ -210,6 +284,13 @@ class SelfLearning:
             'very_high (0.9+)': {'wins': 0, 'total': 0}
         }
 
+        if self.store is not None:
+            for bucket, stats in self._grouped_stats(hours, self.CONFIDENCE_SQL).items():
+                buckets[bucket] = {'wins': stats['wins'], 'total': stats['total']}
+            trades = []
+        else:
+            trades = self._get_closed_trades(hours)
+
         for trade in trades:
             conf = trade.get('confidence') or 0.5  # Handle None values
             pnl = trade.get('pnl') or 0
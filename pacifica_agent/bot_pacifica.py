@@ -28,6 +28,7 @@ from trade_tracker import TradeTracker
 from dexes.pacifica.pacifica_sdk import PacificaSDK
 from pacifica_agent.execution.pacifica_executor import PacificaTradeExecutor
 from pacifica_agent.data.pacifica_aggregator import PacificaMarketDataAggregator
+from core.cycle_profiler import CycleProfiler
 
 # Load environment variables from project root
 project_root_env = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
@@ -131,9 +132,11 @@ class PacificaTradingBot:
         self.pacifica_sdk = None  # Will be initialized in async context
 
         self.trade_tracker = TradeTracker(dex="pacifica")
+        self.profiler = CycleProfiler("pacifica")  # per-phase cycle timings (logs/metrics + local HTTP)
 
         # Store executor params (will initialize after SDK)
         self.executor = None
+        self._deep42_task = None  # Background Deep42 signal refresh (sentiment filter only)
         self._executor_params = {
             "trade_tracker": self.trade_tracker,
             "dry_run": dry_run,
@@ -194,6 +197,10 @@ class PacificaTradingBot:
                     pacifica_sdk=self.pacifica_sdk,
                     **self._executor_params
                 )
+            if self.executor.deep42 and self._deep42_task is None:
+                self._deep42_task = asyncio.create_task(
+                    self.executor.deep42.run(lambda: self.aggregator.pacifica.available_symbols)
+                )
             logger.info("✅ Pacifica SDK initialized")
 
     async def run_once(self):
@@ -223,6 +230,7 @@ class PacificaTradingBot:
 
         try:
 
+            self.profiler.phase("positions")
             # Get ALL positions from Pacifica API (for reference)
             # Note: Pacifica SDK's get_positions() is synchronous (uses requests.get)
             positions_result = self.pacifica_sdk.get_positions()
@@ -286,6 +294,7 @@ class PacificaTradingBot:
                         })
                 open_positions = all_exchange_positions
 
+            self.profiler.phase("markets")
             # Fetch market data (condensed logging with timestamp)
             fetch_start = datetime.now()
             logger.info("")
@@ -293,6 +302,7 @@ class PacificaTradingBot:
             logger.info("│ ⏳ Fetching markets from Pacifica...")
 
             all_market_data_dict = await self.aggregator.fetch_all_markets()
+            self.profiler.add_stages(self.aggregator.fetch_engine.stage_timings, prefix="markets.")
 
             fetch_end = datetime.now()
             fetch_duration = (fetch_end - fetch_start).total_seconds()
@@ -319,6 +329,7 @@ class PacificaTradingBot:
             pacifica_symbols = list(market_data_dict.keys())
             logger.info(f"📊 Analyzing {len(pacifica_symbols)} Pacifica markets: {', '.join(pacifica_symbols)}")
 
+            self.profiler.phase("prompt")
             # Get recently closed symbols (soft warning)
             recently_closed = self.trade_tracker.get_recently_closed_symbols(hours=2)
             if recently_closed:
@@ -417,8 +428,9 @@ class PacificaTradingBot:
             for attempt in range(self.llm_agent.max_retries + 1):
                 logger.info(f"LLM query attempt {attempt + 1}/{self.llm_agent.max_retries + 1}...")
 
+                self.profiler.phase("llm")
                 # Query model (same parameters as Pacifica)
-                result = self.llm_agent.model_client.query(
+                result = await self.llm_agent.model_client.aquery(
                     prompt=prompt,
                     max_tokens=500,
                     temperature=0.1
@@ -441,6 +453,7 @@ class PacificaTradingBot:
                 logger.info("=" * 80)
                 logger.info("")
 
+                self.profiler.phase("parse")
                 # Try parsing multiple decisions (same parser as Pacifica)
                 parsed_decisions = self.llm_agent.response_parser.parse_multiple_decisions(result["content"])
                 if parsed_decisions is None or len(parsed_decisions) == 0:
@@ -462,6 +475,7 @@ class PacificaTradingBot:
                         )
                     continue
 
+                self.profiler.phase("validation")
                 # Validate all decisions (same validation as Pacifica)
                 logger.info("")
                 logger.info("=" * 80)
@@ -580,6 +594,13 @@ class PacificaTradingBot:
             if not isinstance(decisions, list):
                 decisions = [decisions]  # Backward compatibility
 
+            # Pull orderbooks for new entries in the background while decisions are
+            # logged and executed, so the pre-trade liquidity check hits the cache
+            if not self.executor.dry_run:
+                self.executor.liquidity_checker.prefetch(
+                    d.get('symbol') for d in decisions if d.get('action') in ("BUY", "SELL")
+                )
+
             # Clean LLM decision output with FULL reasoning (not truncated)
             prompt_version = self.llm_agent.prompt_formatter.get_prompt_version()
             total_cost = sum(d.get('cost', 0) for d in decisions)
@@ -640,6 +661,7 @@ class PacificaTradingBot:
 
             logger.info("└─" + "─" * 76)
 
+            self.profiler.phase("execution")
             # Execute decisions (clean output)
             logger.info("")
             logger.info("┌─ EXECUTION " + "─" * 64)
@@ -707,10 +729,12 @@ class PacificaTradingBot:
         prompt_version = self.llm_agent.prompt_formatter.get_prompt_version()
         logger.info(f"📝 Active Prompt Version: {prompt_version}")
         logger.info(f"Position size: ${self.position_size}")
+        await self.profiler.serve_http()
 
         try:
             while True:
-                await self.run_once()
+                with self.profiler.cycle():
+                    await self.run_once()
 
                 # Calculate and display next cycle time
                 next_cycle_time = datetime.now() + timedelta(seconds=self.check_interval)
@@ -726,6 +750,10 @@ class PacificaTradingBot:
             logger.info("Bot stopped by user (Ctrl+C)")
         except Exception as e:
             logger.error(f"Bot crashed: {e}", exc_info=True)
+        finally:
+            if self._deep42_task:
+                self._deep42_task.cancel()
+            await self.profiler.close()
 
 
 def main():
@@ -0,0 +1,164 @@
+"""
+Deep42 Signal Prefetcher
+Background refresh of per-symbol Deep42 social signals for trade entry
+
+The executor used to call three Deep42 endpoints with blocking requests.get
+(up to 10s each) in the middle of opening a position. This prefetcher
+refreshes token sentiment, sentiment shifts and alpha tweets for every
+tradeable symbol on its own schedule, all symbols concurrently, into a TTL
+cache. At decision time the executor only does a dict lookup, so entry
+latency no longer depends on Cambrian API latency.
+
+A failed refresh keeps the previous value until it expires; a symbol with
+nothing fresh in the cache reads as None (no signal). Requests reuse one
+keep-alive pool and draw from the host-wide 'cambrian' rate-limit budget,
+so a 429 backs off every bot sharing the API key.
+
+Usage:
+    signals = Deep42SignalPrefetcher(cambrian_api_key)
+    task = asyncio.create_task(signals.run(lambda: fetcher.available_symbols))
+    ...
+    shifts = signals.get("shifts", "SOL")   # raw Deep42 payload or None
+    await signals.close()
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dexes.http_session import PooledSession
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
+
+logger = logging.getLogger(__name__)
+
+DEEP42_BASE_URL = "https://deep42.cambrian.network/api/v1/deep42/social-data"
+
+# Shared rate-limit budget (utils/shared_rate_limiter.py) for the Cambrian API key
+RATE_LIMIT_ENDPOINT = "cambrian"
+
+# signal -> (endpoint, symbol param name, fixed params)
+ENDPOINTS = {
+    # Token sentiment (24h window)
+    "sentiment": ("token-analysis", "symbol", {"days": "1", "granularity": "total"}),
+    # Shifts >= 1.5 points over 4h (good balance)
+    "shifts": ("sentiment-shifts", "token", {"threshold": "1.5", "period": "4h"}),
+    # Last 10 tweets above quality threshold 20 (20-30 range)
+    "alpha": ("alpha-tweet-detection", "token_filter", {"min_threshold": "20", "limit": "10"}),
+}
+
+
+class Deep42SignalPrefetcher:
+    """Keep Deep42 sentiment/shift/alpha data for all symbols fresh in the background"""
+
+    def __init__(
+        self,
+        cambrian_api_key: str,
+        refresh_interval: float = 300.0,
+        ttl: float = 900.0,
+        max_concurrency: int = 8,
+        timeout: float = 10.0,
+        base_url: str = DEEP42_BASE_URL
+    ):
+        """
+        Initialize prefetcher
+
+        Args:
+            cambrian_api_key: Cambrian API key
+            refresh_interval: Seconds between refreshes in run()
+            ttl: Seconds a fetched value stays usable
+            max_concurrency: Max symbols refreshed at once
+            timeout: Per-request timeout in seconds
+            base_url: Deep42 social-data base URL
+        """
+        self.cambrian_api_key = cambrian_api_key
+        self.refresh_interval = refresh_interval
+        self.ttl = ttl
+        self.base_url = base_url.rstrip("/")
+        self.fetch_engine = ConcurrentFetchEngine(max_concurrency=max_concurrency)
+        self._http = PooledSession(limit_per_host=max_concurrency, timeout=timeout, rate_limit=RATE_LIMIT_ENDPOINT)
+        self._headers = {"X-API-KEY": cambrian_api_key, "Content-Type": "application/json"}
+        self._cache: Dict[str, Dict[str, Tuple[float, object]]] = {name: {} for name in ENDPOINTS}
+        self.last_refresh: Optional[float] = None
+        self.errors = 0
+
+    def get(self, signal: str, symbol: str) -> Optional[object]:
+        """
+        Cached Deep42 payload for a symbol (O(1), never touches the network)
+
+        Args:
+            signal: 'sentiment', 'shifts' or 'alpha'
+            symbol: Token symbol (e.g., 'SOL')
+
+        Returns:
+            Parsed JSON response, or None if never fetched or older than ttl
+        """
+        entry = self._cache[signal].get(symbol)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    async def refresh(self, symbols: List[str]) -> int:
+        """
+        Fetch every signal for every symbol concurrently
+
+        Args:
+            symbols: Symbols to refresh
+
+        Returns:
+            Number of symbols with at least one signal refreshed
+        """
+        start = time.perf_counter()
+
+        async def fetch_symbol(symbol: str):
+            results = await asyncio.gather(*(self._fetch(name, symbol) for name in ENDPOINTS))
+            return True if any(results) else None
+
+        refreshed = await self.fetch_engine.map(list(symbols), fetch_symbol)
+
+        self.last_refresh = time.time()
+        logger.info(f"🧠 Deep42 signals refreshed for {len(refreshed)}/{len(symbols)} symbols "
+                    f"in {time.perf_counter() - start:.2f}s")
+        return len(refreshed)
+
+    async def _fetch(self, signal: str, symbol: str) -> bool:
+        endpoint, symbol_param, params = ENDPOINTS[signal]
+        try:
+            async with self._http.request("GET", f"{self.base_url}/{endpoint}", headers=self._headers,
+                                          params={symbol_param: symbol, **params}) as resp:
+                if resp.status != 200:
+                    logger.debug(f"Deep42 {endpoint} unavailable for {symbol}: HTTP {resp.status}")
+                    self.errors += 1
+                    return False
+                data = await resp.json(content_type=None)
+        except Exception as e:
+            logger.debug(f"Deep42 {endpoint} fetch failed for {symbol}: {e}")
+            self.errors += 1
+            return False
+        self._cache[signal][symbol] = (time.time(), data)
+        return True
+
+    async def run(self, symbols_fn: Callable[[], List[str]]):
+        """
+        Refresh every `refresh_interval` seconds until cancelled
+
+        Args:
+            symbols_fn: Returns the current tradeable symbols
+        """
+        try:
+            while True:
+                try:
+                    symbols = list(symbols_fn() or [])
+                    if symbols:
+                        await self.refresh(symbols)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"⚠️ Deep42 signal refresh failed: {e}")
+                await asyncio.sleep(self.refresh_interval)
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Release the HTTP pool"""
+        await self._http.close()
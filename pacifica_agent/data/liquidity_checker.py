@@ -1,10 +1,18 @@
 """
 Orderbook Liquidity Checker for Pacifica DEX
 Prevents orders from being placed on markets with insufficient liquidity
+
+Books are held in an OrderBookCache (core/orderbook_cache.py) with cumulative
+depth indexes: each check is a binary search, and prefetch() pulls the books
+for pending entries in the background so the order path rarely waits on a
+REST round-trip.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict
+from typing import Dict, Iterable, List, Optional
+
+from core.orderbook_cache import OrderBookCache, evaluate_liquidity
 
 logger = logging.getLogger(__name__)
 
@@ -12,16 +20,26 @@ logger = logging.getLogger(__name__)
 class LiquidityChecker:
     """Check orderbook liquidity before placing orders"""
 
-    def __init__(self, sdk):
+    MAX_SLIPPAGE = 0.02     # Depth counted within 2% of current price
+    MIN_DEPTH_RATIO = 2.0   # Require at least 2x the order size in orderbook depth
+
+    def __init__(self, sdk, max_age: float = 10.0):
         """
         Initialize liquidity checker
 
         Args:
             sdk: PacificaSDK instance for API calls
+            max_age: Seconds a cached orderbook is trusted for a check
         """
         self.sdk = sdk
-        self._orderbook_cache = {}  # Cache orderbooks briefly
-        self._cache_ttl = 5  # 5 seconds cache
+        self.books = OrderBookCache(max_age=max_age)
+
+    def prefetch(self, symbols: Iterable[str]):
+        """Start fetching orderbooks for upcoming orders (returns immediately)"""
+        self.books.prefetch({symbol: self._symbol_fetcher(symbol) for symbol in symbols if symbol})
+
+    def _symbol_fetcher(self, symbol: str):
+        return lambda: self._fetch_orderbook(symbol)
 
     async def check_liquidity(
         self,
@@ -39,90 +57,50 @@ class LiquidityChecker:
             side: 'BUY' or 'SELL'
             size_usd: Order size in USD
             current_price: Current market price
-            market_id: Market ID (optional, will lookup if not provided)
+            market_id: Ignored (Pacifica works directly with symbols, kept for API compatibility)
 
         Returns:
             Dict with:
                 - has_liquidity: bool - Whether there's sufficient liquidity
                 - available_liquidity_usd: float - Available liquidity in USD
                 - depth_ratio: float - Ratio of available to required liquidity
+                - expected_slippage_pct: float - VWAP slippage for the full size (None if unknown)
                 - reason: str - Explanation
         """
-        try:
-            # Note: Pacifica SDK doesn't use market_id, works directly with symbols
-            # market_id parameter is kept for API compatibility but ignored
-
-            # Fetch orderbook from API (using symbol directly)
-            orderbook = await self._fetch_orderbook(symbol)
-            if not orderbook:
-                # If we can't fetch orderbook, allow reasonable orders on filtered markets
-                # With leverage-aware sizing, orders can be $60-120 depending on confidence
-                if size_usd <= 150:  # Allow orders up to $150 if orderbook unavailable
-                    logger.warning(f"⚠️  Could not fetch orderbook for {symbol} - allowing order (${size_usd:.2f}) on pre-filtered liquid market")
-                    return {
-                        'has_liquidity': True,
-                        'available_liquidity_usd': size_usd,
-                        'depth_ratio': 1.0,
-                        'reason': 'Orderbook unavailable, allowing order on pre-filtered market'
-                    }
-                else:
-                    return {
-                        'has_liquidity': False,
-                        'available_liquidity_usd': 0,
-                        'depth_ratio': 0,
-                        'reason': 'Orderbook unavailable and order size too large'
-                    }
-
-            # Calculate required liquidity (order size in tokens)
-            required_tokens = size_usd / current_price
-
-            # Check appropriate side of orderbook
-            if side == 'BUY':
-                # For BUY orders, check ASK side (selling side)
-                available_tokens = self._calculate_available_liquidity(
-                    orderbook.get('asks', []),
-                    current_price,
-                    max_price_slippage=0.02  # 2% max slippage
-                )
-            else:  # SELL
-                # For SELL orders, check BID side (buying side)
-                available_tokens = self._calculate_available_liquidity(
-                    orderbook.get('bids', []),
-                    current_price,
-                    max_price_slippage=0.02  # 2% max slippage
-                )
-
-            available_usd = available_tokens * current_price
-            depth_ratio = available_usd / size_usd if size_usd > 0 else 0
-
-            # Require at least 2x the order size in orderbook depth
-            MIN_DEPTH_RATIO = 2.0
-            has_liquidity = depth_ratio >= MIN_DEPTH_RATIO
-
-            reason = (
-                f"Orderbook has ${available_usd:.2f} available (ratio: {depth_ratio:.2f}x) "
-                f"for ${size_usd:.2f} order"
-            )
-
-            if not has_liquidity:
-                reason += f" - INSUFFICIENT (need {MIN_DEPTH_RATIO}x minimum)"
-
-            return {
-                'has_liquidity': has_liquidity,
-                'available_liquidity_usd': available_usd,
-                'depth_ratio': depth_ratio,
-                'reason': reason
-            }
+        results = await self.check_batch([{
+            'symbol': symbol, 'side': side, 'size_usd': size_usd, 'current_price': current_price,
+        }])
+        return results[0]
+
+    async def check_batch(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Check every pending order in one pass (one concurrent fetch per stale book)
 
+        Args:
+            orders: Dicts with symbol, side, size_usd and current_price
+
+        Returns:
+            check_liquidity() result per order, in order
+        """
+        try:
+            books = await asyncio.gather(*(
+                self.books.get_or_fetch(order['symbol'], self._symbol_fetcher(order['symbol'])) for order in orders
+            ))
         except Exception as e:
-            logger.error(f"Error checking liquidity for {symbol}: {e}")
+            logger.error(f"Error checking liquidity: {e}")
             # On error, be conservative and reject
-            return {
+            return [{
                 'has_liquidity': False,
                 'available_liquidity_usd': 0,
                 'depth_ratio': 0,
                 'reason': f"Error: {str(e)}"
-            }
+            } for _ in orders]
+
+        return [
+            evaluate_liquidity(book, order['side'], order['size_usd'], order['current_price'],
+                               max_slippage=self.MAX_SLIPPAGE, min_depth_ratio=self.MIN_DEPTH_RATIO)
+            for order, book in zip(orders, books)
+        ]
 
     async def _fetch_orderbook(self, symbol: str) -> Optional[Dict]:
         """
@@ -164,44 +142,3 @@ class LiquidityChecker:
         except Exception as e:
             logger.warning(f"Could not fetch orderbook for {symbol}: {e}")
             return {}
-
-    def _calculate_available_liquidity(
-        self,
-        levels: list,
-        current_price: float,
-        max_price_slippage: float = 0.02
-    ) -> float:
-        """
-        Calculate available liquidity within acceptable price range
-
-        Args:
-            levels: Orderbook levels [[price, size], ...]
-            current_price: Current market price
-            max_price_slippage: Maximum acceptable price slippage (e.g., 0.02 = 2%)
-
-        Returns:
-            Total available size in tokens within price range
-        """
-        if not levels:
-            return 0
-
-        max_price_deviation = current_price * max_price_slippage
-        min_acceptable_price = current_price - max_price_deviation
-        max_acceptable_price = current_price + max_price_deviation
-
-        total_size = 0
-        for level in levels:
-            if len(level) < 2:
-                continue
-
-            price, size = float(level[0]), float(level[1])
-
-            # Check if price is within acceptable range
-            if min_acceptable_price <= price <= max_acceptable_price:
-                total_size += size
-            else:
-                # Once we hit levels outside price range, stop
-                # (assumes orderbook is sorted)
-                break
-
-        return total_size
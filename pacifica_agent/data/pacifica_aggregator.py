@@ -5,8 +5,9 @@ Uses Pacifica DEX data instead of Pacifica
 Symbols fetched dynamically from Pacifica API via SDK
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 # Import shared components
@@ -17,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from llm_agent.data.macro_fetcher import MacroContextFetcher
 from llm_agent.data.indicator_calculator import IndicatorCalculator
 from llm_agent.data.oi_fetcher import OIDataFetcher
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
 from pacifica_agent.data.pacifica_fetcher import PacificaDataFetcher
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,8 @@ class PacificaMarketDataAggregator:
         sdk=None,
         interval: str = "15m",
         candle_limit: int = 100,
-        macro_refresh_hours: int = 12
+        macro_refresh_hours: int = 12,
+        max_concurrency: int = 8
     ):
         """
         Initialize Pacifica market data aggregator
@@ -46,6 +49,7 @@ class PacificaMarketDataAggregator:
             interval: Candle interval (default: 15m)
             candle_limit: Number of candles to fetch (default: 100)
             macro_refresh_hours: Hours between macro context refreshes (default: 12)
+            max_concurrency: Max in-flight per-symbol fetches (default: 8)
         """
         self.interval = interval
         self.candle_limit = candle_limit
@@ -65,6 +69,9 @@ class PacificaMarketDataAggregator:
         self.indicator_calc = IndicatorCalculator()
         self.oi_fetcher = OIDataFetcher()
 
+        # Concurrent per-symbol fetches + executor for blocking indicator/OI work
+        self.fetch_engine = ConcurrentFetchEngine(max_concurrency=max_concurrency)
+
         logger.info(f"✅ PacificaMarketDataAggregator initialized (interval={interval}, candles={candle_limit})")
 
     @property
@@ -111,20 +118,18 @@ class PacificaMarketDataAggregator:
         funding_rate = pacifica_data['funding_rate']
         current_price = pacifica_data['current_price']
 
-        # Calculate indicators
-        if kline_df is not None and not kline_df.empty:
-            kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-            indicators = self.indicator_calc.get_latest_values(kline_df)
-
-            # Calculate 24h volume from recent candles
-            volume_24h = self._calculate_24h_volume(kline_df)
+        # Indicators (CPU) and OI (blocking HTTP) run in the executor, concurrently
+        computed, oi_map = await asyncio.gather(
+            self.fetch_engine.run_blocking(self._compute_indicators, kline_df),
+            self.fetch_engine.run_blocking(self.oi_fetcher.get_oi_snapshot, [symbol])
+        )
+        oi = oi_map.get(symbol)
+        if computed:
+            kline_df, indicators, volume_24h = computed
         else:
             indicators = {}
             volume_24h = None
 
-        # Fetch OI (may not be available for all Pacifica markets)
-        oi = self.oi_fetcher.fetch_oi(symbol)
-
         return {
             "symbol": symbol,
             "price": current_price or indicators.get('price'),
@@ -167,31 +172,48 @@ class PacificaMarketDataAggregator:
                 logger.warning(f"No valid Pacifica symbols in provided list")
                 return {}
 
-        # Use fetcher's async method (uses HTTP API directly)
         # Note: PacificaDataFetcher doesn't need candlestick_api
-        results = await self.pacifica.fetch_all_markets(
-            symbols=symbols,
-            interval=self.interval,
-            limit=self.candle_limit,
-            candlestick_api=self.candlestick_api,
-            funding_api=self.funding_api
-        )
+        engine = self.fetch_engine
+        engine.reset_timings()
+
+        async def _fetch_candles() -> Dict[str, Dict]:
+            with engine.stage("candles"):
+                return await self.pacifica.fetch_all_markets(
+                    symbols=symbols,
+                    interval=self.interval,
+                    limit=self.candle_limit,
+                    candlestick_api=self.candlestick_api,
+                    funding_api=self.funding_api,
+                    fetch_engine=engine
+                )
+
+        async def _fetch_oi() -> Dict[str, Optional[float]]:
+            # One shared snapshot per cycle (1 HyperLiquid bulk + parallel Binance)
+            with engine.stage("oi"):
+                return await engine.run_blocking(self.oi_fetcher.get_oi_snapshot, symbols)
+
+        with engine.stage("total"):
+            # Candle/funding requests and OI requests fan out at the same time
+            results, oi_map = await asyncio.gather(_fetch_candles(), _fetch_oi())
+
+            # Indicator math is CPU-bound - keep it off the event loop
+            with engine.stage("indicators"):
+                computed = await engine.map(
+                    list(results),
+                    lambda s: engine.run_blocking(self._compute_indicators, results[s].get('kline_df'))
+                )
 
-        # Process each result to add indicators
         for symbol, data in results.items():
-            kline_df = data.get('kline_df')
-            if kline_df is not None and not kline_df.empty:
-                kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
-                indicators = self.indicator_calc.get_latest_values(kline_df)
-                volume_24h = self._calculate_24h_volume(kline_df)
-                oi = self.oi_fetcher.fetch_oi(symbol)
-                
-                data['indicators'] = indicators
-                data['volume_24h'] = volume_24h
-                data['oi'] = oi
-                data['price'] = data.get('current_price') or indicators.get('price')
-                data['kline_df'] = kline_df
-
+            if symbol not in computed:
+                continue
+            kline_df, indicators, volume_24h = computed[symbol]
+            data['indicators'] = indicators
+            data['volume_24h'] = volume_24h
+            data['oi'] = oi_map.get(symbol)
+            data['price'] = data.get('current_price') or indicators.get('price')
+            data['kline_df'] = kline_df
+
+        logger.info(f"⏱️ Pacifica data stages: {engine.format_stage_timings()}")
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Pacifica markets")
         return results
 
@@ -248,6 +270,22 @@ class PacificaMarketDataAggregator:
 
         return "\n".join(lines)
 
+    def _compute_indicators(self, kline_df) -> Optional[Tuple]:
+        """
+        Calculate indicators and 24h volume for one symbol (blocking, runs in executor)
+
+        Args:
+            kline_df: OHLCV DataFrame
+
+        Returns:
+            (kline_df with indicators, latest indicator values, 24h volume) or None if no candles
+        """
+        if kline_df is None or kline_df.empty:
+            return None
+        kline_df = self.indicator_calc.calculate_all_indicators(kline_df)
+        indicators = self.indicator_calc.get_latest_values(kline_df)
+        return kline_df, indicators, self._calculate_24h_volume(kline_df)
+
     def _calculate_24h_volume(self, kline_df) -> Optional[float]:
         """Calculate 24h volume from candles (same as Pacifica aggregator)"""
         if kline_df is None or kline_df.empty:
@@ -5,6 +5,7 @@ Uses Pacifica HTTP API for market data
 Symbols fetched dynamically from Pacifica API
 """
 
+import asyncio
 import logging
 import pandas as pd
 from typing import Optional, Dict, List
@@ -12,6 +13,8 @@ from datetime import datetime
 import time
 import aiohttp
 
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -248,8 +251,10 @@ class PacificaDataFetcher:
         Returns:
             Dict with keys: symbol, kline_df, funding_rate, current_price
         """
-        kline_df = await self.fetch_kline(symbol, interval, limit)
-        funding_rate = await self.fetch_funding_rate(symbol)
+        kline_df, funding_rate = await asyncio.gather(
+            self.fetch_kline(symbol, interval, limit),
+            self.fetch_funding_rate(symbol)
+        )
         current_price = await self.fetch_current_price(symbol) if kline_df is None or kline_df.empty else None
 
         return {
@@ -265,10 +270,11 @@ class PacificaDataFetcher:
         interval: str = "15m",
         limit: int = 100,
         candlestick_api=None,
-        funding_api=None
+        funding_api=None,
+        fetch_engine: Optional[ConcurrentFetchEngine] = None
     ) -> Dict[str, Dict]:
         """
-        Fetch market data for all Pacifica markets
+        Fetch market data for all Pacifica markets concurrently
 
         Args:
             symbols: List of symbols to fetch (default: all Pacifica markets from API)
@@ -276,6 +282,7 @@ class PacificaDataFetcher:
             limit: Number of candles (default: 100)
             candlestick_api: Ignored (for API compatibility)
             funding_api: Ignored (for API compatibility)
+            fetch_engine: Engine bounding concurrent requests (default: 8 in flight)
 
         Returns:
             Dict mapping symbol -> market data dict
@@ -289,15 +296,19 @@ class PacificaDataFetcher:
             # Filter to only Pacifica markets (from API)
             symbols = [s for s in symbols if s in self.available_symbols]
 
-        results = {}
-        for symbol in symbols:
+        engine = fetch_engine or ConcurrentFetchEngine(max_concurrency=8)
+
+        async def _fetch(symbol: str) -> Optional[Dict]:
             data = await self.fetch_market_data(
                 symbol,
                 interval,
                 limit
             )
             if data and data.get('kline_df') is not None:
-                results[symbol] = data
+                return data
+            return None
+
+        results = await engine.map(symbols, _fetch)
 
         logger.info(f"✅ Fetched data for {len(results)}/{len(symbols)} Pacifica markets")
         return results
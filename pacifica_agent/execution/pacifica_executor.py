@@ -9,7 +9,6 @@ import logging
 import sys
 import os
 import asyncio
-import requests
 from typing import Optional, Dict
 from datetime import datetime
 from decimal import Decimal
@@ -19,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from trade_tracker import TradeTracker
 from pacifica_agent.data.liquidity_checker import LiquidityChecker
+from pacifica_agent.data.deep42_signals import Deep42SignalPrefetcher
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +62,8 @@ class PacificaTradeExecutor:
         self.sentiment_threshold_bullish = sentiment_threshold_bullish
         self.sentiment_threshold_bearish = sentiment_threshold_bearish
         self.use_sentiment_filter = use_sentiment_filter and cambrian_api_key is not None
+        # Refreshed in the background (bot starts deep42.run); entries only read the cache
+        self.deep42 = Deep42SignalPrefetcher(cambrian_api_key) if self.use_sentiment_filter else None
 
         # Position aging/rotation (REQ-1.5)
         self.max_position_age_minutes = max_position_age_minutes
@@ -141,25 +143,12 @@ class PacificaTradeExecutor:
             return (True, "Sentiment filter disabled")
 
         try:
-            # Query Deep42 token sentiment (24h window)
-            url = "https://deep42.cambrian.network/api/v1/deep42/social-data/token-analysis"
-            params = {
-                "symbol": symbol,
-                "days": 1,
-                "granularity": "total"
-            }
-            headers = {
-                "X-API-KEY": self.cambrian_api_key,
-                "Content-Type": "application/json"
-            }
-
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                logger.warning(f"Deep42 API error for {symbol}: HTTP {response.status_code}")
-                return (True, f"Sentiment API unavailable (HTTP {response.status_code}), proceeding anyway")
+            # Deep42 token sentiment (24h window), prefetched in the background
+            data = self.deep42.get("sentiment", symbol)
 
-            data = response.json()
+            if not data:
+                logger.warning(f"No fresh Deep42 sentiment cached for {symbol}")
+                return (True, "Sentiment data unavailable, proceeding anyway")
 
             # Extract sentiment metrics
             bullish_pct = data.get('veryBullishPct', 0) + data.get('bullishPct', 0)
@@ -219,25 +208,8 @@ class PacificaTradeExecutor:
             return None
 
         try:
-            # Query Deep42 sentiment shifts
-            url = "https://deep42.cambrian.network/api/v1/deep42/social-data/sentiment-shifts"
-            params = {
-                "token": symbol,  # Filter for specific token
-                "threshold": 1.5,  # Minimum shift magnitude to detect
-                "period": "4h"  # Check 4-hour shifts (good balance)
-            }
-            headers = {
-                "X-API-KEY": self.cambrian_api_key,
-                "Content-Type": "application/json"
-            }
-
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                logger.debug(f"Sentiment shifts API unavailable for {symbol}: HTTP {response.status_code}")
-                return None
-
-            shifts_data = response.json()
+            # Deep42 sentiment shifts (>=1.5 points over 4h), prefetched in the background
+            shifts_data = self.deep42.get("shifts", symbol)
 
             # Check if any shifts detected for this symbol
             if not shifts_data or len(shifts_data) == 0:
@@ -304,25 +276,8 @@ class PacificaTradeExecutor:
             return None
 
         try:
-            # Query Deep42 alpha tweet detection
-            url = "https://deep42.cambrian.network/api/v1/deep42/social-data/alpha-tweet-detection"
-            params = {
-                "token_filter": symbol,
-                "min_threshold": 20,  # Minimum quality threshold (20-30 range)
-                "limit": 10  # Check last 10 tweets
-            }
-            headers = {
-                "X-API-KEY": self.cambrian_api_key,
-                "Content-Type": "application/json"
-            }
-
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                logger.debug(f"Alpha tweets API unavailable for {symbol}: HTTP {response.status_code}")
-                return None
-
-            alpha_tweets = response.json()
+            # Deep42 alpha tweet detection (last 10 tweets), prefetched in the background
+            alpha_tweets = self.deep42.get("alpha", symbol)
 
             # Check if any alpha found
             if not alpha_tweets or len(alpha_tweets) == 0:
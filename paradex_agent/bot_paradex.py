@@ -38,6 +38,7 @@ from llm_agent.self_learning import SelfLearning
 from trade_tracker import TradeTracker
 from paradex_agent.data.paradex_fetcher import ParadexDataFetcher
 from paradex_agent.execution.paradex_executor import ParadexTradeExecutor
+from core.cycle_profiler import CycleProfiler
 
 # Configure logging
 logging.basicConfig(
@@ -112,6 +113,7 @@ class ParadexTradingBot:
 
         # Initialize trade tracker
         self.trade_tracker = TradeTracker(dex="paradex")
+        self.profiler = CycleProfiler("paradex")  # per-phase cycle timings (logs/metrics + local HTTP)
 
         # Initialize executor (0.5% spread for zero-fee volume farming)
         self.executor = ParadexTradeExecutor(
@@ -246,6 +248,7 @@ class ParadexTradingBot:
         logger.info("")
 
         try:
+            self.profiler.phase("positions")
             # Fetch account summary
             account = self.fetcher.fetch_account_summary()
             account_balance = account.get('account_value', 0)
@@ -256,6 +259,7 @@ class ParadexTradingBot:
             logger.info("")
             logger.info(self.format_positions(positions))
 
+            self.profiler.phase("markets")
             # Fetch all market data
             logger.info("")
             logger.info("Fetching market data...")
@@ -268,6 +272,7 @@ class ParadexTradingBot:
             logger.info(f"Loaded {len(market_data)} markets")
             logger.info("")
 
+            self.profiler.phase("prompt")
             # Format market table
             market_table = self.format_market_table(market_data)
             logger.info(market_table)
@@ -303,7 +308,8 @@ class ParadexTradingBot:
             logger.info("")
             logger.info("Getting trading decision from LLM...")
 
-            result = self.llm_agent.model_client.query(
+            self.profiler.phase("llm")
+            result = await self.llm_agent.model_client.aquery(
                 prompt=prompt,
                 max_tokens=1500,  # More tokens for multiple decisions
                 temperature=0.3   # Slightly more creative for finding trades
@@ -322,6 +328,7 @@ class ParadexTradingBot:
                 logger.info(line)
             logger.info("=" * 60)
 
+            self.profiler.phase("parse")
             # Parse decisions
             parsed_decisions = self.llm_agent.response_parser.parse_multiple_decisions(result["content"])
 
@@ -329,6 +336,7 @@ class ParadexTradingBot:
                 logger.info("No actionable decisions from LLM")
                 return
 
+            self.profiler.phase("execution")
             # Validate and execute decisions
             logger.info("")
             logger.info(f"Processing {len(parsed_decisions)} decisions...")
@@ -426,10 +434,12 @@ class ParadexTradingBot:
 
         # Start background monitor
         monitor_task = asyncio.create_task(self.run_background_monitor())
+        await self.profiler.serve_http()
 
         try:
             while True:
-                await self.run_once()
+                with self.profiler.cycle():
+                    await self.run_once()
 
                 next_cycle = datetime.now() + timedelta(seconds=self.check_interval)
                 logger.info("")
@@ -444,6 +454,8 @@ class ParadexTradingBot:
         except Exception as e:
             logger.error(f"Bot crashed: {e}", exc_info=True)
             monitor_task.cancel()
+        finally:
+            await self.profiler.close()
 
 
 def main():
@@ -351,7 +351,7 @@ class SwingTradingBot:
 
             # Query LLM
             logger.info(f"  Querying LLM...")
-            result = self.llm_agent.model_client.query(
+            result = await self.llm_agent.model_client.aquery(
                 prompt=prompt,
                 max_tokens=500,
                 temperature=0.1
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Exit Rule Backtest - sweep TP / SL / hold / trailing parameters
+Replays historical entries over cached candles (see core/backtest)
+
+Examples:
+    # Pull 5m candles for every symbol in the export, then sweep TP x SL
+    python3 scripts/backtest_exit_rules.py \\
+        --trades data/lighter_exports/lighter-trade-export-2025-11-13T01_20_06.047Z-UTC.csv \\
+        --candles data/candles/5m --fetch-pacifica 5m \\
+        --grid take_profit_pct=2,4,6,8 --grid stop_loss_pct=1,2,3,4
+
+    # Check the vectorized engine against the live StrategyBExitRules
+    python3 scripts/backtest_exit_rules.py --trades logs/trades/extended.json \\
+        --candles data/candles/5m --preset b --validate
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from core.backtest import (
+    EXIT_REASONS,
+    ExitParams,
+    build_paths,
+    load_candles_dir,
+    load_lighter_entries,
+    load_tracker_entries,
+    replay_rules,
+    run_vectorized,
+    save_candles,
+    summarize,
+    sweep,
+)
+
+logger = logging.getLogger(__name__)
+
+PRESETS = {
+    'a': ExitParams.strategy_a,
+    'b': ExitParams.strategy_b,
+    'hard': ExitParams.hard_rules,
+}
+
+
+def parse_grid(specs):
+    """--grid field=v1,v2,... -> {field: [values]} ('none' disables an optional rule)"""
+    grid = {}
+    for spec in specs or []:
+        name, _, values = spec.partition('=')
+        grid[name.strip()] = [None if v.strip().lower() == 'none' else float(v) for v in values.split(',')]
+    return grid
+
+
+def fetch_pacifica_candles(symbols, candle_dir, interval, limit):
+    """Pull klines from Pacifica into the candle cache"""
+    from llm_agent.data.pacifica_fetcher import PacificaDataFetcher
+
+    fetcher = PacificaDataFetcher()
+    for symbol in sorted(symbols):
+        df = fetcher.fetch_kline(symbol, interval=interval, limit=limit)
+        if df is None or df.empty:
+            logger.warning(f"⚠️ No klines for {symbol}")
+            continue
+        save_candles(df, candle_dir, symbol)
+        logger.info(f"✅ Cached {len(df)} {interval} candles for {symbol}")
+
+
+def live_rules(preset):
+    """Live exit-rule objects for --validate"""
+    if preset == 'a':
+        from hibachi_agent.execution.fast_exit_monitor import FastExitMonitor
+        from hibachi_agent.execution.strategy_a_exit_rules import StrategyAExitRules
+        rules = StrategyAExitRules()
+        return rules, FastExitMonitor(None, None, rules, None, enabled=False)
+    if preset == 'b':
+        from extended_agent.execution.strategy_b_exit_rules import StrategyBExitRules
+        return StrategyBExitRules(), None
+    from hibachi_agent.execution.hard_exit_rules import HardExitRules
+    return HardExitRules(), None
+
+
+def print_summary(title, stats):
+    print(f"\n{title}")
+    print(f"  Trades: {stats['trades']}  |  Win rate: {stats['win_rate']:.1%}  |  PF: {stats['profit_factor']:.2f}")
+    print(f"  Total: {stats['total_pnl_pct']:+.2f}%  |  Avg: {stats['avg_pnl_pct']:+.3f}%  |  "
+          f"Max DD: {stats['max_drawdown_pct']:.2f}%  |  Avg hold: {stats['avg_hold_hours']:.1f}h")
+    print(f"  Exits: {stats['exits']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest and sweep LLM bot exit rules over historical candles")
+    parser.add_argument('--trades', required=True, help="Lighter export CSV or TradeTracker JSON")
+    parser.add_argument('--candles', default='data/candles/5m', help="Candle cache directory")
+    parser.add_argument('--fetch-pacifica', metavar='INTERVAL', help="Pull candles from Pacifica first (e.g. 5m)")
+    parser.add_argument('--fetch-limit', type=int, default=1000, help="Candles per symbol to pull")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='a', help="Base exit params")
+    parser.add_argument('--grid', action='append', help="field=v1,v2,... (repeatable)")
+    parser.add_argument('--horizon-hours', type=float, default=96.0)
+    parser.add_argument('--fee-bps', type=float, default=4.5, help="Fee per side (bps)")
+    parser.add_argument('--slippage-bps', type=float, default=2.0, help="Slippage per side (bps)")
+    parser.add_argument('--workers', type=int, default=None, help="Sweep processes (default: CPU count)")
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--validate', action='store_true', help="Compare against the live rule classes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if args.trades.endswith('.csv'):
+        entries = load_lighter_entries(args.trades)
+    else:
+        entries = load_tracker_entries(args.trades)
+    symbols = {e.symbol for e in entries}
+
+    if args.fetch_pacifica:
+        fetch_pacifica_candles(symbols, args.candles, args.fetch_pacifica, args.fetch_limit)
+
+    candles = load_candles_dir(args.candles, symbols)
+    paths = build_paths(entries, candles, horizon_hours=args.horizon_hours)
+    if not paths.entries:
+        print("No entries covered by the candle cache")
+        return
+
+    base = PRESETS[args.preset]()
+    baseline = summarize(run_vectorized(paths, base, args.fee_bps, args.slippage_bps))
+    print_summary(f"Baseline ({args.preset}): {base}", baseline)
+
+    if args.validate:
+        rules, monitor = live_rules(args.preset)
+        vectorized = run_vectorized(paths, base, args.fee_bps, args.slippage_bps)
+        replayed = replay_rules(paths, rules, monitor, args.fee_bps, args.slippage_bps)
+        mismatched = np.flatnonzero(vectorized.exit_idx != replayed.exit_idx)
+        print_summary("Live rule replay", summarize(replayed))
+        print(f"\n  Exit mismatches: {len(mismatched)}/{len(paths.entries)}")
+        for i in mismatched[:10]:
+            entry = paths.entries[i]
+            print(f"    {entry.symbol} {entry.side} {entry.time}: vectorized "
+                  f"{EXIT_REASONS[vectorized.reason[i]]}@{vectorized.exit_idx[i]} vs live "
+                  f"{EXIT_REASONS[replayed.reason[i]]}@{replayed.exit_idx[i]}")
+
+    grid = parse_grid(args.grid)
+    if not grid:
+        return
+
+    results = sweep(paths, grid, base=base, fee_bps=args.fee_bps,
+                    slippage_bps=args.slippage_bps, workers=args.workers)
+    print(f"\nTop {min(args.top, len(results))} of {len(results)} combos:")
+    print(f"  {'params':<60} {'total%':>8} {'win':>6} {'PF':>6} {'DD%':>7} {'hold h':>7}")
+    for row in results[:args.top]:
+        params = ", ".join(f"{name}={row[name]}" for name in grid)
+        print(f"  {params:<60} {row['total_pnl_pct']:>+8.2f} {row['win_rate']:>6.1%} "
+              f"{row['profit_factor']:>6.2f} {row['max_drawdown_pct']:>7.2f} {row['avg_hold_hours']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+One-time migration of JSON trade/outcome logs into the SQLite TradeStore
+
+Imports:
+- logs/trades/<dex>.json (+ <dex>.events.jsonl) for every DEX
+- rotated/archived trade logs (logs/trades/<dex>_<timestamp>.json, logs/trades/archive/*.json)
+- self-improving LLM and pairs outcome logs (logs/strategies/*_outcomes.json)
+
+Safe to re-run: trades are keyed by (dex, entry timestamp, order_id) and
+outcome logs are only imported into empty trackers.
+
+Usage:
+    python scripts/general/migrate_trade_store.py [--db logs/trades.db] [--trades-dir logs/trades]
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.trade_store import TradeStore
+from trade_tracker import SQLiteTradeLog, TradeEventLog, TradeTracker
+from core.strategies.self_improving_llm.outcome_tracker import OutcomeTracker as LLMOutcomeTracker
+from core.strategies.self_improving_pairs.outcome_tracker import OutcomeTracker as PairsOutcomeTracker
+
+
+ROTATED_LOG = re.compile(r"^(?P<dex>.+)_\d{8}_\d{6}$")  # <dex>_<YYYYmmdd>_<HHMMSS>
+
+
+def migrate_trade_logs(store: TradeStore, trades_dir: Path) -> int:
+    """Import current, rotated and archived TradeTracker logs"""
+    total = 0
+    rotated = []
+
+    # Current logs: snapshot + event log per DEX
+    for snapshot in sorted(trades_dir.glob("*.json")):
+        match = ROTATED_LOG.match(snapshot.stem)
+        if match:
+            rotated.append((snapshot, match.group("dex")))
+            continue
+        dex = snapshot.stem
+        trades = TradeEventLog(trades_dir, dex).load()
+        SQLiteTradeLog(store, trades_dir, dex, TradeTracker.MAX_TRADES_PER_FILE).upsert(trades)
+        print(f"  {dex}: {len(trades)} trades")
+        total += len(trades)
+
+    # Rotated logs, then switch_strategy.py archives (archive/<dex>_<strategy>_<timestamp>.json)
+    archives = rotated + [(a, a.stem.split("_")[0]) for a in sorted((trades_dir / "archive").glob("*.json"))]
+    for archive, dex in archives:
+        try:
+            with open(archive, 'r') as f:
+                trades = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"  ⚠️  Skipping {archive}: {e}")
+            continue
+        if not isinstance(trades, list):
+            continue
+        SQLiteTradeLog(store, trades_dir, dex, TradeTracker.MAX_TRADES_PER_FILE).upsert(trades)
+        print(f"  {archive.name}: {len(trades)} trades ({dex})")
+        total += len(trades)
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate JSON trade logs into the SQLite TradeStore")
+    parser.add_argument("--db", default=None, help="SQLite path (default: TRADE_STORE_DB or logs/trades.db)")
+    parser.add_argument("--trades-dir", default="logs/trades", help="TradeTracker log directory")
+    args = parser.parse_args()
+
+    store = TradeStore.shared(args.db)
+    print("=" * 60)
+    print(f"📥 MIGRATING TRADE LOGS → {store.db_path}")
+    print("=" * 60)
+
+    trades_dir = Path(args.trades_dir)
+    if trades_dir.exists():
+        total = migrate_trade_logs(store, trades_dir)
+        print(f"✅ Trade logs: {total} rows imported/updated")
+
+    # Outcome trackers import their JSON log on first open
+    for tracker_cls in (LLMOutcomeTracker, PairsOutcomeTracker):
+        tracker = tracker_cls(db_path=store.db_path)
+        print(f"✅ {tracker.log_file}: {tracker.get_trade_count()} closed trades")
+
+    rows = store.query("SELECT dex, COUNT(*) AS n FROM trades GROUP BY dex ORDER BY dex")
+    print("\n📊 Trades per DEX:")
+    for row in rows:
+        print(f"  {row['dex']}: {row['n']}")
+
+
+if __name__ == "__main__":
+    main()
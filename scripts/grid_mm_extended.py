@@ -8,7 +8,7 @@ REQUIRES Python 3.11+ (x10-python-trading-starknet)
 Strategy: Place POST_ONLY limit orders on both sides of mid price.
 - Dynamic spread adjusts with ROC volatility (4-15 bps)
 - POST_ONLY ensures all fills are maker (zero/low fees)
-- Refresh on 5-min timer or 0.5% price move
+- Refresh on 5-min timer or 0.5% price move (diff-based: unchanged levels keep queue priority)
 - ROC > 50 bps pauses all orders
 
 v18 Parameters (Qwen-calibrated):
@@ -34,6 +34,10 @@ from typing import Optional
 from dotenv import load_dotenv
 load_dotenv('.env')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_reconciler import GridLevel, execute_plan, plan_grid
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -93,7 +97,9 @@ class GridMarketMakerExtended:
         self.total_orders_placed = 0
         self.total_fills = 0
         self.total_volume = 0.0
-        self.open_order_ids = []
+        self.open_orders = {}  # order_id -> {'side', 'price', 'size', 'level', 'placed_at'}
+        self.reconcile_tolerance = 0.25  # Keep resting orders within 25% of spread of their level
+        self.order_max_age = 3000  # Re-place orders after 50 min (they are GTT with 1h expiry)
 
         # Market config
         config = MARKET_CONFIG.get(symbol, MARKET_CONFIG["BTC-USD"])
@@ -243,17 +249,22 @@ class GridMarketMakerExtended:
             result = await self.client.orders.mass_cancel(
                 markets=[self.symbol]
             )
-            self.open_order_ids = []
+            self.open_orders.clear()
             logger.info("  Orders cancelled")
         except Exception as e:
             logger.error(f"Error cancelling orders: {e}")
 
     async def _place_grid_orders(self, mid: float):
-        """Place POST_ONLY grid orders around mid price."""
+        """
+        Reconcile POST_ONLY grid orders around mid price.
+
+        Resting orders within tolerance of their target level are kept (queue
+        priority); stale/expiring ones are cancelled in one mass_cancel and the
+        missing levels are placed concurrently.
+        """
         from x10.perpetual.orders import OrderSide, TimeInForce
 
         spread_decimal = self.current_spread_bps / 10000.0
-        orders_placed = 0
         balance = await self._get_balance()
         pos = await self._get_position()
 
@@ -271,63 +282,54 @@ class GridMarketMakerExtended:
             elif pos["side"] == "SHORT" and inventory_ratio > 0.8:
                 can_sell = False  # Too short, only buy
 
-        # Place BUY orders (below mid)
-        if can_buy:
+        amount = round(self.order_size_usd / mid, self.amount_precision)
+        targets = []
+        for side, enabled, sign in (("BUY", can_buy, -1), ("SELL", can_sell, 1)):
+            if not enabled:
+                continue
             for i in range(1, self.num_levels + 1):
-                price = mid * (1 - spread_decimal * i)
+                price = mid * (1 + sign * spread_decimal * i)
                 if self.price_precision == 0:
                     price = int(price)
                 else:
                     price = round(price, self.price_precision)
+                targets.append(GridLevel(side, price, amount, i))
+
+        # Orders close to their GTT expiry are replaced rather than kept
+        now = time.time()
+        live = {oid: info for oid, info in self.open_orders.items() if now - info['placed_at'] < self.order_max_age}
+        tick = 10 ** -self.price_precision
+        tolerance = max(tick, mid * spread_decimal * self.reconcile_tolerance)
+        plan = plan_grid(targets, live, price_tolerance=tolerance)
+        plan.cancel += [oid for oid in self.open_orders if oid not in live]
+
+        async def place(level: GridLevel):
+            order = await self.client.place_order(
+                market_name=self.symbol,
+                amount_of_synthetic=Decimal(str(level.size)),
+                price=Decimal(str(level.price)),
+                side=OrderSide.BUY if level.side == "BUY" else OrderSide.SELL,
+                post_only=True,
+                time_in_force=TimeInForce.GTT,
+                expire_time=datetime.now(timezone.utc) + timedelta(hours=1),
+            )
+            return order.data.id if order and order.data else None
 
-                amount = round(self.order_size_usd / mid, self.amount_precision)
-
-                try:
-                    order = await self.client.place_order(
-                        market_name=self.symbol,
-                        amount_of_synthetic=Decimal(str(amount)),
-                        price=Decimal(str(price)),
-                        side=OrderSide.BUY,
-                        post_only=True,
-                        time_in_force=TimeInForce.GTT,
-                        expire_time=datetime.now(timezone.utc) + timedelta(hours=1),
-                    )
-                    if order and order.data:
-                        self.open_order_ids.append(order.data.id)
-                        orders_placed += 1
-                        self.total_orders_placed += 1
-                except Exception as e:
-                    logger.error(f"  Buy order failed (level {i}): {e}")
-
-        # Place SELL orders (above mid)
-        if can_sell:
-            for i in range(1, self.num_levels + 1):
-                price = mid * (1 + spread_decimal * i)
-                if self.price_precision == 0:
-                    price = int(price)
-                else:
-                    price = round(price, self.price_precision)
+        async def cancel_batch(order_ids):
+            await self.client.orders.mass_cancel(order_ids=order_ids)
+            return True
+
+        result = await execute_plan(plan, None, place, cancel_batch_fn=cancel_batch)
+
+        for order_id in result.cancelled:
+            self.open_orders.pop(order_id, None)
+        for order_id, level in result.placed.items():
+            self.open_orders[order_id] = {**level.to_order_info(), 'placed_at': now}
+        for level in result.failed_places:
+            logger.error(f"  {level.side.capitalize()} order failed (level {level.level})")
+        self.total_orders_placed += len(result.placed)
 
-                amount = round(self.order_size_usd / mid, self.amount_precision)
-
-                try:
-                    order = await self.client.place_order(
-                        market_name=self.symbol,
-                        amount_of_synthetic=Decimal(str(amount)),
-                        price=Decimal(str(price)),
-                        side=OrderSide.SELL,
-                        post_only=True,
-                        time_in_force=TimeInForce.GTT,
-                        expire_time=datetime.now(timezone.utc) + timedelta(hours=1),
-                    )
-                    if order and order.data:
-                        self.open_order_ids.append(order.data.id)
-                        orders_placed += 1
-                        self.total_orders_placed += 1
-                except Exception as e:
-                    logger.error(f"  Sell order failed (level {i}): {e}")
-
-        logger.info(f"  Grid: {orders_placed} orders @ ${mid:,.2f} (spread: {self.current_spread_bps:.1f}bps)")
+        logger.info(f"  Grid: {len(result.placed)} orders @ ${mid:,.2f} (spread: {self.current_spread_bps:.1f}bps) [{plan.summary()}]")
         self.last_refresh_time = time.time()
 
     def _calculate_roc(self) -> float:
@@ -396,15 +398,16 @@ class GridMarketMakerExtended:
             if open_orders and open_orders.data:
                 current_ids = {o.id for o in open_orders.data}
                 # Count orders that disappeared (filled or cancelled)
-                if self.open_order_ids:
-                    prev_ids = set(self.open_order_ids)
+                if self.open_orders:
+                    prev_ids = set(self.open_orders)
                     filled = prev_ids - current_ids
                     if filled:
                         self.total_fills += len(filled)
                         fill_volume = len(filled) * self.order_size_usd
                         self.total_volume += fill_volume
                         logger.info(f"  🎯 {len(filled)} fills detected! (+${fill_volume:.0f} volume)")
-                self.open_order_ids = list(current_ids)
+                    for order_id in filled:
+                        del self.open_orders[order_id]
         except Exception as e:
             logger.error(f"Error checking fills: {e}")
 
@@ -464,7 +467,6 @@ class GridMarketMakerExtended:
 
                 # Check if refresh needed
                 if self._should_refresh(mid):
-                    await self._cancel_all_orders()
                     self.grid_center = mid
                     await self._place_grid_orders(mid)
 
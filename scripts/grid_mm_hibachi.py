@@ -19,7 +19,7 @@ Parameters (aggressive volume farming):
 - Spread: 20 bps (wide since no POST_ONLY)
 - Order Size: $50 per order (matches Nado style)
 - Levels: 3 per side ($150 per side)
-- Refresh: 30 seconds
+- Refresh: 30 seconds (diff-based: only changed levels are cancelled/placed)
 """
 
 import os
@@ -28,7 +28,7 @@ import time
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from collections import deque
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -51,6 +51,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from dexes.hibachi.hibachi_sdk import HibachiSDK
+from core.grid_reconciler import GridLevel, execute_plan, plan_grid
 
 
 class HibachiGridMM:
@@ -83,6 +84,7 @@ class HibachiGridMM:
         self.sdk: Optional[HibachiSDK] = None
         self.price_history: deque = deque(maxlen=30)
         self.open_orders: Dict[str, Dict] = {}
+        self.reconcile_tolerance = 0.25  # Keep resting orders within 25% of level spacing
 
         # Trend detection
         self.orders_paused = False
@@ -276,19 +278,56 @@ class HibachiGridMM:
             self.open_orders.clear()
             return 0
 
+    async def _sync_open_orders(self):
+        """Drop tracked orders that are no longer resting (filled, cancelled or expired)"""
+        # fetch_orders returns None on a failed request (get_orders would return []):
+        # keep the tracked orders rather than re-posting a grid over them
+        orders = await self.sdk.fetch_orders(self.symbol)
+        if orders is None:
+            logger.warning("⚠️ Order sync failed - keeping tracked orders until the next cycle")
+            return
+        live_ids = {
+            str(o.get('orderId')) for o in orders
+            if str(o.get('status', '')).upper() not in ('FILLED', 'CANCELLED', 'REJECTED')
+        }
+        for order_id in [oid for oid in self.open_orders if oid not in live_ids]:
+            del self.open_orders[order_id]
+
+    async def _place_order(self, level: GridLevel) -> Optional[str]:
+        """Submit one grid level; returns the order id or None"""
+        result = await self.sdk.create_limit_order(
+            symbol=self.symbol,
+            is_buy=level.side == 'BUY',
+            amount=level.size,
+            price=level.price
+        )
+        if result and 'orderId' in result:
+            logger.debug(f"  {level.side} {level.size:.4f} @ ${level.price:,.2f}")
+            return str(result['orderId'])
+        return None
+
     async def _place_grid_orders(self, mid_price: float, roc: float = 0.0):
-        """Place limit orders on both sides of mid price with dynamic spread"""
-        orders_placed = 0
+        """
+        Reconcile the grid with dynamic spread against resting orders
 
+        Levels whose resting order is still within a quarter of the level
+        spacing (min 1 tick) are kept; only the rest are cancelled/placed,
+        concurrently.
+
+        Returns:
+            Number of grid orders resting after the refresh
+        """
         # Check position limit
         current_position = await self._get_position()
         if current_position >= self.max_position_usd:
             logger.warning(f"  Max position reached: ${current_position:.2f} >= ${self.max_position_usd}")
+            await self._cancel_all_orders()
             return 0
 
         # Use dynamic spread based on ROC volatility
         dynamic_spread = self._calculate_dynamic_spread(roc)
 
+        targets: List[GridLevel] = []
         for level in range(1, self.num_levels + 1):
             # Spread increases with level, using dynamic base spread
             spread_multiplier = level * dynamic_spread / 10000
@@ -298,47 +337,25 @@ class HibachiGridMM:
 
             # BUY order (below mid)
             if not self.orders_paused or self.pause_side not in ['BUY', 'ALL']:
-                buy_price = self._round_price(mid_price * (1 - spread_multiplier))
-                try:
-                    result = await self.sdk.create_limit_order(
-                        symbol=self.symbol,
-                        is_buy=True,
-                        amount=size,
-                        price=buy_price
-                    )
-                    if result and 'orderId' in result:
-                        orders_placed += 1
-                        self.open_orders[result.get('orderId', str(time.time()))] = {
-                            'side': 'BUY',
-                            'price': buy_price,
-                            'size': size
-                        }
-                        logger.debug(f"  BUY {size:.4f} @ ${buy_price:,.2f}")
-                except Exception as e:
-                    logger.debug(f"Buy order error: {e}")
+                targets.append(GridLevel('BUY', self._round_price(mid_price * (1 - spread_multiplier)), size, level))
 
             # SELL order (above mid)
             if not self.orders_paused or self.pause_side not in ['SELL', 'ALL']:
-                sell_price = self._round_price(mid_price * (1 + spread_multiplier))
-                try:
-                    result = await self.sdk.create_limit_order(
-                        symbol=self.symbol,
-                        is_buy=False,
-                        amount=size,
-                        price=sell_price
-                    )
-                    if result and 'orderId' in result:
-                        orders_placed += 1
-                        self.open_orders[result.get('orderId', str(time.time()))] = {
-                            'side': 'SELL',
-                            'price': sell_price,
-                            'size': size
-                        }
-                        logger.debug(f"  SELL {size:.4f} @ ${sell_price:,.2f}")
-                except Exception as e:
-                    logger.debug(f"Sell order error: {e}")
-
-        return orders_placed
+                targets.append(GridLevel('SELL', self._round_price(mid_price * (1 + spread_multiplier)), size, level))
+
+        await self._sync_open_orders()
+        tolerance = max(self.tick_size, mid_price * dynamic_spread / 10000 * self.reconcile_tolerance)
+        plan = plan_grid(targets, self.open_orders, price_tolerance=tolerance)
+        result = await execute_plan(plan, self.sdk.cancel_order, self._place_order)
+
+        for order_id in result.cancelled:
+            self.open_orders.pop(order_id, None)
+        for order_id, level in result.placed.items():
+            self.open_orders[order_id] = level.to_order_info()
+
+        if plan.changes:
+            logger.info(f"  Reconcile: {plan.summary()} ({len(result.failed_places)} failed)")
+        return len(plan.keep) + len(result.placed)
 
     async def run_cycle(self):
         """Run one grid cycle"""
@@ -354,10 +371,7 @@ class HibachiGridMM:
         roc = self._calculate_roc()
         self._update_pause_state(roc)
 
-        # Cancel existing orders
-        await self._cancel_all_orders()
-
-        # Place new grid with dynamic spread
+        # Reconcile grid with dynamic spread (unchanged levels keep their queue position)
         if not self.orders_paused or self.pause_side != 'ALL':
             orders_placed = await self._place_grid_orders(mid, roc)
             dynamic_spread = self._calculate_dynamic_spread(roc)
@@ -367,6 +381,7 @@ class HibachiGridMM:
                 f"Orders: {orders_placed}{pause_info}"
             )
         else:
+            await self._cancel_all_orders()
             logger.info(f"Grid PAUSED @ ${mid:,.2f} | ROC: {roc:+.2f} bps")
 
     async def run(self):
@@ -404,6 +419,8 @@ class HibachiGridMM:
         """Clean shutdown"""
         logger.info("Cancelling all orders...")
         await self._cancel_all_orders()
+        if self.sdk:
+            await self.sdk.close()
         logger.info("Shutdown complete")
 
 
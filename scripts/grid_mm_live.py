@@ -1,6 +1,6 @@
 #!/usr/bin/env python3.11
 """
-Grid Market Maker v17 - LIVE on Paradex
+Grid Market Maker v20 - LIVE on Paradex
 Dynamic spread based on ROC volatility + time-based refresh + stale order detection + tight spread mode
 
 Strategy: Place limit orders on both sides of mid price
@@ -10,6 +10,29 @@ Strategy: Place limit orders on both sides of mid price
 - STALE ORDER DETECTION: Refresh if orders drift >0.2% from mid (US-003)
 - TIGHT SPREAD MODE: Reduce spread by 20% after 2 min of calm market (NP-002)
 
+v20 Changes (Quoting metrics):
+- Prometheus-style metrics (core/grid_mm/metrics.py): fills, quote uptime, time-to-requote,
+  order API latency, placed/cancelled/rejected orders, refresh triggers, inventory, realized spread
+- Served at http://127.0.0.1:9320/metrics (--metrics-port, 0 = off); --metrics-file also writes
+  them for node_exporter's textfile collector with every 30s status line
+
+v19 Changes (Diff-based grid refresh):
+- Refresh computes the target ladder and diffs it against resting orders (core/grid_reconciler.py)
+- Orders within 25% of the spread (min 1 tick) of their target level are kept
+- Only changed levels are cancelled/placed, via batch endpoints when available
+  (concurrent single requests otherwise)
+
+v18 Changes (Websocket market data):
+- --feed ws (default): BBO, order status and fills stream over the Paradex websocket
+  (dexes/paradex/market_stream.py) instead of polling fetch_bbo/fetch_orders every second
+- Fills and stale/moved quotes trigger a grid refresh as soon as the event arrives
+- ROC still samples the mid once per second, so the 3-minute window is unchanged
+- Falls back to REST polling while the stream is stale/disconnected; REST order
+  reconciliation still runs every 30s to catch missed messages
+- Account balance for inventory limits is cached for 10s in stream mode
+- --feed local: random-walk feed + in-memory paper client (no credentials, no real orders)
+- --feed rest: original 1s polling loop
+
 v17 Changes (Tight spread mode - NP-002):
 - Track consecutive low-ROC cycles (ROC < 2bps)
 - After 2 minutes of low ROC, reduce spread by 20%
@@ -43,10 +66,11 @@ import sys
 import time
 import asyncio
 import logging
+from contextlib import nullcontext
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -63,8 +87,22 @@ logger = logging.getLogger(__name__)
 
 from paradex_py import ParadexSubkey
 from paradex_py.common.order import Order, OrderType, OrderSide
+from core.grid_mm.metrics import DEFAULT_PORT, GridMetrics, MetricsRegistry
+from core.grid_mm.price_ring import PriceRing
+from core.grid_reconciler import GridLevel, plan_grid
+from dexes.paradex import (
+    BBOUpdate,
+    FillUpdate,
+    LocalMarketFeed,
+    LocalParadexClient,
+    OrderUpdate,
+    ParadexMarketStream,
+)
+from dexes.paradex.market_stream import parse_batch_cancel
 from llm_agent.self_learning import SelfLearning
 
+FEEDS = ("ws", "rest", "local")
+
 
 class GridMarketMakerLive:
     """
@@ -83,7 +121,13 @@ class GridMarketMakerLive:
         capital: float = 73.0,
         roc_threshold_bps: float = 50.0,   # v10: real trends only per Qwen
         min_pause_duration: int = 300,     # v10: 5 min pause per Qwen
+        feed: str = "ws",                  # v18: ws | rest | local
+        history_path: Optional[str] = None,  # mmap file keeping the ROC window across restarts
+        metrics_port: int = 0,             # v20: Prometheus /metrics port (0 = off)
+        metrics_file: Optional[str] = None,  # v20: textfile collector output
     ):
+        if feed not in FEEDS:
+            raise ValueError(f"feed must be one of {FEEDS}, got {feed!r}")
         self.symbol = symbol
         self.base_spread_bps = base_spread_bps
         self.order_size_usd = order_size_usd
@@ -93,12 +137,15 @@ class GridMarketMakerLive:
         self.capital = capital
         self.roc_threshold_bps = roc_threshold_bps
         self.min_pause_duration = min_pause_duration
+        self.feed = feed
 
         # State
         self.client = None
         self.grid_center = None
+        self.grid_reset_pct = 0.50  # v10: 0.5% price move - less whipsawing
+        self.reconcile_tolerance = 0.25  # v19: keep resting orders within 25% of spread of target
         self.open_orders: Dict[str, Dict] = {}  # order_id -> order info
-        self.price_history: deque = deque(maxlen=360)  # 6 minutes at 1/sec
+        self.price_history = PriceRing(360, path=history_path)  # 6 minutes at 1/sec
 
         # Trend detection
         self.orders_paused = False
@@ -147,6 +194,28 @@ class GridMarketMakerLive:
         self.last_self_learning_time = datetime.now()
         self.self_learning_interval = 1800  # 30 minutes
 
+        # v18: Websocket market data
+        self.stream = None
+        self.stream_stale_seconds = 5.0       # No events for 5s -> REST fallback
+        self.stream_reconnect_seconds = 30.0  # Reconnect after 30s stale
+        self.rest_reconcile_interval = 30.0   # REST order sync to catch missed messages
+        self.using_rest_fallback = False
+        self.recently_closed: Dict[str, Dict] = {}  # order_id -> info, for fills arriving after CLOSED
+        # Fill dedupe across stream events and REST reconciliation
+        self._seen_fill_ids: Dict[str, None] = {}  # fill events already counted (replays after reconnect)
+        self._fill_ledger: Dict[str, Optional[float]] = {}  # order_id -> size counted from fill events, None once REST settled it
+
+        # Balance cache (REST mode keeps fetching every tick)
+        self.balance_max_age = 0.0 if feed == "rest" else 10.0
+        self._cached_balance: Optional[float] = None
+        self._balance_time: Optional[float] = None
+
+        # v20: Quoting metrics (None when neither export is enabled)
+        self.metrics_port = metrics_port
+        self.metrics_file = metrics_file
+        self.metrics = GridMetrics(MetricsRegistry(), "paradex", symbol) if (metrics_port or metrics_file) else None
+        self._unpriced_fills: List[tuple] = []  # (side, size, price) seen since the last tick
+
     def _run_self_learning_check(self):
         """Check and log user notes + performance (every 30 min)"""
         notes = SelfLearning.get_active_notes()
@@ -183,17 +252,26 @@ class GridMarketMakerLive:
         logger.info(f"Time-based Refresh: {self.time_refresh_interval}s")
         logger.info("=" * 70)
 
-        # Initialize authenticated client
-        private_key = os.getenv("PARADEX_PRIVATE_SUBKEY")
-        if not private_key:
-            raise ValueError("PARADEX_PRIVATE_SUBKEY not set in .env")
-
-        logger.info("Connecting to Paradex...")
-        self.client = ParadexSubkey(
-            env='prod',
-            l2_private_key=private_key,
-            l2_address=os.getenv('PARADEX_ACCOUNT_ADDRESS'),
-        )
+        if self.feed == "local":
+            # v18: Paper client + random-walk feed, nothing is sent to Paradex
+            logger.info("🧪 LOCAL FEED: paper client, no real orders")
+            self.client = LocalParadexClient(self.symbol, balance=self.capital)
+            self.stream = LocalMarketFeed(self.symbol, exchange=self.client)
+            self.stream.step()
+        else:
+            # Initialize authenticated client
+            private_key = os.getenv("PARADEX_PRIVATE_SUBKEY")
+            if not private_key:
+                raise ValueError("PARADEX_PRIVATE_SUBKEY not set in .env")
+
+            logger.info("Connecting to Paradex...")
+            self.client = ParadexSubkey(
+                env='prod',
+                l2_private_key=private_key,
+                l2_address=os.getenv('PARADEX_ACCOUNT_ADDRESS'),
+            )
+            if self.feed == "ws":
+                self.stream = ParadexMarketStream(self.client, self.symbol)
 
         # Get account balance
         account = self.client.api_client.fetch_account_summary()
@@ -318,17 +396,8 @@ class GridMarketMakerLive:
 
     def _calculate_roc(self) -> float:
         """Calculate Rate of Change in bps over 3-minute window"""
-        if len(self.price_history) < 180:
-            return 0.0  # Need 3 min of data before calculating ROC
-
-        prices = list(self.price_history)
-        current = prices[-1]
-        past = prices[-180]  # 3 minutes ago (180 samples at 1/sec)
-
-        if past == 0:
-            return 0.0
-
-        return (current - past) / past * 10000
+        # 3 minutes ago = 180 samples at 1/sec (0 until 3 min of data)
+        return self.price_history.roc_bps(180)
 
     def _calculate_dynamic_spread(self, roc: float) -> float:
         """
@@ -476,18 +545,59 @@ class GridMarketMakerLive:
         elif not self.orders_paused and old_paused:
             logger.info(f"  RESUME orders (ROC: {roc:+.2f} bps)")
 
+    def _get_balance(self) -> float:
+        """
+        Account value for inventory limits
+
+        Fetched on every call in REST mode; cached for balance_max_age seconds
+        in stream mode, where ticks are event-driven and can be much more frequent.
+        """
+        now = time.monotonic()
+        if self._balance_time is not None and now - self._balance_time < self.balance_max_age:
+            return self._cached_balance
+        try:
+            account = self.client.api_client.fetch_account_summary()
+            balance = float(account.account_value) if account else self.capital
+        except Exception:
+            balance = self.capital
+        self._cached_balance = balance
+        self._balance_time = now
+        return balance
+
+    def _api(self, op: str):
+        """v20: Time a Paradex call as `op` when metrics are on"""
+        return self.metrics.api(op) if self.metrics is not None else nullcontext()
+
+    def _start_metrics(self):
+        if self.metrics is not None and self.metrics_port:
+            self.metrics.registry.start_http_server(self.metrics_port)
+
+    def _export_metrics(self):
+        if self.metrics is not None and self.metrics_file:
+            self.metrics.registry.write_textfile(self.metrics_file)
+
+    def _stop_metrics(self):
+        if self.metrics is not None:
+            self._export_metrics()
+            self.metrics.registry.stop_http_server()
+
     def _cancel_all_orders(self):
         """Cancel all open orders"""
         try:
-            orders = self.client.api_client.fetch_orders(params={'market': self.symbol})
+            with self._api('sync'):
+                orders = self.client.api_client.fetch_orders(params={'market': self.symbol})
             if orders and orders.get('results'):
                 for order in orders['results']:
                     if order.get('status') in ['NEW', 'OPEN', 'UNTRIGGERED']:
                         order_id = order.get('id')
                         try:
-                            self.client.api_client.cancel_order(order_id=order_id)
+                            with self._api('cancel'):
+                                self.client.api_client.cancel_order(order_id=order_id)
+                            if self.metrics is not None:
+                                self.metrics.orders(cancelled=1)
                         except Exception as e:
                             logger.debug(f"Cancel error for {order_id}: {e}")
+            self._remember_closed(self.open_orders)
             self.open_orders.clear()
         except Exception as e:
             logger.error(f"Cancel all orders error: {e}")
@@ -498,12 +608,14 @@ class GridMarketMakerLive:
 
         Dynamic spread protects from adverse selection during volatile periods
         while capturing fills during calm markets.
-        """
-        # First cancel existing orders
-        self._cancel_all_orders()
 
+        v19: Reconciles instead of cancel-all/replace-all - resting orders still
+        within tolerance of their target level are kept (queue priority), only
+        the changed levels are cancelled/placed, in batch requests.
+        """
         # TASK 10: If ALL orders paused due to strong trend, don't place anything
         if self.orders_paused and self.pause_side == 'ALL':
+            self._cancel_all_orders()
             logger.info(f"  Grid SKIPPED: Strong trend detected, all orders paused")
             return
 
@@ -519,11 +631,7 @@ class GridMarketMakerLive:
         spread_pct = self.current_spread_bps / 10000
         # DYNAMIC BALANCE: Fetch fresh balance for inventory calculations
         # (Don't use cached self.capital - balance may have changed from deposits/withdrawals)
-        try:
-            account = self.client.api_client.fetch_account_summary()
-            current_balance = float(account.account_value) if account else self.capital
-        except:
-            current_balance = self.capital
+        current_balance = self._get_balance()
         max_inventory = current_balance * (self.max_inventory_pct / 100)
 
         # Calculate inventory ratio (signed: positive=long, negative=short)
@@ -557,7 +665,7 @@ class GridMarketMakerLive:
             buy_mult = 1.3
             sell_mult = max(min_mult, 0.3)
 
-        orders_placed = 0
+        targets: List[GridLevel] = []
 
         # Place BUY orders (below mid) - skip if paused
         if not (self.orders_paused and self.pause_side == 'BUY') and buy_mult > 0:
@@ -589,29 +697,7 @@ class GridMarketMakerLive:
                     logger.debug(f"  Skip BUY L{i}: ${potential:.2f} would exceed ${max_inventory:.2f} limit")
                     continue
 
-                try:
-                    order = Order(
-                        market=self.symbol,
-                        order_type=OrderType.Limit,
-                        order_side=OrderSide.Buy,
-                        size=size_dec,
-                        limit_price=price_dec,
-                        client_id=f"grid_buy_{i}_{int(time.time())}",
-                        instruction="POST_ONLY",  # Maker-only: reject if would cross spread
-                    )
-                    result = self.client.api_client.submit_order(order)
-                    if result.get('status') in ['NEW', 'OPEN']:
-                        self.open_orders[result.get('id')] = {
-                            'side': 'BUY',
-                            'price': float(price_dec),
-                            'size': float(size_dec),
-                            'level': i
-                        }
-                        orders_placed += 1
-                    else:
-                        logger.warning(f"BUY order rejected: {result}"[:100])
-                except Exception as e:
-                    logger.warning(f"BUY error L{i}: size={size_dec} price={price_dec}: {e}"[:100])
+                targets.append(GridLevel('BUY', float(price_dec), float(size_dec), i))
 
         # Place SELL orders (above mid) - skip if paused
         if not (self.orders_paused and self.pause_side == 'SELL') and sell_mult > 0:
@@ -643,33 +729,124 @@ class GridMarketMakerLive:
                     logger.debug(f"  Skip SELL L{i}: ${potential:.2f} would exceed -${max_inventory:.2f} limit")
                     continue
 
+                targets.append(GridLevel('SELL', float(price_dec), float(size_dec), i))
+
+        # v19: Diff against resting orders; keep levels within a quarter of the spread (min 1 tick)
+        tolerance = max(self.tick_size, mid_price * self.current_spread_bps / 10000 * self.reconcile_tolerance)
+        plan = plan_grid(targets, self.open_orders, price_tolerance=tolerance)
+
+        if plan.cancel:
+            cancelled = self._cancel_orders(plan.cancel)
+            for order_id in cancelled:
+                info = self.open_orders.pop(order_id, None)
+                if info is not None:
+                    self._remember_closed({order_id: info})
+            if self.metrics is not None:
+                self.metrics.orders(cancelled=len(cancelled))
+        orders_placed = self._submit_levels(plan.place) if plan.place else 0
+
+        self.grid_center = mid_price
+        if self.metrics is not None:
+            self.metrics.orders(placed=orders_placed, rejected=len(plan.place) - orders_placed)
+            self.metrics.requoted()
+        if plan.changes > 0:
+            logger.info(f"  Grid: {orders_placed} orders placed around ${mid_price:,.2f} (spread: {self.current_spread_bps:.1f}bps) [{plan.summary()}]")
+
+    def _build_order(self, level: GridLevel) -> Order:
+        """POST_ONLY limit order for one grid level"""
+        side = 'buy' if level.side == 'BUY' else 'sell'
+        return Order(
+            market=self.symbol,
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy if level.side == 'BUY' else OrderSide.Sell,
+            size=Decimal(str(level.size)),
+            limit_price=Decimal(str(level.price)),
+            client_id=f"grid_{side}_{level.level}_{int(time.time())}",
+            instruction="POST_ONLY",  # Maker-only: reject if would cross spread
+        )
+
+    def _submit_levels(self, levels: List[GridLevel]) -> int:
+        """
+        Submit grid levels in one batch request (or concurrently if batching fails)
+
+        Returns:
+            Number of orders accepted
+        """
+        api = self.client.api_client
+        orders = [self._build_order(level) for level in levels]
+        results = None
+
+        submit_batch = getattr(api, 'submit_orders_batch', None)
+        if submit_batch and len(orders) > 1:
+            try:
+                with self._api('place_batch'):
+                    response = submit_batch(orders) or {}
+                by_client_id = {o.get('client_id'): o for o in response.get('orders') or [] if o}
+                if len(by_client_id) < len(orders):
+                    # Unmatched entries may still have been accepted - look them up so none are orphaned
+                    live = self.client.api_client.fetch_orders(params={'market': self.symbol}) or {}
+                    for o in live.get('results') or []:
+                        if o.get('status') in ['NEW', 'OPEN']:
+                            by_client_id.setdefault(o.get('client_id'), o)
+                results = [by_client_id.get(order.client_id) for order in orders]
+            except Exception as e:
+                logger.warning(f"Batch submit error, falling back to single orders: {e}"[:100])
+
+        if results is None:
+            def _submit(order):
                 try:
-                    order = Order(
-                        market=self.symbol,
-                        order_type=OrderType.Limit,
-                        order_side=OrderSide.Sell,
-                        size=size_dec,
-                        limit_price=price_dec,
-                        client_id=f"grid_sell_{i}_{int(time.time())}",
-                        instruction="POST_ONLY",  # Maker-only: reject if would cross spread
-                    )
-                    result = self.client.api_client.submit_order(order)
-                    if result.get('status') in ['NEW', 'OPEN']:
-                        self.open_orders[result.get('id')] = {
-                            'side': 'SELL',
-                            'price': float(price_dec),
-                            'size': float(size_dec),
-                            'level': i
-                        }
-                        orders_placed += 1
-                    else:
-                        logger.warning(f"SELL order rejected: {result}"[:100])
+                    with self._api('place'):
+                        return api.submit_order(order)
                 except Exception as e:
-                    logger.warning(f"SELL error L{i}: size={size_dec} price={price_dec}: {e}"[:100])
+                    return {'error': str(e)}
 
-        self.grid_center = mid_price
-        if orders_placed > 0:
-            logger.info(f"  Grid: {orders_placed} orders placed around ${mid_price:,.2f} (spread: {self.current_spread_bps:.1f}bps)")
+            with ThreadPoolExecutor(max_workers=min(8, len(orders))) as pool:
+                results = list(pool.map(_submit, orders))
+
+        placed = 0
+        for level, result in zip(levels, results):
+            if result and result.get('status') in ['NEW', 'OPEN']:
+                self.open_orders[result.get('id')] = level.to_order_info()
+                placed += 1
+            else:
+                logger.warning(f"{level.side} L{level.level} rejected: size={level.size} price={level.price}: {result}"[:100])
+        return placed
+
+    def _cancel_orders(self, order_ids: List[str]) -> List[str]:
+        """
+        Cancel specific orders in one batch request (or concurrently if batching fails)
+
+        Returns:
+            Order ids that were cancelled
+        """
+        api = self.client.api_client
+        cancelled: List[str] = []
+
+        cancel_batch = getattr(api, 'cancel_orders_batch', None)
+        if cancel_batch and len(order_ids) > 1:
+            try:
+                with self._api('cancel_batch'):
+                    response = cancel_batch(order_ids=list(order_ids))
+                # Only ids the response confirms; unmentioned ones are retried singly
+                cancelled, order_ids = parse_batch_cancel(response, order_ids)
+                if not order_ids:
+                    return cancelled
+                logger.debug(f"Batch cancel unconfirmed for {len(order_ids)} orders, retrying singly")
+            except Exception as e:
+                logger.debug(f"Batch cancel error, falling back to single cancels: {e}")
+
+        def _cancel(order_id):
+            try:
+                with self._api('cancel'):
+                    api.cancel_order(order_id=order_id)
+                return True
+            except Exception as e:
+                logger.debug(f"Cancel error for {order_id}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(8, len(order_ids))) as pool:
+            ok = list(pool.map(_cancel, order_ids))
+        return cancelled + [order_id for order_id, done in zip(order_ids, ok) if done]
 
     def _check_fill_rate_alert(self):
         """
@@ -703,7 +880,8 @@ class GridMarketMakerLive:
         """Check for filled orders and update stats. Also sync open_orders with exchange."""
         fills = 0
         try:
-            orders = self.client.api_client.fetch_orders(params={'market': self.symbol})
+            with self._api('sync'):
+                orders = self.client.api_client.fetch_orders(params={'market': self.symbol})
             exchange_order_ids = set()
 
             if orders and orders.get('results'):
@@ -716,22 +894,17 @@ class GridMarketMakerLive:
                         exchange_order_ids.add(order_id)
 
                     if order_id in self.open_orders and status == 'CLOSED':
-                        # Order filled!
-                        info = self.open_orders[order_id]
+                        # Order filled! Count only the size fill events haven't already
+                        info = self.open_orders.pop(order_id)
                         filled_size = float(order.get('filled_size', 0))
                         fill_price = float(order.get('avg_fill_price', info['price']))
 
-                        notional = filled_size * fill_price
-                        self.total_volume += notional
-                        self.fills_count += 1
-                        fills += 1
-
-                        # NP-004: Track last fill time
-                        self.last_fill_time = datetime.now()
-                        self.no_fill_alert_triggered = False
-
-                        logger.info(f"  FILL: {info['side']} {filled_size:.6f} @ ${fill_price:,.2f} (${notional:,.2f})")
-                        del self.open_orders[order_id]
+                        counted = self._fill_ledger.get(order_id) or 0.0
+                        self._remember(self._fill_ledger, order_id, None)
+                        unseen = filled_size - counted
+                        if unseen > self.step_size / 2:
+                            self._record_fill(info['side'], unseen, fill_price)
+                            fills += 1
 
             # Sync: remove tracked orders that no longer exist on exchange
             stale_orders = [oid for oid in self.open_orders if oid not in exchange_order_ids]
@@ -743,15 +916,218 @@ class GridMarketMakerLive:
 
         return fills
 
+    def _on_market_tick(self, bid: float, ask: float, fills: int, cycle: int, sample: bool = True):
+        """
+        Grid decision logic for one market update
+
+        Args:
+            bid: Best bid
+            ask: Best ask
+            fills: Fills seen since the previous tick
+            cycle: Tick counter (status log every 30)
+            sample: Append the mid to price_history (once per second, keeps ROC at 1/sec)
+        """
+        mid = (bid + ask) / 2
+        spread_bps = (ask - bid) / mid * 10000
+
+        if sample:
+            self.price_history.append(mid)
+
+        # v20: Realized spread against this mid for fills seen since the last tick
+        if self.metrics is not None:
+            for side, size, price in self._unpriced_fills:
+                self.metrics.fill(side, size, price, mid)
+        self._unpriced_fills.clear()
+
+        # Calculate ROC and update pause state
+        roc = self._calculate_roc()
+        self._update_pause_state(roc)
+
+        # v17: Update tight spread mode based on low-ROC periods (NP-002)
+        self._update_tight_spread_mode(roc)
+
+        # Refresh grid on price move or fills (matches v8 paper trading logic)
+        price_move_pct = abs(mid - self.grid_center) / self.grid_center * 100 if self.grid_center else 0
+
+        # Calculate inventory ratio for force reset (use fresh balance)
+        loop_balance = self._get_balance()
+        max_inventory = loop_balance * (self.max_inventory_pct / 100)
+        inventory_ratio = abs(self.position_notional) / max_inventory if max_inventory > 0 else 0
+
+        # Safety check: refresh if no tracked orders (external cancel/expire)
+        no_tracked_orders = len(self.open_orders) == 0
+        not_fully_paused = not (self.orders_paused and self.pause_side == 'ALL')
+
+        # v15: Time-based refresh check (US-002)
+        time_since_refresh = (datetime.now() - self.last_refresh_time).total_seconds() if self.last_refresh_time else 0
+        time_based_refresh = time_since_refresh >= self.time_refresh_interval
+
+        # v16: Check for stale orders (US-003)
+        # If any tracked order is >0.2% from mid price, trigger immediate refresh
+        stale_order_info = self._check_stale_orders(mid)
+        stale_order_refresh = stale_order_info is not None
+
+        should_refresh = (
+            fills > 0 or
+            price_move_pct >= self.grid_reset_pct or  # 0.5% price move (v10 behavior)
+            inventory_ratio > 0.8 or  # Inventory force reset at 80%
+            (no_tracked_orders and not_fully_paused) or  # Re-place if orders disappeared
+            time_based_refresh or  # v15: Refresh every 5 minutes regardless of price/fills
+            stale_order_refresh  # v16: Refresh if orders are stale
+        )
+
+        if should_refresh:
+            trigger = 'fill'
+            if stale_order_refresh:
+                stale_price, stale_dist = stale_order_info
+                logger.info(f"  Stale order refresh: order at ${stale_price:,.2f} is {stale_dist:.2f}% from mid")
+                trigger = 'stale'
+            elif price_move_pct >= self.grid_reset_pct:
+                logger.info(f"  Grid reset: price moved {price_move_pct:.3f}%")
+                trigger = 'price_move'
+            elif inventory_ratio > 0.8:
+                logger.info(f"  Grid reset: inventory at {inventory_ratio*100:.0f}%")
+                trigger = 'inventory'
+            elif no_tracked_orders and not_fully_paused:
+                logger.info(f"  Grid reset: no active orders, re-placing grid")
+                trigger = 'empty'
+            elif time_based_refresh:
+                logger.info(f"  Time-based refresh: {time_since_refresh:.0f}s since last placement")
+                trigger = 'timer'
+            if self.metrics is not None:
+                self.metrics.refresh(trigger)
+            self._sync_position()
+            self._place_grid_orders(mid, roc)
+            self.last_refresh_time = datetime.now()  # v15: Update refresh time
+
+        # Self-learning check (every 30 min - read user notes)
+        time_since_learning = (datetime.now() - self.last_self_learning_time).total_seconds()
+        if time_since_learning >= self.self_learning_interval:
+            self._run_self_learning_check()
+
+        # NP-004: Check fill rate alert
+        self._check_fill_rate_alert()
+
+        if self.metrics is not None:
+            bids = sum(1 for info in self.open_orders.values() if info['side'] == 'BUY')
+            self.metrics.state(
+                bids, len(self.open_orders) - bids, self.position_size, self.position_notional,
+                self.current_spread_bps, self.orders_paused,
+                pnl=self.current_balance - self.initial_balance if self.initial_balance else None
+            )
+
+        # Status log every 30 seconds
+        if sample and cycle % 30 == 0:
+            # Update balance
+            try:
+                account = self.client.api_client.fetch_account_summary()
+                self.current_balance = float(account.account_value)
+            except:
+                pass
+
+            pnl = self.current_balance - self.initial_balance
+            elapsed = (datetime.now() - self.start_time).total_seconds() / 60
+            inv_pct = abs(self.position_notional) / self.capital * 100 if self.capital > 0 else 0
+            pause_status = f"PAUSE-{self.pause_side}" if self.orders_paused else "LIVE"
+
+            # NP-004: Calculate fill rate
+            fill_rate = self._get_fill_rate_per_hour()
+
+            logger.info(f"\n[{elapsed:.1f}m] ${mid:,.2f} | Mkt: {spread_bps:.1f}bps | Bot: {self.current_spread_bps:.1f}bps | ROC: {roc:+.1f}bps | {pause_status}")
+            logger.info(f"  Position: {self.position_size:.6f} BTC ({inv_pct:.0f}% inv)")
+            logger.info(f"  Volume: ${self.total_volume:,.2f} | Fills: {self.fills_count} ({fill_rate:.1f}/hr)")
+            logger.info(f"  P&L: ${pnl:+.2f} (${self.current_balance:.2f})")
+
+            if self.total_volume > 0:
+                profit_per_10k = pnl / self.total_volume * 10000
+                logger.info(f"  Efficiency: ${profit_per_10k:+.2f} per $10k vol")
+            if self.stream is not None:
+                feed_status = "REST fallback" if self.using_rest_fallback else "streaming"
+                logger.info(f"  Feed: {self.feed} {feed_status} | events: {self.stream.events_received} (dropped {self.stream.events_dropped})")
+            self._export_metrics()
+
+    def _apply_stream_event(self, event) -> int:
+        """
+        Apply an order/fill event to local state
+
+        Fills are counted per execution (partial fills included) for orders
+        this grid placed; CLOSED order updates just stop tracking the order.
+
+        Returns:
+            Number of fills recorded
+        """
+        if isinstance(event, FillUpdate):
+            info = self.open_orders.get(event.order_id) or self.recently_closed.get(event.order_id)
+            if info is None:
+                return 0  # Not a grid order (e.g. position close at startup)
+            if event.fill_id in self._seen_fill_ids:
+                return 0  # Replayed after a reconnect
+            self._remember(self._seen_fill_ids, event.fill_id, None, limit=1000)
+
+            counted = self._fill_ledger.get(event.order_id, 0.0)
+            if counted is None:
+                return 0  # Late fill for an order REST reconciliation already counted in full
+            self._remember(self._fill_ledger, event.order_id, counted + event.size)
+            self._record_fill(info['side'], event.size, event.price)
+            return 1
+
+        if isinstance(event, OrderUpdate) and event.status == 'CLOSED':
+            info = self.open_orders.pop(event.order_id, None)
+            if info is not None:
+                self._remember_closed({event.order_id: info})
+        return 0
+
+    def _record_fill(self, side: str, size: float, price: float):
+        """Add one fill to the stats (counted once, whichever path saw it first)"""
+        notional = size * price
+        self.total_volume += notional
+        self.fills_count += 1
+        self._unpriced_fills.append((side, size, price))
+
+        # NP-004: Track last fill time
+        self.last_fill_time = datetime.now()
+        self.no_fill_alert_triggered = False
+
+        logger.info(f"  FILL: {side} {size:.6f} @ ${price:,.2f} (${notional:,.2f})")
+
+    @staticmethod
+    def _remember(cache: Dict, key, value, limit: int = 500):
+        """Insert into an insertion-ordered dict, evicting the oldest entries past limit"""
+        cache.pop(key, None)
+        cache[key] = value
+        while len(cache) > limit:
+            cache.pop(next(iter(cache)))
+
+    def _remember_closed(self, orders: Dict[str, Dict]):
+        """Keep the last 100 closed/canceled orders so late fill events can be attributed"""
+        for order_id, info in orders.items():
+            self._remember(self.recently_closed, order_id, info, limit=100)
+
+    def _fetch_bbo_rest(self) -> Optional[tuple]:
+        """REST BBO (fallback path): (bid, ask) or None"""
+        try:
+            with self._api('bbo'):
+                bbo = self.client.api_client.fetch_bbo(market=self.symbol)
+        except Exception as e:
+            logger.warning(f"BBO error: {e}")
+            return None
+        if not bbo:
+            return None
+        return float(bbo['bid']), float(bbo['ask'])
+
     def run(self):
         """Main trading loop"""
+        if self.feed != "rest":
+            asyncio.run(self.run_streaming())
+            return
+
         try:
             if not self.initialize():
                 return
+            self._start_metrics()
 
             end_time = self.start_time + timedelta(minutes=self.duration_minutes)
             cycle = 0
-            grid_reset_pct = 0.50  # v10: 0.5% price move - less whipsawing
 
             logger.info(f"\nStarting live trading until {end_time.strftime('%H:%M:%S')}...")
             logger.info("-" * 70)
@@ -765,7 +1141,8 @@ class GridMarketMakerLive:
 
                 # Get current BBO
                 try:
-                    bbo = self.client.api_client.fetch_bbo(market=self.symbol)
+                    with self._api('bbo'):
+                        bbo = self.client.api_client.fetch_bbo(market=self.symbol)
                 except Exception as e:
                     logger.warning(f"BBO error: {e}")
                     time.sleep(2)
@@ -775,106 +1152,10 @@ class GridMarketMakerLive:
                     time.sleep(1)
                     continue
 
-                bid = float(bbo['bid'])
-                ask = float(bbo['ask'])
-                mid = (bid + ask) / 2
-                spread_bps = (ask - bid) / mid * 10000
-
-                self.price_history.append(mid)
-
-                # Calculate ROC and update pause state
-                roc = self._calculate_roc()
-                self._update_pause_state(roc)
-
-                # v17: Update tight spread mode based on low-ROC periods (NP-002)
-                self._update_tight_spread_mode(roc)
-
                 # Check for fills
                 fills = self._check_fills()
 
-                # Refresh grid on price move or fills (matches v8 paper trading logic)
-                price_move_pct = abs(mid - self.grid_center) / self.grid_center * 100 if self.grid_center else 0
-
-                # Calculate inventory ratio for force reset (use fresh balance)
-                try:
-                    loop_account = self.client.api_client.fetch_account_summary()
-                    loop_balance = float(loop_account.account_value) if loop_account else self.capital
-                except:
-                    loop_balance = self.capital
-                max_inventory = loop_balance * (self.max_inventory_pct / 100)
-                inventory_ratio = abs(self.position_notional) / max_inventory if max_inventory > 0 else 0
-
-                # Safety check: refresh if no tracked orders (external cancel/expire)
-                no_tracked_orders = len(self.open_orders) == 0
-                not_fully_paused = not (self.orders_paused and self.pause_side == 'ALL')
-
-                # v15: Time-based refresh check (US-002)
-                time_since_refresh = (datetime.now() - self.last_refresh_time).total_seconds() if self.last_refresh_time else 0
-                time_based_refresh = time_since_refresh >= self.time_refresh_interval
-
-                # v16: Check for stale orders (US-003)
-                # If any tracked order is >0.2% from mid price, trigger immediate refresh
-                stale_order_info = self._check_stale_orders(mid)
-                stale_order_refresh = stale_order_info is not None
-
-                should_refresh = (
-                    fills > 0 or
-                    price_move_pct >= grid_reset_pct or  # 0.5% price move (v10 behavior)
-                    inventory_ratio > 0.8 or  # Inventory force reset at 80%
-                    (no_tracked_orders and not_fully_paused) or  # Re-place if orders disappeared
-                    time_based_refresh or  # v15: Refresh every 5 minutes regardless of price/fills
-                    stale_order_refresh  # v16: Refresh if orders are stale
-                )
-
-                if should_refresh:
-                    if stale_order_refresh:
-                        stale_price, stale_dist = stale_order_info
-                        logger.info(f"  Stale order refresh: order at ${stale_price:,.2f} is {stale_dist:.2f}% from mid")
-                    elif price_move_pct >= grid_reset_pct:
-                        logger.info(f"  Grid reset: price moved {price_move_pct:.3f}%")
-                    elif inventory_ratio > 0.8:
-                        logger.info(f"  Grid reset: inventory at {inventory_ratio*100:.0f}%")
-                    elif no_tracked_orders and not_fully_paused:
-                        logger.info(f"  Grid reset: no active orders, re-placing grid")
-                    elif time_based_refresh:
-                        logger.info(f"  Time-based refresh: {time_since_refresh:.0f}s since last placement")
-                    self._sync_position()
-                    self._place_grid_orders(mid, roc)
-                    self.last_refresh_time = datetime.now()  # v15: Update refresh time
-
-                # Self-learning check (every 30 min - read user notes)
-                time_since_learning = (datetime.now() - self.last_self_learning_time).total_seconds()
-                if time_since_learning >= self.self_learning_interval:
-                    self._run_self_learning_check()
-
-                # NP-004: Check fill rate alert
-                self._check_fill_rate_alert()
-
-                # Status log every 30 seconds
-                if cycle % 30 == 0:
-                    # Update balance
-                    try:
-                        account = self.client.api_client.fetch_account_summary()
-                        self.current_balance = float(account.account_value)
-                    except:
-                        pass
-
-                    pnl = self.current_balance - self.initial_balance
-                    elapsed = (datetime.now() - self.start_time).total_seconds() / 60
-                    inv_pct = abs(self.position_notional) / self.capital * 100 if self.capital > 0 else 0
-                    pause_status = f"PAUSE-{self.pause_side}" if self.orders_paused else "LIVE"
-
-                    # NP-004: Calculate fill rate
-                    fill_rate = self._get_fill_rate_per_hour()
-
-                    logger.info(f"\n[{elapsed:.1f}m] ${mid:,.2f} | Mkt: {spread_bps:.1f}bps | Bot: {self.current_spread_bps:.1f}bps | ROC: {roc:+.1f}bps | {pause_status}")
-                    logger.info(f"  Position: {self.position_size:.6f} BTC ({inv_pct:.0f}% inv)")
-                    logger.info(f"  Volume: ${self.total_volume:,.2f} | Fills: {self.fills_count} ({fill_rate:.1f}/hr)")
-                    logger.info(f"  P&L: ${pnl:+.2f} (${self.current_balance:.2f})")
-
-                    if self.total_volume > 0:
-                        profit_per_10k = pnl / self.total_volume * 10000
-                        logger.info(f"  Efficiency: ${profit_per_10k:+.2f} per $10k vol")
+                self._on_market_tick(float(bbo['bid']), float(bbo['ask']), fills, cycle)
 
                 time.sleep(1)
 
@@ -889,6 +1170,115 @@ class GridMarketMakerLive:
             logger.info("\nCleaning up - canceling open orders...")
             self._cancel_all_orders()
             self._print_report()
+            self._stop_metrics()
+
+    async def run_streaming(self):
+        """
+        v18: Event-driven trading loop on the websocket (or local) feed
+
+        Grid logic runs once per second (ROC sample + status, same as REST mode)
+        and immediately on fills or when the new BBO leaves a quote stale.
+        Blocking REST calls (order placement, position sync) run in a worker
+        thread while the loop waits, so state is never mutated concurrently.
+        """
+        try:
+            if not self.initialize():
+                return
+            self._start_metrics()
+            await self.stream.start()
+
+            end_time = self.start_time + timedelta(minutes=self.duration_minutes)
+            cycle = 0
+            pending_fills = 0
+            last_sample = time.monotonic()
+            last_reconcile = last_sample
+            stale_since = None
+
+            logger.info(f"\nStarting live trading ({self.feed} feed) until {end_time.strftime('%H:%M:%S')}...")
+            logger.info("-" * 70)
+
+            # Place initial grid
+            await asyncio.to_thread(self._place_grid_orders, self.grid_center)
+            self.last_refresh_time = datetime.now()  # v15: Track refresh time
+
+            while datetime.now() < end_time:
+                wait = max(0.0, 1.0 - (time.monotonic() - last_sample))
+                event = await self.stream.next_event(timeout=wait)
+
+                urgent = False
+                if event is not None:
+                    fills = self._apply_stream_event(event)
+                    pending_fills += fills
+                    urgent = fills > 0 or (
+                        isinstance(event, BBOUpdate) and self._check_stale_orders(event.mid) is not None
+                    )
+
+                now = time.monotonic()
+                sample = now - last_sample >= 1.0
+                if not (sample or urgent):
+                    continue
+                if sample:
+                    last_sample = now
+                    cycle += 1
+
+                # REST fallback while the stream is stale/disconnected
+                if self.stream.is_stale(self.stream_stale_seconds):
+                    if not self.using_rest_fallback:
+                        logger.warning(f"  ⚠️ Stream stale >{self.stream_stale_seconds:.0f}s - REST polling fallback")
+                        self.using_rest_fallback = True
+                    stale_since = stale_since or now
+                    if now - stale_since >= self.stream_reconnect_seconds:
+                        logger.info("  🔄 Reconnecting market stream...")
+                        await self.stream.stop()
+                        await self.stream.start()
+                        stale_since = now
+                    if not sample:
+                        continue
+                    bbo = await asyncio.to_thread(self._fetch_bbo_rest)
+                    pending_fills += await asyncio.to_thread(self._check_fills)
+                    last_reconcile = now
+                    if bbo is None:
+                        continue
+                    bid, ask = bbo
+                else:
+                    if self.using_rest_fallback:
+                        logger.info("  ✅ Stream recovered - back to websocket data")
+                        self.using_rest_fallback = False
+                    stale_since = None
+                    # Periodic REST reconciliation catches any missed order/fill messages
+                    if sample and now - last_reconcile >= self.rest_reconcile_interval:
+                        pending_fills += await asyncio.to_thread(self._check_fills)
+                        last_reconcile = now
+                    last_bbo = self.stream.last_bbo
+                    if last_bbo is None:
+                        # Order/fill events can arrive before the first BBO: poll REST until then
+                        if not sample:
+                            continue
+                        bbo = await asyncio.to_thread(self._fetch_bbo_rest)
+                        if bbo is None:
+                            continue
+                        bid, ask = bbo
+                    else:
+                        bid, ask = last_bbo.bid, last_bbo.ask
+
+                await asyncio.to_thread(self._on_market_tick, bid, ask, pending_fills, cycle, sample)
+                pending_fills = 0
+
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            logger.info("\nStopping by user request...")
+        except Exception as e:
+            logger.error(f"Error: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            # Cleanup
+            if self.stream is not None:
+                await self.stream.stop()
+            if self.client is not None:
+                logger.info("\nCleaning up - canceling open orders...")
+                self._cancel_all_orders()
+                self._print_report()
+            self._stop_metrics()
 
     def _print_report(self):
         """Print final report"""
@@ -903,7 +1293,7 @@ class GridMarketMakerLive:
         pnl = self.current_balance - self.initial_balance
 
         logger.info("\n" + "=" * 70)
-        logger.info("GRID MM v17 LIVE - FINAL REPORT")
+        logger.info("GRID MM v20 LIVE - FINAL REPORT")
         logger.info("=" * 70)
         logger.info(f"Duration: {elapsed:.1f} minutes")
         logger.info(f"Total Volume: ${self.total_volume:,.2f}")
@@ -943,17 +1333,36 @@ def main():
     - ROC 15-30 bps → 6 bps spread (moderate volatility)
     - ROC 30-50 bps → 10 bps spread (high volatility)
     - ROC >50 bps → PAUSE orders
+
+    Market data: --feed ws (default, websocket + REST fallback), rest (1s polling)
+    or local (random-walk feed + paper client, no real orders).
     """
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--feed', choices=FEEDS, default='ws', help='Market data source')
+    parser.add_argument('--duration', type=int, default=525600, help='Duration in minutes')
+    parser.add_argument('--history-file', default=None,
+                        help='Memory-mapped price history (restarts skip the 3-minute ROC warm-up)')
+    parser.add_argument('--metrics-port', type=int, default=int(os.getenv('GRID_METRICS_PORT', DEFAULT_PORT)),
+                        help='Serve Prometheus metrics on 127.0.0.1:PORT/metrics (0 = off)')
+    parser.add_argument('--metrics-file', default=None,
+                        help='Also write metrics here every 30s (node_exporter textfile collector)')
+    args = parser.parse_args()
+
     mm = GridMarketMakerLive(
         symbol="BTC-USD-PERP",
         base_spread_bps=8.0,        # v11: 8 bps (15 too wide) per Qwen
         order_size_usd=100.0,       # $100 per order
         num_levels=2,               # 2 levels per side
-        duration_minutes=525600,    # Run indefinitely (1 year)
+        duration_minutes=args.duration,  # Default: run indefinitely (1 year)
         max_inventory_pct=100.0,    # v10: lower leverage
         capital=105.0,              # $105 account
         roc_threshold_bps=50.0,     # v10: real trends only per Qwen
         min_pause_duration=300,     # v10: 5 min pause per Qwen
+        feed=args.feed,
+        history_path=args.history_file,
+        metrics_port=args.metrics_port,
+        metrics_file=args.metrics_file,
     )
     mm.run()
 
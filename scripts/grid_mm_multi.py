@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Multi-venue Grid Market Maker
+
+Runs any number of grid markets across Paradex, Nado, Hibachi and Extended
+in ONE process on ONE event loop, using the shared engine in core/grid_mm.
+Each market is a GridEngine; markets on the same venue share one adapter
+(one login, one connection pool). Strategy parameters come from the venue
+presets in core/grid_mm/config.py (same bands as the single-venue scripts).
+
+Usage:
+    python3 scripts/grid_mm_multi.py --bot paradex:BTC-USD-PERP --bot hibachi:BTC/USDT-P
+    python3 scripts/grid_mm_multi.py --bot nado:ETH-PERP --bot extended:BTC-USD --duration 60
+    python3 scripts/grid_mm_multi.py --bot local:BTC-USD-PERP --bot local:ETH-USD-PERP   # paper
+    python3 scripts/grid_mm_multi.py --bot paradex:BTC-USD-PERP --history-dir data/grid_state
+    python3 scripts/grid_mm_multi.py --bot paradex:BTC-USD-PERP --metrics-file /var/lib/node_exporter/grid.prom
+
+'local:SYMBOL' quotes against the in-memory Paradex paper client driven by a
+random-walk feed - no credentials, no real orders.
+
+--history-dir keeps each market's ROC price window in a memory-mapped file,
+so a restart resumes dynamic spreads immediately instead of re-warming.
+
+Quoting metrics (fills, quote uptime, time-to-requote, API latency, order
+counts, inventory, realized spread) are served Prometheus-style at
+http://127.0.0.1:9320/metrics (--metrics-port, 0 = off) and optionally
+written to a textfile every --metrics-interval seconds.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+from core.grid_mm import GridRunner, MetricsRegistry, ParadexAdapter, parse_bot_spec, preset_for
+from core.grid_mm.metrics import DEFAULT_PORT
+from dexes.paradex import LocalMarketFeed, LocalParadexClient
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+LOCAL_START_PRICES = {"BTC": 100000.0, "ETH": 3500.0, "SOL": 200.0}
+
+
+def _local_market(symbol: str, feeds: list) -> ParadexAdapter:
+    """Paper adapter + random-walk feed for one local market"""
+    start_price = LOCAL_START_PRICES.get(symbol.split('-')[0].upper(), 100.0)
+    client = LocalParadexClient(symbol, balance=1000.0, tick_size=start_price / 100000)
+    feeds.append(LocalMarketFeed(symbol, start_price=start_price, interval=0.5, exchange=client))
+    return ParadexAdapter(client, name="local")
+
+
+async def run(specs, duration_minutes: float, history_dir=None, metrics_port: int = 0,
+              metrics_file=None, metrics_interval: float = 15.0):
+    registry = MetricsRegistry() if metrics_port or metrics_file else None
+    runner = GridRunner(history_dir=history_dir, metrics=registry)
+    feeds = []
+    for spec in specs:
+        venue, symbol = parse_bot_spec(spec)
+        if venue == "local":
+            runner.add(venue, symbol, config=preset_for("paradex"), adapter=_local_market(symbol, feeds))
+        else:
+            runner.add(venue, symbol)
+
+    async def drain(feed):
+        # Engines poll the paper client; feed events are only its side effect
+        while True:
+            await feed.next_event(timeout=1.0)
+
+    async def export_textfile():
+        while True:
+            await asyncio.sleep(metrics_interval)
+            registry.write_textfile(metrics_file)
+
+    for feed in feeds:
+        await feed.start()
+    tasks = [asyncio.create_task(drain(feed)) for feed in feeds]
+    if registry is not None:
+        registry.start_http_server(metrics_port)
+        if metrics_file:
+            tasks.append(asyncio.create_task(export_textfile()))
+    try:
+        await runner.run(duration=duration_minutes * 60 if duration_minutes else None)
+    finally:
+        for task in tasks:
+            task.cancel()
+        for feed in feeds:
+            await feed.stop()
+        if registry is not None:
+            if metrics_file:
+                registry.write_textfile(metrics_file)
+            registry.stop_http_server()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run grid market makers for several venues/symbols in one process")
+    parser.add_argument('--bot', action='append', required=True, metavar='VENUE:SYMBOL',
+                        help='Market to quote, e.g. paradex:BTC-USD-PERP (repeatable; venues: '
+                             'paradex, nado, hibachi, extended, local)')
+    parser.add_argument('--duration', type=float, default=0, help='Duration in minutes (0 = until Ctrl+C)')
+    parser.add_argument('--history-dir', default=None,
+                        help='Persist price histories here (e.g. data/grid_state or /dev/shm/grid_state)')
+    parser.add_argument('--metrics-port', type=int, default=int(os.getenv('GRID_METRICS_PORT', DEFAULT_PORT)),
+                        help='Serve Prometheus metrics on 127.0.0.1:PORT/metrics (0 = off)')
+    parser.add_argument('--metrics-file', default=None,
+                        help='Also write metrics to this file (node_exporter textfile collector)')
+    parser.add_argument('--metrics-interval', type=float, default=15.0, help='Seconds between metrics file writes')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args.bot, args.duration, args.history_dir, args.metrics_port,
+                        args.metrics_file, args.metrics_interval))
+    except KeyboardInterrupt:
+        logger.info("Interrupted")
+
+
+if __name__ == "__main__":
+    main()
@@ -61,6 +61,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from dexes.nado.nado_sdk import NadoSDK
+from core.grid_reconciler import GridLevel, plan_grid
 
 
 class GridMarketMakerNado:
@@ -99,6 +100,7 @@ class GridMarketMakerNado:
         self.sdk: Optional[NadoSDK] = None
         self.grid_center = None
         self.open_orders: Dict[str, Dict] = {}  # digest -> order info
+        self.reconcile_tolerance = 0.25  # Grid unchanged if every order is within 25% of spread of its level
         self.price_history: deque = deque(maxlen=360)  # 6 minutes at 1/sec
 
         # Trend detection
@@ -581,12 +583,19 @@ class GridMarketMakerNado:
             self.open_orders.clear()
 
     async def _place_grid_orders(self, mid_price: float, roc: float = 0.0):
-        """Place grid orders with dynamic spread based on volatility (ROC)"""
-        # First cancel existing orders
-        await self._cancel_all_orders()
-
+        """
+        Place grid orders with dynamic spread based on volatility (ROC)
+
+        The target ladder is diffed against tracked orders first: if every
+        level is still resting within tolerance the refresh is a no-op and the
+        orders keep their queue priority. Otherwise the grid is replaced, with
+        all levels submitted concurrently. Nado only exposes cancel-all, and
+        orders can briefly vanish from get_orders(), so a partial update could
+        leave duplicates on the book.
+        """
         # If ALL orders paused, don't place anything
         if self.orders_paused and self.pause_side == 'ALL':
+            await self._cancel_all_orders()
             logger.info(f"  Grid SKIPPED: Strong trend, all orders paused")
             return
 
@@ -637,7 +646,7 @@ class GridMarketMakerNado:
             buy_mult = 1.3
             sell_mult = max(min_mult, 0.3)
 
-        orders_placed = 0
+        targets: List[GridLevel] = []
 
         # Place BUY orders
         if not (self.orders_paused and self.pause_side == 'BUY') and buy_mult > 0:
@@ -661,23 +670,7 @@ class GridMarketMakerNado:
                 if potential > max_inventory:
                     continue
 
-                try:
-                    result = await self.sdk.create_limit_order(
-                        symbol=self.symbol,
-                        is_buy=True,
-                        amount=size,
-                        price=price,
-                        order_type="POST_ONLY"  # Maker-only: reject if would cross spread
-                    )
-                    if result and result.get('status') == 'success':
-                        digest = result.get('data', {}).get('digest', str(time.time()))
-                        self.open_orders[digest] = {
-                            'side': 'BUY', 'price': price, 'size': size
-                        }
-                        orders_placed += 1
-                        logger.debug(f"  BUY {size:.4f} @ ${price:,.2f}")
-                except Exception as e:
-                    logger.debug(f"BUY L{i} error: {e}")
+                targets.append(GridLevel('BUY', price, size, i))
 
         # Place SELL orders
         if not (self.orders_paused and self.pause_side == 'SELL') and sell_mult > 0:
@@ -701,23 +694,25 @@ class GridMarketMakerNado:
                 if potential < -max_inventory:
                     continue
 
-                try:
-                    result = await self.sdk.create_limit_order(
-                        symbol=self.symbol,
-                        is_buy=False,
-                        amount=size,
-                        price=price,
-                        order_type="POST_ONLY"  # Maker-only: reject if would cross spread
-                    )
-                    if result and result.get('status') == 'success':
-                        digest = result.get('data', {}).get('digest', str(time.time()))
-                        self.open_orders[digest] = {
-                            'side': 'SELL', 'price': price, 'size': size
-                        }
-                        orders_placed += 1
-                        logger.debug(f"  SELL {size:.4f} @ ${price:,.2f}")
-                except Exception as e:
-                    logger.debug(f"SELL L{i} error: {e}")
+                targets.append(GridLevel('SELL', price, size, i))
+
+        tolerance = max(self.tick_size, mid_price * self.current_spread_bps / 10000 * self.reconcile_tolerance)
+        plan = plan_grid(targets, self.open_orders, price_tolerance=tolerance)
+        if plan.changes == 0:
+            self.grid_center = mid_price
+            logger.info(f"  Grid unchanged: {len(plan.keep)} orders still within tolerance")
+            return
+
+        await self._cancel_all_orders()
+        results = await asyncio.gather(*(self._place_order(level) for level in targets), return_exceptions=True)
+        orders_placed = 0
+        for level, digest in zip(targets, results):
+            if isinstance(digest, Exception):
+                logger.debug(f"{level.side} L{level.level} error: {digest}")
+            elif digest:
+                self.open_orders[digest] = {'side': level.side, 'price': level.price, 'size': level.size}
+                orders_placed += 1
+                logger.debug(f"  {level.side} {level.size:.4f} @ ${level.price:,.2f}")
 
         self.grid_center = mid_price
         if orders_placed > 0:
@@ -725,6 +720,19 @@ class GridMarketMakerNado:
             # v14: Set cooldown to allow orders to propagate before checking fills
             self.skip_fill_check_cycles = 3  # Skip fill check for 3 seconds
 
+    async def _place_order(self, level: GridLevel) -> Optional[str]:
+        """Submit one POST_ONLY grid level; returns the order digest or None"""
+        result = await self.sdk.create_limit_order(
+            symbol=self.symbol,
+            is_buy=level.side == 'BUY',
+            amount=level.size,
+            price=level.price,
+            order_type="POST_ONLY"  # Maker-only: reject if would cross spread
+        )
+        if result and result.get('status') == 'success':
+            return result.get('data', {}).get('digest', str(time.time()))
+        return None
+
     def _check_fill_rate_alert(self):
         """
         NP-004: Check fill rate and alert if 0 fills for >30 minutes.
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Grid MM Tick Recorder + Offline Simulator
+
+record: capture BBO (and trade prints on Paradex's websocket) to a compact
+        binary .ticks file
+replay: run the shared GridEngine over a recording, thousands of times
+        faster than real time
+sweep:  replay a parameter grid across a process pool
+
+Usage:
+    python3 scripts/grid_mm_sim.py record --bot paradex:BTC-USD-PERP --minutes 60
+    python3 scripts/grid_mm_sim.py record --bot hibachi:BTC/USDT-P --minutes 60 --poll 0.5
+    python3 scripts/grid_mm_sim.py replay data/ticks/paradex_BTC-USD-PERP_20251201_120000.ticks --venue paradex
+    python3 scripts/grid_mm_sim.py sweep data/ticks/paradex_BTC-USD-PERP_20251201_120000.ticks --venue paradex \\
+        --grid base_spread_bps=1,1.5,2,3 --grid roc_threshold_bps=20,35,50 --grid inventory_reduce_ratio=0.5,0.7
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+from core.grid_mm import ADAPTERS, MarketInfo, TickRecorder, load_ticks, parse_bot_spec, preset_for, tick_path
+from core.grid_mm.sim import replay, sweep
+from core.grid_mm.ticks import record_paradex_ws, record_polling
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+async def record(spec: str, minutes: float, out_dir: str, poll: float):
+    venue, symbol = parse_bot_spec(spec)
+    adapter = ADAPTERS[venue]()
+    await adapter.connect()
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(minutes * 60, stop.set)
+
+    try:
+        with TickRecorder(tick_path(out_dir, venue, symbol)) as recorder:
+            if venue == "paradex" and not poll:
+                await record_paradex_ws(adapter.client, symbol, recorder, stop)
+            else:
+                await record_polling(adapter, symbol, recorder, stop, interval=poll or 0.5)
+    finally:
+        await adapter.close()
+
+
+def parse_grid(specs):
+    """--grid field=v1,v2,... -> {field: [values]}"""
+    grid = {}
+    for spec in specs or []:
+        name, _, values = spec.partition('=')
+        grid[name.strip()] = [float(v) for v in values.split(',')]
+    return grid
+
+
+def print_row(row, keys=()):
+    params = " ".join(f"{k}={row[k]}" for k in keys)
+    print(f"  {params:<50} P&L ${row['pnl']:+8.2f} | fills {row['fills']:5d} | vol ${row['volume']:>11,.0f} | "
+          f"fees ${row['fees']:+.2f} | max inv ${row['max_inventory']:,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record ticks and replay the grid market maker offline")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help="Record BBO/trades from a venue")
+    rec.add_argument('--bot', required=True, metavar='VENUE:SYMBOL')
+    rec.add_argument('--minutes', type=float, default=60)
+    rec.add_argument('--out', default='data/ticks')
+    rec.add_argument('--poll', type=float, default=0.0,
+                     help="Poll BBO every N seconds (default: websocket on Paradex, 0.5s elsewhere)")
+
+    for name in ('replay', 'sweep'):
+        sim = sub.add_parser(name)
+        sim.add_argument('ticks', help=".ticks recording")
+        sim.add_argument('--venue', default='paradex', help="Preset to start from")
+        sim.add_argument('--tick-size', type=float, default=0.1)
+        sim.add_argument('--step-size', type=float, default=0.0001)
+        sim.add_argument('--min-notional', type=float, default=10.0)
+        sim.add_argument('--balance', type=float, default=1000.0)
+        sim.add_argument('--maker-fee-bps', type=float, default=0.0, help="Negative for a rebate")
+        sim.add_argument('--latency', type=float, default=0.05, help="Order placement latency (s)")
+        if name == 'sweep':
+            sim.add_argument('--grid', action='append', required=True,
+                             help="field=v1,v2,... (GridConfig field or base_spread_bps; repeatable)")
+            sim.add_argument('--workers', type=int, default=None)
+            sim.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        try:
+            asyncio.run(record(args.bot, args.minutes, args.out, args.poll))
+        except KeyboardInterrupt:
+            logger.info("Interrupted")
+        return
+
+    ticks = load_ticks(args.ticks)
+    market = MarketInfo(args.tick_size, args.step_size, args.min_notional)
+    sim_kwargs = dict(initial_balance=args.balance, maker_fee_bps=args.maker_fee_bps, latency=args.latency)
+    base = preset_for(args.venue)
+
+    if args.command == 'replay':
+        stats = replay(ticks, base, market, **sim_kwargs)
+        print(f"\nReplayed {stats['sim_hours']:.2f}h in {stats['wall_seconds']:.2f}s ({stats['speedup']:,.0f}x)")
+        print_row(stats)
+        return
+
+    grid = parse_grid(args.grid)
+    results = sweep(ticks, base, market, grid, workers=args.workers, **sim_kwargs)
+    print(f"\nTop {min(args.top, len(results))} of {len(results)} combos:")
+    for row in results[:args.top]:
+        print_row(row, grid)
+
+
+if __name__ == "__main__":
+    main()
@@ -46,6 +46,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from paradex_py import Paradex
+from core.grid_mm.price_ring import PriceRing
 
 
 class GridMarketMakerV2:
@@ -69,6 +70,7 @@ class GridMarketMakerV2:
         capital: float = 1000.0,
         volatility_window: int = 30,           # 30 samples for volatility calc
         volatility_multiplier: float = 1.5,   # Spread multiplier based on vol
+        history_path: Optional[str] = None,   # mmap file keeping price history across restarts
     ):
         self.symbol = symbol
         self.base_spread_bps = base_spread_bps
@@ -89,7 +91,7 @@ class GridMarketMakerV2:
         self.sell_orders: List[Dict] = []
 
         # Price history for volatility and trend detection
-        self.price_history: deque = deque(maxlen=volatility_window)
+        self.price_history = PriceRing(volatility_window, path=history_path)
         self.market_spread_history: deque = deque(maxlen=volatility_window)  # Track market spread
         self.current_spread_bps = base_spread_bps
         self.current_market_spread_bps = 0.5  # Will be updated from live data
@@ -154,17 +156,8 @@ class GridMarketMakerV2:
         if len(self.price_history) < 5:
             return 0.0
 
-        prices = list(self.price_history)
-        returns = []
-        for i in range(1, len(prices)):
-            ret = abs(prices[i] - prices[i-1]) / prices[i-1] * 10000  # bps
-            returns.append(ret)
-
-        if not returns:
-            return 0.0
-
         # Use average absolute return as volatility proxy
-        return sum(returns) / len(returns)
+        return self.price_history.mean_abs_return_bps()
 
     def _calculate_trend(self) -> float:
         """
@@ -175,16 +168,8 @@ class GridMarketMakerV2:
         if len(self.price_history) < 10:
             return 0.0
 
-        prices = list(self.price_history)
-        # Compare recent prices (last 5) to earlier prices (5 before that)
-        recent_avg = sum(prices[-5:]) / 5
-        earlier_avg = sum(prices[-10:-5]) / 5
-
-        if earlier_avg == 0:
-            return 0.0
-
-        # Trend strength in bps
-        trend_bps = (recent_avg - earlier_avg) / earlier_avg * 10000
+        # Compare recent prices (last 5) to earlier prices (5 before that), in bps
+        trend_bps = self.price_history.trend_bps(10)
         self.trend_strength = trend_bps
         return trend_bps
 
@@ -197,14 +182,7 @@ class GridMarketMakerV2:
         if len(self.price_history) < 10:
             return 0.0
 
-        prices = list(self.price_history)
-        current_price = prices[-1]
-        price_10s_ago = prices[-10]
-
-        if price_10s_ago == 0:
-            return 0.0
-
-        roc_bps = (current_price - price_10s_ago) / price_10s_ago * 10000
+        roc_bps = self.price_history.roc_bps(10)
         self.roc_bps = roc_bps
         return roc_bps
 
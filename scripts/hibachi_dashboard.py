@@ -61,6 +61,7 @@ class HibachiDashboard:
     def get_llm_stats(self, hours: int = 24) -> Dict:
         """Get LLM bot trading statistics."""
         cutoff = datetime.now() - timedelta(hours=hours)
+        self.tracker.refresh()  # the bots log trades from other processes
         trades = [t for t in self.tracker.trades if t.get('status') == 'closed']
 
         # Filter by time
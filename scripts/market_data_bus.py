@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Host Market Data Bus
+
+serve:  run the daemon; every bot on this host that finds its socket reads
+        candles, funding, OI and sentiment from it instead of polling the
+        upstream APIs itself
+status: print the running daemon's topics, subscribers and fetch counters
+
+Usage:
+    python3 scripts/market_data_bus.py serve
+    python3 scripts/market_data_bus.py status
+    MARKET_DATA_BUS=off python3 -m hibachi_agent.bot_hibachi   # opt a bot out
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.market_bus import DEFAULT_SOCKET_PATH, MarketDataBusClient, MarketDataDaemon
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+async def serve(args):
+    daemon = MarketDataDaemon(path=args.socket, idle_grace=args.idle_grace, candle_limit=args.candle_limit)
+    await daemon.start()
+    try:
+        while True:
+            await asyncio.sleep(60)
+            stats = daemon.get_stats()
+            fetches = sum(t['fetches'] for t in stats['topics'].values())
+            logger.info(f"📊 {stats['clients']} clients | {len(stats['topics'])} topics | {fetches} upstream fetches")
+    finally:
+        await daemon.stop()
+
+
+async def status(args):
+    client = MarketDataBusClient(args.socket)
+    stats = await client.daemon_stats()
+    await client.close()
+    if stats is None:
+        print(f"No market data bus running at {args.socket}")
+        return
+    print(json.dumps(stats, indent=2, default=str))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared market data daemon for all bots on this host")
+    parser.add_argument('--socket', default=os.getenv("MARKET_DATA_BUS", DEFAULT_SOCKET_PATH))
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    srv = sub.add_parser('serve', help="Run the daemon")
+    srv.add_argument('--idle-grace', type=float, default=300.0,
+                     help="Seconds to keep polling a topic after its last subscriber leaves")
+    srv.add_argument('--candle-limit', type=int, default=200, help="Candles kept per candles topic")
+
+    sub.add_parser('status', help="Show the running daemon's topics")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args) if args.command == 'serve' else status(args))
+    except KeyboardInterrupt:
+        logger.info("Interrupted")
+
+
+if __name__ == "__main__":
+    main()
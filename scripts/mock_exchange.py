@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Local Mock Exchange
+
+serve: run the mock Hibachi/Extended/Lighter/Paradex server and print the
+       environment overrides that point the SDKs (and every bot built on
+       them) at it
+bench: fire limit orders through the unchanged HibachiSDK and report
+       orders/sec and request latency
+
+Usage:
+    python3 scripts/mock_exchange.py serve --port 8900 --latency-ms 20 --jitter-ms 30 --error-rate 0.01
+    HIBACHI_API_URL=http://127.0.0.1:8900/hibachi HIBACHI_DATA_API_URL=http://127.0.0.1:8900/hibachi \\
+        python3 scripts/grid_mm_multi.py --bot hibachi:BTC/USDT-P
+    python3 scripts/mock_exchange.py bench --orders 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dexes.hibachi.hibachi_sdk import HibachiSDK
+from dexes.mock_exchange import VENUES, MockExchangeServer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+
+async def serve(args):
+    async with MockExchangeServer(
+        venues=args.venues, host=args.host, port=args.port, latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000, error_rate=args.error_rate, step_interval=args.step,
+        funding_interval=args.funding_interval, seed=args.seed,
+    ) as server:
+        print("\nPoint the SDKs at the mock venue with:")
+        for key, value in server.env_vars().items():
+            print(f"  export {key}={value}")
+        if "paradex" in server.exchanges:
+            print(f"  (Paradex REST: {server.base_url('paradex')})")
+        print()
+        while True:
+            await asyncio.sleep(60)
+            stats = server.get_stats()
+            fills = sum(v['fills'] for v in stats['venues'].values())
+            logger.info(f"📊 {stats['requests']} requests | {stats['injected_errors']} injected errors | {fills} fills")
+
+
+async def bench(args):
+    server = None
+    url = args.url
+    if not url:
+        server = MockExchangeServer(venues=["hibachi"], latency=args.latency_ms / 1000, step_interval=0)
+        await server.start()
+        url = server.base_url("hibachi")
+
+    sdk = HibachiSDK("bench", "bench", "1", max_connections_per_host=args.concurrency,
+                     base_url=url, data_api_url=url)
+    price = await sdk.get_price(args.symbol)
+    if not price:
+        logger.error(f"❌ No price for {args.symbol} at {url}")
+        return
+    bid = round(price * 0.9, 1)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def place():
+        async with semaphore:
+            result = await sdk.create_limit_order(args.symbol, True, args.size, bid)
+            return bool(result and 'orderId' in result)
+
+    logging.getLogger('dexes.hibachi.hibachi_sdk').setLevel(logging.WARNING)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(place() for _ in range(args.orders)))
+    elapsed = time.perf_counter() - start
+    cancelled = await sdk.cancel_all_orders(args.symbol)
+
+    print(f"\n{sum(results)}/{args.orders} orders accepted in {elapsed:.2f}s "
+          f"({args.orders / elapsed:,.0f} orders/s, concurrency {args.concurrency}); cancelled {cancelled}")
+    for endpoint, stats in sdk.get_latency_stats().items():
+        print(f"  {endpoint:<32} {stats['count']:6d} req | avg {stats['avg_ms']:6.2f}ms | max {stats['max_ms']:7.2f}ms")
+
+    await sdk.close()
+    if server:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock exchange for Hibachi, Extended, Lighter and Paradex")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    srv = sub.add_parser('serve', help="Run the mock venue server")
+    srv.add_argument('--host', default='127.0.0.1')
+    srv.add_argument('--port', type=int, default=8900)
+    srv.add_argument('--venues', nargs='+', default=list(VENUES), choices=list(VENUES))
+    srv.add_argument('--latency-ms', type=float, default=0.0)
+    srv.add_argument('--jitter-ms', type=float, default=0.0)
+    srv.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 503")
+    srv.add_argument('--step', type=float, default=1.0, help="Seconds between house requotes")
+    srv.add_argument('--funding-interval', type=float, default=3600.0)
+    srv.add_argument('--seed', type=int, default=None)
+
+    bch = sub.add_parser('bench', help="Load-test order entry through HibachiSDK")
+    bch.add_argument('--url', default=None, help="Running mock's Hibachi URL (default: start one in-process)")
+    bch.add_argument('--orders', type=int, default=2000)
+    bch.add_argument('--concurrency', type=int, default=20)
+    bch.add_argument('--symbol', default='BTC/USDT-P')
+    bch.add_argument('--size', type=float, default=0.001)
+    bch.add_argument('--latency-ms', type=float, default=0.0)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args) if args.command == 'serve' else bench(args))
+    except KeyboardInterrupt:
+        logger.info("Interrupted")
+
+
+if __name__ == "__main__":
+    main()
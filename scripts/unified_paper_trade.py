@@ -10,14 +10,23 @@ Simulates:
 - Sentiment-aware decision making
 - 2-hour test duration
 
-Usage: python3.11 scripts/unified_paper_trade.py
+Each exchange runs its own fetch + exit-check task (every --poll seconds)
+alongside the LLM decision task (every --cycle minutes), all on one shared
+clock. Live runs record every fetch; --replay fast-forwards a recording on
+a virtual clock, so comparing a configuration costs LLM time instead of
+the run's wall-clock length. Replays still use live sentiment and shared
+learning. --fill picks the fill model (mid price, or bid/ask touch).
+
+Usage:
+    python3.11 scripts/unified_paper_trade.py
+    python3.11 scripts/unified_paper_trade.py --replay logs/paper_quotes/unified_20260101_120000.jsonl --fill touch
 """
 
 import os
 import sys
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from dotenv import load_dotenv
@@ -48,6 +57,20 @@ logging.getLogger('aiohttp').setLevel(logging.WARNING)
 from llm_agent.data.sentiment_fetcher import SentimentFetcher
 from llm_agent.shared_learning import SharedLearning
 from llm_agent.llm import LLMTradingAgent
+from core.paper_sim import (
+    FILL_MODELS,
+    FillModel,
+    MidFill,
+    QuoteRecorder,
+    RecordedFeed,
+    ReplayClock,
+    WallClock,
+    load_recording,
+    recording_span,
+)
+
+VENUES = ('hibachi', 'extended', 'paradex')
+RECORD_DIR = 'logs/paper_quotes'
 
 
 class PaperPosition:
@@ -89,15 +112,18 @@ class PaperPosition:
             return 0
         return ((self.current_price - self.entry_price) / self.entry_price) * 100
 
-    def hold_hours(self) -> float:
-        return (datetime.now() - self.entry_time).total_seconds() / 3600
+    def hold_hours(self, now: Optional[datetime] = None) -> float:
+        return ((now or datetime.now()) - self.entry_time).total_seconds() / 3600
 
 
 class ExchangeSimulator:
     """Simulates trading on a single exchange"""
 
-    def __init__(self, name: str, initial_balance: float = 100.0):
+    def __init__(self, name: str, initial_balance: float = 100.0, clock=None,
+                 fill_model: Optional[FillModel] = None):
         self.name = name
+        self.clock = clock or WallClock()
+        self.fill_model = fill_model or MidFill()
         self.initial_balance = initial_balance
         self.balance = initial_balance
         self.positions: Dict[str, PaperPosition] = {}
@@ -110,12 +136,16 @@ class ExchangeSimulator:
         self.max_hold_hours = 48.0
         self.cut_loser_hours = 4.0
 
-    def open_position(self, symbol: str, side: str, price: float,
+    def open_position(self, symbol: str, side: str, quote: Dict,
                       notional: float, leverage: int = 10) -> bool:
-        """Open a new leveraged paper position"""
+        """Open a new leveraged paper position, filled by the fill model"""
         if symbol in self.positions:
             return False
 
+        price = self.fill_model.price(side == 'LONG', quote)
+        if not price:
+            return False
+
         margin = notional / leverage  # e.g., $300 / 10 = $30 margin
 
         # Check if we have enough balance
@@ -130,7 +160,7 @@ class ExchangeSimulator:
             notional=notional,
             margin=margin,
             leverage=leverage,
-            entry_time=datetime.now(),
+            entry_time=self.clock.now(),
             exchange=self.name
         )
         self.total_volume += notional  # Track notional volume
@@ -139,12 +169,15 @@ class ExchangeSimulator:
         logger.info(f"  [{self.name}] OPEN {side} {symbol} @ ${price:,.2f} (${notional:.0f} notional, {leverage}x)")
         return True
 
-    def close_position(self, symbol: str, price: float, reason: str) -> Optional[float]:
-        """Close a paper position and return P&L"""
+    def close_position(self, symbol: str, quote: Dict, reason: str) -> Optional[float]:
+        """Close a paper position (filled by the fill model) and return P&L"""
         if symbol not in self.positions:
             return None
 
         pos = self.positions[symbol]
+        price = self.fill_model.price(pos.side == 'SHORT', quote)
+        if not price:
+            return None
         pos.update_price(price)
         pnl = pos.get_pnl()
         pnl_pct = pos.get_pnl_pct()
@@ -162,9 +195,9 @@ class ExchangeSimulator:
             'notional': pos.notional,
             'pnl': pnl,
             'pnl_pct': pnl_pct,
-            'hold_hours': pos.hold_hours(),
+            'hold_hours': pos.hold_hours(self.clock.now()),
             'reason': reason,
-            'timestamp': datetime.now()
+            'timestamp': self.clock.now()
         })
 
         emoji = "✅" if pnl > 0 else "❌"
@@ -173,15 +206,16 @@ class ExchangeSimulator:
         del self.positions[symbol]
         return pnl
 
-    def check_exits(self, prices: Dict[str, float]) -> List[Tuple[str, str]]:
-        """Check positions for exit conditions, return list of (symbol, reason)"""
+    def check_exits(self, quotes: Dict[str, Dict]) -> List[Tuple[str, str]]:
+        """Mark positions to the latest quotes, return list of (symbol, reason) to exit"""
         exits = []
+        now = self.clock.now()
 
         for symbol, pos in list(self.positions.items()):
-            if symbol in prices:
-                pos.update_price(prices[symbol])
+            if symbol in quotes:
+                pos.update_price(quotes[symbol]['price'])
                 pnl_pct = pos.get_pnl_pct()
-                hold_hours = pos.hold_hours()
+                hold_hours = pos.hold_hours(now)
 
                 # Take Profit
                 if pnl_pct >= self.take_profit_pct:
@@ -224,15 +258,52 @@ class ExchangeSimulator:
 class UnifiedPaperTrader:
     """Orchestrates paper trading across all exchanges"""
 
-    def __init__(self, duration_hours: float = 2.0, cycle_minutes: int = 10):
+    def __init__(self, duration_hours: float = 2.0, cycle_minutes: int = 10,
+                 poll_seconds: float = 60.0, fill_model: str = 'mid', slippage_bps: float = 0.0,
+                 record_path: Optional[str] = None, replay_path: Optional[str] = None):
+        """
+        Args:
+            duration_hours: Simulated duration (capped at the recording's length in replay)
+            cycle_minutes: Minutes between LLM decision cycles
+            poll_seconds: Seconds between each exchange's fetch + exit check
+            fill_model: Key in FILL_MODELS ('mid' or 'touch')
+            slippage_bps: Adverse slippage applied to every fill
+            record_path: JSONL file to record live fetches to (None = don't record)
+            replay_path: Recording to fast-forward through instead of live data
+        """
         self.duration_hours = duration_hours
         self.cycle_minutes = cycle_minutes
+        self.poll_seconds = poll_seconds
         self.start_time = None
+        self.end_ts = None
+
+        # Shared clock: virtual time over a recording, wall time live
+        self.recording = load_recording(replay_path) if replay_path else None
+        self.replay_path = replay_path
+        if self.recording:
+            # Start once every exchange has its first snapshot
+            self.clock = ReplayClock(start=max(snaps[0][0] for snaps in self.recording.values()))
+        else:
+            self.clock = WallClock()
+        self.recorder = QuoteRecorder(record_path) if record_path and not replay_path else None
+        self.fill_model = FILL_MODELS[fill_model](slippage_bps=slippage_bps)
 
         # Initialize exchanges
-        self.hibachi = ExchangeSimulator("Hibachi", 100.0)
-        self.extended = ExchangeSimulator("Extended", 100.0)
-        self.paradex = ExchangeSimulator("Paradex", 100.0)
+        self.hibachi = ExchangeSimulator("Hibachi", 100.0, self.clock, self.fill_model)
+        self.extended = ExchangeSimulator("Extended", 100.0, self.clock, self.fill_model)
+        self.paradex = ExchangeSimulator("Paradex", 100.0, self.clock, self.fill_model)
+        self.exchanges = {'hibachi': self.hibachi, 'extended': self.extended, 'paradex': self.paradex}
+
+        # Per-exchange feeds and their latest fetch
+        if self.recording:
+            self.feeds = {v: RecordedFeed(self.recording.get(v, []), self.clock).fetch for v in VENUES}
+        else:
+            self.feeds = {
+                'hibachi': self.fetch_hibachi_data,
+                'extended': self.fetch_extended_data,
+                'paradex': self.fetch_paradex_data,
+            }
+        self.latest: Dict[str, Dict] = {v: {} for v in VENUES}
 
         # Shared components
         self.sentiment_fetcher = SentimentFetcher()
@@ -276,12 +347,23 @@ class UnifiedPaperTrader:
         logger.info("UNIFIED PAPER TRADING TEST")
         logger.info("=" * 70)
         logger.info(f"Duration: {self.duration_hours} hours")
-        logger.info(f"Cycle: {self.cycle_minutes} minutes")
+        logger.info(f"Cycle: {self.cycle_minutes} minutes (exits checked every {self.poll_seconds:.0f}s per exchange)")
+        logger.info(f"Fill model: {type(self.fill_model).__name__} (+{self.fill_model.slippage_bps} bps slippage)")
+        if self.recording:
+            start, end = recording_span(self.recording)
+            logger.info(f"⏩ FAST-FORWARD: replaying {self.replay_path} ({(end - start) / 3600:.2f}h recorded)")
+        elif self.recorder:
+            logger.info(f"📼 Recording fetches to {self.recorder.path}")
         logger.info(f"Balance: $100 per exchange ($300 total)")
         logger.info(f"Position Sizing: balance × {self.base_pct} × {self.base_leverage}-5x leverage")
         logger.info(f"  → With $100: ${100 * self.base_pct * self.base_leverage:.0f} to ${100 * self.base_pct * 5:.0f} notional")
         logger.info("=" * 70)
 
+        self.start_time = self.clock.now()
+        if self.recording:
+            logger.info("=" * 70)
+            return
+
         # Initialize Hibachi - using REST API directly (no SDK needed for paper trading)
         logger.info("✅ Hibachi data via REST API (no SDK needed for paper trade)")
 
@@ -316,7 +398,6 @@ class UnifiedPaperTrader:
         except Exception as e:
             logger.error(f"❌ Paradex init failed: {e}")
 
-        self.start_time = datetime.now()
         logger.info("=" * 70)
 
     async def fetch_hibachi_data(self) -> Dict[str, Dict]:
@@ -329,7 +410,7 @@ class UnifiedPaperTrader:
             base_url = "https://data-api.hibachi.xyz"
 
             async with aiohttp.ClientSession() as session:
-                for symbol in symbols:
+                async def fetch_symbol(symbol: str):
                     try:
                         url = f"{base_url}/market/data/prices?symbol={symbol}"
 
@@ -344,6 +425,8 @@ class UnifiedPaperTrader:
                                     }
                     except Exception as e:
                         logger.debug(f"Hibachi {symbol} fetch error: {e}")
+
+                await asyncio.gather(*(fetch_symbol(s) for s in symbols))
         except Exception as e:
             logger.warning(f"Hibachi data error: {e}")
 
@@ -357,7 +440,8 @@ class UnifiedPaperTrader:
 
         try:
             markets = ['BTC-USD', 'ETH-USD', 'SOL-USD']
-            for market in markets:
+
+            async def fetch_market(market: str):
                 try:
                     # Use the SDK's market price method
                     price = await self.extended_client._get_market_price(market)
@@ -368,6 +452,8 @@ class UnifiedPaperTrader:
                         }
                 except Exception as e:
                     logger.debug(f"Extended {market} error: {e}")
+
+            await asyncio.gather(*(fetch_market(m) for m in markets))
         except Exception as e:
             logger.warning(f"Extended data error: {e}")
 
@@ -380,7 +466,8 @@ class UnifiedPaperTrader:
             return data
 
         try:
-            bbo = self.paradex_client.api_client.fetch_bbo(market="BTC-USD-PERP")
+            # Sync SDK call: keep it off the loop the other exchanges share
+            bbo = await asyncio.to_thread(self.paradex_client.api_client.fetch_bbo, market="BTC-USD-PERP")
             if bbo:
                 bid = float(bbo['bid'])
                 ask = float(bbo['ask'])
@@ -397,17 +484,39 @@ class UnifiedPaperTrader:
 
         return data
 
-    async def fetch_all_data(self) -> Dict[str, Dict]:
-        """Fetch data from all exchanges"""
-        hibachi_data = await self.fetch_hibachi_data()
-        extended_data = await self.fetch_extended_data()
-        paradex_data = await self.fetch_paradex_data()
+    async def refresh_venue(self, venue: str) -> Dict[str, Dict]:
+        """Fetch one exchange's data (recording it on live runs)"""
+        data = await self.feeds[venue]()
+        self.latest[venue] = data
+        if self.recorder and data:
+            self.recorder.record(venue, self.clock.time(), data)
+        return data
 
-        return {
-            'hibachi': hibachi_data,
-            'extended': extended_data,
-            'paradex': paradex_data
-        }
+    async def fetch_all_data(self) -> Dict[str, Dict]:
+        """Fetch data from all exchanges concurrently"""
+        await asyncio.gather(*(self.refresh_venue(v) for v in VENUES))
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Latest data from every exchange"""
+        return {venue: dict(self.latest[venue]) for venue in VENUES}
+
+    def process_exits(self, venue: str):
+        """Close any position on this exchange that hit an exit rule"""
+        exchange = self.exchanges[venue]
+        quotes = self.latest[venue]
+        for symbol, reason in exchange.check_exits(quotes):
+            exchange.close_position(symbol, quotes[symbol], reason)
+
+    async def venue_loop(self, venue: str):
+        """One exchange's own fetch + exit-check task"""
+        while self.clock.time() < self.end_ts:
+            await self.clock.sleep(self.poll_seconds)
+            try:
+                await self.refresh_venue(venue)
+                self.process_exits(venue)
+            except Exception as e:
+                logger.warning(f"{venue} update error: {e}")
 
     async def get_sentiment(self) -> Dict:
         """Fetch market sentiment"""
@@ -504,7 +613,7 @@ REASON: [brief explanation]
             # Add explicit instruction to avoid reasoning-only mode
             prompt += "\n\nIMPORTANT: Output your response directly. Do not think internally - output the EXCHANGE/SYMBOL/ACTION/CONFIDENCE/REASON format immediately."
 
-            result = self.llm_agent.model_client.query(
+            result = await self.llm_agent.model_client.aquery(
                 prompt=prompt,
                 max_tokens=800,  # Increased to give room for actual output
                 temperature=0.3
@@ -563,25 +672,7 @@ REASON: [brief explanation]
         return decisions
 
     async def execute_cycle(self, all_data: Dict):
-        """Execute one trading cycle"""
-
-        # Check exits first
-        hibachi_prices = {s: d['price'] for s, d in all_data.get('hibachi', {}).items()}
-        extended_prices = {s: d['price'] for s, d in all_data.get('extended', {}).items()}
-        paradex_prices = {s: d['price'] for s, d in all_data.get('paradex', {}).items()}
-
-        # Process exits
-        for symbol, reason in self.hibachi.check_exits(hibachi_prices):
-            if symbol in hibachi_prices:
-                self.hibachi.close_position(symbol, hibachi_prices[symbol], reason)
-
-        for symbol, reason in self.extended.check_exits(extended_prices):
-            if symbol in extended_prices:
-                self.extended.close_position(symbol, extended_prices[symbol], reason)
-
-        for symbol, reason in self.paradex.check_exits(paradex_prices):
-            if symbol in paradex_prices:
-                self.paradex.close_position(symbol, paradex_prices[symbol], reason)
+        """Execute one trading cycle (exits run in each exchange's own task)"""
 
         # Get sentiment
         sentiment = await self.get_sentiment()
@@ -601,17 +692,11 @@ REASON: [brief explanation]
                 continue
 
             # Map to correct exchange
-            if 'hibachi' in exchange_name:
-                exchange = self.hibachi
-                prices = hibachi_prices
-            elif 'extended' in exchange_name:
-                exchange = self.extended
-                prices = extended_prices
-            elif 'paradex' in exchange_name:
-                exchange = self.paradex
-                prices = paradex_prices
-            else:
+            venue = next((v for v in VENUES if v in exchange_name), None)
+            if venue is None:
                 continue
+            exchange = self.exchanges[venue]
+            quotes = all_data.get(venue, {})
 
             # Check if we can trade
             if len(exchange.positions) >= self.max_positions_per_exchange:
@@ -631,9 +716,9 @@ REASON: [brief explanation]
                 logger.info(f"  [{exchange.name}] BLOCKED: {block_reason}")
                 continue
 
-            # Get price
-            price = prices.get(symbol)
-            if not price:
+            # Get quote
+            quote = quotes.get(symbol)
+            if not quote:
                 continue
 
             # Calculate dynamic position size (matches Extended executor logic)
@@ -657,14 +742,15 @@ REASON: [brief explanation]
             logger.info(f"    Sizing: ${exchange.balance:.0f} × {self.base_pct} × {leverage:.1f}x = ${position_notional:.0f} notional")
             logger.info(f"    Reason: {reason[:80]}...")
 
-            exchange.open_position(symbol, side, price, position_notional, int(leverage))
+            if not exchange.open_position(symbol, side, quote, position_notional, int(leverage)):
+                continue
 
             # Record in shared learning
             self.shared_learning.register_position(base_symbol, direction, "orchestrator")
 
     def print_status(self, cycle: int, all_data: Dict):
         """Print current status"""
-        elapsed = (datetime.now() - self.start_time).total_seconds() / 60
+        elapsed = (self.clock.now() - self.start_time).total_seconds() / 60
 
         logger.info("")
         logger.info("=" * 70)
@@ -690,7 +776,7 @@ REASON: [brief explanation]
             # Show open positions
             for symbol, pos in exchange.positions.items():
                 pnl_pct = pos.get_pnl_pct()
-                logger.info(f"       {pos.side} {symbol}: {pnl_pct:+.1f}% ({pos.hold_hours():.1f}h)")
+                logger.info(f"       {pos.side} {symbol}: {pnl_pct:+.1f}% ({pos.hold_hours(self.clock.now()):.1f}h)")
 
     def print_final_report(self):
         """Print final trading report"""
@@ -783,41 +869,48 @@ REASON: [brief explanation]
 
         return True
 
-    async def run(self):
-        """Main trading loop"""
-        await self.initialize()
-
-        end_time = self.start_time + timedelta(hours=self.duration_hours)
+    async def decision_loop(self):
+        """LLM decision task: trades on the latest data from every exchange"""
         cycle = 0
+        while self.clock.time() < self.end_ts:
+            cycle += 1
+            all_data = self.snapshot()
 
-        try:
-            while datetime.now() < end_time:
-                cycle += 1
+            # Health check - validate all exchanges have data
+            if cycle % 3 == 0:  # Check every 3rd cycle
+                logger.info("\n🔍 Periodic health check:")
+                self.health_check(all_data)
+
+            # Print status
+            self.print_status(cycle, all_data)
+
+            # Execute trading cycle
+            await self.execute_cycle(all_data)
 
-                # Fetch data
-                all_data = await self.fetch_all_data()
+            # Wait for next cycle
+            remaining = (self.end_ts - self.clock.time()) / 60
+            logger.info(f"\n⏳ {remaining:.0f} min remaining | Next cycle in {self.cycle_minutes} min...")
 
-                # Health check - validate all exchanges have data
-                if cycle == 1:
-                    logger.info("\n🔍 INITIAL HEALTH CHECK:")
-                    if not self.health_check(all_data):
-                        logger.error("Health check failed on first cycle - fix data issues before continuing!")
-                        return
-                elif cycle % 3 == 0:  # Check every 3rd cycle
-                    logger.info("\n🔍 Periodic health check:")
-                    self.health_check(all_data)
+            await self.clock.sleep(self.cycle_minutes * 60)
 
-                # Print status
-                self.print_status(cycle, all_data)
+    async def run(self):
+        """Run every exchange task and the decision task on the shared clock"""
+        await self.initialize()
 
-                # Execute trading cycle
-                await self.execute_cycle(all_data)
+        self.end_ts = self.clock.time() + self.duration_hours * 3600
+        if self.recording:
+            self.end_ts = min(self.end_ts, recording_span(self.recording)[1])
+        wall_start = datetime.now()
 
-                # Wait for next cycle
-                remaining = (end_time - datetime.now()).total_seconds() / 60
-                logger.info(f"\n⏳ {remaining:.0f} min remaining | Next cycle in {self.cycle_minutes} min...")
+        try:
+            # Health check - validate all exchanges have data
+            all_data = await self.fetch_all_data()
+            logger.info("\n🔍 INITIAL HEALTH CHECK:")
+            if not self.health_check(all_data):
+                logger.error("Health check failed on first cycle - fix data issues before continuing!")
+                return
 
-                await asyncio.sleep(self.cycle_minutes * 60)
+            await self.clock.run([self.venue_loop(v) for v in VENUES] + [self.decision_loop()])
 
         except KeyboardInterrupt:
             logger.info("\n👋 Stopping by user request...")
@@ -826,7 +919,11 @@ REASON: [brief explanation]
             import traceback
             traceback.print_exc()
         finally:
+            if self.recorder:
+                self.recorder.close()
             self.print_final_report()
+            simulated = (self.clock.now() - self.start_time).total_seconds() / 3600
+            logger.info(f"Simulated {simulated:.2f}h in {(datetime.now() - wall_start).total_seconds() / 60:.1f} min wall clock")
 
 
 async def main():
@@ -838,12 +935,34 @@ async def main():
                         help='Duration in hours (default: 2)')
     parser.add_argument('--cycle', type=int, default=10,
                         help='Cycle interval in minutes (default: 10)')
+    parser.add_argument('--poll', type=float, default=60.0,
+                        help='Per-exchange fetch + exit check interval in seconds (default: 60)')
+    parser.add_argument('--fill', choices=sorted(FILL_MODELS), default='mid',
+                        help='Fill model: mid = quote price, touch = bid/ask (default: mid)')
+    parser.add_argument('--slippage-bps', type=float, default=0.0,
+                        help='Adverse slippage per fill in bps (default: 0)')
+    parser.add_argument('--record', default=None,
+                        help=f'Record fetches here (default: {RECORD_DIR}/unified_<timestamp>.jsonl)')
+    parser.add_argument('--no-record', action='store_true',
+                        help='Do not record live fetches')
+    parser.add_argument('--replay', default=None,
+                        help='Fast-forward through a recording instead of live data')
 
     args = parser.parse_args()
 
+    record_path = None
+    if not args.replay and not args.no_record:
+        record_path = args.record or os.path.join(
+            RECORD_DIR, f"unified_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+
     trader = UnifiedPaperTrader(
         duration_hours=args.hours,
-        cycle_minutes=args.cycle
+        cycle_minutes=args.cycle,
+        poll_seconds=args.poll,
+        fill_model=args.fill,
+        slippage_bps=args.slippage_bps,
+        record_path=record_path,
+        replay_path=args.replay
     )
     await trader.run()
 
@@ -51,6 +51,14 @@ BOTS = [
         "restart": "nohup python3.11 -u scripts/grid_mm_extended.py > logs/grid_mm_extended.log 2>&1 &",
         "log": "logs/grid_mm_extended.log",
     },
+    # Single-process alternative to the grid entries above (remove those when enabling):
+    # {
+    #     "name": "Grid MM (multi-venue)",
+    #     "grep": "grid_mm_multi.py",
+    #     "restart": "nohup python3.11 -u scripts/grid_mm_multi.py --bot paradex:BTC-USD-PERP --bot nado:ETH-PERP "
+    #                "--bot hibachi:BTC/USDT-P --bot extended:BTC-USD > logs/grid_mm_multi.log 2>&1 &",
+    #     "log": "logs/grid_mm_multi.log",
+    # },
 ]
 
 
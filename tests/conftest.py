@@ -0,0 +1,11 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_trade_store(tmp_path, monkeypatch):
+    """Point the SQLite TradeStore at a per-test database instead of logs/trades.db"""
+    monkeypatch.setenv("TRADE_STORE_DB", str(tmp_path / "trades.db"))
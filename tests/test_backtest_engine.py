@@ -0,0 +1,74 @@
+"""
+Tests for the exit rule backtester (core/backtest)
+
+Run with: python -m pytest tests/test_backtest_engine.py -v
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import Candles, Entry, ExitParams, build_paths, replay_rules, run_vectorized, summarize, sweep
+from extended_agent.execution.strategy_b_exit_rules import StrategyBExitRules
+from hibachi_agent.execution.fast_exit_monitor import FastExitMonitor
+from hibachi_agent.execution.hard_exit_rules import HardExitRules
+from hibachi_agent.execution.strategy_a_exit_rules import StrategyAExitRules
+
+
+def synthetic_market(seed=7, days=6):
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 11, 1)
+    times = pd.date_range(start, periods=days * 288, freq='5min')
+    candles = {}
+    for symbol, vol in (('BTC', 0.004), ('SOL', 0.008)):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, vol, len(times))))
+        candles[symbol] = Candles.from_frame(symbol, pd.DataFrame({'timestamp': times, 'close': close}))
+
+    entries = [
+        Entry(symbol=str(rng.choice(['BTC', 'SOL'])), side=str(rng.choice(['LONG', 'SHORT'])),
+              time=start + timedelta(minutes=int(rng.integers(0, (days - 3) * 1440))))
+        for _ in range(60)
+    ]
+    return entries, candles
+
+
+def test_vectorized_matches_live_rules():
+    entries, candles = synthetic_market()
+    paths = build_paths(entries, candles, horizon_hours=60)
+    assert len(paths.entries) == 60
+
+    strategy_a = StrategyAExitRules()
+    cases = [
+        (ExitParams.strategy_a(), strategy_a, FastExitMonitor(None, None, strategy_a, None, enabled=False)),
+        (ExitParams.strategy_b(), StrategyBExitRules(), None),
+        (ExitParams.hard_rules(), HardExitRules(), None),
+    ]
+    for params, rules, monitor in cases:
+        fast = run_vectorized(paths, params)
+        live = replay_rules(paths, rules, monitor)
+        assert np.array_equal(fast.exit_idx, live.exit_idx), params
+        assert np.array_equal(fast.reason, live.reason), params
+        assert np.allclose(fast.net_pnl_pct, live.net_pnl_pct)
+        assert len(summarize(fast)['exits']) > 1
+
+
+def test_sweep_costs_and_ordering():
+    entries, candles = synthetic_market(seed=3)
+    paths = build_paths(entries, candles)
+
+    no_cost = run_vectorized(paths, ExitParams(), fee_bps=0, slippage_bps=0)
+    with_cost = run_vectorized(paths, ExitParams(), fee_bps=4.5, slippage_bps=2)
+    assert np.allclose(no_cost.net_pnl_pct - with_cost.net_pnl_pct, 0.13)
+
+    grid = {'take_profit_pct': [2, 4, 8], 'stop_loss_pct': [1, 3], 'cut_loser_hours': [None, 4.0]}
+    results = sweep(paths, grid, workers=2, chunk_size=4)
+    assert len(results) == 12
+    totals = [row['total_pnl_pct'] for row in results]
+    assert totals == sorted(totals, reverse=True)
+    assert results == sweep(paths, grid, workers=1)
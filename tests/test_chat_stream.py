@@ -0,0 +1,115 @@
+"""
+Tests for async streaming LLM queries (ModelClient.aquery / chat_stream)
+
+Run with: python -m pytest tests/test_chat_stream.py -v
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dexes.http_session import PooledSession
+from llm_agent.llm.chat_stream import stream_chat_with_retries
+from llm_agent.llm.model_client import ModelClient
+
+
+def sse(chunk) -> bytes:
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+async def completions(request):
+    body = await request.json()
+    assert body['stream'] is True
+    prompt = body['messages'][0]['content']
+    if prompt == 'slow':
+        await asyncio.sleep(1)
+    if prompt == 'broke':
+        return web.Response(status=402, text='insufficient balance')
+
+    resp = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+    await resp.prepare(request)
+    await resp.write(b": OPENROUTER PROCESSING\n\n")
+    if prompt == 'qwen':
+        await resp.write(sse({'choices': [{'delta': {'reasoning_content': 'thinking...</think>DECISION: BUY'}}]}))
+    else:
+        for piece in ('DECISION: ', 'BUY', '\nREASON: trend'):
+            await resp.write(sse({'choices': [{'delta': {'content': piece}}]}))
+    await resp.write(sse({'choices': [{'delta': {}, 'finish_reason': 'stop'}],
+                          'usage': {'prompt_tokens': 1000, 'completion_tokens': 10, 'total_tokens': 1010,
+                                    'prompt_cache_hit_tokens': 800, 'prompt_cache_miss_tokens': 200}}))
+    await resp.write(b"data: [DONE]\n\n")
+    return resp
+
+
+def run_with_server(scenario):
+    async def main():
+        app = web.Application()
+        app.router.add_post('/v1/chat/completions', completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(f"http://127.0.0.1:{port}/v1/chat/completions")
+        finally:
+            await runner.cleanup()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def test_aquery_streams_and_tracks_spend():
+    client = ModelClient(api_key="test", model="deepseek-chat")
+    seen = []
+
+    async def scenario(url):
+        client.url = url
+        full = await client.aquery("hello", on_token=lambda delta, text: seen.append(delta))
+        early = await client.aquery("hello", on_token=lambda delta, text: 'BUY' in text)
+        qwen = await client.aquery("qwen")
+        await client.close()
+        return full, early, qwen
+
+    full, early, qwen = run_with_server(scenario)
+
+    assert full['content'] == 'DECISION: BUY\nREASON: trend'
+    assert seen == ['DECISION: ', 'BUY', '\nREASON: trend']
+    assert full['usage']['prompt_tokens'] == 1000 and full['cost'] > 0
+    assert full['usage']['cached_tokens'] == 800 and full['usage']['uncached_tokens'] == 200
+    assert client.get_cache_stats()['cached_tokens'] == 1600  # full + qwen (early has estimated usage)
+    assert early['stopped_early'] and early['content'] == 'DECISION: BUY'
+    assert early['usage']['estimated']
+    assert qwen['content'] == 'DECISION: BUY'  # extracted from reasoning_content
+    assert client.get_daily_spend() == full['cost'] + early['cost'] + qwen['cost']
+
+
+def test_deadline_and_non_retryable_errors():
+    async def scenario(url):
+        http = PooledSession()
+        try:
+            start = time.monotonic()
+            slow = await stream_chat_with_retries(
+                http, url, {}, {'messages': [{'content': 'slow'}]}, label='t', provider='t', deadline=0.3
+            )
+            elapsed = time.monotonic() - start
+            broke = await stream_chat_with_retries(
+                http, url, {}, {'messages': [{'content': 'broke'}]}, label='t', provider='t', deadline=5
+            )
+            return slow, elapsed, broke
+        finally:
+            await http.close()
+
+    slow, elapsed, broke = run_with_server(scenario)
+    assert slow is None and elapsed < 0.8
+    assert broke is None
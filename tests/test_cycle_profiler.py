@@ -0,0 +1,92 @@
+"""
+Tests for the per-phase cycle profiler (core/cycle_profiler.py)
+
+Run with: python -m pytest tests/test_cycle_profiler.py -v
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+import aiohttp
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cycle_profiler import CycleProfiler, PhaseHistogram
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_phases_sum_per_cycle_and_dump():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics", "test_cycles.json")
+        profiler = CycleProfiler("test", metrics_path=path, port=0)
+
+        for _ in range(3):
+            with profiler.cycle():
+                profiler.phase("prompt")
+                time.sleep(0.01)
+                for _ in range(2):  # LLM retries add up within the cycle
+                    profiler.phase("llm")
+                    time.sleep(0.02)
+                    profiler.phase("parse")
+                profiler.end_phase()
+                with profiler.span("execution"):
+                    time.sleep(0.01)
+                profiler.add_stages({'candles': 0.5, 'indicators': 0.25, 'total': 0.75}, prefix="markets.")
+
+        stats = json.load(open(path))
+        assert stats['cycles'] == 3
+        phases = stats['phases']
+        assert phases['llm']['count'] == 3 and phases['llm']['last_ms'] >= 40
+        assert phases['markets.candles']['p50_ms'] == 500.0
+        assert 'markets.total' not in phases
+        assert phases['cycle']['p50_ms'] >= phases['llm']['p50_ms'] + phases['prompt']['p50_ms']
+        assert set(stats['last_cycle_ms']) == {'cycle', 'prompt', 'llm', 'parse', 'execution',
+                                               'markets.candles', 'markets.indicators'}
+
+    hist = PhaseHistogram(window=100)
+    for ms in range(1, 201):
+        hist.record(float(ms))
+    result = hist.to_dict()
+    assert result['count'] == 200 and result['max_ms'] == 200.0
+    assert result['p50_ms'] == 150.5 and result['p99_ms'] == 199.0  # only the last 100 samples
+
+
+def test_http_endpoint_serves_snapshot():
+    async def run():
+        port = free_port()
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = CycleProfiler("test", metrics_path=os.path.join(tmp, "c.json"), port=port)
+            assert await profiler.serve_http()
+            try:
+                with profiler.cycle():
+                    with profiler.span("llm"):
+                        pass
+                # A second profiler on the same port degrades instead of crashing the bot
+                clash = CycleProfiler("test", metrics_path=os.path.join(tmp, "d.json"), port=port)
+                assert not await clash.serve_http()
+
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f"http://127.0.0.1:{port}/cycles") as resp:
+                        assert resp.status == 200
+                        data = await resp.json()
+            finally:
+                await profiler.close()
+        assert data['bot'] == "test" and data['cycles'] == 1
+        assert data['phases']['llm']['count'] == 1
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
@@ -0,0 +1,62 @@
+"""
+Tests for the LLM Decision Cache
+
+Run with: python -m pytest tests/test_decision_cache.py -v
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_agent.llm.decision_cache import DecisionCache, DecisionCacheConfig
+
+
+def market(price, rsi, macd_diff):
+    return {"price": price, "indicators": {"rsi": rsi, "macd_diff": macd_diff}}
+
+
+def test_fingerprint_ignores_noise_but_not_real_moves():
+    cache = DecisionCache(DecisionCacheConfig(price_bucket_pct=0.5, rsi_bucket=5))
+    positions = [{"symbol": "SOL", "side": "LONG", "entry_price": 150.0, "size": 10, "pnl": 2.0}]
+    base = cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, positions)
+
+    def with_pnl(pnl, size=10):
+        return [{"symbol": "SOL", "side": "LONG", "entry_price": 150.0, "size": size, "pnl": pnl}]
+
+    assert cache.fingerprint({"BTC": market(100010, 52, 11), "SOL": market(150.01, 42, 0.01)}, with_pnl(4.0)) == base
+    # P&L is bucketed as a % of notional: the same $20 is 1.3% of a $1.5k position, 0.13% of $15k
+    assert cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, with_pnl(20.0)) != base
+    assert cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, with_pnl(20.0, 100)) == \
+        cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, with_pnl(2.0, 100))
+    assert cache._position_pnl_pct({"side": "SHORT", "entry_price": 100.0, "current_price": 98.0}) == 2.0
+    assert cache._position_pnl_pct({"pnl_pct": 0.015}) == 1.5
+    assert cache.fingerprint({"BTC": market(101500, 51, 10), "SOL": market(150, 41, 0.01)}, positions) != base
+    assert cache.fingerprint({"BTC": market(100000, 58, 10), "SOL": market(150, 41, 0.01)}, positions) != base
+    assert cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, []) != base
+    assert cache.fingerprint({"BTC": market(100000, 51, 10), "SOL": market(150, 41, 0.01)}, positions,
+                             context="new Deep42 regime") != base
+
+
+def test_hits_misses_ttl_and_modes():
+    decisions = [{"action": "BUY", "symbol": "SOL", "cost": 0.002}, {"action": "NOTHING", "symbol": "BTC", "cost": 0.001}]
+
+    skip = DecisionCache(DecisionCacheConfig(ttl_seconds=60))  # skip is the default
+    assert skip.get("k") is None
+    skip.put("k", decisions)
+    assert skip.get("k") == []
+    skip._entries["k"] = (skip._entries["k"][0] - 61, decisions)
+    assert skip.get("k") is None  # expired
+    stats = skip.get_stats()
+    assert (stats["hits"], stats["misses"], stats["saved_cost"]) == (1, 2, 0.003)
+
+    # Reuse replays only passive decisions: the cached BUY was already executed
+    reuse = DecisionCache(DecisionCacheConfig(mode="reuse"))
+    reuse.put("k", decisions)
+    assert reuse.get("k") == [{"action": "NOTHING", "symbol": "BTC", "cost": 0.0, "cached": True}]
+    assert decisions[1]["cost"] == 0.001  # stored entry not mutated
+
+    disabled = DecisionCache(DecisionCacheConfig(enabled=False))
+    disabled.put("k", decisions)
+    assert disabled.get("k") is None
@@ -0,0 +1,105 @@
+"""
+Tests for the Deep42 signal prefetcher and the executor checks that read it
+
+Run with: python -m pytest tests/test_deep42_signals.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pacifica_agent.data.deep42_signals import Deep42SignalPrefetcher
+from pacifica_agent.execution.pacifica_executor import PacificaTradeExecutor
+from utils import shared_rate_limiter
+from utils.shared_rate_limiter import RateLimit, SharedRateLimiter
+
+DELAY = 0.2
+
+
+async def start_fake_deep42():
+    async def token_analysis(request):
+        await asyncio.sleep(DELAY)
+        return web.json_response({'bullishPct': 70.0, 'bearishPct': 10.0, 'avgSentiment': 7.0, 'totalTweets': 40})
+
+    async def sentiment_shifts(request):
+        await asyncio.sleep(DELAY)
+        if request.query['token'] == 'SOL':
+            return web.json_response([{'sentiment_shift': -2.5, 'shift_direction': 'negative',
+                                       'current_sentiment': 4.0, 'previous_sentiment': 6.5, 'timeframe': '4h'}])
+        return web.json_response([])
+
+    async def alpha_tweets(request):
+        await asyncio.sleep(DELAY)
+        if request.query['token_filter'] == 'BTC':
+            return web.Response(status=503)
+        if request.query['token_filter'] == 'PENGU':
+            return web.Response(status=429, headers={'Retry-After': '0'})
+        return web.json_response([{'combined_score': 31.0}, {'combined_score': 35.0}])
+
+    app = web.Application()
+    app.router.add_get('/token-analysis', token_analysis)
+    app.router.add_get('/sentiment-shifts', sentiment_shifts)
+    app.router.add_get('/alpha-tweet-detection', alpha_tweets)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_prefetch_is_concurrent_and_executor_reads_cache(monkeypatch):
+    limiter = SharedRateLimiter({'cambrian': RateLimit(rate=100.0, burst=100)}, shared=False)
+    monkeypatch.setattr(shared_rate_limiter, "_instance", limiter)
+
+    async def run():
+        runner, base_url = await start_fake_deep42()
+        signals = Deep42SignalPrefetcher("key", ttl=60, base_url=base_url)
+        try:
+            symbols = ['SOL', 'BTC', 'ETH', 'DOGE', 'WIF', 'PENGU']
+            start = time.perf_counter()
+            assert await signals.refresh(symbols) == 6
+            # 18 requests at 0.2s each, overlapped instead of back to back
+            assert time.perf_counter() - start < 6 * 3 * DELAY / 2
+            assert signals.errors == 2 and signals.get('alpha', 'BTC') is None
+            assert signals.get('shifts', 'ETH') == [] and signals.get('sentiment', 'XRP') is None
+
+            # Every request drew from the shared budget; the 429 backed the whole host off
+            cambrian = limiter.get_stats()['endpoints']['cambrian']
+            assert cambrian['requests'] == 18 and cambrian['penalties'] == 1
+
+            # The next refresh reuses the same keep-alive pool
+            session = await signals._http.get_session()
+            await signals.refresh(['SOL'])
+            assert await signals._http.get_session() is session
+        finally:
+            await signals.close()
+            await runner.cleanup()
+
+        executor = PacificaTradeExecutor(None, None, dry_run=True, cambrian_api_key="key", use_sentiment_filter=True)
+        executor.deep42 = signals
+        start = time.perf_counter()
+        assert executor._check_sentiment_alignment('SOL', 'BUY')[0]
+        shift = executor._check_sentiment_shifts('SOL')
+        assert shift['shift_direction'] == 'negative' and shift['sentiment_shift'] == -2.5
+        assert executor._check_sentiment_shifts('ETH') is None
+        assert executor._check_alpha_tweets('SOL')['position_multiplier'] == 2.0
+        assert executor._check_alpha_tweets('BTC') is None
+        assert time.perf_counter() - start < DELAY  # no network at decision time
+
+        # Expired entries read as "no signal" rather than triggering a fetch
+        signals.ttl = 0.0
+        assert executor._check_sentiment_shifts('SOL') is None
+        assert executor._check_sentiment_alignment('SOL', 'SELL') == (True, "Sentiment data unavailable, proceeding anyway")
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
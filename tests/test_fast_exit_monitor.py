@@ -0,0 +1,100 @@
+"""
+Tests for the batched Fast Exit Monitor
+
+Run with: python -m pytest tests/test_fast_exit_monitor.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hibachi_agent.execution.fast_exit_monitor import FastExitMonitor
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class FakeSDK:
+    def __init__(self, prices):
+        self.prices = prices
+        self.batches = []
+
+    async def get_prices(self, symbols):
+        self.batches.append(sorted(symbols))
+        await asyncio.sleep(0)
+        return {s: self.prices[s] for s in symbols if s in self.prices}
+
+
+class FakeExecutor:
+    def __init__(self, positions):
+        self.positions = positions
+        self.position_fetches = 0
+        self.closed = []
+
+    async def _fetch_open_positions(self):
+        self.position_fetches += 1
+        return self.positions
+
+    async def execute_decision(self, decision):
+        self.closed.append(decision['symbol'])
+        return {'success': True}
+
+
+class FakeTracker:
+    def __init__(self, entries):
+        self.entries = entries
+        self.lookups = 0
+
+    def get_open_trade_for_symbol(self, symbol):
+        self.lookups += 1
+        return self.entries.get(symbol)
+
+
+class HoldRules:
+    def check_should_force_close(self, position, market_data, tracker_data):
+        return False, ""
+
+    def unregister_position(self, symbol):
+        pass
+
+
+def test_batched_prices_cached_entries_and_trailing_exit():
+    sdk = FakeSDK({"BTC/USDT-P": 100.0, "ETH/USDT-P": 10.0})
+    executor = FakeExecutor([
+        {"symbol": "BTC/USDT-P", "quantity": "0.1", "direction": "Long"},
+        {"symbol": "ETH/USDT-P", "quantity": "1", "direction": "Short"},
+    ])
+    tracker = FakeTracker({
+        "BTC/USDT-P": {"entry_price": 100.0, "notional": 10.0},
+        "ETH/USDT-P": {"entry_price": 10.0, "notional": 10.0},
+    })
+    monitor = FastExitMonitor(sdk, executor, HoldRules(), tracker)
+
+    async def scenario():
+        assert await monitor.check_positions_once() == []
+        sdk.prices["BTC/USDT-P"] = 107.0   # +7% -> trailing stop at +5%
+        assert await monitor.check_positions_once() == []
+        sdk.prices["BTC/USDT-P"] = 104.5   # back under the trail
+        return await monitor.check_positions_once()
+
+    closed = run(scenario())
+
+    assert [c['symbol'] for c in closed] == ["BTC/USDT-P"] and executor.closed == ["BTC/USDT-P"]
+    assert "TRAILING_STOP" in closed[0]['reason']
+    # One position read + one tracker lookup per symbol; one price batch per tick
+    assert executor.position_fetches == 1 and tracker.lookups == 2
+    assert sdk.batches == [["BTC/USDT-P", "ETH/USDT-P"]] * 3
+    stats = monitor.get_stats()
+    assert stats['positions_tracked'] == 1 and stats['avg_check_ms'] is not None
+
+    monitor.notify_positions_changed()
+    run(monitor.check_positions_once())
+    assert executor.position_fetches == 2
@@ -0,0 +1,99 @@
+"""
+Tests for the concurrent per-symbol fetch engine and the aggregator fan-out
+(llm_agent/data/fetch_engine.py, pacifica_agent/data/pacifica_aggregator.py)
+
+Run with: python -m pytest tests/test_fetch_engine.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_agent.data.fetch_engine import ConcurrentFetchEngine
+from llm_agent.data.oi_fetcher import OIDataFetcher, OISnapshotCache
+from pacifica_agent.data.pacifica_aggregator import PacificaMarketDataAggregator
+
+DELAY = 0.1
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def candles(n: int = 100) -> pd.DataFrame:
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(end=pd.Timestamp.now(), periods=n, freq='15min'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': np.full(n, 1000.0),
+    })
+
+
+def test_map_bounds_concurrency_and_drops_failures():
+    engine = ConcurrentFetchEngine(max_concurrency=3)
+    in_flight = []
+    peak = []
+
+    async def fetch(symbol):
+        in_flight.append(symbol)
+        peak.append(len(in_flight))
+        await asyncio.sleep(DELAY)
+        in_flight.remove(symbol)
+        if symbol == 'BAD':
+            raise RuntimeError("boom")
+        return None if symbol == 'NONE' else symbol.lower()
+
+    async def scenario():
+        with engine.stage("candles"):
+            results = await engine.map(['A', 'B', 'C', 'D', 'BAD', 'NONE'], fetch)
+        total = await engine.run_blocking(sum, [1, 2, 3])
+        return results, total
+
+    start = time.perf_counter()
+    results, total = run(scenario())
+    assert time.perf_counter() - start < 6 * DELAY  # two waves of 3, not six sequential calls
+    assert results == {'A': 'a', 'B': 'b', 'C': 'c', 'D': 'd'}
+    assert max(peak) == 3 and total == 6
+    assert engine.stage_timings['candles'] >= 2 * DELAY
+    assert engine.format_stage_timings().startswith("candles=")
+    engine.reset_timings()
+    assert engine.stage_timings == {}
+
+
+def test_pacifica_aggregator_fetches_symbols_concurrently():
+    aggregator = PacificaMarketDataAggregator("key", max_concurrency=8)
+    aggregator.pacifica.available_symbols = ['BTC', 'ETH', 'SOL', 'DOGE']
+    aggregator.pacifica._initialized = True
+
+    async def fetch_market_data(symbol, interval="15m", limit=100, **kwargs):
+        await asyncio.sleep(DELAY)
+        return {'symbol': symbol, 'kline_df': candles(), 'funding_rate': 0.0001, 'current_price': 100.0}
+
+    class FakeOI(OIDataFetcher):
+        def fetch_binance_oi(self, symbol):
+            return {'BTC': 1.0, 'ETH': 2.0}.get(symbol)
+
+        def fetch_hyperliquid_data(self):
+            return {'SOL': 3.0}
+
+    aggregator.pacifica.fetch_market_data = fetch_market_data
+    aggregator.oi_fetcher = FakeOI(snapshot_cache=OISnapshotCache())
+
+    start = time.perf_counter()
+    data = run(aggregator.fetch_all_markets(['BTC', 'ETH', 'SOL', 'DOGE', 'XRP']))
+    assert time.perf_counter() - start < 4 * DELAY
+    assert set(data) == {'BTC', 'ETH', 'SOL', 'DOGE'}
+    assert [data[s]['oi'] for s in ('BTC', 'ETH', 'SOL', 'DOGE')] == [1.0, 2.0, 3.0, None]
+    assert data['BTC']['price'] == 100.0 and 'rsi' in data['BTC']['indicators']
+    assert {'candles', 'oi', 'indicators', 'total'} <= set(aggregator.fetch_engine.stage_timings)
@@ -0,0 +1,104 @@
+"""
+Tests for the grid venue adapters (core/grid_mm/adapters.py)
+
+Run with: python -m pytest tests/test_grid_adapters.py -v
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_mm.adapters import ExtendedAdapter, HibachiAdapter, ParadexAdapter
+from core.grid_reconciler import GridLevel
+from dexes.hibachi.hibachi_sdk import HibachiSDK
+from dexes.mock_exchange import MockExchangeServer
+from dexes.paradex import LocalParadexClient
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_hibachi_concurrent_places_and_real_cancel_all_result():
+    async def scenario():
+        async with MockExchangeServer(venues=["hibachi"], step_interval=0, latency=0.001, seed=3) as server:
+            url = server.base_url("hibachi")
+            adapter = HibachiAdapter(HibachiSDK("key", "secret", "7", base_url=url, data_api_url=url))
+            try:
+                levels = [GridLevel('BUY', 99000.0 - 10 * i, 0.001, i + 1) for i in range(4)]
+                ids = await asyncio.gather(*(adapter.place_limit("BTC/USDT-P", level) for level in levels))
+                assert all(ids) and len(set(ids)) == 4
+                assert await adapter.get_open_order_ids("BTC/USDT-P") == set(ids)
+
+                sdk_cancel = adapter.sdk.cancel_order
+
+                async def flaky_cancel(order_id):
+                    return False if order_id == ids[0] else await sdk_cancel(order_id)
+
+                adapter.sdk.cancel_order = flaky_cancel
+                assert await adapter.cancel_all("BTC/USDT-P") is False
+                assert await adapter.get_open_order_ids("BTC/USDT-P") == {ids[0]}
+                adapter.sdk.cancel_order = sdk_cancel
+                assert await adapter.cancel_all("BTC/USDT-P") is True
+                assert await adapter.get_open_order_ids("BTC/USDT-P") == set()
+            finally:
+                await adapter.close()
+
+    run(scenario())
+
+
+def test_hibachi_sync_counts_only_filled_orders():
+    async def scenario():
+        async with MockExchangeServer(venues=["hibachi"], step_interval=0, latency=0.001, seed=3) as server:
+            url = server.base_url("hibachi")
+            exchange = server.exchanges["hibachi"]
+            adapter = HibachiAdapter(HibachiSDK("key", "secret", "7", base_url=url, data_api_url=url))
+            try:
+                bid, _ = exchange.bbo("BTC/USDT-P")
+                levels = [GridLevel('BUY', bid + 5 - 10 * i, 0.001, i + 1) for i in range(3)]  # first one is the best bid
+                ids = [await adapter.place_limit("BTC/USDT-P", level) for level in levels]
+                tracked = {oid: {'size': 0.001} for oid in ids}
+
+                # A failed listing is not an empty book
+                server.fail_next()
+                assert await adapter.sync_orders("BTC/USDT-P", tracked) is None
+
+                exchange.submit("taker", "BTC/USDT-P", "SELL", 0.001, price=levels[0].price)
+                exchange.cancel(ids[1])  # cancelled outside the engine
+                sync = await adapter.sync_orders("BTC/USDT-P", tracked)
+                assert sync.filled == {ids[0]: 0.001} and sync.live == {ids[2]}
+            finally:
+                await adapter.close()
+
+    run(scenario())
+
+
+def test_paradex_batch_cancel_needs_confirmation():
+    client = LocalParadexClient("BTC-USD-PERP")
+    adapter = ParadexAdapter(client)
+    order = SimpleNamespace(order_side="BUY", order_type="LIMIT", size=1.0, limit_price=90.0, instruction="POST_ONLY")
+    ids = [client.submit_order(order)['id'] for _ in range(2)]
+
+    assert run(adapter.cancel_orders("BTC-USD-PERP", ids)) is True
+    assert run(adapter.cancel_orders("BTC-USD-PERP", [client.submit_order(order)['id'], "gone"])) is False
+
+
+def test_extended_position_is_signed():
+    def client_with(side):
+        positions = SimpleNamespace(data=[SimpleNamespace(size="0.5", side=SimpleNamespace(value=side))])
+
+        async def get_positions(market_names):
+            return positions
+
+        return SimpleNamespace(account=SimpleNamespace(get_positions=get_positions))
+
+    assert run(ExtendedAdapter(client_with("SHORT")).get_position("BTC-USD")) == -0.5
+    assert run(ExtendedAdapter(client_with("LONG")).get_position("BTC-USD")) == 0.5
@@ -0,0 +1,191 @@
+"""
+Tests for the shared Grid MM engine (core/grid_mm)
+
+Run with: python -m pytest tests/test_grid_mm_engine.py -v
+"""
+
+import asyncio
+import itertools
+import os
+import socket
+import sys
+import urllib.request
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_mm import (
+    GridEngine,
+    GridMetrics,
+    GridRunner,
+    MarketInfo,
+    MetricsRegistry,
+    VenueAdapter,
+    parse_bot_spec,
+    preset_for,
+)
+
+
+class FakeAdapter(VenueAdapter):
+    """In-memory venue: orders rest until the test removes them"""
+
+    def __init__(self, name="fake", partial_cancel=True, mid=100000.0):
+        self.name = name
+        self.supports_partial_cancel = partial_cancel
+        self.mid = mid
+        self.orders = {}
+        self.filled = set()
+        self.calls = []
+        self._ids = itertools.count(1)
+
+    async def market_info(self, symbol):
+        return MarketInfo(tick_size=1.0, step_size=0.0001, min_notional=10.0)
+
+    async def get_bbo(self, symbol):
+        return self.mid - 1, self.mid + 1
+
+    async def get_balance(self):
+        return 1000.0
+
+    async def get_position(self, symbol):
+        return 0.0
+
+    async def get_open_order_ids(self, symbol):
+        return set(self.orders)
+
+    async def get_order_status(self, symbol, order_id):
+        return ('FILLED', 0.0) if order_id in self.filled else ('CANCELLED', 0.0)
+
+    async def place_limit(self, symbol, level):
+        order_id = f"{symbol}-{next(self._ids)}"
+        self.orders[order_id] = level
+        self.calls.append('place')
+        return order_id
+
+    async def cancel_order(self, symbol, order_id):
+        self.calls.append('cancel')
+        return self.orders.pop(order_id, None) is not None
+
+    async def cancel_all(self, symbol):
+        self.calls.append('cancel_all')
+        self.orders.clear()
+        return True
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_parse_bot_spec_and_presets():
+    assert parse_bot_spec("Paradex:BTC-USD-PERP") == ("paradex", "BTC-USD-PERP")
+    with pytest.raises(ValueError):
+        parse_bot_spec("paradex")
+    assert preset_for("nado").spread_bands[0] == (5, 4.0)
+    assert preset_for("hibachi").num_levels == 3
+
+
+def test_fill_only_replaces_filled_level():
+    adapter = FakeAdapter()
+    engine = GridEngine(adapter, "BTC", preset_for("paradex"))
+
+    async def scenario():
+        await engine.start()
+        await engine.tick()
+        assert len(adapter.orders) == 4
+        filled, cancelled = list(adapter.orders)[:2]
+        del adapter.orders[filled]  # venue filled it
+        adapter.filled.add(filled)
+        del adapter.orders[cancelled]  # cancelled elsewhere: not a fill
+        adapter.calls.clear()
+        await engine.tick()
+
+    run(scenario())
+    assert engine.fills_count == 1
+    assert adapter.calls == ['place', 'place']
+    assert set(engine.open_orders) == set(adapter.orders)
+
+
+def test_cancel_all_venue_replaces_whole_grid():
+    adapter = FakeAdapter(partial_cancel=False)
+    engine = GridEngine(adapter, "BTC", preset_for("nado").with_overrides(fill_grace_seconds=0.0))
+
+    async def scenario():
+        await engine.start()
+        await engine.tick()
+        adapter.calls.clear()
+        await engine.tick()  # unchanged grid: no calls
+        assert adapter.calls == []
+        adapter.mid *= 1.006  # past grid_reset_pct
+        await engine.tick()
+
+    run(scenario())
+    assert adapter.calls == ['cancel_all'] + ['place'] * 4
+
+
+def test_runner_shares_adapter_and_cancels_on_stop():
+    adapter = FakeAdapter()
+    runner = GridRunner()
+    config = preset_for("paradex").with_overrides(tick_interval=0.01)
+    runner.add("fake", "BTC", config=config, adapter=adapter)
+    runner.add("fake", "ETH", config=config, adapter=adapter)
+
+    run(runner.run(duration=0.05))
+
+    assert {e.symbol for e in runner.engines} == {"BTC", "ETH"}
+    assert adapter.calls.count('cancel_all') == 2
+    assert adapter.orders == {}
+
+
+def test_engine_metrics_and_prometheus_export(tmp_path):
+    registry = MetricsRegistry()
+    now = [0.0]
+    adapter = FakeAdapter()
+    engine = GridEngine(adapter, "BTC", preset_for("paradex"), clock=lambda: now[0],
+                        metrics=GridMetrics(registry, "fake", "BTC"))
+
+    async def scenario():
+        await engine.start()
+        await engine.tick()
+        now[0] = 10.0
+        filled = next(oid for oid, level in adapter.orders.items() if level.side == 'BUY')
+        del adapter.orders[filled]
+        adapter.filled.add(filled)
+        await engine.tick()
+
+    run(scenario())
+    m = engine.metrics
+    labels = {'venue': 'fake', 'symbol': 'BTC'}
+    assert m.placed.value(**labels) == 5
+    assert m.refreshes.value(trigger='empty', **labels) == 1 and m.refreshes.value(trigger='fill', **labels) == 1
+    assert m.fills.value(side='BUY', **labels) == 1
+    assert m.realized_spread.count(**labels) == 1 and m.realized_spread._values[('fake', 'BTC')]['sum'] > 0
+    assert m.requote.count(**labels) == 1
+    assert m.api_latency.count(op='place', **labels) == 5
+    assert m.uptime.value(**labels) == 1.0 and m.quoted_seconds.value(**labels) == 10.0
+
+    text = registry.render()
+    assert '# TYPE grid_fills_total counter' in text
+    assert 'grid_fills_total{venue="fake",symbol="BTC",side="BUY"} 1' in text
+    assert 'grid_requote_seconds_bucket{venue="fake",symbol="BTC",le="+Inf"} 1' in text
+    assert 'grid_open_orders{venue="fake",symbol="BTC",side="SELL"} 2' in text
+
+    path = tmp_path / "metrics" / "grid.prom"
+    assert registry.write_textfile(str(path))
+    assert path.read_text() == registry.render()
+
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    assert registry.start_http_server(port)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            assert resp.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert 'grid_quote_uptime_ratio{venue="fake",symbol="BTC"} 1' in resp.read().decode()
+    finally:
+        registry.stop_http_server()
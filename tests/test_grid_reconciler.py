@@ -0,0 +1,80 @@
+"""
+Tests for the Grid Reconciler
+
+Run with: python -m pytest tests/test_grid_reconciler.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_reconciler import GridLevel, execute_plan, plan_grid
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def ladder(mid: float, spread: float, size: float = 0.001):
+    return [
+        GridLevel('BUY', mid - spread, size, 1), GridLevel('BUY', mid - 2 * spread, size, 2),
+        GridLevel('SELL', mid + spread, size, 1), GridLevel('SELL', mid + 2 * spread, size, 2),
+    ]
+
+
+def as_live(levels):
+    return {f"o{i}": level.to_order_info() for i, level in enumerate(levels)}
+
+
+def test_unchanged_grid_is_kept():
+    live = as_live(ladder(100000.0, 15.0))
+    plan = plan_grid(ladder(100002.0, 15.0), live, price_tolerance=4.0)
+    assert plan.changes == 0
+    assert set(plan.keep) == set(live)
+
+
+def test_only_moved_and_filled_levels_change():
+    live = as_live(ladder(100000.0, 15.0))
+    del live["o0"]  # BUY L1 filled
+    targets = ladder(100000.0, 15.0)
+    targets[3] = GridLevel('SELL', 100040.0, 0.001, 2)  # SELL L2 moved beyond tolerance
+
+    plan = plan_grid(targets, live, price_tolerance=4.0)
+    assert plan.cancel == ["o3"]
+    assert [(t.side, t.level) for t in plan.place] == [('BUY', 1), ('SELL', 2)]
+    assert set(plan.keep) == {"o1", "o2"}
+
+
+def test_size_change_replaces_order():
+    live = as_live(ladder(100000.0, 15.0))
+    plan = plan_grid(ladder(100000.0, 15.0, size=0.0013), live, price_tolerance=4.0)
+    assert sorted(plan.cancel) == sorted(live)
+    assert len(plan.place) == 4
+
+
+def test_execute_plan_cancels_then_places():
+    calls = []
+
+    async def cancel(order_id):
+        calls.append(('cancel', order_id))
+        return order_id != "bad"
+
+    async def place(level):
+        calls.append(('place', level.side))
+        return None if level.side == 'SELL' else f"new-{level.level}"
+
+    plan = plan_grid(ladder(100000.0, 15.0)[:1] + [GridLevel('SELL', 100015.0, 0.001, 1)],
+                     {"old": {'side': 'BUY', 'price': 99000.0, 'size': 0.001}, "bad": {'side': 'SELL', 'price': 1.0, 'size': 1}},
+                     price_tolerance=4.0)
+    result = run(execute_plan(plan, cancel, place))
+
+    assert [c[0] for c in calls] == ['cancel', 'cancel', 'place', 'place']
+    assert result.cancelled == ["old"] and result.failed_cancels == ["bad"]
+    assert list(result.placed) == ["new-1"] and len(result.failed_places) == 1
@@ -0,0 +1,78 @@
+"""
+Tests for tick recording and the offline grid simulator (core/grid_mm/sim.py)
+
+Run with: python -m pytest tests/test_grid_sim.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_mm import MarketInfo, SimVenue, TickRecorder, load_ticks, preset_for
+from core.grid_mm.sim import config_with, replay, sweep
+from core.grid_reconciler import GridLevel
+
+MARKET = MarketInfo(tick_size=0.1, step_size=0.0001, min_notional=10.0)
+
+
+def record_random_walk(path, minutes=30, seed=1):
+    rng = np.random.default_rng(seed)
+    mid, ts = 100000.0, 1_700_000_000.0
+    with TickRecorder(path, buffer_size=256) as recorder:
+        for _ in range(minutes * 240):  # 4 updates per second
+            ts += 0.25
+            mid = round(mid * (1 + rng.normal(0, 0.5) / 10000), 1)
+            recorder.record_bbo(mid - 0.1, mid + 0.1, float(rng.uniform(0.05, 1)), float(rng.uniform(0.05, 1)), ts=ts)
+            if rng.random() < 0.5:
+                side = 'BUY' if rng.random() < 0.5 else 'SELL'
+                price = mid + 0.1 if side == 'BUY' else mid - 0.1
+                recorder.record_trade(price, float(rng.uniform(0.01, 0.5)), side, ts=ts + 0.01)
+
+
+def test_queue_position_fill_model():
+    venue = SimVenue(MARKET, latency=0.0)
+    venue.on_bbo(100.0, 100.2, bid_size=2.0, ask_size=1.0)
+    loop = asyncio.new_event_loop()
+    try:
+        at_touch = loop.run_until_complete(venue.place_limit("SIM", GridLevel('BUY', 100.0, 1.0, 1)))
+        behind = loop.run_until_complete(venue.place_limit("SIM", GridLevel('BUY', 99.9, 1.0, 2)))
+        assert loop.run_until_complete(venue.place_limit("SIM", GridLevel('BUY', 100.2, 1.0, 1))) is None
+    finally:
+        loop.close()
+
+    venue.on_trade(100.0, 1.5, side=-1)   # eats 1.5 of the 2.0 ahead of us
+    assert venue.position == 0 and venue.orders[at_touch].queue_ahead == 0.5
+    venue.on_trade(100.0, 1.0, side=-1)   # 0.5 ahead, then 0.5 fills us
+    assert venue.position == 0.5
+    venue.on_trade(99.9, 0.1, side=-1)    # through our 100.0 bid; 99.9 is still behind an unknown queue
+    assert venue.position == 1.0 and at_touch not in venue.orders
+    assert venue.orders[behind].remaining == 1.0
+    venue.on_bbo(99.8, 99.9, bid_size=1.0, ask_size=1.0)  # touch trades through 99.9
+    assert venue.position == 2.0 and not venue.orders
+
+
+def test_replay_recording_and_sweep(tmp_path):
+    path = str(tmp_path / "paradex_BTC-USD-PERP.ticks")
+    record_random_walk(path)
+    ticks = load_ticks(path)
+    assert len(ticks) > 7200 and np.all(np.diff(ticks['ts']) >= 0)
+
+    config = preset_for("paradex").with_overrides(roc_window=60)
+    stats = replay(ticks, config, MARKET, maker_fee_bps=-0.5)
+    assert stats['fills'] > 0 and stats['ticks'] >= 1799
+    assert stats['fees'] < 0  # rebate
+    assert stats['speedup'] > 100
+
+    scaled = config_with(config, {'base_spread_bps': 3.0})
+    assert scaled.spread_bands[0][1] == 3.0 and scaled.spread_bands[1][1] == 6.0
+    assert config.spread_bands[0][1] == 1.5
+
+    grid = {'base_spread_bps': [1.5, 3.0], 'inventory_skew_ratio': [0.3, 0.5]}
+    results = sweep(ticks, config, MARKET, grid, workers=2)
+    assert len(results) == 4
+    assert [r['pnl'] for r in results] == sorted((r['pnl'] for r in results), reverse=True)
@@ -0,0 +1,83 @@
+"""
+Tests for the pooled HTTP session shared by the SDK wrappers (dexes/http_session.py)
+
+Run with: python -m pytest tests/test_http_session.py -v
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dexes.http_session import PooledSession
+
+
+def start_server_thread():
+    """Serve GET /ping and GET /missing on a loop in a daemon thread (outlives the test loops)"""
+    ready = threading.Event()
+    state = {}
+
+    async def ping(request):
+        return web.json_response({'ok': True})
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_get('/ping', ping)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        loop.run_until_complete(site.start())
+        state['url'] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        state['loop'], state['runner'] = loop, runner
+        ready.set()
+        loop.run_forever()
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    ready.wait(5)
+    return state, thread
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_session_reused_per_loop_and_released_on_loop_change():
+    server, thread = start_server_thread()
+    pool = PooledSession()
+
+    async def fetch_twice():
+        for path in ('/ping', '/ping', '/missing'):
+            async with pool.request('GET', server['url'] + path) as resp:
+                await resp.read()
+        return await pool.get_session()
+
+    try:
+        first = run(fetch_twice())
+        stats = pool.get_latency_stats()
+        assert stats['GET /ping']['count'] == 2 and stats['GET /ping']['errors'] == 0
+        assert stats['GET /missing']['errors'] == 1
+        assert first.connector is not None and not first.connector.closed
+
+        # A second loop gets a fresh pool; the old one is released instead of leaked
+        old_connector = first.connector
+        second = run(fetch_twice())
+        assert second is not first
+        assert first.closed and old_connector.closed
+        run(pool.close())
+        assert second.closed
+    finally:
+        server['loop'].call_soon_threadsafe(server['loop'].stop)
+        thread.join(5)
@@ -0,0 +1,111 @@
+"""
+Tests for the Incremental Indicator Engine
+
+Checks streaming indicator values against the ta-based IndicatorCalculator.
+
+Run with: python -m pytest tests/test_incremental_indicators.py -v
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("ta")
+
+from llm_agent.data.indicator_calculator import IndicatorCalculator
+from llm_agent.data.incremental_indicators import IncrementalIndicatorEngine
+
+
+def make_klines(n: int = 150, seed: int = 7) -> pd.DataFrame:
+    """Random-walk OHLCV candles"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.002, n)) * close
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2026-01-01', periods=n, freq='5min'),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(100, 1000, n),
+    })
+
+
+def assert_values_match(actual: dict, expected: dict):
+    assert list(actual.keys()) == list(expected.keys())
+    for key, exp in expected.items():
+        got = actual[key]
+        if isinstance(exp, (bool, np.bool_)):
+            assert bool(got) == bool(exp), key
+        elif exp is None or math.isnan(exp):
+            assert math.isnan(got), key
+        else:
+            assert got == pytest.approx(float(exp), rel=1e-9, abs=1e-9), key
+
+
+@pytest.mark.parametrize("timeframe", ["5m", "4h", "default"])
+def test_streaming_matches_full_recompute(timeframe):
+    """Feeding candles one by one matches ta on the same history at every step"""
+    df = make_klines()
+    calc = IndicatorCalculator()
+    engine = IncrementalIndicatorEngine(timeframe=timeframe)
+
+    # ta's ATR/ADX need at least 2 windows of candles
+    for end in range(30, len(df) + 1, 7):
+        window = df.iloc[:end]
+        expected = calc.get_latest_values(calc.calculate_all_indicators(window, timeframe), timeframe)
+        assert_values_match(engine.update("SOL", window), expected)
+
+    assert engine.rebuilds == 1
+
+
+def test_forming_candle_is_revised():
+    """A changed last candle replaces the earlier version instead of stacking"""
+    df = make_klines()
+    calc = IndicatorCalculator()
+    engine = IncrementalIndicatorEngine(timeframe="5m")
+
+    forming = df.copy()
+    forming.loc[forming.index[-1], ['high', 'close']] = [forming['high'].iloc[-1] * 1.01, forming['close'].iloc[-1] * 1.01]
+    engine.update("SOL", df.iloc[:-1])
+    engine.update("SOL", forming)
+    result = engine.update("SOL", df)
+
+    expected = calc.get_latest_values(calc.calculate_all_indicators(df, "5m"), "5m")
+    assert_values_match(result, expected)
+    assert engine.rebuilds == 1
+    assert engine.incremental_updates == 2
+
+
+def test_gap_rebuilds_from_window():
+    """A window that no longer overlaps stored state is rebuilt from scratch"""
+    df = make_klines(n=300)
+    calc = IndicatorCalculator()
+    engine = IncrementalIndicatorEngine(timeframe="5m")
+
+    engine.update("SOL", df.iloc[:100])
+    window = df.iloc[150:250]
+    result = engine.update("SOL", window)
+
+    expected = calc.get_latest_values(calc.calculate_all_indicators(window, "5m"), "5m")
+    assert_values_match(result, expected)
+    assert engine.rebuilds == 2
+
+
+def test_empty_and_reset():
+    engine = IncrementalIndicatorEngine()
+    assert engine.update("SOL", pd.DataFrame()) == {}
+    assert engine.latest_values("SOL") == {}
+
+    engine.update("SOL", make_klines(n=40))
+    assert engine.latest_values("SOL")["price"] > 0
+    engine.reset("SOL")
+    assert engine.latest_values("SOL") == {}
@@ -0,0 +1,175 @@
+"""
+Tests for the host market data bus (core/market_bus)
+
+Run with: python -m pytest tests/test_market_bus.py -v
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.market_bus import MarketDataBusClient, MarketDataDaemon, Source
+
+
+def test_clients_share_one_upstream_fetch():
+    calls = {'candles': 0, 'oi': []}
+
+    async def candles(venue, symbol, interval):
+        calls['candles'] += 1
+        return [[1_700_000_000_000 + i * 300_000, 1.0, 2.0, 0.5, 1.5 + i, 10.0] for i in range(5)]
+
+    async def oi(args_list):
+        calls['oi'].append(sorted(args[0] for args in args_list))
+        return {f"oi:{args[0]}": 1000.0 for args in args_list}
+
+    sources = {
+        'candles': Source('candles', interval=60.0, fetch=candles),
+        'oi': Source('oi', interval=60.0, fetch=oi, batch=True),
+    }
+
+    async def run(path):
+        daemon = MarketDataDaemon(path=path, sources=sources)
+        await daemon.start()
+        first, second = MarketDataBusClient(path), MarketDataBusClient(path)
+        try:
+            df = await first.klines("binance", "ETHUSDT", "5m", limit=3)
+            assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            assert list(df['close']) == [3.5, 4.5, 5.5] and str(df['timestamp'].dtype).startswith('datetime64')
+
+            # Second bot gets the cached snapshot without another upstream call
+            assert len(await second.klines("binance", "ETHUSDT", "5m")) == 5
+            assert calls['candles'] == 1
+
+            # OI topics are normalized and batched; a newcomer wakes the batch poller
+            assert await first.oi_snapshot(["ETH/USDT-P"]) == {"ETH/USDT-P": 1000.0}
+            assert await second.oi_snapshot(["SOL", "ETH-USD"]) == {"SOL": 1000.0, "ETH-USD": 1000.0}
+            assert calls['oi'] == [["ETH"], ["ETH", "SOL"]]
+
+            assert await first.get("bogus:topic", timeout=0.2) is None
+            stats = await second.daemon_stats()
+            assert stats['clients'] == 2 and stats['topics']['candles:binance:ETHUSDT:5m']['subscribers'] == 2
+        finally:
+            await first.close()
+            await second.close()
+            await daemon.stop()
+
+        # Daemon gone: accessors report the bus as down so callers fall back
+        down = MarketDataBusClient(path)
+        assert await down.klines("binance", "ETHUSDT", "5m") is None
+        assert await down.oi_snapshot(["ETH"]) is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bus.sock")
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run(path))
+        finally:
+            loop.close()
+
+        os.environ["MARKET_DATA_BUS"] = path
+        try:
+            assert MarketDataBusClient.from_env() is None  # socket removed on stop
+        finally:
+            del os.environ["MARKET_DATA_BUS"]
+
+
+def test_sentiment_and_lighter_candles_fall_back_when_bus_is_down(tmp_path, monkeypatch):
+    from lighter_agent.data import lighter_fetcher
+    from lighter_agent.data.lighter_fetcher import LighterDataFetcher
+    from llm_agent.data.sentiment_fetcher import SentimentFetcher
+
+    monkeypatch.chdir(tmp_path)
+    snapshot = {'timestamp': '2026-01-01T00:00:00', 'combined_score': 61.0, 'fear_greed': {'value': 70}}
+
+    async def sentiment():
+        return snapshot
+
+    class FakeResponse:
+        status_code = 200
+
+        def json(self):
+            return {'candlesticks': [{'timestamp': 1_700_000_300_000 - i * 300_000, 'open': 1, 'high': 2,
+                                      'low': 0.5, 'close': 1.5, 'volume1': 10} for i in range(3)]}
+
+    requests_made = []
+    monkeypatch.setattr(lighter_fetcher.requests, "get", lambda url, **kw: requests_made.append(url) or FakeResponse())
+
+    async def run(path):
+        daemon = MarketDataDaemon(path=path, sources={'sentiment': Source('sentiment', interval=60.0, fetch=sentiment)})
+        await daemon.start()
+        bus = MarketDataBusClient(path)
+        try:
+            # Bots read the daemon's sentiment snapshot instead of polling the sources
+            assert await SentimentFetcher(market_bus=bus).fetch_all() == snapshot
+        finally:
+            await bus.close()
+            await daemon.stop()
+
+        # Bus down and no CandlestickApi: the fetcher goes straight to Lighter REST
+        fetcher = LighterDataFetcher(market_bus=MarketDataBusClient(path))
+        fetcher.market_ids, fetcher._initialized = {'SOL': 2}, True
+        df = await fetcher.fetch_kline("SOL", "5m", 3)
+        assert len(df) == 3 and df['timestamp'].is_monotonic_increasing
+        assert requests_made and requests_made[0].endswith("/api/v1/candlesticks")
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run(str(tmp_path / "bus.sock")))
+    finally:
+        loop.close()
+
+
+def test_client_reconnects_across_loops_and_does_not_wait_on_stale_topics(tmp_path):
+    import threading
+    import time
+
+    calls = []
+
+    async def candles(venue, symbol, interval):
+        calls.append(symbol)
+        return [[1_700_000_000_000, 1.0, 2.0, 0.5, 1.5, 10.0]]
+
+    # Daemon on its own loop in a thread, so it outlives the client's loops
+    path = str(tmp_path / "bus.sock")
+    daemon_loop = asyncio.new_event_loop()
+    daemon = MarketDataDaemon(path=path, sources={'candles': Source('candles', interval=3600.0, fetch=candles)})
+    daemon_loop.run_until_complete(daemon.start())
+    thread = threading.Thread(target=daemon_loop.run_forever, daemon=True)
+    thread.start()
+
+    def run(coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    client = MarketDataBusClient(path)
+    try:
+        assert len(run(client.klines("binance", "ETHUSDT", "5m"))) == 1
+        first_writer = client._writer
+
+        # A new loop replaces the connection instead of leaking it
+        assert len(run(client.klines("binance", "ETHUSDT", "5m"))) == 1
+        assert client._writer is not first_writer and first_writer.is_closing()
+        time.sleep(0.1)
+        assert len(daemon._connections) == 1  # the daemon saw the old connection end
+
+        # A stale snapshot fails fast instead of blocking for the full timeout
+        async def stale():
+            start = time.perf_counter()
+            assert await client.get("candles:binance:ETHUSDT:5m", timeout=2.0, max_age=0.0) is None
+            return time.perf_counter() - start
+
+        assert run(stale()) < 0.5
+        assert calls == ["ETHUSDT"]
+    finally:
+        run(client.close())
+        asyncio.run_coroutine_threadsafe(daemon.stop(), daemon_loop).result(5)
+        daemon_loop.call_soon_threadsafe(daemon_loop.stop)
+        thread.join(5)
+        daemon_loop.close()
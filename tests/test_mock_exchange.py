@@ -0,0 +1,101 @@
+"""
+Tests for the local mock exchange (dexes/mock_exchange)
+
+Run with: python -m pytest tests/test_mock_exchange.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dexes.extended.extended_sdk import ExtendedSDK
+from dexes.hibachi.hibachi_sdk import HibachiSDK
+from dexes.mock_exchange import MockExchange, MockExchangeServer, MockMarket
+from dexes.mock_exchange.engine import CANCELLED, FILLED, OPEN, REJECTED
+
+
+def make_exchange():
+    market = MockMarket("BTC-USD", price=100.0, tick_size=0.1, house_levels=2, house_level_size=1.0,
+                        house_spread_bps=10.0, house_step_bps=10.0, maker_fee=-0.0001, taker_fee=0.001,
+                        funding_rate=0.01)
+    return MockExchange([market], seed=1, clock=lambda: 0.0)
+
+
+def test_matching_positions_and_funding():
+    ex = make_exchange()
+    assert ex.bbo("BTC-USD") == (99.9, 100.1)
+
+    # Price-time priority: two resting bids at 100.0, the first one fills first
+    first = ex.submit("maker", "BTC-USD", "BUY", 1.0, price=100.0)
+    second = ex.submit("maker", "BTC-USD", "BUY", 1.0, price=100.0)
+    assert ex.submit("maker", "BTC-USD", "SELL", 1.0, price=100.0, post_only=True).status == REJECTED
+    sell = ex.submit("taker", "BTC-USD", "SELL", 1.5, price=100.0)
+    assert sell.status == FILLED and first.status == FILLED
+    assert second.status == OPEN and second.remaining == 0.5
+
+    # Market order walks the house asks: 1.0 @ 100.1 + 0.5 @ 100.2, taker fee on both
+    taker = ex.accounts["taker"]
+    buy = ex.submit("taker", "BTC-USD", "BUY", 1.5, order_type="MARKET")
+    assert buy.status == FILLED and abs(buy.avg_fill_price - (100.1 + 0.5 * 100.2) / 1.5) < 1e-9
+    position = taker.positions["BTC-USD"]
+    assert abs(position.size) < 1e-12 and abs(position.realized_pnl - (-1.0 * 0.1 - 0.5 * 0.2)) < 1e-9
+
+    # The maker is long 1.5: reduce-only buys are rejected and funding is charged
+    maker = ex.accounts["maker"]
+    assert maker.positions["BTC-USD"].size == 1.5
+    assert ex.submit("maker", "BTC-USD", "BUY", 1.0, order_type="MARKET", reduce_only=True).status == REJECTED
+    balance = maker.balance
+    ex.accrue_funding()
+    assert maker.balance < balance and maker.positions["BTC-USD"].funding_paid > 0
+
+    assert ex.cancel(second.order_id, "taker") is False
+    assert ex.cancel(second.order_id, "maker") and second.status == CANCELLED
+    assert not ex.open_orders("maker")
+
+
+def test_sdks_against_mock_server_with_injected_errors():
+    async def run():
+        async with MockExchangeServer(venues=["hibachi", "extended"], step_interval=0, latency=0.001, seed=3) as server:
+            url = server.base_url("hibachi")
+            hibachi = HibachiSDK("key", "secret", "7", base_url=url, data_api_url=url)
+            assert hibachi._http.rate_limit is None  # local venue skips the shared live budget
+
+            assert await hibachi.get_price("BTC/USDT-P") == 100000.0
+            order = await hibachi.create_limit_order("BTC/USDT-P", True, 0.001, 99000.0)
+            orders = await hibachi.get_orders("BTC/USDT-P")
+            assert [o['orderId'] for o in orders] == [order['orderId']] and orders[0]['status'] == "PLACED"
+            assert await hibachi.cancel_order(order['orderId'])
+            assert await hibachi.get_orders() == []
+
+            # Orders placed in the same millisecond still get distinct nonces
+            batch = await asyncio.gather(*(
+                hibachi.create_limit_order("BTC/USDT-P", True, 0.001, 98000.0 - i) for i in range(5)
+            ))
+            assert all(batch) and len(await hibachi.get_orders("BTC/USDT-P")) == 5
+            assert await hibachi.cancel_all_orders("BTC/USDT-P") == 5
+
+            await hibachi.create_market_order("BTC/USDT-P", False, 0.01)
+            assert await hibachi.get_position_size("BTC/USDT-P") == -0.01
+
+            server.fail_next(2, status=503)
+            assert await hibachi.get_balance() is None
+            assert (await hibachi.create_limit_order("BTC/USDT-P", True, 0.001, 99000.0)) is None  # market info failed
+            assert await hibachi.get_balance() > 0
+            assert server.injected_errors == 2
+            await hibachi.close()
+
+            extended = ExtendedSDK("ext-key", base_url=server.base_url("extended"))
+            assert await extended.get_price("ETH-USD") == 3500.0
+            book = await extended.get_orderbook("ETH-USD")
+            assert float(book['bid'][0]['price']) < float(book['ask'][0]['price'])
+            assert await extended.get_positions() == []
+            await extended.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
@@ -0,0 +1,55 @@
+"""
+Tests for the shared per-cycle OI snapshot (llm_agent/data/oi_fetcher.py)
+
+Run with: python -m pytest tests/test_oi_snapshot.py -v
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_agent.data.oi_fetcher import OIDataFetcher, OISnapshotCache
+
+
+class FakeSourcesFetcher(OIDataFetcher):
+    """OIDataFetcher with Binance/HyperLiquid answered from dicts (None = request failed)"""
+
+    def __init__(self, binance, hyperliquid, cache):
+        super().__init__(snapshot_cache=cache)
+        self.binance = binance
+        self.hyperliquid = hyperliquid
+        self.binance_calls = []
+        self.hl_calls = 0
+
+    def fetch_binance_oi(self, symbol):
+        self.binance_calls.append(symbol)
+        return self.binance.get(symbol)
+
+    def fetch_hyperliquid_data(self):
+        self.hl_calls += 1
+        return dict(self.hyperliquid or {})
+
+
+def test_snapshot_shared_and_failures_not_cached():
+    cache = OISnapshotCache(ttl_seconds=3600)
+    fetcher = FakeSourcesFetcher({'SOL': 100.0, 'BTC': None}, {'BTC': 5.0, 'HYPE': 7.0}, cache)
+
+    snapshot = fetcher.get_oi_snapshot(['SOL/USDT-P', 'BTC-USD', 'ETH-USD-PERP'])
+    assert snapshot == {'SOL/USDT-P': 100.0, 'BTC-USD': 5.0, 'ETH-USD-PERP': None}
+    assert sorted(fetcher.binance_calls) == ['BTC', 'ETH', 'SOL'] and fetcher.hl_calls == 1
+
+    # A second fetcher in the same cycle reads the cached values; only the miss is retried
+    other = FakeSourcesFetcher({'ETH': 42.0}, {}, cache)
+    assert other.get_oi_snapshot(['SOL', 'ETH']) == {'SOL': 100.0, 'ETH': 42.0}
+    assert other.binance_calls == ['ETH']
+    assert other.fetch_oi('ETH') == 42.0 and other.binance_calls == ['ETH']
+
+    # A failed HyperLiquid call is retried on the next read instead of hiding OI for the TTL
+    flaky = FakeSourcesFetcher({}, None, OISnapshotCache(ttl_seconds=3600))
+    assert flaky.get_oi_snapshot(['HYPE']) == {'HYPE': None}
+    flaky.hyperliquid = {'HYPE': 7.0}
+    assert flaky.get_oi_snapshot(['HYPE']) == {'HYPE': 7.0}
+    assert flaky.hl_calls == 2
+    assert flaky.get_hyperliquid_oi('HYPE') == 7.0 and flaky.hl_calls == 2
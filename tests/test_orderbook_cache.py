@@ -0,0 +1,93 @@
+"""
+Tests for the order book cache and the LiquidityChecker built on it
+
+Run with: python -m pytest tests/test_orderbook_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.orderbook_cache import OrderBook, OrderBookCache
+from lighter_agent.data.liquidity_checker import LiquidityChecker
+
+
+def test_depth_queries_match_level_walk():
+    rng = np.random.default_rng(3)
+    asks = [[100 + 0.1 * i, float(s)] for i, s in enumerate(rng.uniform(0.5, 2.0, 200))]
+    bids = [[99.9 - 0.1 * i, float(s)] for i, s in enumerate(rng.uniform(0.5, 2.0, 200))]
+    rng.shuffle(asks)
+    book = OrderBook(bids=bids, asks=asks)
+    assert book.asks.best == 100.0 and book.bids.best == 99.9
+
+    for limit in (99.0, 100.0, 102.05, 130.0):
+        assert abs(book.asks.size_within(limit) - sum(s for p, s in asks if p <= limit)) < 1e-9
+        assert abs(book.bids.size_within(limit) - sum(s for p, s in bids if p >= limit)) < 1e-9
+
+    # VWAP for a size: walk the ordered asks by hand
+    remaining, notional = 5.0, 0.0
+    for price, size in sorted(asks):
+        take = min(size, remaining)
+        notional, remaining = notional + take * price, remaining - take
+        if remaining <= 0:
+            break
+    filled, vwap, worst = book.asks.fill(5.0)
+    assert filled == 5.0 and abs(vwap - notional / 5.0) < 1e-9 and worst >= vwap
+    assert book.asks.fill(1e9)[0] == book.asks.total_size
+
+    # Incremental updates: remove the best ask, add a better one
+    cache = OrderBookCache()
+    cache.update("SOL", bids, asks)
+    assert cache.apply_delta("SOL", "ask", 100.0, 0)
+    assert cache.apply_delta("SOL", "ask", 99.95, 3.0)
+    assert cache.get("SOL").asks.best == 99.95 and cache.get("SOL").asks.size_within(99.95) == 3.0
+    assert not cache.apply_delta("ETH", "bid", 1.0, 1.0)
+
+
+class FakeSDK:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_market_id_for_symbol(self, symbol):
+        return {"SOL": 2, "BTC": 1}.get(symbol)
+
+    async def get_orderbook(self, market_id):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {'bids': [[99.0, 5.0], [98.0, 5.0]], 'asks': [[101.0, 1.0], [102.0, 9.0], [110.0, 50.0]]}
+
+
+def test_batch_check_shares_prefetched_books():
+    async def run():
+        sdk = FakeSDK()
+        checker = LiquidityChecker(sdk)
+        checker.prefetch(["SOL", "BTC"])
+        results = await checker.check_batch([
+            {'symbol': 'SOL', 'side': 'BUY', 'size_usd': 400.0, 'current_price': 100.0},
+            {'symbol': 'SOL', 'side': 'SELL', 'size_usd': 600.0, 'current_price': 100.0},
+            {'symbol': 'BTC', 'side': 'BUY', 'size_usd': 500.0, 'current_price': 100.0},
+            {'symbol': 'DOGE', 'side': 'BUY', 'size_usd': 10.0, 'current_price': 1.0},
+        ])
+        assert sdk.calls == 2  # one fetch per market, shared by prefetch and the batch
+
+        # BUY: asks within 2% = 10 tokens = $1000 -> 2.5x; fills 1 @ 101 + 3 @ 102
+        assert results[0]['has_liquidity'] and abs(results[0]['depth_ratio'] - 2.5) < 1e-9
+        assert abs(results[0]['expected_slippage_pct'] - ((101 + 3 * 102) / 4 - 100)) < 1e-9
+        # SELL: bids within 2% = 10 tokens = $1000 -> 1.67x < 2x
+        assert not results[1]['has_liquidity'] and "INSUFFICIENT" in results[1]['reason']
+        assert results[2]['has_liquidity']
+        assert not results[3]['has_liquidity'] and "market ID" in results[3]['reason']
+
+        again = await checker.check_liquidity("SOL", "BUY", 100.0, 100.0)
+        assert again['has_liquidity'] and sdk.calls == 2 and checker.books.hits >= 1
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
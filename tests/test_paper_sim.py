@@ -0,0 +1,99 @@
+"""
+Tests for the paper simulation clock, fill models and recordings (core/paper_sim.py)
+
+Run with: python -m pytest tests/test_paper_sim.py -v
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.paper_sim import (
+    MidFill,
+    QuoteRecorder,
+    RecordedFeed,
+    ReplayClock,
+    TouchFill,
+    load_recording,
+    recording_span,
+)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_replay_clock_interleaves_tasks_in_virtual_time():
+    clock = ReplayClock(start=1000.0)
+    events = []
+
+    async def venue(name, interval):
+        while clock.time() < 1000.0 + 7200:
+            await clock.sleep(interval)
+            await asyncio.sleep(0)  # real awaits (network, LLM) freeze the clock
+            events.append((clock.time(), name))
+
+    async def decisions():
+        while clock.time() < 1000.0 + 7200:
+            events.append((clock.time(), "decide"))
+            await asyncio.sleep(0.001)
+            await clock.sleep(600)
+
+    start = time.perf_counter()
+    run(clock.run([venue("hibachi", 60), venue("paradex", 45), decisions()]))
+    assert time.perf_counter() - start < 2.0  # two simulated hours
+
+    assert [t for t, _ in events] == sorted(t for t, _ in events)
+    assert sum(1 for _, n in events if n == "hibachi") == 120
+    assert sum(1 for _, n in events if n == "paradex") == 160
+    assert [t for t, n in events if n == "decide"] == [1000.0 + 600 * i for i in range(12)]
+
+    other = ReplayClock(start=0.0)
+
+    async def healthy():
+        while True:
+            await other.sleep(60)
+
+    async def broken():
+        await other.sleep(90)
+        raise RuntimeError("venue down")
+
+    try:
+        run(other.run([healthy(), broken()]))
+        assert False, "task error should propagate"
+    except RuntimeError as e:
+        assert "venue down" in str(e)
+
+
+def test_recording_round_trip_and_fill_models():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "quotes", "run.jsonl")
+        recorder = QuoteRecorder(path)
+        recorder.record("paradex", 100.0, {"BTC": {"price": 100.0, "bid": 99.0, "ask": 101.0}})
+        recorder.record("hibachi", 100.5, {"BTC": {"price": 100.2}})
+        recorder.record("paradex", 160.0, {"BTC": {"price": 110.0, "bid": 109.0, "ask": 111.0}})
+        recorder.close()
+
+        recording = load_recording(path)
+        assert recording_span(recording) == (100.0, 160.0)
+        clock = ReplayClock(start=50.0)
+        feed = RecordedFeed(recording["paradex"], clock)
+        assert run(feed.fetch()) == {}
+        clock._now = 159.0
+        quote = run(feed.fetch())["BTC"]
+        assert quote["price"] == 100.0
+
+    assert MidFill().price(True, quote) == 100.0
+    assert TouchFill().price(True, quote) == 101.0 and TouchFill().price(False, quote) == 99.0
+    assert TouchFill().price(True, {"price": 50.0}) == 50.0
+    assert abs(MidFill(slippage_bps=10).price(False, quote) - 99.9) < 1e-9
+    assert MidFill().price(True, {}) is None
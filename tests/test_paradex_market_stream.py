@@ -0,0 +1,104 @@
+"""
+Tests for the Paradex market stream and local paper client
+
+Run with: python -m pytest tests/test_paradex_market_stream.py -v
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dexes.paradex import BBOUpdate, FillUpdate, LocalMarketFeed, LocalParadexClient, OrderUpdate
+from dexes.paradex.market_stream import parse_batch_cancel, parse_bbo, parse_fill, parse_order
+
+
+def limit_order(side: str, price: float, size: float):
+    return SimpleNamespace(order_side=side, order_type="LIMIT", size=size, limit_price=price, instruction="POST_ONLY")
+
+
+def test_parse_ws_payloads():
+    bbo = parse_bbo({'bid': '100.5', 'ask': '101.5', 'bid_size': '2', 'ask_size': '3', 'last_updated_at': 1700000000000})
+    assert bbo.mid == 101.0 and bbo.timestamp == 1700000000.0
+    assert parse_bbo({'bid': '100.5'}) is None
+
+    order = parse_order({'id': 'o1', 'status': 'CLOSED', 'side': 'BUY', 'price': '100', 'size': '0.5', 'remaining_size': '0.2'})
+    assert order.filled_size == 0.5 - 0.2
+
+    fill = parse_fill({'id': 'f1', 'order_id': 'o1', 'side': 'SELL', 'price': '101', 'size': '0.1'})
+    assert (fill.order_id, fill.side, fill.size) == ('o1', 'SELL', 0.1)
+
+
+def test_local_client_fills_orders_the_price_walks_through():
+    client = LocalParadexClient("BTC-USD-PERP", balance=100.0)
+    client.match(BBOUpdate(bid=99.0, ask=101.0))
+
+    buy = client.submit_order(limit_order("BUY", 98.0, 1.0))
+    assert buy['status'] == 'OPEN'
+    # POST_ONLY order that would cross is rejected
+    assert client.submit_order(limit_order("SELL", 98.0, 1.0))['status'] == 'CLOSED'
+
+    assert client.match(BBOUpdate(bid=98.5, ask=99.0)) == []
+    events = client.match(BBOUpdate(bid=97.0, ask=98.0))
+    assert [type(e) for e in events] == [FillUpdate, OrderUpdate]
+    assert events[1].status == 'CLOSED' and events[1].order_id == buy['id']
+    assert client.position_size == 1.0 and client.entry_price == 98.0
+    assert client.fetch_orders()['results'] == []
+
+
+def test_feed_queues_bbo_and_fill_events():
+    async def run():
+        client = LocalParadexClient("BTC-USD-PERP")
+        feed = LocalMarketFeed("BTC-USD-PERP", start_price=100.0, volatility_bps=0.0, exchange=client)
+        assert feed.is_stale()
+
+        feed.step()
+        client.submit_order(limit_order("SELL", 101.0, 1.0))
+        feed.mid = 102.0  # next BBO trades through the resting sell
+        feed.step()
+        await feed.start()
+        events = [await feed.next_event(timeout=0.1) for _ in range(4)]
+        await feed.stop()
+        return feed, events
+
+    loop = asyncio.new_event_loop()
+    try:
+        feed, events = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert [type(e).__name__ for e in events] == ['BBOUpdate', 'BBOUpdate', 'FillUpdate', 'OrderUpdate']
+    assert feed.is_stale()  # stopped
+
+
+def test_full_queue_drops_bbo_not_fills():
+    feed = LocalMarketFeed("BTC-USD-PERP")
+    feed._queue = asyncio.Queue(maxsize=2)
+    feed.push(BBOUpdate(1.0, 2.0))
+    feed.push(BBOUpdate(1.0, 2.0))
+    feed.push(BBOUpdate(1.0, 2.0))
+    feed.push(FillUpdate("f1", "o1", "BUY", 1.0, 1.0))
+
+    assert feed.events_dropped == 2
+    queued = [feed._queue.get_nowait() for _ in range(2)]
+    assert isinstance(queued[-1], FillUpdate)
+
+    # Queue holding only order/fill events: the new one is counted as dropped instead of raising
+    feed.push(FillUpdate("f2", "o1", "BUY", 1.0, 1.0))
+    feed.push(FillUpdate("f3", "o1", "BUY", 1.0, 1.0))
+    feed.push(FillUpdate("f4", "o1", "BUY", 1.0, 1.0))
+    assert feed.events_dropped == 3 and feed._queue.qsize() == 2
+
+
+def test_batch_cancel_only_confirmed_ids_count():
+    response = {'results': [{'id': 'a', 'status': 'QUEUED_FOR_CANCELLATION'},
+                            {'id': 'b', 'status': 'ALREADY_CLOSED'}]}
+    assert parse_batch_cancel(response, ['a', 'b', 'c']) == (['a'], ['c'])
+    assert parse_batch_cancel(None, ['a', 'b']) == ([], ['a', 'b'])
+
+    client = LocalParadexClient("BTC-USD-PERP")
+    resting = client.submit_order(limit_order("BUY", 90.0, 1.0))['id']
+    response = client.api_client.cancel_orders_batch(order_ids=[resting, "gone"])
+    assert parse_batch_cancel(response, [resting, "gone"]) == ([resting], [])
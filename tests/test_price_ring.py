@@ -0,0 +1,57 @@
+"""
+Tests for the grid MM price history ring (core/grid_mm/price_ring.py)
+
+Run with: python -m pytest tests/test_price_ring.py -v
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.grid_mm import PriceRing
+
+
+def test_signals_match_deque_formulas_after_wrap():
+    rng = np.random.default_rng(7)
+    prices = 100.0 * np.cumprod(1 + rng.normal(0, 0.001, 500))
+    ring, history = PriceRing(30), deque(maxlen=30)
+    for price in prices:
+        ring.append(price)
+        history.append(price)
+
+    window = list(history)
+    assert len(ring) == 30 and ring[0] == window[0] and ring[-1] == window[-1]
+    assert np.array_equal(ring.prices(), window)
+    assert abs(ring.roc_bps(10) - (window[-1] - window[-10]) / window[-10] * 10000) < 1e-9
+    mean_abs = sum(abs(b - a) / a for a, b in zip(window, window[1:])) / 29 * 10000
+    assert abs(ring.mean_abs_return_bps() - mean_abs) < 1e-9
+    trend = (sum(window[-5:]) / 5 - sum(window[-10:-5]) / 5) / (sum(window[-10:-5]) / 5) * 10000
+    assert abs(ring.trend_bps(10) - trend) < 1e-9
+    assert ring.realized_vol_bps() > 0
+    assert PriceRing(30).roc_bps(10) == 0.0
+
+
+def test_mmap_history_survives_restart_unless_stale():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state", "BTC.ring")
+        now = time.time()
+        ring = PriceRing(5, path=path)
+        for i in range(7):
+            ring.append(100.0 + i, ts=now - 7 + i)
+        ring.close()
+
+        restored = PriceRing(5, path=path)
+        assert list(restored.prices()) == [102.0, 103.0, 104.0, 105.0, 106.0]
+        assert restored.samples_since(2.5, now=now) == 2
+        restored.append(107.0)
+        assert restored[0] == 103.0
+
+        assert len(PriceRing(5, path=path, max_gap=0.0)) == 0  # too old to trust
+        assert len(PriceRing(6, path=path)) == 0                # capacity changed
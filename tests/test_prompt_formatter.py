@@ -0,0 +1,47 @@
+"""
+Tests for the stable-prefix prompt layout and prompt cache accounting
+
+Run with: python -m pytest tests/test_prompt_formatter.py -v
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_agent.llm.chat_stream import normalize_cache_usage
+from llm_agent.llm.prompt_formatter import PromptFormatter
+
+
+def test_consecutive_prompts_share_stable_prefix():
+    formatter = PromptFormatter()
+    context = dict(
+        macro_context="MACRO: risk-on",
+        deep42_context={"regime": "Bull", "btc_health": "Strong"},
+        analyzed_tokens=["BTC", "ETH"],
+        dex_name="Hibachi",
+    )
+
+    first = formatter.format_trading_prompt(market_table="BTC 100000", account_balance=50.0, **context)
+    assert not formatter.last_prompt_stats['prefix_reused']
+    second = formatter.format_trading_prompt(market_table="BTC 100250", account_balance=49.5, **context)
+    stats = formatter.last_prompt_stats
+
+    assert stats['prefix_reused']
+    assert first[:stats['prefix_chars']] == second[:stats['prefix_chars']]
+    prefix = second[:stats['prefix_chars']]
+    assert "HIBACHI TRADING STRATEGY" in prefix and "DEEP42" in prefix and "MACRO: risk-on" in prefix
+    assert "BTC 100250" not in prefix and "ACCOUNT BALANCE" not in prefix
+    assert prefix.index("RESPONSE FORMAT") < prefix.index("DEEP42")
+
+
+def test_normalize_cache_usage_across_providers():
+    deepseek = normalize_cache_usage({'prompt_tokens': 1000, 'prompt_cache_hit_tokens': 900,
+                                      'prompt_cache_miss_tokens': 100})
+    openrouter = normalize_cache_usage({'prompt_tokens': 1000, 'prompt_tokens_details': {'cached_tokens': 640}})
+    no_cache = normalize_cache_usage({'prompt_tokens': 1000})
+
+    assert (deepseek['cached_tokens'], deepseek['uncached_tokens']) == (900, 100)
+    assert (openrouter['cached_tokens'], openrouter['uncached_tokens']) == (640, 360)
+    assert (no_cache['cached_tokens'], no_cache['uncached_tokens']) == (0, 1000)
@@ -185,6 +185,40 @@ class TestOutcomeTracker:
         finally:
             os.unlink(temp_file)
 
+    def test_ids_unique_across_processes(self, tmp_path):
+        """Two trackers on separate connections (as in two bots) never share an id"""
+        import threading
+        import time
+        from core.trade_store import TradeStore
+
+        db_path = str(tmp_path / "trades.db")
+        log_file = str(tmp_path / "outcomes.json")
+        trackers = [OutcomeTracker(log_file=log_file, db_path=db_path) for _ in range(2)]
+        trackers[1].store = TradeStore(db_path)  # own connection, like another process
+        ids = []
+
+        for tracker in trackers:
+            def slow_get_meta(*args, _get=tracker.store.get_meta, **kwargs):
+                value = _get(*args, **kwargs)
+                time.sleep(0.001)  # widen the read-then-write window
+                return value
+            tracker.store.get_meta = slow_get_meta
+
+        def open_trades(tracker):
+            for _ in range(20):
+                ids.append(tracker.record_entry(symbol="SOL/USDT-P", direction="LONG",
+                                                confidence=0.7, entry_price=100.0))
+
+        threads = [threading.Thread(target=open_trades, args=(t,)) for t in trackers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(ids) == list(range(1, 41))
+        assert len(trackers[0].get_open_trades()) == 40
+        trackers[1].store.close()
+
 
 class TestPerformanceAnalyzer:
     """Test PerformanceAnalyzer functionality"""
@@ -0,0 +1,57 @@
+"""
+Tests for the Shared Rate Limiter
+
+Run with: python -m pytest tests/test_shared_rate_limiter.py -v
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.shared_rate_limiter import RateLimit, SharedRateLimiter
+
+
+def test_burst_then_rate(tmp_path):
+    limiter = SharedRateLimiter({"api": RateLimit(rate=10.0, burst=3)}, state_dir=str(tmp_path))
+    waits = [limiter.reserve("api") for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.09 < waits[3] <= 0.1 and 0.19 < waits[4] <= 0.2  # queued behind each other
+    stats = limiter.get_stats()['endpoints']['api']
+    assert stats['requests'] == 5 and stats['waited'] == 2
+
+
+def test_budget_is_shared_between_limiters(tmp_path):
+    limits = {"api": RateLimit(rate=1.0, burst=2)}
+    bot_a = SharedRateLimiter(limits, state_dir=str(tmp_path))
+    bot_b = SharedRateLimiter(limits, state_dir=str(tmp_path))
+
+    assert bot_a.reserve("api") == 0.0
+    assert bot_b.reserve("api") == 0.0
+    assert bot_a.reserve("api") > 0.9  # bucket drained by both
+
+    bot_b.penalize("api", 5.0)
+    assert bot_a.reserve("api") > 5.0
+
+
+def test_acquire_does_not_block_event_loop():
+    limiter = SharedRateLimiter({"api": RateLimit(rate=20.0, burst=1)}, shared=False)
+    ticks = []
+
+    async def heartbeat():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        start = time.monotonic()
+        await asyncio.gather(heartbeat(), *(limiter.acquire("api") for _ in range(3)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.new_event_loop().run_until_complete(scenario())
+    assert 0.09 <= elapsed < 0.3
+    assert len(ticks) == 5 and ticks[1] - ticks[0] < 0.05
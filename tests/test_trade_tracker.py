@@ -0,0 +1,96 @@
+"""
+Tests for the trade tracker storage backends (trade_tracker.py)
+
+Run with: python -m pytest tests/test_trade_tracker.py -v
+"""
+
+import json
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trade_tracker
+from core.trade_store import TradeStore
+from trade_tracker import TradeEventLog, TradeTracker
+
+
+def test_jsonl_instances_interleave_across_compactions(tmp_path):
+    bot = TradeTracker("hibachi", log_dir=str(tmp_path), backend="jsonl")
+    script = TradeTracker("hibachi", log_dir=str(tmp_path), backend="jsonl")
+
+    bot.log_entry("1", "BTC/USDT-P", "buy", 0.1, 100.0)
+    bot.log_entry("2", "ETH/USDT-P", "sell", 1.0, 10.0)
+    script.log_exit("1", 110.0, "tp")  # opened by the other instance
+
+    # The script compacts while the bot's view is behind; nothing the bot wrote is dropped
+    script.log_entry("3", "SOL/USDT-P", "buy", 2.0, 5.0)
+    script._store.compact(script.trades)
+    assert [t['order_id'] for t in json.load(open(tmp_path / "hibachi.json"))] == ["1", "2", "3"]
+
+    # Regrow the new generation past the bot's stale byte offset: it must reload, not seek mid-line
+    for i in range(4, 10):
+        script.log_entry(str(i), "DOGE/USDT-P", "buy", 1.0, 1.0)
+    assert bot._store.read_new_events() is None
+
+    bot.log_exit("3", 6.0, "tp")
+    bot.log_exit("2", 9.0, "tp")
+    script.log_exit("4", 1.5, "tp")
+
+    fresh = TradeEventLog(tmp_path, "hibachi").load()
+    status = {t['order_id']: t['status'] for t in fresh}
+    assert len(fresh) == 9
+    assert [o for o, s in status.items() if s == 'closed'] == ["1", "2", "3", "4"]
+    assert next(t for t in fresh if t['order_id'] == "1")['exit_price'] == 110.0
+
+    bot._sync_from_log()
+    assert bot.trades == fresh
+    assert bot.get_open_trade_for_symbol("ETH/USDT-P") is None
+    assert bot.get_order_id_for_symbol("DOGE/USDT-P") == "9"
+
+
+def test_sqlite_migrates_legacy_json_once(tmp_path):
+    db_path = str(tmp_path / "trades.db")
+    legacy = TradeTracker("lighter", log_dir=str(tmp_path), backend="jsonl")
+    legacy.log_entry("7", "ETH", "buy", 1.0, 10.0)
+    legacy._store.compact(legacy.trades)
+    legacy.log_entry("8", "SOL", "sell", 2.0, 5.0)  # still only in the event log
+    legacy.log_exit("7", 12.0, "tp")
+
+    tracker = TradeTracker("lighter", log_dir=str(tmp_path), db_path=db_path)
+    assert [(t['order_id'], t['status']) for t in tracker.trades] == [("7", "closed"), ("8", "open")]
+    assert tracker.get_order_id_for_symbol("SOL") == "8"
+
+    again = TradeTracker("lighter", log_dir=str(tmp_path), db_path=db_path)
+    count = TradeStore.shared(db_path).query_one("SELECT COUNT(*) AS n FROM trades WHERE dex = 'lighter'")
+    assert count['n'] == 2 and again.trades == tracker.trades
+
+
+def test_sqlite_instances_see_each_others_entries_and_exits(tmp_path):
+    bot = TradeTracker("hibachi", log_dir=str(tmp_path))
+    executor = TradeTracker("hibachi", log_dir=str(tmp_path))
+
+    bot.log_entry("1", "BTC/USDT-P", "buy", 0.1, 100.0)
+    executor.log_exit("1", 110.0, "tp")  # logged by the other instance
+    executor.log_entry("2", "ETH/USDT-P", "sell", 1.0, 10.0)
+
+    bot.refresh()
+    assert bot.get_open_trade_for_symbol("BTC/USDT-P") is None
+    assert bot.get_order_id_for_symbol("ETH/USDT-P") == "2"
+    bot.log_exit("2", 9.0, "tp")
+
+    # Compacting a stale view must not reopen the other instance's exit
+    executor._store.compact(executor.trades)
+    fresh = TradeTracker("hibachi", log_dir=str(tmp_path))
+    assert [(t['order_id'], t['status'], t['pnl']) for t in fresh.trades] == [("1", "closed", 1.0), ("2", "closed", 1.0)]
+    assert json.load(open(tmp_path / "hibachi.json")) == fresh.trades
+
+
+def test_global_trackers_created_on_first_access(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trade_tracker, "_global_trackers", {})
+    assert not (tmp_path / "logs").exists()
+    assert trade_tracker.tracker is trade_tracker.pacifica_tracker is trade_tracker.get_tracker("Pacifica")
+    assert trade_tracker.lighter_tracker.dex == "lighter"
+    assert (tmp_path / "logs" / "trades").is_dir()
@@ -0,0 +1,72 @@
+"""
+Tests for warm-start snapshots (core/warm_start.py)
+
+Run with: python -m pytest tests/test_warm_start.py -v
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import warm_start
+from core.warm_start import WarmStartStore
+from llm_agent.data.incremental_indicators import IncrementalIndicatorEngine
+
+
+def make_klines(n: int, start: str = '2026-01-01') -> pd.DataFrame:
+    close = 100 + np.cumsum(np.sin(np.arange(n) / 3.0))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq='5min'),
+        'open': close, 'high': close + 0.5, 'low': close - 0.5, 'close': close, 'volume': 1.0,
+    })
+
+
+def test_restart_restores_state_and_skips_stale_sections():
+    with tempfile.TemporaryDirectory() as tmp:
+        klines = make_klines(120)
+        engine = IncrementalIndicatorEngine(timeframe="5m")
+        engine.update("SOL", klines.iloc[:100])
+        symbols = {'available_symbols': ['BTC/USDT-P', 'SOL/USDT-P']}
+
+        store = WarmStartStore("bot", directory=tmp)
+        store.register("indicators", engine.get_state, engine.set_state, max_age=3600)
+        store.register("symbols", lambda: symbols, lambda s: None, max_age=3600)
+        store.register("empty", lambda: None, lambda s: None, max_age=3600)
+        assert store.save()
+
+        # "Restarted" process: indicators continue incrementally instead of rebuilding
+        restarted = IncrementalIndicatorEngine(timeframe="5m")
+        restored = {}
+        store = WarmStartStore("bot", directory=tmp)
+        store.register("indicators", restarted.get_state, restarted.set_state, max_age=3600)
+        store.register("symbols", lambda: symbols, lambda s: restored.update(s), max_age=3600)
+        assert sorted(store.restore()) == ["indicators", "symbols"] and restored == symbols
+        assert restarted.update("SOL", klines.iloc[5:105]) == engine.update("SOL", klines.iloc[5:105])
+        assert restarted.rebuilds == 0 and restarted.incremental_updates == 1
+
+        # Unchanged sections keep their original age; changed ones are re-stamped
+        with open(store.path, 'rb') as f:
+            first = pickle.load(f)
+        time.sleep(0.01)
+        store.save()
+        with open(store.path, 'rb') as f:
+            second = pickle.load(f)['sections']
+        assert second['symbols']['saved_at'] == first['sections']['symbols']['saved_at']
+        assert second['indicators']['saved_at'] > first['sections']['indicators']['saved_at']
+
+        # Too old for its max_age, or another snapshot version: start cold
+        late = WarmStartStore("bot", directory=tmp)
+        late.register("symbols", lambda: None, lambda s: None, max_age=0.0)
+        assert late.restore() == []
+        first['version'] = warm_start.SNAPSHOT_VERSION + 1
+        with open(store.path, 'wb') as f:
+            pickle.dump(first, f)
+        assert store.restore() == []
@@ -1,14 +1,31 @@
 """
 Trade Tracking System - DEX-aware with automatic rotation
 Maintains separate logs per DEX with size limits
+
+Storage backends:
+- "sqlite" (default): rows in the shared TradeStore database (core/trade_store.py)
+- "jsonl": append-only logs/trades/<dex>.events.jsonl
+
+Either way each entry/exit writes O(1) bytes, and <dex>.json is rewritten
+only on periodic compaction (kept for scripts that read it directly).
+Open trades are indexed by order_id and symbol.
 """
 import json
 import os
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields as dataclass_fields
 from pathlib import Path
 
+from core.trade_store import TradeStore
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
 @dataclass
 class TradeEntry:
     """Individual trade entry"""
@@ -29,63 +46,432 @@ class TradeEntry:
     notes: Optional[str] = None
     confidence: Optional[float] = None  # Track LLM confidence at entry
 
+TRADE_FIELDS = [f.name for f in dataclass_fields(TradeEntry)]
+
+
+def _trade_key(trade: Dict) -> tuple:
+    """Stable identity for a trade across snapshot + event log (entry time is unique per tracker)"""
+    return (trade.get('timestamp'), trade.get('order_id'))
+
+
+def _write_json_atomic(path: Path, data):
+    """Write JSON to a temp file and rename it over path"""
+    tmp_file = path.with_suffix('.json.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+class TradeEventLog:
+    """
+    Append-only trade storage: JSON snapshot + JSONL event log
+
+    <dex>.json holds the last compacted snapshot (same list format as before,
+    so analysis scripts keep working). <dex>.events.jsonl holds entry/exit
+    events written since then, one short line per event. Loading replays the
+    events on top of the snapshot; replay is idempotent, so a crash between
+    writing the snapshot and truncating the log loses nothing.
+
+    Several tracker instances (bot + scripts) may share the files: every
+    read, append and compaction holds an flock on <dex>.events.lock, and
+    compaction starts a new events file whose first line names its
+    generation, so a reader holding a byte offset into an older generation
+    reloads instead of seeking into the middle of someone else's line.
+    """
+
+    def __init__(self, log_dir: Path, dex: str):
+        self.snapshot_file = log_dir / f"{dex}.json"
+        self.events_file = log_dir / f"{dex}.events.jsonl"
+        self.lock_file = log_dir / f"{dex}.events.lock"
+        self.pending_events = 0  # events this instance wrote since last compaction
+        self._offset = 0  # bytes of events_file already applied
+        self._generation: Optional[str] = None  # events_file generation _offset refers to
+
+    @contextmanager
+    def _locked(self, exclusive: bool = False):
+        """Hold the cross-process lock on this DEX's files (no-op where fcntl is unavailable)"""
+        with open(self.lock_file, 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _start_generation(self):
+        """Replace the events file with an empty one headed by a new generation id"""
+        generation = uuid.uuid4().hex
+        tmp_file = self.events_file.with_suffix('.jsonl.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(json.dumps({'event': 'generation', 'id': generation}) + "\n")
+        os.replace(tmp_file, self.events_file)
+
+    @staticmethod
+    def _read_generation(f) -> Optional[str]:
+        """Generation id from the header line (None for logs written before headers)"""
+        f.seek(0)
+        try:
+            header = json.loads(f.readline())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return header.get('id') if isinstance(header, dict) and header.get('event') == 'generation' else None
+
+    def load(self) -> List[Dict]:
+        """Load snapshot and replay the event log"""
+        with self._locked(exclusive=True):
+            return self._load_locked()
+
+    def _load_locked(self) -> List[Dict]:
+        trades: List[Dict] = []
+        if self.snapshot_file.exists():
+            try:
+                with open(self.snapshot_file, 'r') as f:
+                    trades = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                print(f"Warning: Could not load {self.snapshot_file}, starting fresh")
+                trades = []
+
+        try:
+            with open(self.events_file, 'rb') as f:
+                self._generation = self._read_generation(f)
+        except FileNotFoundError:
+            self._generation = None
+        self._offset = 0
+        events = self._read_locked() or []
+        self.pending_events = len(events)
+        self.apply(trades, events)
+        return trades
+
+    def read_new_events(self) -> Optional[List[Dict]]:
+        """
+        Read events appended since the last read (by this or another tracker instance)
+
+        Returns:
+            List of new events, or None if the log was compacted underneath us
+        """
+        with self._locked():
+            return self._read_locked()
+
+    def _read_locked(self) -> Optional[List[Dict]]:
+        try:
+            f = open(self.events_file, 'rb')
+        except FileNotFoundError:
+            return [] if self._generation is None and not self._offset else None
+        events = []
+        with f:
+            if self._read_generation(f) != self._generation:
+                return None  # Another instance compacted since our last read
+            size = os.fstat(f.fileno()).st_size
+            if size < self._offset:
+                return None
+            if size == self._offset:
+                return []
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Torn write (crash mid-line) - retry later
+                self._offset += len(raw)
+                try:
+                    events.append(json.loads(raw))
+                except json.JSONDecodeError:
+                    print(f"Warning: Skipping corrupt line in {self.events_file}")
+        return events
+
+    @staticmethod
+    def apply(trades: List[Dict], events: List[Dict]):
+        """Replay events onto a trade list (already-applied events are skipped)"""
+        positions = {_trade_key(t): i for i, t in enumerate(trades)}
+        for event in events:
+            key = (event.get('timestamp'), event.get('order_id'))
+            if event.get('event') == 'entry':
+                if key not in positions:
+                    positions[key] = len(trades)
+                    trades.append(event['trade'])
+            elif event.get('event') == 'exit':
+                pos = positions.get(key)
+                if pos is not None:
+                    trades[pos].update(event['fields'])
+
+    def _append(self, event: Dict):
+        # _offset is left alone: other instances may have appended since our
+        # last read, and our own line is replayed harmlessly on the next one
+        line = (json.dumps(event) + "\n").encode()
+        with self._locked(exclusive=True):
+            with open(self.events_file, 'ab') as f:
+                f.write(line)
+        self.pending_events += 1
+
+    def append_entry(self, trade: Dict):
+        """Append an entry event"""
+        self._append({
+            'event': 'entry',
+            'timestamp': trade['timestamp'],
+            'order_id': trade.get('order_id'),
+            'trade': trade
+        })
+
+    def append_exit(self, trade: Dict, fields: Dict):
+        """Append an exit event (fields = updated trade fields)"""
+        self._append({
+            'event': 'exit',
+            'timestamp': trade['timestamp'],
+            'order_id': trade.get('order_id'),
+            'fields': fields
+        })
+
+    def compact(self, trades: List[Dict]):
+        """
+        Write a full snapshot atomically, then start a new event log generation
+
+        Events other instances appended since our last read are applied to
+        `trades` first (in place), so the snapshot never drops them.
+        """
+        with self._locked(exclusive=True):
+            events = self._read_locked()
+            if events is None:
+                trades[:] = self._load_locked()  # Disk already holds every instance's events
+            else:
+                self.apply(trades, events)
+            _write_json_atomic(self.snapshot_file, trades)
+            self._start_generation()
+            with open(self.events_file, 'rb') as f:
+                self._generation = self._read_generation(f)
+                self._offset = f.seek(0, os.SEEK_END)
+        self.pending_events = 0
+
+    def archive(self, trades: List[Dict], archive_file: Path) -> Optional[Path]:
+        """Write trades to an archive file"""
+        with open(archive_file, 'w') as f:
+            json.dump(trades, f, indent=2)
+        return archive_file
+
+
+class SQLiteTradeLog:
+    """
+    TradeTracker storage on the shared SQLite TradeStore
+
+    Every trade ever logged stays in the trades table; the tracker only
+    loads the most recent `window` rows (plus any older open ones) into
+    memory. The first load of a DEX with no rows imports the existing JSON
+    snapshot and event log. Compaction still exports <dex>.json for
+    analysis scripts that read it directly.
+    """
+
+    # Exits are re-read for this long after a sync, covering writers whose
+    # exit_timestamp was taken just before their UPDATE committed
+    EXIT_SYNC_SLACK = timedelta(seconds=60)
+
+    def __init__(self, store: TradeStore, log_dir: Path, dex: str, window: int):
+        self.store = store
+        self.dex = dex
+        self.window = window
+        self.snapshot_file = log_dir / f"{dex}.json"
+        self._legacy = TradeEventLog(log_dir, dex)
+        self.pending_events = 0
+        self._last_id = 0  # highest row id already loaded
+        self._synced_at = ""  # exits stamped at/after this were not yet seen by the last read
+
+    def load(self) -> List[Dict]:
+        """Load recent trades from the database (migrating JSON logs once)"""
+        exists = self.store.query_one("SELECT 1 FROM trades WHERE dex = ? LIMIT 1", (self.dex,))
+        if not exists:
+            legacy_trades = self._legacy.load()
+            if legacy_trades:
+                self.upsert(legacy_trades)
+                print(f"📥 Migrated {len(legacy_trades)} {self.dex} trades from JSON to {self.store.db_path}")
+
+        columns = ", ".join(TRADE_FIELDS)
+        self._synced_at = self._sync_marker()
+        rows = self.store.query(
+            f"SELECT id, {columns} FROM trades WHERE dex = ? AND (status = 'open' OR id IN "
+            f"(SELECT id FROM trades WHERE dex = ? ORDER BY id DESC LIMIT ?)) ORDER BY id",
+            (self.dex, self.dex, self.window)
+        )
+        self.pending_events = 0
+        trades = [dict(row) for row in rows]
+        for trade in trades:
+            self._last_id = max(self._last_id, trade.pop('id'))
+        return trades
+
+    def _sync_marker(self) -> str:
+        return (datetime.now() - self.EXIT_SYNC_SLACK).isoformat()
+
+    def read_new_events(self) -> Optional[List[Dict]]:
+        """
+        Rows other tracker instances inserted or closed since the last read
+
+        New rows are found by id, exits by exit_timestamp (both indexed).
+        Returned as entry/exit events so apply() merges them idempotently.
+        """
+        columns = ", ".join(TRADE_FIELDS)
+        synced_at, self._synced_at = self._synced_at, self._sync_marker()
+        rows = self.store.query(
+            f"SELECT id, {columns} FROM trades WHERE dex = ? AND (id > ? OR exit_timestamp >= ?) ORDER BY id",
+            (self.dex, self._last_id, synced_at)
+        )
+        events = []
+        for row in rows:
+            trade = dict(row)
+            self._last_id = max(self._last_id, trade.pop('id'))
+            key = {'timestamp': trade['timestamp'], 'order_id': trade.get('order_id')}
+            events.append({'event': 'entry', **key, 'trade': trade})
+            if trade.get('status') != 'open':
+                events.append({'event': 'exit', **key, 'fields': dict(trade)})
+        return events
+
+    apply = staticmethod(TradeEventLog.apply)
+
+    def upsert(self, trades: List[Dict]):
+        """Insert or update trades by (dex, entry timestamp, order_id)"""
+        columns = ", ".join(TRADE_FIELDS)
+        placeholders = ", ".join("?" for _ in TRADE_FIELDS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in TRADE_FIELDS if c not in ('dex', 'timestamp'))
+        self.store.executemany(
+            f"INSERT INTO trades (order_key, {columns}) VALUES (?, {placeholders}) "
+            f"ON CONFLICT (dex, timestamp, order_key) DO UPDATE SET {updates}",
+            [
+                [trade.get('order_id') or ''] +
+                [self.dex if c == 'dex' else trade.get(c) for c in TRADE_FIELDS]
+                for trade in trades
+            ]
+        )
+
+    def append_entry(self, trade: Dict):
+        """Insert a new trade row"""
+        self.upsert([trade])
+        self.pending_events += 1
+
+    def append_exit(self, trade: Dict, fields: Dict):
+        """Update a trade row with its exit fields"""
+        assignments = ", ".join(f"{c} = ?" for c in fields)
+        self.store.execute(
+            f"UPDATE trades SET {assignments} WHERE dex = ? AND timestamp = ? AND order_key = ?",
+            list(fields.values()) + [self.dex, trade['timestamp'], trade.get('order_id') or '']
+        )
+        self.pending_events += 1
+
+    def compact(self, trades: List[Dict]):
+        """Sync in-memory trades (may have been edited in place) and export <dex>.json"""
+        self.apply(trades, self.read_new_events())  # never overwrite another instance's exit
+        self.upsert(trades)
+        _write_json_atomic(self.snapshot_file, trades)
+        self.pending_events = 0
+
+    def archive(self, trades: List[Dict], archive_file: Path) -> Optional[Path]:
+        """Nothing to write - full history stays in the database"""
+        return None
+
+
 class TradeTracker:
     """DEX-aware trade tracker with automatic rotation"""
 
     MAX_TRADES_PER_FILE = 1000  # Rotate after 1000 trades
+    COMPACT_EVERY = 200  # Rewrite snapshot after this many logged events
 
-    def __init__(self, dex: str, log_dir: str = "logs/trades"):
+    def __init__(self, dex: str, log_dir: str = "logs/trades", backend: str = "sqlite",
+                 db_path: Optional[str] = None):
         """
         Initialize tracker for specific DEX
 
         Args:
             dex: "pacifica" or "lighter"
             log_dir: Directory for trade logs
+            backend: "sqlite" (shared TradeStore) or "jsonl" (append-only event log)
+            db_path: SQLite file for the sqlite backend (default: TRADE_STORE_DB or logs/trades.db)
         """
         self.dex = dex.lower()
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.log_dir / f"{self.dex}.json"
         self.trades: List[Dict] = []
+        # Open-trade indexes: positions in self.trades, most recent last
+        self._open_by_order_id: Dict[Optional[str], List[int]] = {}
+        self._open_by_symbol: Dict[str, List[int]] = {}
+        if backend == "sqlite":
+            self.trade_store: Optional[TradeStore] = TradeStore.shared(db_path)
+            self._store = SQLiteTradeLog(self.trade_store, self.log_dir, self.dex, self.MAX_TRADES_PER_FILE)
+        elif backend == "jsonl":
+            self.trade_store = None
+            self._store = TradeEventLog(self.log_dir, self.dex)
+        else:
+            raise ValueError(f"Unknown TradeTracker backend: {backend}")
         self._load_trades()
 
     def _load_trades(self):
-        """Load existing trades from file"""
-        if self.log_file.exists():
-            try:
-                with open(self.log_file, 'r') as f:
-                    self.trades = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                print(f"Warning: Could not load {self.log_file}, starting fresh")
-                self.trades = []
-        else:
-            self.trades = []
+        """Load existing trades (snapshot + event log)"""
+        self.trades = self._store.load()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Rebuild open-trade indexes from self.trades"""
+        self._open_by_order_id = {}
+        self._open_by_symbol = {}
+        for pos, trade in enumerate(self.trades):
+            if trade.get('status') == 'open':
+                self._index_open(pos, trade)
+
+    def _index_open(self, pos: int, trade: Dict):
+        self._open_by_order_id.setdefault(trade.get('order_id'), []).append(pos)
+        self._open_by_symbol.setdefault(trade.get('symbol'), []).append(pos)
+
+    def _unindex_open(self, pos: int, trade: Dict):
+        for index, key in ((self._open_by_order_id, trade.get('order_id')),
+                           (self._open_by_symbol, trade.get('symbol'))):
+            positions = index.get(key)
+            if positions and pos in positions:
+                positions.remove(pos)
+                if not positions:
+                    del index[key]
+
+    def _sync_from_log(self):
+        """Pick up events another tracker instance appended for this DEX"""
+        events = self._store.read_new_events()
+        if events is None:
+            self._load_trades()
+        elif events:
+            self._store.apply(self.trades, events)
+            self._rebuild_indexes()
+
+    def refresh(self):
+        """Pick up trades other tracker instances logged since the last call (e.g. dashboards)"""
+        self._sync_from_log()
 
     def _save_trades(self):
-        """Save trades to file with rotation if needed"""
-        # Rotate if too large
+        """
+        Compact: write the full trade list to the snapshot file
+
+        Also used after editing trade dicts in place (e.g. clean_tracker.py),
+        so indexes are rebuilt from the current list.
+        """
         if len(self.trades) > self.MAX_TRADES_PER_FILE:
             self._rotate_log()
+        self._store.compact(self.trades)
+        self._rebuild_indexes()
 
-        with open(self.log_file, 'w') as f:
-            json.dump(self.trades, f, indent=2)
+    def _maybe_compact(self):
+        """Rotate or compact once enough events have accumulated"""
+        if len(self.trades) > self.MAX_TRADES_PER_FILE:
+            self._save_trades()
+        elif self._store.pending_events >= self.COMPACT_EVERY:
+            self._store.compact(self.trades)
+            self._rebuild_indexes()  # compaction may have merged other instances' events
 
     def _rotate_log(self):
         """Rotate log file when it gets too large"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         archive_file = self.log_dir / f"{self.dex}_{timestamp}.json"
 
-        # Move current file to archive
-        if self.log_file.exists():
-            with open(self.log_file, 'r') as f:
-                old_trades = json.load(f)
-
-            with open(archive_file, 'w') as f:
-                json.dump(old_trades, f, indent=2)
+        # Archive the full in-memory history (no need to re-read the file)
+        archived = self._store.archive(self.trades, archive_file)
 
         # Keep only last 100 trades in active file
         self.trades = self.trades[-100:]
-        print(f"📦 Rotated {self.dex} trade log to {archive_file}")
+        self._rebuild_indexes()
+        if archived:
+            print(f"📦 Rotated {self.dex} trade log to {archived}")
+        else:
+            print(f"📦 Rotated {self.dex} in-memory trade window (history kept in {self.trade_store.db_path})")
 
     def log_entry(self, order_id: Optional[str], symbol: str, side: str,
                   size: float, entry_price: float, notes: str = None,
@@ -96,6 +482,7 @@ class TradeTracker:
         Returns:
             trade_id: Unique identifier for this trade
         """
+        self._sync_from_log()
         timestamp = datetime.now().isoformat()
         trade_id = f"{self.dex}_{symbol}_{timestamp}_{order_id or 'manual'}"
 
@@ -112,60 +499,67 @@ class TradeTracker:
             confidence=confidence
         )
 
-        self.trades.append(asdict(trade))
-        self._save_trades()
+        trade_dict = asdict(trade)
+        self.trades.append(trade_dict)
+        self._index_open(len(self.trades) - 1, trade_dict)
+        self._store.append_entry(trade_dict)
+        self._maybe_compact()
 
         return trade_id
 
     def log_exit(self, order_id: str, exit_price: float, exit_reason: str = None,
                  fees: float = 0.0):
         """Log trade exit and calculate P&L"""
-        # Find the trade by order_id
-        for trade in reversed(self.trades):
-            if trade.get('order_id') == order_id and trade['status'] == 'open':
-                # Calculate P&L
-                entry_price = trade['entry_price']
-                size = trade['size']
-                side = trade['side']
-
-                if side == "buy":
-                    pnl = (exit_price - entry_price) * size
-                    pnl_pct = (exit_price - entry_price) / entry_price
-                else:  # sell/short
-                    pnl = (entry_price - exit_price) * size
-                    pnl_pct = (entry_price - exit_price) / entry_price
-
-                # Update trade
-                trade['exit_price'] = exit_price
-                trade['exit_timestamp'] = datetime.now().isoformat()
-                trade['pnl'] = round(pnl - fees, 4)
-                trade['pnl_pct'] = round(pnl_pct, 4)
-                trade['fees'] = fees
-                trade['exit_reason'] = exit_reason
-                trade['status'] = 'closed'
-
-                self._save_trades()
-                return
-
-        print(f"Warning: Could not find open trade with order_id {order_id}")
-    
+        self._sync_from_log()
+        # Most recent open trade with this order_id
+        positions = self._open_by_order_id.get(order_id)
+        if not positions:
+            print(f"Warning: Could not find open trade with order_id {order_id}")
+            return
+
+        pos = positions[-1]
+        trade = self.trades[pos]
+
+        # Calculate P&L
+        entry_price = trade['entry_price']
+        size = trade['size']
+        side = trade['side']
+
+        if side == "buy":
+            pnl = (exit_price - entry_price) * size
+            pnl_pct = (exit_price - entry_price) / entry_price
+        else:  # sell/short
+            pnl = (entry_price - exit_price) * size
+            pnl_pct = (entry_price - exit_price) / entry_price
+
+        # Update trade
+        fields = {
+            'exit_price': exit_price,
+            'exit_timestamp': datetime.now().isoformat(),
+            'pnl': round(pnl - fees, 4),
+            'pnl_pct': round(pnl_pct, 4),
+            'fees': fees,
+            'exit_reason': exit_reason,
+            'status': 'closed'
+        }
+        trade.update(fields)
+        self._unindex_open(pos, trade)
+        self._store.append_exit(trade, fields)
+        self._maybe_compact()
+
     def get_order_id_for_symbol(self, symbol: str) -> Optional[str]:
         """Get order_id for the most recent open trade for symbol"""
-        # Search in reverse order (most recent first)
-        for trade in reversed(self.trades):
-            if trade.get('symbol') == symbol and trade.get('status') == 'open':
-                return trade.get('order_id')
-        return None
-    
+        trade = self.get_open_trade_for_symbol(symbol)
+        return trade.get('order_id') if trade else None
+
     def get_open_trade_for_symbol(self, symbol: str) -> Optional[Dict]:
         """Get the most recent open trade for symbol"""
-        for trade in reversed(self.trades):
-            if trade.get('symbol') == symbol and trade.get('status') == 'open':
-                return trade
-        return None
+        positions = self._open_by_symbol.get(symbol)
+        return self.trades[positions[-1]] if positions else None
 
     def get_open_trades(self) -> List[Dict]:
-        return [t for t in self.trades if t['status'] == 'open']
+        positions = sorted(p for ps in self._open_by_symbol.values() for p in ps)
+        return [self.trades[p] for p in positions]
 
     def get_closed_trades(self) -> List[Dict]:
         return [t for t in self.trades if t['status'] == 'closed']
@@ -264,9 +658,24 @@ class TradeTracker:
         print("=" * 60 + "\n")
 
 
-# Create global instances for each DEX
-pacifica_tracker = TradeTracker("pacifica")
-lighter_tracker = TradeTracker("lighter")
+_global_trackers: Dict[str, TradeTracker] = {}
+
+
+def get_tracker(dex: str) -> TradeTracker:
+    """Process-wide tracker for a DEX, created on first use"""
+    dex = dex.lower()
+    if dex not in _global_trackers:
+        _global_trackers[dex] = TradeTracker(dex)
+    return _global_trackers[dex]
+
+
+# Global instances for each DEX (pacifica_tracker, lighter_tracker, and
+# `tracker` for backwards compatibility - defaults to Pacifica), created on
+# first access so importing this module doesn't open logs/trades.db
+_GLOBAL_TRACKERS = {'pacifica_tracker': 'pacifica', 'lighter_tracker': 'lighter', 'tracker': 'pacifica'}
+
 
-# Backwards compatibility - defaults to Pacifica
-tracker = pacifica_tracker
+def __getattr__(name: str):
+    if name in _GLOBAL_TRACKERS:
+        return get_tracker(_GLOBAL_TRACKERS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,72 +1,301 @@
 """
-Shared Rate Limiter for DeepSeek API
-Coordinates rate limiting across multiple bots using the same API key
+Shared Rate Limiter - Token buckets per endpoint, shared across processes
+Coordinates request budgets across every bot using the same API keys
+
+Each endpoint ("deepseek", "openrouter", "hibachi", ...) has a token bucket:
+`rate` requests/second sustained with up to `burst` back-to-back. Bucket
+state lives in a small file per endpoint under RATE_LIMIT_DIR, updated under
+an exclusive flock, so all bots on the host draw from one budget.
+
+Acquiring never holds the lock while waiting: a caller reserves its token
+(the bucket may go negative, which queues later callers behind it), releases
+the lock and then sleeps - asyncio.sleep in async code, time.sleep in sync
+code. The critical section is a 16-byte read/write.
+
+On a 429, penalize() empties the bucket for every process so the whole host
+backs off together instead of each bot discovering the limit separately.
+
+Limits default to DEFAULT_LIMITS and can be overridden per endpoint with
+RATE_LIMIT_<ENDPOINT>="<rate>/<burst>", e.g. RATE_LIMIT_DEEPSEEK="2/5".
+
+Usage:
+    limiter = get_rate_limiter()
+    await limiter.acquire("openrouter", bot_name="Hibachi")   # async bots
+    limiter.wait_if_needed("Hibachi", endpoint="deepseek")    # sync clients
 """
 
-import time
-import threading
+import asyncio
 import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, buckets are per process
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+_STATE = struct.Struct('<dd')  # tokens, last update (unix time)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket parameters"""
+    rate: float   # tokens added per second
+    burst: float  # bucket capacity
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse '<rate>/<burst>' (burst defaults to 1)"""
+        rate, _, burst = value.partition('/')
+        return cls(float(rate), float(burst or 1))
+
+
+# Conservative defaults per API key. Tune with RATE_LIMIT_<ENDPOINT>.
+DEFAULT_LIMITS: Dict[str, RateLimit] = {
+    "deepseek": RateLimit(rate=1.0, burst=3),
+    "openrouter": RateLimit(rate=1.0, burst=3),
+    "hibachi": RateLimit(rate=10.0, burst=20),
+    "extended": RateLimit(rate=15.0, burst=20),
+    "paradex": RateLimit(rate=15.0, burst=20),
+    "nado": RateLimit(rate=10.0, burst=20),
+    "cambrian": RateLimit(rate=5.0, burst=10),
+}
+FALLBACK_LIMIT = RateLimit(rate=1.0, burst=1)
+
+
+class EndpointWaitStats:
+    """Wait-time counters for one endpoint (this process only)"""
 
-class SharedRateLimiter:
-    """Thread-safe rate limiter shared across all bots"""
-    
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        """Initialize rate limiter"""
-        if self._initialized:
-            return
-        
-        self._min_request_interval = 1.0  # 1 second between requests (shared across bots)
-        self._last_request_time = None
-        self._request_lock = threading.Lock()
-        self._request_count = 0
-        self._request_count_lock = threading.Lock()
-        
-        self._initialized = True
-        logger.info("✅ Shared rate limiter initialized (1.0s between requests)")
-    
-    def wait_if_needed(self, bot_name: str = "unknown"):
+        self.requests = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.penalties = 0
+
+    def record(self, wait: float):
+        self.requests += 1
+        if wait > 0:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'waited': self.waited,
+            'total_wait_s': self.total_wait,
+            'avg_wait_ms': self.total_wait / self.requests * 1000 if self.requests else 0.0,
+            'max_wait_s': self.max_wait,
+            'penalties': self.penalties,
+        }
+
+
+class _Bucket:
+    """One endpoint's bucket, persisted in a shared file when possible"""
+
+    def __init__(self, name: str, limit: RateLimit, state_dir: Optional[str]):
+        self.name = name
+        self.limit = limit
+        self._lock = threading.Lock()  # flock doesn't exclude threads sharing the fd
+        self._tokens = limit.burst
+        self._updated = time.time()
+        self._fd: Optional[int] = None
+
+        if state_dir and fcntl is not None:
+            try:
+                os.makedirs(state_dir, exist_ok=True)
+                self._fd = os.open(os.path.join(state_dir, f"{name}.bucket"), os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError as e:
+                logger.warning(f"⚠️ Rate limiter: shared state unavailable for {name} ({e}), limiting per process")
+
+    def _update(self, fn) -> float:
+        """Run fn(tokens, now) -> (tokens, result) on the current state, atomically"""
+        with self._lock:
+            if self._fd is None:
+                self._tokens, result = fn(self._refill(self._tokens, self._updated), time.time())
+                self._updated = time.time()
+                return result
+
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(self._fd, _STATE.size, 0)
+                tokens, updated = _STATE.unpack(raw) if len(raw) == _STATE.size else (self.limit.burst, time.time())
+                now = time.time()
+                tokens, result = fn(self._refill(tokens, updated), now)
+                os.pwrite(self._fd, _STATE.pack(tokens, now), 0)
+                return result
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _refill(self, tokens: float, updated: float) -> float:
+        elapsed = max(0.0, time.time() - updated)
+        return min(self.limit.burst, tokens + elapsed * self.limit.rate)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens now; returns seconds the caller must wait before using them"""
+        def take(available, _now):
+            remaining = available - tokens
+            wait = -remaining / self.limit.rate if remaining < 0 else 0.0
+            return remaining, wait
+        return self._update(take)
+
+    def drain(self, seconds: float):
+        """Empty the bucket so the next token is `seconds` away"""
+        self._update(lambda available, _now: (min(available, -seconds * self.limit.rate), 0.0))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class SharedRateLimiter:
+    """Per-endpoint token buckets shared by all bots on this host"""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        state_dir: Optional[str] = None,
+        shared: bool = True
+    ):
+        """
+        Args:
+            limits: Endpoint -> RateLimit (default: DEFAULT_LIMITS + env overrides)
+            state_dir: Directory for shared bucket files
+                (default: $RATE_LIMIT_DIR or <tmp>/pacifica_rate_limits)
+            shared: False keeps buckets in this process only
+        """
+        self.limits = dict(limits) if limits is not None else self._limits_from_env()
+        if shared:
+            self.state_dir = state_dir or os.getenv(
+                'RATE_LIMIT_DIR', os.path.join(tempfile.gettempdir(), 'pacifica_rate_limits')
+            )
+        else:
+            self.state_dir = None
+        self._buckets: Dict[str, _Bucket] = {}
+        self._stats: Dict[str, EndpointWaitStats] = {}
+        self._create_lock = threading.Lock()
+
+        mode = f"shared via {self.state_dir}" if self.state_dir and fcntl is not None else "per process"
+        logger.info(f"✅ Shared rate limiter initialized ({mode})")
+
+    @staticmethod
+    def _limits_from_env() -> Dict[str, RateLimit]:
+        limits = dict(DEFAULT_LIMITS)
+        for key, value in os.environ.items():
+            if key.startswith('RATE_LIMIT_') and key != 'RATE_LIMIT_DIR':
+                try:
+                    limits[key[len('RATE_LIMIT_'):].lower()] = RateLimit.parse(value)
+                except ValueError:
+                    logger.warning(f"⚠️ Ignoring {key}={value!r} (expected '<rate>/<burst>')")
+        return limits
+
+    def _bucket(self, endpoint: str) -> _Bucket:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            with self._create_lock:
+                bucket = self._buckets.get(endpoint)
+                if bucket is None:
+                    limit = self.limits.get(endpoint, FALLBACK_LIMIT)
+                    bucket = self._buckets[endpoint] = _Bucket(endpoint, limit, self.state_dir)
+                    self._stats[endpoint] = EndpointWaitStats()
+        return bucket
+
+    def reserve(self, endpoint: str, tokens: float = 1.0) -> float:
         """
-        Wait if needed to respect rate limit
-        
+        Reserve tokens without waiting
+
         Args:
-            bot_name: Name of bot making request (for logging)
+            endpoint: Budget name (e.g. 'deepseek')
+            tokens: Request cost
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        wait = self._bucket(endpoint).reserve(tokens)
+        self._stats[endpoint].record(wait)
+        if wait > 1.0:
+            logger.info(f"⏳ Rate limit [{endpoint}]: waiting {wait:.2f}s")
+        return wait
+
+    async def acquire(self, endpoint: str, bot_name: str = "unknown", tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent
+
+        Returns:
+            Seconds waited
         """
-        with self._request_lock:
-            if self._last_request_time is not None:
-                elapsed = time.time() - self._last_request_time
-                if elapsed < self._min_request_interval:
-                    wait_time = self._min_request_interval - elapsed
-                    logger.debug(f"[{bot_name}] Rate limit: waiting {wait_time:.2f}s")
-                    time.sleep(wait_time)
-            
-            self._last_request_time = time.time()
-            
-            with self._request_count_lock:
-                self._request_count += 1
-                if self._request_count % 10 == 0:
-                    logger.info(f"📊 Shared API usage: {self._request_count} requests (from {bot_name})")
-    
-    def get_stats(self):
-        """Get rate limiter stats"""
-        with self._request_count_lock:
-            return {
-                'total_requests': self._request_count,
-                'min_interval': self._min_request_interval
-            }
+        wait = self.reserve(endpoint, tokens)
+        if wait > 0:
+            logger.debug(f"[{bot_name}] Rate limit [{endpoint}]: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def wait_if_needed(self, bot_name: str = "unknown", endpoint: str = "deepseek", tokens: float = 1.0) -> float:
+        """
+        Blocking variant for synchronous clients
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(endpoint, tokens)
+        if wait > 0:
+            logger.debug(f"[{bot_name}] Rate limit [{endpoint}]: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, endpoint: str, seconds: float):
+        """
+        Back every process off an endpoint after a 429
+
+        Args:
+            endpoint: Budget name
+            seconds: Time until the next request may go out
+        """
+        self._bucket(endpoint).drain(seconds)
+        self._stats[endpoint].penalties += 1
+        logger.warning(f"🚦 Rate limit [{endpoint}]: 429 received, all bots paused {seconds:.1f}s")
+
+    def get_stats(self) -> Dict:
+        """
+        Wait-time stats for this process
+
+        Returns:
+            {'total_requests': int, 'endpoints': {endpoint: {requests, waited,
+            total_wait_s, avg_wait_ms, max_wait_s, penalties, rate, burst}}}
+        """
+        endpoints = {}
+        for name, stats in self._stats.items():
+            limit = self._buckets[name].limit
+            endpoints[name] = {**stats.to_dict(), 'rate': limit.rate, 'burst': limit.burst}
+        return {
+            'total_requests': sum(s.requests for s in self._stats.values()),
+            'endpoints': endpoints,
+        }
+
+    def close(self):
+        """Close the shared state files"""
+        for bucket in self._buckets.values():
+            bucket.close()
+
+
+_instance: Optional[SharedRateLimiter] = None
+_instance_lock = threading.Lock()
 
 
+def get_rate_limiter() -> SharedRateLimiter:
+    """Process-wide limiter (created on first use)"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = SharedRateLimiter()
+    return _instance